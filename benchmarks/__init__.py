@@ -0,0 +1,3 @@
+"""
+Benchmarky výkonu MULTIPONG (engine, serializace, game loop, paměť).
+"""
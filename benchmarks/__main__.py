@@ -0,0 +1,73 @@
+"""
+Spuštění celé sady benchmarků a porovnání s baseline.
+
+Použití:
+  python -m benchmarks                     # změří a porovná s baseline.json
+  python -m benchmarks --quick             # rychlý běh (méně přesný)
+  python -m benchmarks --filter update_4v4 # jen vybrané benchmarky
+  python -m benchmarks --save-baseline     # uloží výsledky jako novou baseline
+
+Návratový kód je 1, pokud některý benchmark klesl pod baseline o víc než
+``--tolerance`` (výchozí 25 %). Baseline je závislá na stroji – po změně
+hardwaru ji přegenerujte.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from .harness import BASELINE_PATH, compare, load_baseline, save_baseline
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="MULTIPONG benchmarky (ticky za sekundu)")
+    parser.add_argument("--quick", action="store_true", help="kratší měření bez opakování")
+    parser.add_argument("--filter", default="", help="jen benchmarky obsahující tento text")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="soubor s baseline")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="uložit výsledky jako baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25, help="povolený relativní pokles")
+    args = parser.parse_args()
+
+    # Benchmarky nemají zahlcovat výstup INFO logy serveru (i při importu)
+    logging.disable(logging.INFO)
+    from . import bench_broadcast, bench_codec, bench_engine, bench_game_loop
+
+    min_time, repeat = (0.05, 1) if args.quick else (0.2, 3)
+    baseline = load_baseline(args.baseline)
+
+    results = {}
+    print(f"{'benchmark':<40} {'ops/s':>14} {'baseline':>14} {'poměr':>7}")
+    for module in (bench_engine, bench_game_loop, bench_broadcast, bench_codec):
+        for name, value in module.run(min_time, repeat, args.filter).items():
+            results[name] = value
+            reference = baseline.get(name)
+            if reference:
+                print(f"{name:<40} {value:>14,.0f} {reference:>14,.0f} {value / reference:>6.2f}x")
+            else:
+                print(f"{name:<40} {value:>14,.0f} {'-':>14} {'-':>7}")
+
+    if args.save_baseline:
+        merged = {**baseline, **results} if args.filter else results
+        save_baseline(merged, args.baseline)
+        print(f"💾 Baseline uložena do {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ Regrese výkonu (tolerance {args.tolerance:.0%}):")
+        for name, value, reference, ratio in regressions:
+            print(f"   {name}: {value:,.0f}/s vs. baseline {reference:,.0f}/s ({ratio:.2f}x)")
+        return 1
+
+    if baseline:
+        print("\n✅ Bez regresí vůči baseline")
+    else:
+        print("\nℹ️ Baseline zatím neexistuje (--save-baseline)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+bench_broadcast.py – cena broadcastu snapshotu na jednoho příjemce.
+
+Porovnává WebSocketManager.broadcast (JSON se zakóduje jednou, všem
+relacím se zařadí stejný text a odešlou ho writer tasky relací)
+s původní cestou, kdy se pro každou relaci volalo ``send_json``
+a snapshot se serializoval znovu pro každého příjemce.
+
+Benchmarky:
+  broadcast_<N>v<N>_<R>r             – WebSocketManager.broadcast, R příjemců
+  broadcast_per_recipient_<N>v<N>_<R>r – send_json pro každou relaci (původní)
+
+Spuštění (vypíše i cenu na příjemce v µs):
+  python -m benchmarks.bench_broadcast
+"""
+
+import asyncio
+from typing import Dict
+
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.server.websocket_manager import WebSocketManager
+
+from .bench_engine import make_engine
+from .bench_game_loop import FakeWebSocket
+from .harness import RunN, measure
+
+RECIPIENTS = (1, 8, 64)
+TEAM_SIZES = (1, 4)
+
+
+def make_manager(recipients: int) -> WebSocketManager:
+    """WebSocketManager s R falešnými relacemi."""
+    manager = WebSocketManager()
+    for i in range(recipients):
+        session = PlayerSession(FakeWebSocket(), f"S{i + 1}")
+        manager.sessions[session.player_id] = session
+    return manager
+
+
+def make_snapshot(num_players_per_team: int) -> dict:
+    """Typický snapshot rozehraného zápasu (se statistikami)."""
+    builder = SnapshotBuilder(make_engine(num_players_per_team))
+    return builder.build_snapshot()
+
+
+def _broadcast_case(manager: WebSocketManager, snapshot: dict) -> RunN:
+    async def broadcasts(n: int) -> None:
+        broadcast = manager.broadcast
+        for _ in range(n):
+            await broadcast(snapshot)
+            await asyncio.sleep(0)  # writer tasky relací odešlou snapshot
+
+    def run_n(n: int) -> None:
+        asyncio.run(broadcasts(n))
+    return run_n
+
+
+def _per_recipient_case(manager: WebSocketManager, snapshot: dict) -> RunN:
+    async def broadcasts(n: int) -> None:
+        for _ in range(n):
+            for session in list(manager.sessions.values()):
+                await session.send_json(snapshot)
+
+    def run_n(n: int) -> None:
+        asyncio.run(broadcasts(n))
+    return run_n
+
+
+def cases() -> Dict[str, RunN]:
+    """Vrátí všechny benchmarky tohoto modulu {název: run_n}."""
+    result: Dict[str, RunN] = {}
+    for size in TEAM_SIZES:
+        snapshot = make_snapshot(size)
+        for recipients in RECIPIENTS:
+            manager = make_manager(recipients)
+            tag = f"{size}v{size}_{recipients}r"
+            result[f"broadcast_{tag}"] = _broadcast_case(manager, snapshot)
+            result[f"broadcast_per_recipient_{tag}"] = _per_recipient_case(manager, snapshot)
+    return result
+
+
+def run(min_time: float = 0.2, repeat: int = 3, name_filter: str = "") -> Dict[str, float]:
+    """Spustí benchmarky a vrátí {název: ops/s}."""
+    return {
+        name: measure(run_n, min_time, repeat)
+        for name, run_n in cases().items()
+        if name_filter in name
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        recipients = int(name.rsplit("_", 1)[1].rstrip("r"))
+        per_recipient_us = 1e6 / value / recipients
+        print(f"{name:<40} {value:>12,.0f} /s  {per_recipient_us:>8.2f} µs/příjemce")
@@ -0,0 +1,83 @@
+"""
+bench_codec.py – kódování a parsování snapshotu: JSON vs. binární formát.
+
+Měří typický snapshot rozehraného zápasu bez statistik (tak vypadá
+drtivá většina ticků). Server snapshot kóduje jednou na formát, klient
+ho parsuje každý tick.
+
+Benchmarky:
+  snapshot_encode_<fmt>_<N>v<N> – kódování (encode_message / encode_snapshot)
+  snapshot_decode_<fmt>_<N>v<N> – parsování (json.loads / decode_snapshot)
+
+Spuštění (vypíše i velikost snapshotu v bajtech):
+  python -m benchmarks.bench_codec
+"""
+
+import json
+from typing import Dict
+
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.server.websocket_manager import encode_message
+from multipong.network.snapshot_codec import decode_snapshot, encode_snapshot
+
+from .bench_engine import make_engine
+from .harness import RunN, measure
+
+TEAM_SIZES = (1, 4)
+
+
+def make_snapshot(num_players_per_team: int) -> dict:
+    """Typický snapshot bez statistik (ty se posílají jen při změně)."""
+    engine = make_engine(num_players_per_team)
+    builder = SnapshotBuilder(engine)
+    builder.build_snapshot()
+    engine.update({})
+    return builder.build_snapshot()
+
+
+def _encode_case(encode, snapshot: dict) -> RunN:
+    def run_n(n: int) -> None:
+        for _ in range(n):
+            encode(snapshot)
+    return run_n
+
+
+def _decode_case(decode, payload) -> RunN:
+    def run_n(n: int) -> None:
+        for _ in range(n):
+            decode(payload)
+    return run_n
+
+
+def cases() -> Dict[str, RunN]:
+    """Vrátí všechny benchmarky tohoto modulu {název: run_n}."""
+    result: Dict[str, RunN] = {}
+    for size in TEAM_SIZES:
+        snapshot = make_snapshot(size)
+        tag = f"{size}v{size}"
+        result[f"snapshot_encode_json_{tag}"] = _encode_case(encode_message, snapshot)
+        result[f"snapshot_encode_binary_{tag}"] = _encode_case(encode_snapshot, snapshot)
+        json_data, binary_data = encode_message(snapshot), encode_snapshot(snapshot)
+        result[f"snapshot_decode_json_{tag}"] = _decode_case(json.loads, json_data)
+        result[f"snapshot_decode_binary_{tag}"] = _decode_case(decode_snapshot, binary_data)
+    return result
+
+
+def run(min_time: float = 0.2, repeat: int = 3, name_filter: str = "") -> Dict[str, float]:
+    """Spustí benchmarky a vrátí {název: ops/s}."""
+    return {
+        name: measure(run_n, min_time, repeat)
+        for name, run_n in cases().items()
+        if name_filter in name
+    }
+
+
+if __name__ == "__main__":
+    for size in TEAM_SIZES:
+        snapshot = make_snapshot(size)
+        print(
+            f"snapshot {size}v{size}: JSON {len(encode_message(snapshot).encode('utf-8'))} B, "
+            f"binární {len(encode_snapshot(snapshot))} B"
+        )
+    for name, value in run().items():
+        print(f"{name:<40} {value:>12,.0f} /s  {1e6 / value:>8.2f} µs")
@@ -0,0 +1,106 @@
+"""
+bench_engine.py – propustnost MultipongEngine a serializace stavu.
+
+Benchmarky:
+  engine_update_<N>v<N>_<ai>  – MultipongEngine.update, AI na všech slotech
+                                (none = vstupy/fallback AI enginu)
+  get_state_<N>v<N>           – MultipongEngine.get_state()
+  json_full_<N>v<N>           – JSON plného snapshotu (get_state)
+  snapshot_build_<N>v<N>      – SnapshotBuilder.build_snapshot()
+  json_snapshot_<N>v<N>       – JSON inkrementálního snapshotu
+
+Spuštění:
+  python -m benchmarks.bench_engine
+"""
+
+import json
+import random
+from typing import Callable, Dict, Optional
+
+from multipong.ai import PredictiveAI, QLearningAI, SimpleAI
+from multipong.engine import MultipongEngine
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+
+from .harness import RunN, measure
+
+# AI varianty: název -> továrna (None = bez AI na slotech)
+AI_VARIANTS: Dict[str, Optional[Callable[[], object]]] = {
+    "none": None,
+    "simple": SimpleAI,
+    "predictive": PredictiveAI,
+    "qlearning": lambda: QLearningAI(lr=0.1, gamma=0.9, epsilon=0.1),
+}
+
+TEAM_SIZES = (1, 2, 3, 4)
+
+
+def make_engine(num_players_per_team: int, ai: str = "none") -> MultipongEngine:
+    """
+    Vytvoří rozehraný engine s AI na všech slotech.
+
+    Args:
+        num_players_per_team: Počet hráčů na tým
+        ai: Klíč z AI_VARIANTS
+    """
+    random.seed(1234)
+    engine = MultipongEngine(num_players_per_team=num_players_per_team)
+    factory = AI_VARIANTS[ai]
+    if factory is not None:
+        for paddle in engine.paddles.values():
+            paddle.ai = factory()
+    engine.start()
+    engine.ball.vy = -7.5  # rozehraný míček, ať dochází k zásahům i gólům
+    engine.simulate(60)
+    return engine
+
+
+def _update_case(engine: MultipongEngine) -> RunN:
+    inputs = {"A1": {"up": False, "down": True}}
+    update = engine.update
+
+    def run_n(n: int) -> None:
+        for _ in range(n):
+            update(inputs)
+    return run_n
+
+
+def _call_case(fn: Callable[[], object]) -> RunN:
+    def run_n(n: int) -> None:
+        for _ in range(n):
+            fn()
+    return run_n
+
+
+def cases() -> Dict[str, RunN]:
+    """Vrátí všechny benchmarky tohoto modulu {název: run_n}."""
+    result: Dict[str, RunN] = {}
+    for size in TEAM_SIZES:
+        tag = f"{size}v{size}"
+        for ai in AI_VARIANTS:
+            result[f"engine_update_{tag}_{ai}"] = _update_case(make_engine(size, ai))
+
+        engine = make_engine(size)
+        state = {"type": "snapshot", **engine.get_state()}
+        builder = SnapshotBuilder(engine)
+        builder.build_snapshot()  # první snapshot nese statistiky
+        snapshot = builder.build_snapshot()
+
+        result[f"get_state_{tag}"] = _call_case(engine.get_state)
+        result[f"json_full_{tag}"] = _call_case(lambda s=state: json.dumps(s))
+        result[f"snapshot_build_{tag}"] = _call_case(builder.build_snapshot)
+        result[f"json_snapshot_{tag}"] = _call_case(lambda s=snapshot: json.dumps(s))
+    return result
+
+
+def run(min_time: float = 0.2, repeat: int = 3, name_filter: str = "") -> Dict[str, float]:
+    """Spustí benchmarky a vrátí {název: ops/s}."""
+    return {
+        name: measure(run_n, min_time, repeat)
+        for name, run_n in cases().items()
+        if name_filter in name
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:<36} {value:>14,.0f} /s")
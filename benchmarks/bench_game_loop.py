@@ -0,0 +1,93 @@
+"""
+bench_game_loop.py – propustnost jednoho průchodu GameLoop (simulace,
+snapshot, broadcast) s N připojenými relacemi.
+
+WebSocket je nahrazen atrapou, která zprávu jen zakóduje do JSON stejně
+jako Starlette ``WebSocket.send_json`` (``send_text`` jen započítá) –
+měří se tedy serializace i režie WebSocketManageru, ne síť.
+
+Benchmarky:
+  game_loop_tick_<N>v<N>_<S>s – GameLoop.run_tick(1) s S relacemi
+
+Spuštění:
+  python -m benchmarks.bench_game_loop
+"""
+
+import asyncio
+import json
+from typing import Dict
+
+from multipong.engine import MultipongEngine
+from multipong.network.server.game_loop import GameLoop
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.websocket_manager import WebSocketManager
+
+from .harness import RunN, measure
+
+SESSION_COUNTS = (1, 8, 64)
+TEAM_SIZES = (1, 4)
+
+
+class FakeWebSocket:
+    """Atrapa WebSocketu – zakóduje zprávu jako Starlette a zahodí ji."""
+
+    def __init__(self) -> None:
+        self.bytes_sent = 0
+
+    async def send_json(self, data: dict) -> None:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        self.bytes_sent += len(text)
+
+    async def send_text(self, text: str) -> None:
+        self.bytes_sent += len(text)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.bytes_sent += len(data)
+
+
+def make_game_loop(num_players_per_team: int, sessions: int) -> GameLoop:
+    """
+    Vytvoří GameLoop se skutečným WebSocketManagerem a S falešnými relacemi.
+    """
+    engine = MultipongEngine(num_players_per_team=num_players_per_team)
+    engine.start()
+    manager = WebSocketManager()
+    for i in range(sessions):
+        session = PlayerSession(FakeWebSocket(), f"S{i + 1}")
+        manager.sessions[session.player_id] = session
+    return GameLoop(engine, manager, tick_rate=60, profiling=False)
+
+
+def _tick_case(game_loop: GameLoop) -> RunN:
+    async def ticks(n: int) -> None:
+        run_tick = game_loop.run_tick
+        for _ in range(n):
+            await run_tick(1)
+            await asyncio.sleep(0)  # writer tasky relací odešlou snapshot
+
+    def run_n(n: int) -> None:
+        asyncio.run(ticks(n))
+    return run_n
+
+
+def cases() -> Dict[str, RunN]:
+    """Vrátí všechny benchmarky tohoto modulu {název: run_n}."""
+    return {
+        f"game_loop_tick_{size}v{size}_{sessions}s": _tick_case(make_game_loop(size, sessions))
+        for size in TEAM_SIZES
+        for sessions in SESSION_COUNTS
+    }
+
+
+def run(min_time: float = 0.2, repeat: int = 3, name_filter: str = "") -> Dict[str, float]:
+    """Spustí benchmarky a vrátí {název: ops/s}."""
+    return {
+        name: measure(run_n, min_time, repeat)
+        for name, run_n in cases().items()
+        if name_filter in name
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:<36} {value:>14,.0f} /s")
@@ -0,0 +1,97 @@
+"""
+bench_memory.py – paměťová náročnost jedné místnosti (MultipongEngine).
+
+Měří průměrný počet bajtů alokovaných na jeden engine (včetně míčku,
+pálek, týmů, statistik a branek) pomocí tracemalloc a porovná je s
+uloženou referencí ``memory_baseline.json``. Reference je změřená stejným
+skriptem na stromu před zavedením ``__slots__`` v entitách enginu
+(commit 123431d~1), takže výstup ukazuje paměť "před" a "po".
+
+Spuštění:
+  python -m benchmarks.bench_memory [počet_místností]
+
+Obnovení reference (na checkoutu stromu, který má sloužit jako "před"):
+  python -m benchmarks.bench_memory --save-baseline
+"""
+
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import Dict
+
+from multipong.engine import MultipongEngine
+
+from .harness import load_baseline, save_baseline
+
+
+MEMORY_BASELINE_PATH = Path(__file__).with_name("memory_baseline.json")
+
+
+def measure_room_bytes(num_players_per_team: int, rooms: int = 1000) -> float:
+    """
+    Změří průměrnou paměť na jednu místnost.
+
+    Args:
+        num_players_per_team: Počet hráčů na tým (1-4)
+        rooms: Počet současně vytvořených místností
+
+    Returns:
+        Průměrný počet bajtů na místnost
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        engines = [
+            MultipongEngine(num_players_per_team=num_players_per_team) for _ in range(rooms)
+        ]
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del engines
+    return current / rooms
+
+
+def run(rooms: int = 1000) -> Dict[str, float]:
+    """
+    Spustí měření pro 1v1 až 4v4.
+
+    Returns:
+        Slovník {"memory_room_1v1": bajty, ...}
+    """
+    return {
+        f"memory_room_{n}v{n}": measure_room_bytes(n, rooms)
+        for n in range(1, 5)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MULTIPONG paměť na místnost")
+    parser.add_argument("rooms", type=int, nargs="?", default=1000, help="počet místností")
+    parser.add_argument(
+        "--baseline", type=Path, default=MEMORY_BASELINE_PATH, help="soubor s referencí"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="uložit výsledky jako referenci"
+    )
+    args = parser.parse_args()
+
+    results = run(args.rooms)
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"💾 Reference uložena do {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    print(f"📦 Paměť na místnost (průměr z {args.rooms} místností)")
+    print(f"   {'benchmark':<18} {'před':>10} {'po':>10} {'poměr':>7}")
+    for name, value in results.items():
+        reference = baseline.get(name)
+        if reference:
+            print(f"   {name:<18} {reference:>8.0f} B {value:>8.0f} B {value / reference:>6.2f}x")
+        else:
+            print(f"   {name:<18} {'-':>10} {value:>8.0f} B {'-':>7}")
+
+
+if __name__ == "__main__":
+    main()
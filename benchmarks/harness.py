@@ -0,0 +1,118 @@
+"""
+harness.py – měření propustnosti a porovnání s uloženou baseline.
+
+Každý benchmark je funkce ``run_n(n)``, která provede n operací (ticků,
+serializací, ...). ``measure`` najde n tak, aby jedno měření trvalo aspoň
+``min_time``, a vrátí nejlepší propustnost z ``repeat`` opakování.
+"""
+
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Výchozí soubor s baseline (commitovaný v repozitáři)
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+RunN = Callable[[int], None]
+
+
+def measure(run_n: RunN, min_time: float = 0.2, repeat: int = 3) -> float:
+    """
+    Změří propustnost benchmarku v operacích za sekundu.
+
+    Args:
+        run_n: Funkce provádějící n operací
+        min_time: Minimální délka jednoho měření (s)
+        repeat: Počet opakování (vrací se nejlepší)
+
+    Returns:
+        Nejvyšší naměřený počet operací za sekundu
+    """
+    # Kalibrace počtu operací (1, 2, 5, 10, 20, 50, ...)
+    n = 1
+    while True:
+        started = time.perf_counter()
+        run_n(n)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        n = _next_count(n)
+
+    best = n / elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        run_n(n)
+        elapsed = time.perf_counter() - started
+        best = max(best, n / elapsed)
+    return best
+
+
+def _next_count(n: int) -> int:
+    """Další počet operací v řadě 1, 2, 5, 10, 20, 50, ..."""
+    digits = len(str(n)) - 1
+    lead = n // 10 ** digits
+    if lead == 1:
+        return 2 * 10 ** digits
+    if lead == 2:
+        return 5 * 10 ** digits
+    return 10 ** (digits + 1)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, float]:
+    """
+    Načte výsledky z baseline souboru.
+
+    Returns:
+        Slovník {benchmark: ops/s} (prázdný pokud soubor neexistuje)
+    """
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(results: Dict[str, float], path: Path = BASELINE_PATH) -> None:
+    """Uloží výsledky jako novou baseline (včetně informace o prostředí)."""
+    data = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": {name: round(value, 1) for name, value in sorted(results.items())},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float = 0.25,
+) -> List[Tuple[str, float, Optional[float], Optional[float]]]:
+    """
+    Porovná výsledky s baseline.
+
+    Args:
+        results: Aktuální výsledky {benchmark: ops/s}
+        baseline: Baseline {benchmark: ops/s}
+        tolerance: Povolený relativní pokles (0.25 = o 25 % pomalejší)
+
+    Returns:
+        Seznam (benchmark, aktuální, baseline, poměr) pro regrese
+        (poměr = aktuální / baseline)
+    """
+    regressions = []
+    for name, value in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = value / reference
+        if ratio < 1.0 - tolerance:
+            regressions.append((name, value, reference, ratio))
+    return regressions
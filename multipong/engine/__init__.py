@@ -1,16 +1,24 @@
 """
 Herní engine pro MULTIPONG
-Obsahuje: Ball, Paddle, Arena, MultipongEngine, PlayerStats, Team, GoalZone
+Obsahuje: Ball, Paddle, Arena, MultipongEngine, BatchedMultipongEngine,
+PlayerStats, Team, GoalZone, EventBus a herní události
 Logické jádro hry - nezávislé na Pygame.
+
+Entity enginu (Ball, Paddle, Team, PlayerStats, GoalZone, Arena) deklarují
+__slots__ – instance nemají vlastní __dict__, takže tisíce současných
+místností zabírají méně paměti (viz benchmarks/bench_memory.py).
 """
 
 from .ball import Ball
 from .paddle import Paddle
 from .arena import Arena
 from .game_engine import MultipongEngine
+from .batched_engine import BatchedMultipongEngine
 from .player_stats import PlayerStats
 from .team import Team
 from .goal_zone import GoalZone
+from .events import EventBus, GoalScored, PaddleHit, ServeStarted, WallBounce
+from .profiling import Histogram, PhaseProfiler
 
 __version__ = "0.1.0"
 
@@ -19,7 +27,15 @@ __all__ = [
     "Paddle", 
     "Arena",
     "MultipongEngine",
+    "BatchedMultipongEngine",
     "PlayerStats",
     "Team",
     "GoalZone",
+    "EventBus",
+    "PaddleHit",
+    "WallBounce",
+    "GoalScored",
+    "ServeStarted",
+    "Histogram",
+    "PhaseProfiler",
 ]
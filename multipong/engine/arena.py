@@ -15,6 +15,8 @@ class Arena:
         width: Šířka arény
         height: Výška arény
     """
+
+    __slots__ = ("width", "height")
     
     def __init__(self, width: int = 1200, height: int = 800):
         """
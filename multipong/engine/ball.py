@@ -10,7 +10,7 @@ Pozdější fáze: jemnější fyzika, spin, náhodná inicializace směru, sepa
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
 from multipong import settings
 
@@ -21,11 +21,13 @@ class Ball:
     Attributes:
         x: X souřadnice
         y: Y souřadnice
-        vx: Rychlost ve směru X (px/frame)
-        vy: Rychlost ve směru Y (px/frame)
+        vx: Rychlost ve směru X (px za referenční tick, viz PHYSICS_REFERENCE_RATE)
+        vy: Rychlost ve směru Y (px za referenční tick)
         radius: Poloměr míčku
     """
 
+    __slots__ = ("x", "y", "vx", "vy", "radius")
+
     def __init__(
         self,
         x: float,
@@ -40,16 +42,23 @@ class Ball:
         self.vy = vy
         self.radius = radius
 
-    def update(self) -> None:
+    def update(self, scale: float = 1.0, height: Optional[float] = None) -> None:
         """Aktualizace pozice + odraz od horní/dolní stěny.
 
+        Args:
+            scale: Délka kroku v referenčních ticích (1.0 = jeden tick)
+            height: Výška arény (None = WINDOW_HEIGHT); engine předává svou arénu
+
         Odraz:
             - Pokud y - radius <= 0: invert vy, y nastav na radius
-            - Pokud y + radius >= WINDOW_HEIGHT: invert vy, y nastav na WINDOW_HEIGHT - radius
+            - Pokud y + radius >= height: invert vy, y nastav na height - radius
         """
+        if height is None:
+            height = settings.WINDOW_HEIGHT
+
         # Pohyb
-        self.x += self.vx
-        self.y += self.vy
+        self.x += self.vx * scale
+        self.y += self.vy * scale
 
         # Odraz od horní stěny
         if self.y - self.radius <= 0:
@@ -57,8 +66,8 @@ class Ball:
             self.reverse_y()
 
         # Odraz od dolní stěny
-        elif self.y + self.radius >= settings.WINDOW_HEIGHT:
-            self.y = settings.WINDOW_HEIGHT - self.radius
+        elif self.y + self.radius >= height:
+            self.y = height - self.radius
             self.reverse_y()
 
     def reset(self) -> None:
@@ -0,0 +1,419 @@
+"""
+BatchedMultipongEngine - vektorizovaný engine pro mnoho zápasů najednou.
+
+Drží N nezávislých zápasů jako struct-of-arrays (NumPy) a jedním voláním
+``update(inputs)`` posune všechny o jeden tick. Fyzika je krok po kroku
+shodná s ``MultipongEngine.update`` (stejné pořadí operací, stejné float64
+výpočty), takže výsledky jsou bit po bitu totožné – ověřuje to paritní sada
+testů v ``tests/engine/test_batched_engine.py``.
+
+Vyžaduje NumPy (volitelná závislost ``ml``).
+
+Omezení oproti MultipongEngine:
+- pálky nemají vlastní ``ai`` objekty – rozhodnutí agentů se předávají
+  přímo v poli vstupů (typicky z RL politiky),
+- stretch animace pálek se nesimuluje (čistě vizuální efekt),
+- swept režim kolizí (``BALL_SWEPT_COLLISION``) není podporován –
+  konstruktor ho odmítne, aby dávka tiše nesimulovala jinou fyziku.
+"""
+
+from typing import List, Union
+
+try:  # NumPy je volitelná závislost (extra "ml")
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy nemusí být nainstalovaný
+    np = None  # type: ignore
+
+from multipong import settings
+
+
+# Kódování vstupů v poli inputs (int8 bitová maska)
+INPUT_NONE: int = -1  # slot nemá vstup -> fallback AI (mimo sloty "*1")
+INPUT_IDLE: int = 0
+INPUT_UP: int = 1
+INPUT_DOWN: int = 2
+
+
+class BatchedMultipongEngine:
+    """
+    Vektorizovaný engine držící ``num_matches`` zápasů stejné konfigurace.
+
+    Geometrie pálek (sloty, x, rozměry, zóny) je sdílená všemi zápasy a
+    přebírá se z šablonového ``MultipongEngine`` – rozložení je tak vždy
+    stejné jako u objektového enginu.
+
+    Attributes:
+        num_matches: Počet zápasů (N)
+        player_ids: ID slotů v pořadí sloupců (levý tým, pak pravý)
+        paddle_is_left: (P,) True pro pálky levého týmu
+        paddle_x, paddle_width, paddle_height, paddle_speed: (P,) geometrie
+        zone_top, zone_bottom: (P,) zóny pohybu pálek
+        paddle_y: (N, P) Y pozice pálek
+        ball_x, ball_y, ball_vx, ball_vy: (N,) stav míčků
+        score: (N, 2) skóre týmů [A, B]
+        hits, goals_scored, goals_received: (N, P) statistiky hráčů
+        rally_hits: (N,) délka výměny
+        sim_tick: Simulační čas dávky v referenčních ticích
+        goal_pause_until: (N,) konec pauzy po gólu v sim_tick (NaN = bez pauzy)
+        pending_serve: (N,) čeká míček na znovu-vhození
+    """
+
+    def __init__(
+        self,
+        num_matches: int,
+        arena_width: int = 1200,
+        arena_height: int = 800,
+        num_players_per_team: int = 1,
+    ):
+        """
+        Inicializace dávkového enginu.
+
+        Args:
+            num_matches: Počet současně simulovaných zápasů
+            arena_width: Šířka arény
+            arena_height: Výška arény
+            num_players_per_team: Počet hráčů na tým (1-4)
+
+        Raises:
+            ImportError: Pokud není dostupný NumPy
+            ValueError: Pokud je zapnutý swept režim kolizí (BALL_SWEPT_COLLISION)
+        """
+        if np is None:
+            raise ImportError("BatchedMultipongEngine vyžaduje NumPy (pip install numpy)")
+
+        from .game_engine import MultipongEngine  # lokální import kvůli cyklům
+
+        template = MultipongEngine(arena_width, arena_height, num_players_per_team)
+        if template.swept_collision:
+            raise ValueError(
+                "BatchedMultipongEngine nepodporuje swept režim kolizí "
+                "(vypněte BALL_SWEPT_COLLISION)"
+            )
+        paddles = template.team_left.paddles + template.team_right.paddles
+        n = max(1, int(num_matches))
+
+        self.num_matches = n
+        self.arena_width = template.arena.width
+        self.arena_height = template.arena.height
+        self.num_players_per_team = template.num_players_per_team
+
+        # Sdílená geometrie pálek
+        self.player_ids: List[str] = [p.player_id for p in paddles]
+        self.paddle_is_left = np.array(
+            [p in template.team_left.paddles for p in paddles], dtype=bool
+        )
+        self.paddle_x = np.array([p.x for p in paddles], dtype=np.float64)
+        self.paddle_width = np.array([p.width for p in paddles], dtype=np.float64)
+        self.paddle_height = np.array([p.height for p in paddles], dtype=np.float64)
+        self.paddle_speed = np.array([p.speed for p in paddles], dtype=np.float64)
+        self.zone_top = np.array([p.zone_top for p in paddles], dtype=np.float64)
+        self.zone_bottom = np.array([p.zone_bottom for p in paddles], dtype=np.float64)
+        # Sloty mimo "*1" bez vstupu řídí fallback AI (viz MultipongEngine._ai_control)
+        self._fallback_ai_slots = np.array(
+            [not pid.endswith("1") for pid in self.player_ids], dtype=bool
+        )
+        self._initial_paddle_y = np.array([p.y for p in paddles], dtype=np.float64)
+        # reset() řadí pálky podle pořadí v týmu (enumerate), ne podle zóny
+        zone_height = self.arena_height // self.num_players_per_team
+        self._reset_paddle_y = np.array(
+            [
+                i * zone_height + zone_height // 2 - p.height / 2
+                for team in (template.team_left, template.team_right)
+                for i, p in enumerate(team.paddles)
+            ],
+            dtype=np.float64,
+        )
+
+        # Branky
+        self.goal_left_top = float(template.goal_left.top)
+        self.goal_left_bottom = float(template.goal_left.bottom)
+        self.goal_right_top = float(template.goal_right.top)
+        self.goal_right_bottom = float(template.goal_right.bottom)
+
+        # Dynamický stav zápasů
+        p = len(paddles)
+        self.ball_radius = float(template.ball.radius)
+        self.paddle_y = np.tile(self._initial_paddle_y, (n, 1))
+        self.ball_x = np.full(n, template.ball.x, dtype=np.float64)
+        self.ball_y = np.full(n, template.ball.y, dtype=np.float64)
+        self.ball_vx = np.full(n, template.ball.vx, dtype=np.float64)
+        self.ball_vy = np.full(n, template.ball.vy, dtype=np.float64)
+        self.score = np.zeros((n, 2), dtype=np.int64)
+        self.hits = np.zeros((n, p), dtype=np.int64)
+        self.goals_scored = np.zeros((n, p), dtype=np.int64)
+        self.goals_received = np.zeros((n, p), dtype=np.int64)
+        self.rally_hits = np.zeros(n, dtype=np.int64)
+        self.sim_tick = 0.0
+        self.goal_pause_until = np.full(n, np.nan, dtype=np.float64)
+        self.pending_serve = np.zeros(n, dtype=bool)
+        self.last_ball_vx = self.ball_vx.copy()
+        self.last_ball_vy = self.ball_vy.copy()
+
+    @property
+    def num_paddles(self) -> int:
+        """Počet pálek (sloupců) v každém zápase."""
+        return len(self.player_ids)
+
+    def slot_index(self, player_id: str) -> int:
+        """
+        Vrátí index sloupce pro daný slot.
+
+        Args:
+            player_id: ID slotu (např. "A1")
+
+        Returns:
+            Index do os P polí pálek
+        """
+        return self.player_ids.index(player_id)
+
+    def load_match(self, index: int, engine) -> None:
+        """
+        Zkopíruje dynamický stav objektového enginu do zápasu ``index``.
+
+        Args:
+            index: Index zápasu v dávce
+            engine: Instance MultipongEngine se stejnou konfigurací
+        """
+        paddles = engine.team_left.paddles + engine.team_right.paddles
+        if [p.player_id for p in paddles] != self.player_ids:
+            raise ValueError("Engine má jiné rozložení slotů než dávka")
+        if engine.swept_collision:
+            raise ValueError("Dávka nepodporuje engine ve swept režimu kolizí")
+
+        self.paddle_y[index] = [p.y for p in paddles]
+        self.ball_x[index] = engine.ball.x
+        self.ball_y[index] = engine.ball.y
+        self.ball_vx[index] = engine.ball.vx
+        self.ball_vy[index] = engine.ball.vy
+        self.score[index] = (engine.team_left.score, engine.team_right.score)
+        self.hits[index] = [p.stats.hits for p in paddles]
+        self.goals_scored[index] = [p.stats.goals_scored for p in paddles]
+        self.goals_received[index] = [p.stats.goals_received for p in paddles]
+        self.rally_hits[index] = engine.rally_hits
+        # Konec pauzy převedeme z časové osy enginu na časovou osu dávky
+        self.goal_pause_until[index] = (
+            np.nan
+            if engine.goal_pause_until is None
+            else engine.goal_pause_until - engine.sim_tick + self.sim_tick
+        )
+        self.pending_serve[index] = engine._pending_ball_reset
+        self.last_ball_vx[index] = engine._last_ball_vx
+        self.last_ball_vy[index] = engine._last_ball_vy
+
+    def reset(self, mask=None) -> None:
+        """
+        Resetuje vybrané zápasy (ekvivalent ``MultipongEngine.reset``).
+
+        Args:
+            mask: Bool pole (N,) nebo indexy zápasů; None = všechny
+        """
+        sel = np.ones(self.num_matches, dtype=bool) if mask is None else np.zeros(
+            self.num_matches, dtype=bool
+        )
+        if mask is not None:
+            sel[mask] = True
+
+        self.score[sel] = 0
+        self.hits[sel] = 0
+        self.goals_scored[sel] = 0
+        self.goals_received[sel] = 0
+
+        # reset_ball(): střed arény, invertovaný směr, výchozí rychlost
+        cx, cy = self.arena_width / 2, self.arena_height / 2
+        self.ball_x[sel] = cx
+        self.ball_y[sel] = cy
+        flipped_vx = -self.ball_vx[sel]
+        self.ball_vx[sel] = np.where(flipped_vx > 0, settings.BALL_SPEED_X, -settings.BALL_SPEED_X)
+        self.ball_vy[sel] = np.where(
+            self.ball_vy[sel] > 0, settings.BALL_SPEED_Y, -settings.BALL_SPEED_Y
+        )
+
+        # Pálky na výchozí pozice
+        self.paddle_y[sel] = self._reset_paddle_y
+
+    def update(self, inputs=None) -> None:
+        """
+        Posune všechny zápasy o jeden tick (parita s ``MultipongEngine.update``).
+
+        Args:
+            inputs: Pole (N, P) nebo (P,) int8 s bitovou maskou vstupů
+                    (INPUT_UP | INPUT_DOWN), INPUT_NONE pro slot bez vstupu.
+                    None = žádné vstupy (ekvivalent ``update({})``).
+        """
+        n, p = self.paddle_y.shape
+        self.sim_tick += 1.0
+        if inputs is None:
+            inputs = np.full((n, p), INPUT_NONE, dtype=np.int8)
+        else:
+            inputs = np.broadcast_to(np.asarray(inputs, dtype=np.int8), (n, p))
+
+        # --- pohyb pálek ---
+        missing = inputs < 0
+        up = ~missing & ((inputs & INPUT_UP) != 0)
+        down = ~missing & ((inputs & INPUT_DOWN) != 0)
+
+        fallback = missing & self._fallback_ai_slots
+        if fallback.any():
+            target = self.ball_y[:, None] - self.paddle_height / 2
+            up = np.where(fallback, self.paddle_y > target, up)
+            down = np.where(fallback, self.paddle_y < target, down)
+        down &= ~up  # neutralizuj konfliktní vstupy
+
+        y = self.paddle_y
+        y = np.where(up, y - self.paddle_speed, np.where(down, y + self.paddle_speed, y))
+        top_limit: Union[float, np.ndarray]
+        bottom_limit: Union[float, np.ndarray]
+        if settings.PADDLES_UNRESTRICTED_Y:
+            top_limit = 0.0
+            bottom_limit = float(self.arena_height)
+        else:
+            top_limit = self.zone_top
+            bottom_limit = self.zone_bottom
+        y = np.where(y < top_limit, top_limit, y)
+        y = np.where(y + self.paddle_height > bottom_limit, bottom_limit - self.paddle_height, y)
+        self.paddle_y = y
+
+        # --- pauza po gólu ---
+        paused = ~np.isnan(self.goal_pause_until)
+        expired = paused & (self.goal_pause_until - self.sim_tick <= 0)
+        if expired.any():
+            self.goal_pause_until[expired] = np.nan
+            serve = expired & self.pending_serve
+            self.ball_vx[serve] = -self.last_ball_vx[serve]
+            self.ball_vy[serve] = self.last_ball_vy[serve]
+            self.pending_serve[serve] = False
+        active = ~(paused & ~expired)
+        if not active.any():
+            return
+
+        r = self.ball_radius
+        x, bx_y, vx, vy = self.ball_x, self.ball_y, self.ball_vx, self.ball_vy
+
+        # --- pohyb míče + odraz od horní/dolní stěny (Ball.update) ---
+        x = np.where(active, x + vx, x)
+        bx_y = np.where(active, bx_y + vy, bx_y)
+        height = self.arena_height  # engine předává Ball.update výšku arény
+        hit_top = active & (bx_y - r <= 0)
+        hit_bottom = active & ~hit_top & (bx_y + r >= height)
+        bx_y = np.where(hit_top, r, np.where(hit_bottom, height - r, bx_y))
+        vy = np.where(hit_top | hit_bottom, -vy, vy)
+
+        # --- odraz od zadních stěn mimo branky ---
+        in_goal_left = (self.goal_left_top <= bx_y) & (bx_y <= self.goal_left_bottom)
+        back_left = active & (x - r <= 0) & ~in_goal_left
+        x = np.where(back_left, r, x)
+        vx = np.where(back_left, -vx, vx)
+
+        in_goal_right = (self.goal_right_top <= bx_y) & (bx_y <= self.goal_right_bottom)
+        back_right = active & (x + r >= self.arena_width) & ~in_goal_right
+        x = np.where(back_right, self.arena_width - r, x)
+        vx = np.where(back_right, -vx, vx)
+
+        # --- kolize s pálkami (první zasažená pálka v pořadí slotů) ---
+        px, pw, ph = self.paddle_x, self.paddle_width, self.paddle_height
+        cx, cy = x[:, None], bx_y[:, None]
+        overlap = (
+            (px - r <= cx) & (cx <= px + pw + r)
+            & (self.paddle_y - r <= cy) & (cy <= self.paddle_y + ph + r)
+        )
+        facing = np.where(self.paddle_is_left, vx[:, None] < 0, vx[:, None] > 0)
+        candidates = overlap & facing & active[:, None]
+        hit = candidates.any(axis=1)
+        if hit.any():
+            rows = np.nonzero(hit)[0]
+            cols = candidates[rows].argmax(axis=1)
+            self.hits[rows, cols] += 1
+
+            is_left = self.paddle_is_left[cols]
+            x[rows] = np.where(is_left, px[cols] + pw[cols] + r, px[cols] - r)
+            vx[rows] = -vx[rows]
+            vx, vy = self._increase_ball_speed(hit, vx, vy)
+
+        # --- pasivní zpomalení ---
+        vx, vy = self._apply_ball_speed_decay(active, vx, vy)
+
+        self.ball_x, self.ball_y, self.ball_vx, self.ball_vy = x, bx_y, vx, vy
+
+        # --- góly --- (levá branka -> bod B, pravá branka -> bod A)
+        goal_b = active & (self.ball_x - r <= 0) & (
+            (self.goal_left_top <= self.ball_y) & (self.ball_y <= self.goal_left_bottom)
+        )
+        if goal_b.any():
+            self._handle_goal(goal_b, team_index=1)
+
+        goal_a = active & (self.ball_x + r >= self.arena_width) & (
+            (self.goal_right_top <= self.ball_y) & (self.ball_y <= self.goal_right_bottom)
+        )
+        if goal_a.any():
+            self._handle_goal(goal_a, team_index=0)
+
+    def _increase_ball_speed(self, mask, vx, vy):
+        """Vektorová obdoba ``MultipongEngine._increase_ball_speed``."""
+        base = settings.BALL_SPEED_INCREMENT
+        if base <= 0:
+            return vx, vy
+
+        base_arr = np.full(self.num_matches, base, dtype=np.float64)
+        if settings.RALLY_ADAPT_FACTOR > 0:
+            reduction = self.rally_hits * settings.RALLY_ADAPT_FACTOR
+            mask = mask & (reduction < 1)
+            base_arr = base * (1 - reduction)
+
+        vx = np.where(mask, np.where(vx >= 0, vx + base_arr, vx - base_arr), vx)
+        vy = np.where(mask, np.where(vy >= 0, vy + base_arr, vy - base_arr), vy)
+        return self._cap_speed(mask, vx, vy)
+
+    def _apply_ball_speed_decay(self, mask, vx, vy):
+        """Vektorová obdoba ``MultipongEngine._apply_ball_speed_decay``."""
+        decay = settings.BALL_SPEED_DECAY
+        decay_x = settings.BALL_SPEED_DECAY_X if 0 < settings.BALL_SPEED_DECAY_X < 1 else decay
+        decay_y = settings.BALL_SPEED_DECAY_Y if 0 < settings.BALL_SPEED_DECAY_Y < 1 else decay
+
+        if 0 < decay_x < 1:
+            vx = np.where(mask, vx * decay_x, vx)
+        if 0 < decay_y < 1:
+            vy = np.where(mask, vy * decay_y, vy)
+        return self._cap_speed(mask, vx, vy)
+
+    @staticmethod
+    def _cap_speed(mask, vx, vy):
+        """Omezí komponenty rychlosti na BALL_SPEED_MAX (pokud > 0)."""
+        cap = settings.BALL_SPEED_MAX
+        if cap > 0:
+            vx = np.where(mask & (np.abs(vx) > cap), np.where(vx > 0, cap, -cap), vx)
+            vy = np.where(mask & (np.abs(vy) > cap), np.where(vy > 0, cap, -cap), vy)
+        return vx, vy
+
+    def _handle_goal(self, mask, team_index: int) -> None:
+        """
+        Ošetří gól ve vybraných zápasech (obdoba ``MultipongEngine._handle_goal``).
+
+        Args:
+            mask: Bool pole (N,) zápasů, kde padl gól
+            team_index: 0 = skóroval tým A (levý), 1 = tým B (pravý)
+        """
+        self.score[mask, team_index] += 1
+        scoring_slots = self.paddle_is_left if team_index == 0 else ~self.paddle_is_left
+        self.goals_scored[np.ix_(mask, scoring_slots)] += 1
+
+        # Ulož poslední nenulový směr pro znovu-vhození
+        self.last_ball_vx = np.where(mask & (self.ball_vx != 0), self.ball_vx, self.last_ball_vx)
+        self.last_ball_vy = np.where(mask & (self.ball_vy != 0), self.ball_vy, self.last_ball_vy)
+
+        self.ball_x[mask] = self.arena_width / 2
+        self.ball_y[mask] = self.arena_height / 2
+        self.ball_vx[mask] = 0
+        self.ball_vy[mask] = 0
+
+        self.goal_pause_until[mask] = self.sim_tick + round(
+            settings.GOAL_PAUSE_SECONDS * settings.PHYSICS_REFERENCE_RATE
+        )
+        self.pending_serve[mask] = True
+        self.rally_hits[mask] = 0
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"BatchedMultipongEngine(matches={self.num_matches}, "
+            f"slots={self.player_ids})"
+        )
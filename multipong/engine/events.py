@@ -0,0 +1,178 @@
+"""Herní události a event bus enginu MULTIPONG.
+
+Engine při zásahu pálky, odrazu od stěny, gólu a podání emituje typované
+události. Posluchači (RL odměny, telemetrie, záznam replaye, ...) se
+registrují na ``MultipongEngine.events`` – každá místnost (engine) má
+vlastní bus.
+
+Pokud na daný typ události nikdo neposlouchá, engine událost vůbec
+nevytváří (kontrola ``EventBus.listening``), takže fyzika neplatí nic.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Type, TypeVar, Union
+
+if TYPE_CHECKING:  # typové importy pouze pro lint/IDE
+    from .game_engine import MultipongEngine
+
+
+@dataclass(frozen=True, slots=True)
+class PaddleHit:
+    """Čelní zásah míčku pálkou (stav míčku v okamžiku dopadu)."""
+    tick: float
+    player_id: str
+    team: str
+    ball_x: float
+    ball_y: float
+    ball_vx: float
+    ball_vy: float
+
+
+@dataclass(frozen=True, slots=True)
+class WallBounce:
+    """Odraz míčku od stěny ("top", "bottom", "back_left", "back_right")."""
+    tick: float
+    wall: str
+    ball_x: float
+    ball_y: float
+
+
+@dataclass(frozen=True, slots=True)
+class GoalScored:
+    """Gól – míček v okamžiku průletu brankou, skóre už započtené."""
+    tick: float
+    scoring_team: str
+    conceding_team: str
+    score_a: int
+    score_b: int
+    ball_x: float
+    ball_y: float
+
+
+@dataclass(frozen=True, slots=True)
+class ServeStarted:
+    """Uvedení míčku do hry (start zápasu nebo konec pauzy po gólu)."""
+    tick: float
+    ball_vx: float
+    ball_vy: float
+
+
+EngineEvent = Union[PaddleHit, WallBounce, GoalScored, ServeStarted]
+EventListener = Callable[[EngineEvent], None]
+# Posluchač konkrétního typu události (subscribe(PaddleHit, on_hit: PaddleHit -> None))
+E = TypeVar("E", PaddleHit, WallBounce, GoalScored, ServeStarted)
+
+EVENT_TYPES: Tuple[type, ...] = (PaddleHit, WallBounce, GoalScored, ServeStarted)
+
+
+class EventBus:
+    """Synchronní rozesílání událostí posluchačům podle typu události.
+
+    Posluchači se volají v pořadí registrace, přímo z ``update()`` enginu.
+    Výjimka posluchače se propaguje (chyba se neschová uprostřed fyziky).
+    """
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        self._listeners: Dict[type, List[Callable[[Any], None]]] = {}
+
+    def subscribe(self, event_type: Type[E], listener: Callable[[E], None]) -> None:
+        """Zaregistruje posluchače pro daný typ události.
+
+        Args:
+            event_type: Třída události (např. PaddleHit)
+            listener: Funkce volaná s instancí události
+        """
+        self._listeners.setdefault(event_type, []).append(listener)
+
+    def subscribe_all(self, listener: EventListener) -> None:
+        """Zaregistruje posluchače pro všechny typy událostí (replay, telemetrie)."""
+        for event_type in EVENT_TYPES:
+            self._listeners.setdefault(event_type, []).append(listener)
+
+    def unsubscribe(self, event_type: Type[E], listener: Callable[[E], None]) -> bool:
+        """Odebere posluchače.
+
+        Returns:
+            True pokud byl posluchač nalezen a odebrán
+        """
+        listeners = self._listeners.get(event_type)
+        if not listeners or listener not in listeners:
+            return False
+        listeners.remove(listener)
+        if not listeners:
+            del self._listeners[event_type]
+        return True
+
+    def listening(self, event_type: Type) -> bool:
+        """Vrátí True, pokud na daný typ události někdo poslouchá."""
+        return event_type in self._listeners
+
+    def emit(self, event: EngineEvent) -> None:
+        """Rozešle událost všem posluchačům jejího typu."""
+        for listener in self._listeners.get(type(event), ()):
+            listener(event)
+
+    def clear(self) -> None:
+        """Odebere všechny posluchače."""
+        self._listeners.clear()
+
+    def __repr__(self) -> str:
+        counts = {t.__name__: len(ls) for t, ls in self._listeners.items()}
+        return f"EventBus(listeners={counts})"
+
+
+class AIRewardListener:
+    """RL odměny pro AI pálky s metodou ``give_reward`` (např. QLearningAI).
+
+    Nahrazuje dřívější inline kontroly ``isinstance(paddle.ai, QLearningAI)``
+    v kolizích a gólech. Odměny: zásah +1, vstřelený gól +5 celému útočícímu
+    týmu, obdržený gól -3 celému bránícímu týmu.
+    """
+
+    def __init__(
+        self,
+        engine: "MultipongEngine",
+        hit_reward: float = 1.0,
+        goal_scored_reward: float = 5.0,
+        goal_conceded_reward: float = -3.0,
+    ) -> None:
+        self.engine = engine
+        self.hit_reward = hit_reward
+        self.goal_scored_reward = goal_scored_reward
+        self.goal_conceded_reward = goal_conceded_reward
+
+    def attach(self, bus: EventBus) -> None:
+        """Zaregistruje odměny na zásahy a góly."""
+        bus.subscribe(PaddleHit, self.on_paddle_hit)
+        bus.subscribe(GoalScored, self.on_goal_scored)
+
+    def detach(self, bus: EventBus) -> None:
+        """Odregistruje odměny z busu."""
+        bus.unsubscribe(PaddleHit, self.on_paddle_hit)
+        bus.unsubscribe(GoalScored, self.on_goal_scored)
+
+    def _reward(self, paddle, reward: float) -> None:
+        give_reward = getattr(paddle.ai, "give_reward", None)
+        if give_reward is not None:
+            give_reward(paddle, self.engine.ball, reward=reward)
+
+    def on_paddle_hit(self, event: PaddleHit) -> None:
+        """Odmění pálku, která míček zasáhla."""
+        paddle = self.engine.paddles.get(event.player_id)
+        if paddle is not None:
+            self._reward(paddle, self.hit_reward)
+
+    def on_goal_scored(self, event: GoalScored) -> None:
+        """Penalizuje obranu a odmění útok."""
+        engine = self.engine
+        if event.scoring_team == engine.team_left.name:
+            attacking, defending = engine.team_left, engine.team_right
+        else:
+            attacking, defending = engine.team_right, engine.team_left
+
+        for paddle in defending.paddles:
+            self._reward(paddle, self.goal_conceded_reward)
+        for paddle in attacking.paddles:
+            self._reward(paddle, self.goal_scored_reward)
@@ -3,16 +3,46 @@ MultipongEngine - Hlavní herní engine pro MULTIPONG
 Logické jádro hry - nezávislé na Pygame.
 """
 
-from typing import Dict, Optional, List, Tuple
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, List, Tuple, Union
 from .ball import Ball
 from .paddle import Paddle
 from .arena import Arena
 from .player_stats import PlayerStats
 from .team import Team
 from .goal_zone import GoalZone
+from .collision import sweep_circle_aabb, sweep_line
+from .events import (
+    AIRewardListener,
+    EventBus,
+    GoalScored,
+    PaddleHit,
+    ServeStarted,
+    WallBounce,
+)
+from .profiling import (
+    PHASE_BALL,
+    PHASE_PADDLE_COLLISION,
+    PHASE_PADDLES,
+    PHASE_WALLS_GOALS,
+    PhaseProfiler,
+)
 from multipong import settings
 
 
+# Mapa vstupů hráčů {"A1": {"up": bool, "down": bool}, ...}
+InputMap = Dict[str, Dict[str, bool]]
+
+# Dopady swept režimu, které jsou odrazem od stěny -> název stěny ve WallBounce
+_SWEPT_WALL_EVENTS = {
+    "wall_top": "top",
+    "wall_bottom": "bottom",
+    "back_left": "back_left",
+    "back_right": "back_right",
+}
+
+
 class MultipongEngine:
     """
     Hlavní logický modul hry - NEZÁVISLÝ NA PYGAME.
@@ -31,12 +61,26 @@ class MultipongEngine:
         team_right: Pravý tým (Team instance) - původně team_b
         paddles: Slovník pálek {player_id: Paddle} (zpětná kompatibilita)
         score: Slovník skóre {"A": int, "B": int} (zpětná kompatibilita)
+        sim_tick: Simulační čas v referenčních ticích
         goal_left: Branka vlevo (GoalZone)
         goal_right: Branka vpravo (GoalZone)
+        swept_collision: Spojitá detekce kolizí míčku (bez tunelování)
         is_running: Zda hra běží
+        stats_version: Verze statistik hráčů (zvyšuje se při každé změně)
+        events: EventBus místnosti (PaddleHit, WallBounce, GoalScored, ServeStarted)
+        profiler: Volitelný PhaseProfiler – měří fáze update() (None = vypnuto)
     """
     
-    def __init__(self, arena_width: int = 1200, arena_height: int = 800, num_players_per_team: int = 1):
+    def __init__(
+        self,
+        arena_width: int = 1200,
+        arena_height: int = 800,
+        num_players_per_team: int = 1,
+        swept_collision: Optional[bool] = None,
+        events: Optional[EventBus] = None,
+        ai_rewards: bool = True,
+        profiler: Optional[PhaseProfiler] = None,
+    ):
         """
         Inicializace herního enginu.
         
@@ -44,6 +88,10 @@ class MultipongEngine:
             arena_width: Šířka arény
             arena_height: Výška arény
             num_players_per_team: Počet hráčů na tým (1-4)
+            swept_collision: Spojitá detekce kolizí (None = BALL_SWEPT_COLLISION)
+            events: Sdílený EventBus (None = vlastní bus enginu)
+            ai_rewards: Zaregistrovat RL odměny pro AI s ``give_reward``
+            profiler: PhaseProfiler pro měření fází update() (None = bez měření)
         """
         # Herní objekty
         self.arena = Arena(arena_width, arena_height)
@@ -82,16 +130,37 @@ class MultipongEngine:
             bottom=arena_height // 2 + goal_size // 2
         )
         
+        # Režim detekce kolizí míčku
+        self.swept_collision: bool = (
+            settings.BALL_SWEPT_COLLISION if swept_collision is None else bool(swept_collision)
+        )
+
         # Stav hry
         self.is_running = False
         self.time_left = 120.0  # sekund
-        # Pauza po gólu
+        # Simulační čas v referenčních ticích – jediný zdroj času enginu
+        # (žádné hodiny reálného času => deterministický běh i rychleji než real-time)
+        self.sim_tick: float = 0.0
+        # Pauza po gólu (konec pauzy v jednotkách sim_tick)
         self.goal_pause_until: Optional[float] = None
         self._pending_ball_reset: bool = False
         self._last_ball_vx: float = self.ball.vx
         self._last_ball_vy: float = self.ball.vy
         # Telemetrie výměny (rally) – počet zásahů od posledního gólu
         self.rally_hits: int = 0
+        # Verze statistik hráčů – zvýší se při každé změně (zásah, gól, reset),
+        # díky tomu se statistiky posílají klientům jen když se změnily
+        self.stats_version: int = 0
+
+        # Události pro posluchače místnosti (bez posluchačů nic nestojí)
+        self.events: EventBus = events if events is not None else EventBus()
+        self.ai_reward_listener: Optional[AIRewardListener] = None
+        if ai_rewards:
+            self.ai_reward_listener = AIRewardListener(self)
+            self.ai_reward_listener.attach(self.events)
+
+        # Volitelné profilování fází ticku (None = žádná režie)
+        self.profiler: Optional[PhaseProfiler] = profiler
     
     def _create_team(self, name: str, is_left: bool) -> Team:
         """Vytvoří tým s pálkami.
@@ -107,7 +176,8 @@ class MultipongEngine:
         zone_height = self.arena.height // self.num_players_per_team
         
         for i in range(self.num_players_per_team):
-            player_id = f"{name}{i + 1}"
+            # Internované ID – všechny místnosti sdílí jeden řetězec na slot
+            player_id = sys.intern(f"{name}{i + 1}")
             
             # Per-slot výška pálky (fallback na PADDLE_HEIGHT)
             paddle_height = settings.PADDLE_HEIGHTS.get(player_id, settings.PADDLE_HEIGHT)
@@ -161,15 +231,55 @@ class MultipongEngine:
             player_id="B1"
         )
     
-    def update(self, inputs: Optional[Dict[str, Dict[str, bool]]] = None) -> None:
+    def step(self, dt: float, inputs: Optional[Mapping[str, Mapping[str, bool]]] = None) -> None:
+        """Posune simulaci o dt sekund (časově nezávislá fyzika).
+
+        Pohyb míčku, pálek i decay rychlosti se přepočítají na délku kroku,
+        takže hra se chová stejně při libovolném tick rate. Pro dlouhé kroky
+        (nízký tick rate) je vhodné zapnout ``swept_collision``.
+
+        Args:
+            dt: Délka kroku v sekundách
+            inputs: Slovník vstupů od hráčů (viz ``update``)
+        """
+        self.update(inputs, dt=dt)
+
+    @staticmethod
+    def _dt_to_scale(dt: float) -> float:
+        """Převede dt (sekundy) na počet referenčních ticků."""
+        scale = dt * settings.PHYSICS_REFERENCE_RATE
+        # Krok přesně jednoho referenčního ticku drží bitově shodné výsledky s update()
+        if abs(scale - 1.0) < 1e-9:
+            return 1.0
+        return scale
+
+    def update(
+        self,
+        inputs: Optional[Mapping[str, Mapping[str, bool]]] = None,
+        dt: Optional[float] = None,
+    ) -> None:
         """Aktualizační smyčka enginu podle Phase 3 specifikace.
 
         Args:
             inputs: Slovník vstupů od hráčů {"A1": {"up": bool, "down": bool}, ...}.
                     Pokud je None, použije se prázdný slovník (žádné vstupy).
+            dt: Délka kroku v sekundách; None = jeden referenční tick
+                (1 / PHYSICS_REFERENCE_RATE).
         """
         # Výchozí prázdné vstupy (paddle_inputs v dokumentaci)
         paddle_inputs = inputs if inputs is not None else {}
+        scale = 1.0 if dt is None else self._dt_to_scale(dt)
+
+        # --- simulační čas + časomíra zápasu ---
+        self.sim_tick += scale
+        if self.is_running:
+            self.time_left = max(0.0, self.time_left - scale / settings.PHYSICS_REFERENCE_RATE)
+            if self.time_left <= 0:
+                self.stop()
+
+        profiler = self.profiler
+        if profiler is not None:
+            t_start = perf_counter()
 
         # --- pohyb pálek --- (iterace přes oba týmy)
         unrestricted = settings.PADDLES_UNRESTRICTED_Y
@@ -192,16 +302,19 @@ class MultipongEngine:
                     down = False  # neutralizuj konfliktní vstupy
 
                 if up:
-                    paddle.move_up()
+                    paddle.move_up(scale)
                 elif down:
-                    paddle.move_down()
+                    paddle.move_down(scale)
+
+                paddle.update(self.arena.height, unrestricted=unrestricted, scale=scale)
 
-                paddle.update(self.arena.height, unrestricted=unrestricted)
+        if profiler is not None:
+            t_paddles = perf_counter()
+            profiler.record(PHASE_PADDLES, t_paddles - t_start)
 
         # Zpracování pauzy po gólu – pokud probíhá, zastavíme míček
         if self.goal_pause_until is not None:
-            import time
-            remaining = self.goal_pause_until - time.monotonic()
+            remaining = self.goal_pause_until - self.sim_tick
             if remaining <= 0:
                 # Konec pauzy – uvedeme míček do hry
                 self.goal_pause_until = None
@@ -211,8 +324,24 @@ class MultipongEngine:
                 # Pauza aktivní – neprovádíme pohyb míčku ani kolize / góly
                 return
 
+        # --- spojitý (swept) režim – přesný čas dopadu, více odrazů za tick ---
+        if self.swept_collision:
+            self._update_ball_swept(scale)
+            if profiler is not None:
+                # Swept režim prokládá pohyb, stěny i kolize – měří se jako celek
+                profiler.record(PHASE_BALL, perf_counter() - t_paddles)
+            return
+
         # --- pohyb míče --- (jen mimo pauzu)
-        self.ball.update()
+        if self.events.listening(WallBounce):
+            vy_before = self.ball.vy
+            self.ball.update(scale, self.arena.height)
+            if self.ball.vy != vy_before:
+                self._emit_wall_bounce("top" if self.ball.vy > 0 else "bottom")
+        else:
+            self.ball.update(scale, self.arena.height)
+        if profiler is not None:
+            t_ball = perf_counter()
         # -----------------------------------
         #  ODRAZ OD ZADNÍCH STĚN MIMO BRANKY
         # -----------------------------------
@@ -223,12 +352,19 @@ class MultipongEngine:
             if not (self.goal_left.top <= self.ball.y <= self.goal_left.bottom):
                 self.ball.x = self.ball.radius
                 self.ball.reverse_x()
+                if self.events.listening(WallBounce):
+                    self._emit_wall_bounce("back_left")
 
         # Pravá zadní stěna
         if self.ball.x + self.ball.radius >= self.arena.width:
             if not (self.goal_right.top <= self.ball.y <= self.goal_right.bottom):
                 self.ball.x = self.arena.width - self.ball.radius
                 self.ball.reverse_x()
+                if self.events.listening(WallBounce):
+                    self._emit_wall_bounce("back_right")
+
+        if profiler is not None:
+            t_walls = perf_counter()
 
         # --- kolize s pálkami --- (vylepšené – žádné "zasekávání") 
         collision_handled = False
@@ -249,29 +385,8 @@ class MultipongEngine:
                 if team is self.team_right and self.ball.vx <= 0:
                     continue
 
-                # 2) Zaznamenej zásah + vizuální efekt
-                paddle.stats.record_hit()
-                paddle.apply_hit_effect()
-
-                # 2b) RL reward pro AI agenty – zásah
-                if hasattr(paddle, "ai") and paddle.ai is not None:
-                    from multipong.ai import QLearningAI
-                    if isinstance(paddle.ai, QLearningAI):
-                        paddle.ai.give_reward(paddle, self.ball, reward=1.0)
-
-                # 3) Přisazení míčku ven z pálky, aby nezůstal "uvnitř"
-                if team is self.team_left:
-                    # pálka je vlevo, míček má po odrazu letět doprava
-                    self.ball.x = paddle.x + paddle.width + self.ball.radius
-                else:
-                    # pálka je vpravo, míček má po odrazu letět doleva
-                    self.ball.x = paddle.x - self.ball.radius
-
-                # 4) Skutečný odraz – invertuj vx
-                self.ball.vx *= -1
-
-                # Zrychlení míčku po odrazu (splňuje test očekávající nárůst rychlosti)
-                self._increase_ball_speed()
+                # 2) Zásah: statistiky, efekt, přisazení míčku, odraz, zrychlení
+                self._handle_paddle_hit(paddle, is_left=team is self.team_left)
 
                 collision_handled = True
                 break
@@ -285,8 +400,13 @@ class MultipongEngine:
                     # Zrychli míček mírně po odrazu
                     # self._increase_ball_speed()
         """
+        if profiler is not None:
+            t_collision = perf_counter()
+
         # --- pasivní zpomalení míčku proti exponenciálnímu růstu rychlosti ---
-        self._apply_ball_speed_decay()
+        self._apply_ball_speed_decay(scale)
+        if profiler is not None:
+            t_decay = perf_counter()
 
         # --- gól vlevo --- (míček proletěl levou branou -> bod pro pravý tým)
         if self.goal_left.check_goal(self.ball):
@@ -296,6 +416,165 @@ class MultipongEngine:
         if self.goal_right.check_goal(self.ball):
             self._handle_goal(scoring_team="A")
 
+        if profiler is not None:
+            t_end = perf_counter()
+            profiler.record(PHASE_BALL, (t_ball - t_paddles) + (t_decay - t_collision))
+            profiler.record(PHASE_WALLS_GOALS, (t_walls - t_ball) + (t_end - t_decay))
+            profiler.record(PHASE_PADDLE_COLLISION, t_collision - t_walls)
+
+    def _handle_paddle_hit(self, paddle: Paddle, is_left: bool) -> None:
+        """Zpracuje čelní zásah míčku pálkou (diskrétní i swept režim).
+
+        Args:
+            paddle: Zasažená pálka
+            is_left: True pokud pálka patří levému týmu
+        """
+        # Zaznamenej zásah + vizuální efekt
+        paddle.stats.record_hit()
+        paddle.apply_hit_effect()
+        self.stats_version += 1
+
+        # Událost zásahu (RL odměny, telemetrie, replay) – stav v okamžiku dopadu
+        if self.events.listening(PaddleHit):
+            ball = self.ball
+            self.events.emit(PaddleHit(
+                self.sim_tick, paddle.player_id, "A" if is_left else "B",
+                ball.x, ball.y, ball.vx, ball.vy,
+            ))
+
+        # Přisazení míčku ven z pálky, aby nezůstal "uvnitř"
+        if is_left:
+            # pálka je vlevo, míček má po odrazu letět doprava
+            self.ball.x = paddle.x + paddle.width + self.ball.radius
+        else:
+            # pálka je vpravo, míček má po odrazu letět doleva
+            self.ball.x = paddle.x - self.ball.radius
+
+        # Skutečný odraz – invertuj vx
+        self.ball.vx *= -1
+
+        # Zrychlení míčku po odrazu (splňuje test očekávající nárůst rychlosti)
+        self._increase_ball_speed()
+
+    def _update_ball_swept(self, scale: float = 1.0) -> None:
+        """Pohyb míčku se spojitou detekcí kolizí (swept režim).
+
+        Během ticku opakovaně hledá nejbližší dopad (horní/dolní stěna,
+        zadní stěna / branka, čelo pálky), posune míček přesně do bodu dopadu,
+        vyřeší odraz a pokračuje se zbytkem ticku. Díky tomu míček neproletí
+        pálkou ani při rychlosti větší než její šířka za tick.
+
+        Args:
+            scale: Délka kroku v referenčních ticích
+        """
+        ball = self.ball
+        remaining = scale
+        scoring_team: Optional[str] = None
+
+        for _ in range(max(1, settings.BALL_MAX_BOUNCES_PER_TICK)):
+            toi, event, target = self._find_first_impact(remaining)
+            if event is None:
+                break
+
+            ball.x += ball.vx * toi
+            ball.y += ball.vy * toi
+            remaining -= toi
+
+            if event == "wall_top":
+                ball.y = ball.radius
+                ball.reverse_y()
+            elif event == "wall_bottom":
+                ball.y = self.arena.height - ball.radius
+                ball.reverse_y()
+            elif event == "back_left":
+                ball.x = ball.radius
+                ball.reverse_x()
+            elif event == "back_right":
+                ball.x = self.arena.width - ball.radius
+                ball.reverse_x()
+            elif event == "paddle":
+                paddle, is_left = target
+                self._handle_paddle_hit(paddle, is_left)
+            elif event == "goal":
+                scoring_team = target
+                remaining = 0.0
+                break
+
+            if event in _SWEPT_WALL_EVENTS and self.events.listening(WallBounce):
+                self._emit_wall_bounce(_SWEPT_WALL_EVENTS[event])
+        else:
+            # Limit odrazů vyčerpán – zbytek ticku může ještě narazit; míček
+            # zastaví v bodě dopadu a odraz vyřeší další tick
+            toi, event, _target = self._find_first_impact(remaining)
+            if event is not None:
+                remaining = toi
+
+        # Dojezd zbytku ticku (bez dalšího dopadu)
+        ball.x += ball.vx * remaining
+        ball.y += ball.vy * remaining
+
+        self._apply_ball_speed_decay(scale)
+
+        if scoring_team is not None:
+            self._handle_goal(scoring_team=scoring_team)
+
+    def _find_first_impact(self, t_max: float) -> Tuple[float, Optional[str], Any]:
+        """Najde nejbližší dopad míčku v intervalu <0, t_max>.
+
+        Args:
+            t_max: Zbývající část ticku
+
+        Returns:
+            Trojice (čas, typ události, cíl); typ je None pokud k dopadu nedojde.
+            Cíl je (pálka, is_left) pro "paddle" a skórující tým pro "goal".
+        """
+        ball = self.ball
+        r = ball.radius
+        best_t = t_max
+        best: Tuple[Optional[str], Any] = (None, None)
+
+        def consider(t: Optional[float], event: str, target: Any = None) -> None:
+            nonlocal best_t, best
+            if t is not None and (t < best_t or (best[0] is None and t <= best_t)):
+                best_t = t
+                best = (event, target)
+
+        # Horní / dolní stěna
+        if ball.vy < 0:
+            consider(sweep_line(ball.y, ball.vy, r, t_max), "wall_top")
+        elif ball.vy > 0:
+            consider(sweep_line(ball.y, ball.vy, self.arena.height - r, t_max), "wall_bottom")
+
+        # Zadní stěny a branky (GoalZone rozhodne gól vs. odraz)
+        for goal, scoring_team, wall_event in (
+            (self.goal_left, "B", "back_left"),
+            (self.goal_right, "A", "back_right"),
+        ):
+            t = goal.sweep(ball, t_max)
+            if t is not None:
+                y_hit = ball.y + ball.vy * t
+                if goal.contains_y(y_hit):
+                    consider(t, "goal", scoring_team)
+                else:
+                    consider(t, wall_event)
+
+        # Pálky – jen čelní zásah (levý tým při vx < 0, pravý při vx > 0)
+        for team, is_left in ((self.team_left, True), (self.team_right, False)):
+            if (is_left and ball.vx >= 0) or (not is_left and ball.vx <= 0):
+                continue
+            for paddle in team.paddles:
+                t = sweep_circle_aabb(
+                    ball.x, ball.y, ball.vx, ball.vy, r,
+                    paddle.x, paddle.y,
+                    paddle.x + paddle.width, paddle.y + paddle.height,
+                    t_max,
+                )
+                consider(t, "paddle", (paddle, is_left))
+
+        if best[0] is None:
+            return t_max, None, None
+        return best_t, best[0], best[1]
+
     def _ball_hits_paddle(self, paddle: Paddle) -> bool:
         """Jednoduchá detekce kolize míčku s pálkou (deprecated - použij _check_paddle_collision).
 
@@ -353,19 +632,22 @@ class MultipongEngine:
             if abs(self.ball.vy) > settings.BALL_SPEED_MAX:
                 self.ball.vy = settings.BALL_SPEED_MAX if self.ball.vy > 0 else -settings.BALL_SPEED_MAX
 
-    def _apply_ball_speed_decay(self) -> None:
+    def _apply_ball_speed_decay(self, scale: float = 1.0) -> None:
         """Aplikuje separátní decay pro X a Y osu + zajišťuje rychlostní cap.
 
         Preferuje specifické BALL_SPEED_DECAY_X/Y pokud jsou v (0,1), jinak
         použije globální BALL_SPEED_DECAY. Po decayi aplikuje BALL_SPEED_MAX cap.
+
+        Args:
+            scale: Délka kroku v referenčních ticích (decay se umocní)
         """
         decay_x = settings.BALL_SPEED_DECAY_X if 0 < settings.BALL_SPEED_DECAY_X < 1 else settings.BALL_SPEED_DECAY
         decay_y = settings.BALL_SPEED_DECAY_Y if 0 < settings.BALL_SPEED_DECAY_Y < 1 else settings.BALL_SPEED_DECAY
 
         if 0 < decay_x < 1:
-            self.ball.vx *= decay_x
+            self.ball.vx *= decay_x ** scale
         if 0 < decay_y < 1:
-            self.ball.vy *= decay_y
+            self.ball.vy *= decay_y ** scale
 
         if settings.BALL_SPEED_MAX > 0:
             if abs(self.ball.vx) > settings.BALL_SPEED_MAX:
@@ -373,7 +655,7 @@ class MultipongEngine:
             if abs(self.ball.vy) > settings.BALL_SPEED_MAX:
                 self.ball.vy = settings.BALL_SPEED_MAX if self.ball.vy > 0 else -settings.BALL_SPEED_MAX
     
-    def update_paddles(self, inputs: Dict[str, Dict[str, bool]]) -> None:
+    def update_paddles(self, inputs: Mapping[str, Mapping[str, bool]]) -> None:
         """
         Aktualizuje pozice pálek podle vstupů.
         
@@ -418,6 +700,9 @@ class MultipongEngine:
     def score_goal(self, scoring_team: str) -> None:
         """
         Zaznamená gól pro daný tým (používá Team.add_score).
+
+        Nejde o gól ze simulace – GoalScored emituje jen ``_handle_goal``,
+        takže ruční úprava skóre nespouští RL odměny ani replay.
         
         Args:
             scoring_team: Tým, který dal gól ("A" nebo "B")
@@ -428,6 +713,7 @@ class MultipongEngine:
         elif scoring_team == "B":
             self.team_right.add_score()
             self.score["B"] = self.team_right.score  # Zpětná kompatibilita
+        self.stats_version += 1
         
         self.reset_ball()
 
@@ -471,8 +757,8 @@ class MultipongEngine:
 
         Pauza: míček se zastaví uprostřed na 1s (konfigurovatelné)
         poté se znovu uvede do hry se stejným směrem vy (vx invertovaný).
+        Délka pauzy se měří v simulačních ticích, ne reálným časem.
         """
-        import time
         # Zvýšení skóre
         if scoring_team == "A":
             self.team_left.add_score()
@@ -484,29 +770,11 @@ class MultipongEngine:
             defending_team = self.team_left
         else:
             defending_team = None
+        self.stats_version += 1
 
-        # RL reward: penalizovat obranu za obdržený gól
-        if defending_team:
-            for paddle in defending_team.paddles:
-                if hasattr(paddle, "ai") and paddle.ai is not None:
-                    from multipong.ai import QLearningAI
-                    if isinstance(paddle.ai, QLearningAI):
-                        paddle.ai.give_reward(paddle, self.ball, reward=-3.0)
-
-        # RL reward: odměnit útok za vstřelený gól
-        if scoring_team == "A":
-            attacking_team = self.team_left
-        elif scoring_team == "B":
-            attacking_team = self.team_right
-        else:
-            attacking_team = None
-
-        if attacking_team:
-            for paddle in attacking_team.paddles:
-                if hasattr(paddle, "ai") and paddle.ai is not None:
-                    from multipong.ai import QLearningAI
-                    if isinstance(paddle.ai, QLearningAI):
-                        paddle.ai.give_reward(paddle, self.ball, reward=5.0)
+        # Událost gólu (RL odměny, telemetrie, replay) – míček ještě v brance
+        if defending_team is not None and self.events.listening(GoalScored):
+            self._emit_goal_scored(scoring_team, defending_team.name)
 
         # Ulož poslední směr pro budoucí invertaci
         self._last_ball_vx = self.ball.vx if self.ball.vx != 0 else self._last_ball_vx
@@ -520,7 +788,9 @@ class MultipongEngine:
         self.ball.vy = 0
 
         # Nastav pauzu
-        self.goal_pause_until = time.monotonic() + settings.GOAL_PAUSE_SECONDS
+        self.goal_pause_until = self.sim_tick + round(
+            settings.GOAL_PAUSE_SECONDS * settings.PHYSICS_REFERENCE_RATE
+        )
         self._pending_ball_reset = True
         # Reset výměny
         self.rally_hits = 0
@@ -531,18 +801,74 @@ class MultipongEngine:
         # Invertuj původní směr vx (jako _reset_ball) a obnov vy
         self.ball.vx = -self._last_ball_vx
         self.ball.vy = self._last_ball_vy
+        if self.events.listening(ServeStarted):
+            self.events.emit(ServeStarted(self.sim_tick, self.ball.vx, self.ball.vy))
+
+    # ------------------------------------------------------------------
+    # Emitování událostí (volá se jen pokud na typ někdo poslouchá)
+    # ------------------------------------------------------------------
+    def _emit_wall_bounce(self, wall: str) -> None:
+        """Emituje WallBounce pro stěnu ("top", "bottom", "back_left", "back_right")."""
+        self.events.emit(WallBounce(self.sim_tick, wall, self.ball.x, self.ball.y))
+
+    def _emit_goal_scored(self, scoring_team: str, conceding_team: str) -> None:
+        """Emituje GoalScored s aktuálním skóre a pozicí míčku."""
+        self.events.emit(GoalScored(
+            self.sim_tick, scoring_team, conceding_team,
+            self.score["A"], self.score["B"], self.ball.x, self.ball.y,
+        ))
 
     def get_goal_pause_remaining(self) -> float:
-        """Vrátí zbývající čas pauzy po gólu (sekundy)."""
+        """Vrátí zbývající čas pauzy po gólu (sekundy simulačního času)."""
         if self.goal_pause_until is None:
             return 0.0
-        import time
-        return max(0.0, self.goal_pause_until - time.monotonic())
+        remaining_ticks = self.goal_pause_until - self.sim_tick
+        return max(0.0, remaining_ticks / settings.PHYSICS_REFERENCE_RATE)
+
+    def simulate(
+        self,
+        n_ticks: int,
+        input_source: Union[None, InputMap, Callable[["MultipongEngine", int], InputMap], Iterable[InputMap]] = None,
+        dt: Optional[float] = None,
+    ) -> Dict:
+        """Headless běh enginu na plnou rychlost CPU (bez čekání na reálný čas).
+
+        Engine nepoužívá hodiny reálného času, takže výsledek je pro stejné
+        vstupy deterministický – vhodné pro vyhodnocení AI, regresní testy
+        a přehrávání záznamů.
+
+        Args:
+            n_ticks: Počet kroků simulace
+            input_source: Zdroj vstupů pro každý tick:
+                - None: žádné vstupy
+                - dict: stejné vstupy v každém ticku
+                - callable(engine, tick_index) -> dict: dynamické vstupy (AI, skripty)
+                - iterable dictů: záznam vstupů (replay); po vyčerpání prázdné vstupy
+            dt: Délka kroku v sekundách (None = referenční tick)
+
+        Returns:
+            Stav hry po posledním ticku (``get_state``)
+        """
+        if input_source is None or isinstance(input_source, dict):
+            static_inputs = input_source or {}
+            next_inputs = lambda _i: static_inputs  # noqa: E731
+        elif callable(input_source):
+            next_inputs = lambda i: input_source(self, i)  # noqa: E731
+        else:
+            recorded = iter(input_source)
+            next_inputs = lambda _i: next(recorded, {})  # noqa: E731
+
+        for i in range(max(0, int(n_ticks))):
+            self.update(next_inputs(i), dt=dt)
+
+        return self.get_state()
     
     def start(self) -> None:
         """Spustí hru."""
         self.is_running = True
         self.reset_ball()
+        if self.events.listening(ServeStarted):
+            self.events.emit(ServeStarted(self.sim_tick, self.ball.vx, self.ball.vy))
     
     def stop(self) -> None:
         """Zastaví hru."""
@@ -558,6 +884,7 @@ class MultipongEngine:
         # Reset statistik všech hráčů
         for paddle in self.team_left.paddles + self.team_right.paddles:
             paddle.stats.reset()
+        self.stats_version += 1
         
         # Reset míčku
         self.reset_ball()
@@ -598,6 +925,88 @@ class MultipongEngine:
             "goal_pause_remaining": self.get_goal_pause_remaining(),
             "rally_hits": self.rally_hits,
         }
+
+    def get_static_state(self) -> Dict:
+        """
+        Vrátí neměnnou konfiguraci zápasu (posílá se jednou za spojení).
+
+        Obsahuje rozměry arény, branky, poloměr míčku, omezení pohybu pálek
+        a pro každou pálku její x, rozměry, rychlost, zónu a AI (klient
+        z nich předpovídá pohyb vlastní pálky). Pořadí pálek v ``team_left/team_right``
+        určuje pořadí hodnot v ``get_dynamic_state()["paddles"]``.
+
+        Returns:
+            Slovník se statickou konfigurací zápasu
+        """
+        def team_config(team: Team) -> Dict:
+            return {
+                "name": team.name,
+                "paddles": [
+                    {
+                        "player_id": p.player_id,
+                        "x": p.x,
+                        "width": p.width,
+                        "height": p.height,
+                        "speed": p.speed,
+                        "zone_top": p.zone_top,
+                        "zone_bottom": p.zone_bottom,
+                        "ai_class_name": p.ai.__class__.__name__ if p.ai else None,
+                    }
+                    for p in team.paddles
+                ],
+            }
+
+        return {
+            "arena": self.arena.to_dict(),
+            "goal_left": self.goal_left.to_dict(),
+            "goal_right": self.goal_right.to_dict(),
+            "ball_radius": self.ball.radius,
+            "paddles_unrestricted": settings.PADDLES_UNRESTRICTED_Y,
+            "team_left": team_config(self.team_left),
+            "team_right": team_config(self.team_right),
+        }
+
+    def get_stats_state(self) -> Dict[str, List[int]]:
+        """
+        Vrátí statistiky hráčů v kompaktní podobě.
+
+        Returns:
+            Slovník {player_id: [hits, goals_scored, goals_received]}
+        """
+        return {
+            p.player_id: [p.stats.hits, p.stats.goals_scored, p.stats.goals_received]
+            for p in self.team_left.paddles + self.team_right.paddles
+        }
+
+    def get_dynamic_state(self, stats_version: Optional[int] = None) -> Dict:
+        """
+        Vrátí jen proměnlivou část stavu (posílá se každý tick).
+
+        Pálky jsou seznam y v pořadí ``team_left`` a pak ``team_right``
+        (viz ``get_static_state``). Statistiky se přidají jen pokud se
+        od ``stats_version`` změnily.
+
+        Args:
+            stats_version: Verze statistik, kterou už příjemce má
+                           (None = statistiky přiložit vždy)
+
+        Returns:
+            Slovník s dynamickým stavem hry
+        """
+        ball = self.ball
+        state = {
+            "ball": [ball.x, ball.y, ball.vx, ball.vy],
+            "paddles": [p.y for p in self.team_left.paddles] + [p.y for p in self.team_right.paddles],
+            "score": [self.score["A"], self.score["B"]],
+            "time_left": self.time_left,
+            "is_running": self.is_running,
+            "goal_pause_remaining": self.get_goal_pause_remaining(),
+            "rally_hits": self.rally_hits,
+            "stats_version": self.stats_version,
+        }
+        if stats_version != self.stats_version:
+            state["stats"] = self.get_stats_state()
+        return state
     
     def add_paddle(self, player_id: str, team: str, position: int) -> None:
         """
@@ -3,7 +3,9 @@
 Definuje oblast, přes kterou když míček proletí, je to gól.
 """
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
+
+from .collision import sweep_line
 
 if TYPE_CHECKING:
     from .ball import Ball
@@ -18,6 +20,8 @@ class GoalZone:
         bottom: Dolní hranice branky (Y)
     """
 
+    __slots__ = ("x", "top", "bottom")
+
     def __init__(self, x: float, top: float, bottom: float) -> None:
         """Inicializace branky.
         
@@ -48,6 +52,32 @@ class GoalZone:
                 return self.top <= ball.y <= self.bottom
         return False
 
+    def contains_y(self, y: float) -> bool:
+        """Vrátí True, pokud Y souřadnice leží v ústí branky."""
+        return self.top <= y <= self.bottom
+
+    def sweep(self, ball: "Ball", t_max: float = 1.0) -> Optional[float]:
+        """Spojitá detekce – čas, kdy míček dosáhne brankové čáry.
+
+        Brankovou čárou se rozumí zadní stěna na x branky (míček se jí dotkne
+        okrajem). Zda jde o gól nebo odraz, rozhodne volající přes
+        ``contains_y`` v okamžiku dopadu.
+
+        Args:
+            ball: Instance míčku
+            t_max: Délka sledovaného intervalu (v jednotkách rychlosti míčku)
+
+        Returns:
+            Čas dopadu v intervalu <0, t_max> nebo None
+        """
+        if self.x == 0:  # Levá branka – míček musí letět doleva
+            if ball.vx >= 0:
+                return None
+            return sweep_line(ball.x, ball.vx, self.x + ball.radius, t_max)
+        if ball.vx <= 0:  # Pravá branka – míček musí letět doprava
+            return None
+        return sweep_line(ball.x, ball.vx, self.x - ball.radius, t_max)
+
     def to_dict(self) -> dict:
         """Serializace branky do slovníku."""
         return {
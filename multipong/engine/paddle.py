@@ -4,6 +4,7 @@ Logická reprezentace pálky - nezávislá na Pygame.
 """
 
 from typing import Dict, Optional, TYPE_CHECKING
+from multipong import settings
 from .player_stats import PlayerStats
 
 if TYPE_CHECKING:  # typové importy pouze pro lint/IDE
@@ -19,12 +20,28 @@ class Paddle:
         y: Y souřadnice pozice
         width: Šířka pálky
         height: Výška pálky
-        speed: Rychlost pohybu pálky
+        speed: Rychlost pohybu pálky (px za referenční tick)
         player_id: ID hráče/slotu (např. "A1", "B2")
         zone_top: Horní hranice povolené zóny pohybu (None = bez omezení)
         zone_bottom: Dolní hranice povolené zóny pohybu (None = bez omezení)
         stats: Statistiky hráče (PlayerStats instance)
+        ai: Volitelný AI ovladač pálky
+        stretch_scale: Aktuální měřítko stretch efektu (1.0 = bez efektu)
     """
+
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "speed",
+        "player_id",
+        "zone_top",
+        "zone_bottom",
+        "stats",
+        "ai",
+        "stretch_scale",
+    )
     
     def __init__(
         self, 
@@ -63,22 +80,27 @@ class Paddle:
         self.zone_bottom = zone_bottom
         self.stats = stats if stats is not None else PlayerStats(player_id)
         self.ai = ai
-        # Animace po zásahu (stretch efekt) – parametry z konfigurace
-        from multipong import settings  # lokální import kvůli izolaci
+        # Animace po zásahu (stretch efekt) – parametry se čtou z konfigurace
+        # až při použití, pálka si drží jen aktuální měřítko
         self.stretch_scale: float = 1.0
-        self._stretch_decay: float = settings.PADDLE_STRETCH_DECAY  # faktor poklesu za frame
-        self._stretch_target: float = 1.0
-        self._stretch_hit_factor: float = settings.PADDLE_HIT_STRETCH
     
-    def move_up(self) -> None:
-        """Posune pálku nahoru o konstantní rychlost."""
-        self.y -= self.speed
+    def move_up(self, scale: float = 1.0) -> None:
+        """Posune pálku nahoru o konstantní rychlost.
+
+        Args:
+            scale: Délka kroku v referenčních ticích (1.0 = jeden tick)
+        """
+        self.y -= self.speed * scale
 
-    def move_down(self) -> None:
-        """Posune pálku dolů o konstantní rychlost."""
-        self.y += self.speed
+    def move_down(self, scale: float = 1.0) -> None:
+        """Posune pálku dolů o konstantní rychlost.
+
+        Args:
+            scale: Délka kroku v referenčních ticích (1.0 = jeden tick)
+        """
+        self.y += self.speed * scale
 
-    def update(self, arena_height: int = 600, unrestricted: bool = True) -> None:
+    def update(self, arena_height: int = 600, unrestricted: bool = True, scale: float = 1.0) -> None:
         """
         Aktualizace pálky – nyní vždy umožňuje pohyb v celé výšce arény
         (požadavek: neomezený pohyb v ose Y), přesto zachovává původní
@@ -86,6 +108,8 @@ class Paddle:
 
         Args:
             arena_height: Výška arény
+            unrestricted: Ignorovat zóny a povolit celou výšku arény
+            scale: Délka kroku v referenčních ticích (pro decay stretch efektu)
         """
         if unrestricted:
             # Ignoruj zóny – plný rozsah 0 .. arena_height
@@ -96,16 +120,16 @@ class Paddle:
             bottom_limit = self.zone_bottom if self.zone_bottom is not None else arena_height
             self.clamp_to_arena(bottom_limit, top_limit)
 
-        # Decay stretch efektu
+        # Decay stretch efektu (PADDLE_STRETCH_DECAY = faktor poklesu za tick)
         if self.stretch_scale > 1.001:
-            self.stretch_scale = (self.stretch_scale - 1.0) * self._stretch_decay + 1.0
+            decay = settings.PADDLE_STRETCH_DECAY ** scale
+            self.stretch_scale = (self.stretch_scale - 1.0) * decay + 1.0
         else:
             self.stretch_scale = 1.0
 
     def apply_hit_effect(self) -> None:
         """Aktivuje krátký stretch efekt při zásahu míčku podle konfigurace."""
-        self.stretch_scale = self._stretch_hit_factor
-        self._stretch_target = 1.0
+        self.stretch_scale = settings.PADDLE_HIT_STRETCH
 
     def clamp_to_arena(self, arena_height: int, arena_top: int = 0) -> None:
         """Zabrání pálce opustit arénu nebo zónu.
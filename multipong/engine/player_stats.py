@@ -12,6 +12,8 @@ from typing import Dict
 class PlayerStats:
     """Statistiky jednoho hráče (pálky)."""
 
+    __slots__ = ("player_id", "hits", "goals_scored", "goals_received")
+
     def __init__(self, player_id: str) -> None:
         """Inicializace statistik.
         
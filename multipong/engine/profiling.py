@@ -0,0 +1,161 @@
+"""Profilování fází ticku s histogramy o pevných košících.
+
+``PhaseProfiler`` sbírá doby trvání jednotlivých fází ticku (AI/pálky,
+pohyb míčku, stěny/branky, kolize s pálkami, sestavení snapshotu,
+broadcast) do histogramů s pevnými hranicemi košů. Záznam je O(log košů)
+bez alokací, takže je použitelný i v produkci; výsledky lze číst
+programově přes ``to_dict()``.
+
+Profiler je volitelný – engine i GameLoop bez něj měří nic.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Názvy fází (klíče histogramů)
+PHASE_PADDLES = "paddles"                  # AI rozhodnutí + pohyb pálek
+PHASE_BALL = "ball"                        # integrace míčku (+ útlum rychlosti)
+PHASE_WALLS_GOALS = "walls_goals"          # zadní stěny a kontrola gólů
+PHASE_PADDLE_COLLISION = "paddle_collision"
+PHASE_SNAPSHOT = "snapshot"                # sestavení stavu pro klienty
+PHASE_BROADCAST = "broadcast"              # WebSocketManager.broadcast
+PHASE_TICK = "tick"                        # celý průchod game loopu
+
+ENGINE_PHASES = (PHASE_PADDLES, PHASE_BALL, PHASE_WALLS_GOALS, PHASE_PADDLE_COLLISION)
+
+# Horní hranice košů v sekundách (1 µs … 100 ms); poslední koš je +inf
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    1e-6, 2e-6, 5e-6,
+    1e-5, 2e-5, 5e-5,
+    1e-4, 2e-4, 5e-4,
+    1e-3, 2e-3, 5e-3,
+    1e-2, 2e-2, 5e-2,
+    1e-1,
+)
+
+
+class Histogram:
+    """Histogram dob trvání s pevnými hranicemi košů."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Args:
+            bounds: Vzestupné horní hranice košů v sekundách
+        """
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Zaznamená jeden vzorek."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """
+        Odhad percentilu podle košů (horní hranice koše, max pro poslední).
+
+        Args:
+            q: Percentil v intervalu <0, 100>
+
+        Returns:
+            Odhad doby v sekundách (0.0 bez vzorků)
+        """
+        if not self.count:
+            return 0.0
+        target = q / 100.0 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Průměrná doba vzorku v sekundách."""
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        """Vynuluje všechny koše."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_dict(self) -> Dict:
+        """Serializace histogramu (sekundy)."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": [
+                [bound, count] for bound, count in zip(self.bounds + (float("inf"),), self.counts)
+            ],
+        }
+
+
+class PhaseProfiler:
+    """Histogramy dob trvání fází ticku pro jednu místnost.
+
+    Attributes:
+        histograms: Slovník {fáze: Histogram}
+        last: Poslední naměřená doba každé fáze (pro diagnostiku přetížení)
+    """
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.histograms: Dict[str, Histogram] = {}
+        self.last: Dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Zaznamená dobu trvání fáze."""
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram(self.bounds)
+        histogram.record(seconds)
+        self.last[phase] = seconds
+
+    def get(self, phase: str) -> Optional[Histogram]:
+        """Vrátí histogram fáze nebo None, pokud nebyla měřena."""
+        return self.histograms.get(phase)
+
+    def slowest_last(self, exclude: Iterable[str] = (PHASE_TICK,)) -> Optional[Tuple[str, float]]:
+        """
+        Vrátí nejpomalejší fázi posledního měření.
+
+        Returns:
+            (fáze, sekundy) nebo None pokud zatím nic neměřeno
+        """
+        excluded = set(exclude)
+        candidates = [(t, p) for p, t in self.last.items() if p not in excluded]
+        if not candidates:
+            return None
+        seconds, phase = max(candidates)
+        return phase, seconds
+
+    def reset(self) -> None:
+        """Vynuluje všechny histogramy."""
+        self.histograms.clear()
+        self.last.clear()
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Serializace všech histogramů {fáze: histogram}."""
+        return {phase: h.to_dict() for phase, h in self.histograms.items()}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{p}={h.mean * 1e6:.1f}µs" for p, h in self.histograms.items()
+        )
+        return f"PhaseProfiler({phases})"
@@ -16,6 +16,8 @@ class Team:
         score: Celkové skóre týmu
     """
 
+    __slots__ = ("name", "paddles", "score")
+
     def __init__(self, name: str, paddles: List[Paddle]) -> None:
         """Inicializace týmu.
         
@@ -27,6 +27,7 @@ except Exception:  # pragma: no cover
 
 from multipong import settings
 from multipong.network.client.ws_client import WSClient
+from multipong.network.lobby_diff import LOBBY_SYNC, apply_lobby_update
 from multipong.network.client.state_buffer import StateBuffer
 from multipong.ui.renderer import Renderer
 from multipong.client.ui.menu import MenuUI, LobbyUI, CountdownUI, GameState
@@ -68,6 +69,9 @@ async def run_client(player_id: str = "auto", url: str = "ws://localhost:8000/ws
     # Snapshot debug counter
     snapshot_count = 0
     
+    # Žádost o plný stav lobby odeslána (čekáme na něj, diffy zatím zahazujeme)
+    lobby_sync_requested = False
+    
     # WebSocket client (initially None)
     client: Optional[WSClient] = None
 
@@ -161,12 +165,19 @@ async def run_client(player_id: str = "auto", url: str = "ws://localhost:8000/ws
                 latency_ms = (asyncio.get_event_loop().time() - sent_time) * 1000
         
         def on_message(msg: dict) -> None:
-            nonlocal game_state, countdown_start_time
+            nonlocal game_state, countdown_start_time, lobby_sync_requested
             msg_type = msg.get("type")
             
             if msg_type == "lobby_update":
-                # Update lobby UI
-                lobby_ui.update_lobby_state(msg)
+                # Plný stav nebo diff proti naší verzi; při výpadku verze plný stav
+                state = apply_lobby_update(lobby_ui.lobby_state, msg)
+                if state is None:
+                    if client and not lobby_sync_requested:
+                        lobby_sync_requested = True
+                        asyncio.create_task(client.send_message({"type": LOBBY_SYNC}))
+                else:
+                    lobby_sync_requested = False
+                    lobby_ui.update_lobby_state(state)
             
             elif msg_type == "start_match":
                 # Start countdown
@@ -228,7 +239,8 @@ async def run_client(player_id: str = "auto", url: str = "ws://localhost:8000/ws
     frame_interval = 1.0 / settings.DEFAULT_FPS
     last_ping = 0.0
     last_input_send = 0.0
-    input_send_interval = 1.0 / 20.0  # Limit input sends to ~20 Hz
+    last_input_state = (False, False)
+    input_send_interval = 1.0 / 20.0  # Beze změny vstupu nejvýše ~20 Hz
 
     try:
         while running:
@@ -269,11 +281,14 @@ async def run_client(player_id: str = "auto", url: str = "ws://localhost:8000/ws
                 up = bool(keys[pygame.K_UP] or keys[pygame.K_w])
                 down = bool(keys[pygame.K_DOWN] or keys[pygame.K_s])
 
-                # Odeslat vstupy
+                # Odeslat vstupy – změnu hned (pálka se podle ní předpovídá),
+                # jinak jen občas jako potvrzení stavu
                 now = asyncio.get_event_loop().time()
-                if client and client.is_connected() and (now - last_input_send) > input_send_interval:
+                changed = (up, down) != last_input_state
+                if client and client.is_connected() and (changed or (now - last_input_send) > input_send_interval):
                     asyncio.create_task(client.send_input(up=up, down=down))
                     last_input_send = now
+                    last_input_state = (up, down)
                 elif client and not client.is_connected():
                     # Reconnection attempt
                     recon_ok = await client.connect()
@@ -304,8 +319,12 @@ async def run_client(player_id: str = "auto", url: str = "ws://localhost:8000/ws
                     countdown_ui.draw(screen, countdown_value)
             
             elif game_state == GameState.GAME:
-                # Interpolovaný stav – fallback na latest
-                interp = buffer.get_interpolated() or buffer.get_latest()
+                # Interpolovaný stav (o jeden interval snapshotů zpět) – fallback na latest
+                render_delay = client.render_delay if client else 0.0
+                interp = buffer.get_interpolated(render_delay) or buffer.get_latest()
+                if interp and client:
+                    # Vlastní pálka v aktuálním kroku (predikce), ostatní s render_delay
+                    interp = client.predict(interp)
                 if interp:
                     renderer.draw(interp)
                     
@@ -7,8 +7,10 @@ __version__ = "0.5.0"
 
 from .ws_client import WSClient
 from .state_buffer import StateBuffer
+from .snapshot_assembler import SnapshotAssembler
 
 __all__ = [
 	"WSClient",
 	"StateBuffer",
+	"SnapshotAssembler",
 ]
@@ -0,0 +1,256 @@
+"""
+PaddlePredictor - predikce vlastní pálky na klientu a srovnání se serverem.
+
+Bez predikce se vlastní pálka pohne až po návratu snapshotu (celé RTT).
+Predictor proto pálku posouvá hned, stejnými pravidly jako engine
+(``Paddle.move_up`` / ``move_down`` a ``Paddle.update`` s ořezem na
+arénu nebo zónu), v krocích simulace serveru (``sim_rate``):
+
+- každý odeslaný vstupní rámec (``seq``, ``tick``) se zapamatuje; vstup
+  platí od svého ``tick`` až do dalšího rámce (stejně jako na serveru),
+- snapshot vrací pro hráče ``input_acks`` ``[seq, tick]`` – poslední
+  aplikovaný rámec a krok klienta, kterému odpovídá stav pálky na serveru,
+- při srovnání (``reconcile``) se pálka vrátí na pozici ze serveru,
+  potvrzené rámce se zahodí a nepotvrzené se přehrají od ``tick`` po
+  aktuální krok.
+
+Odchylka předpovědi od serveru (``last_error``) je nulová, pokud server
+aplikoval vstupy ve stejných krocích jako klient; jinak ji srovnání
+opraví skokem (ve vzdálenosti jednotek px).
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from multipong import settings
+from multipong.engine.paddle import Paddle
+
+
+class PaddlePredictor:
+    """
+    Predikce pozice jedné (vlastní) pálky.
+
+    Attributes:
+        player_id: ID předpovídané pálky (None = neaktivní)
+        sim_rate: Frekvence simulace serveru (Hz)
+        paddle: Lokální kopie pálky (None dokud nepřišla konfigurace)
+        tick: Další krok klienta k simulaci (pálka obsahuje kroky < tick)
+        acked_seq: Číslo posledního potvrzeného rámce
+        last_error: Odchylka předpovědi při posledním srovnání (px)
+    """
+
+    def __init__(self, sim_rate: Optional[int] = None):
+        """
+        Args:
+            sim_rate: Frekvence simulace serveru v Hz (None = SERVER_SIM_RATE)
+        """
+        self.player_id: Optional[str] = None
+        self.sim_rate = sim_rate or settings.SERVER_SIM_RATE
+        self.paddle: Optional[Paddle] = None
+        self.tick = 0
+        self.acked_seq: Optional[int] = None
+        self.last_error = 0.0
+        self._synced = False
+        self._arena_height = settings.WINDOW_HEIGHT
+        self._unrestricted = settings.PADDLES_UNRESTRICTED_Y
+        self._base_input: Tuple[bool, bool] = (False, False)
+        self._pending: Deque[Tuple[int, int, bool, bool]] = deque()  # (seq, tick, up, down)
+
+    @property
+    def active(self) -> bool:
+        """True pokud predictor zná pálku a může předpovídat."""
+        return self.paddle is not None
+
+    def configure(self, config: Dict[str, Any], player_id: str, sim_rate: Optional[int] = None) -> None:
+        """
+        Připraví lokální pálku podle konfigurace zápasu (``match_config``).
+
+        Pálky řízené AI serveru se nepředpovídají.
+
+        Args:
+            config: Statická konfigurace zápasu
+            player_id: ID vlastní pálky (přidělený slot)
+            sim_rate: Frekvence simulace serveru (None = ponechat)
+        """
+        if sim_rate:
+            self.sim_rate = sim_rate
+        self.player_id = player_id
+        self.paddle = None
+        self._arena_height = config.get("arena", {}).get("height", self._arena_height)
+        self._unrestricted = config.get("paddles_unrestricted", self._unrestricted)
+        for team_key in ("team_left", "team_right"):
+            for paddle_config in config.get(team_key, {}).get("paddles", ()):
+                if paddle_config.get("player_id") != player_id or paddle_config.get("ai_class_name"):
+                    continue
+                self.paddle = Paddle(
+                    x=paddle_config["x"],
+                    y=0.0,
+                    width=paddle_config["width"],
+                    height=paddle_config["height"],
+                    speed=paddle_config.get("speed", 5.0),
+                    player_id=player_id,
+                    zone_top=paddle_config.get("zone_top"),
+                    zone_bottom=paddle_config.get("zone_bottom"),
+                )
+        self._synced = False
+
+    def reset(self) -> None:
+        """Zapomene pálku i nepotvrzené vstupy (např. po odpojení)."""
+        self.player_id = None
+        self.paddle = None
+        self.tick = 0
+        self.acked_seq = None
+        self.last_error = 0.0
+        self._synced = False
+        self._base_input = (False, False)
+        self._pending.clear()
+
+    def record_input(self, seq: int, tick: int, up: bool, down: bool) -> None:
+        """
+        Zapamatuje odeslaný vstupní rámec (pálku předtím posune před jeho krok).
+
+        Args:
+            seq: Číslo rámce
+            tick: Krok klienta, od kterého vstup platí
+            up: Stav tlačítka nahoru
+            down: Stav tlačítka dolů
+        """
+        self.predict(tick)
+        self._pending.append((seq, tick, up, down))
+
+    def predict(self, tick: int) -> Optional[float]:
+        """
+        Nasimuluje pálku před krok ``tick`` a vrátí její předpovězené y.
+
+        Args:
+            tick: Aktuální krok klienta (jeho vstup se projeví v dalším kroku)
+
+        Returns:
+            Předpovězená y souřadnice (None pokud predictor není aktivní
+            nebo ještě nepřišel první snapshot)
+        """
+        if self.paddle is None or not self._synced:
+            return None
+        if tick > self.tick:
+            self._replay(self.tick, tick)
+            self.tick = tick
+        return self.paddle.y
+
+    def reconcile(self, y: float, ack: Optional[list], tick: int) -> None:
+        """
+        Srovná předpověď s autoritativním snapshotem.
+
+        Args:
+            y: Pozice pálky ve snapshotu serveru
+            ack: ``input_acks`` pro tuto pálku – ``[seq, tick]`` (None = server
+                 zatím žádný rámec neaplikoval)
+            tick: Aktuální krok klienta
+        """
+        paddle = self.paddle
+        if paddle is None:
+            return
+        if not self._synced:
+            # První snapshot – výchozí pozice (vstupy ještě nemusely být odeslány)
+            paddle.y = y
+            self.tick = tick
+            self._synced = True
+            if ack is None:
+                return
+
+        if ack is None:
+            if not self._pending:
+                # Bez vstupů platí pozice ze serveru
+                self.last_error = abs(paddle.y - y)
+                paddle.y = y
+            return
+
+        ack_seq, ack_tick = ack
+        if self.acked_seq is not None and ack_seq < self.acked_seq:
+            return  # starší snapshot (přeuspořádání)
+        pending = self._pending
+        while pending and pending[0][0] <= ack_seq:
+            _seq, _tick, up, down = pending.popleft()
+            self._base_input = (up, down)
+        self.acked_seq = ack_seq
+
+        self.predict(tick)
+        predicted = paddle.y
+        paddle.y = y
+        if ack_tick is not None:
+            # Stav serveru obsahuje kroky klienta <= ack_tick
+            if ack_tick + 1 < self.tick:
+                self._replay(ack_tick + 1, self.tick)
+            else:
+                self.tick = ack_tick + 1  # server je napřed (hodiny klienta se opozdily)
+        self.last_error = abs(paddle.y - predicted)
+
+    def apply(self, state: Dict[str, Any], tick: int) -> Dict[str, Any]:
+        """
+        Dosadí předpovězenou pozici vlastní pálky do stavu pro vykreslení.
+
+        Args:
+            state: Stav hry (plný nebo interpolovaný ze StateBufferu)
+            tick: Aktuální krok klienta
+
+        Returns:
+            Kopie stavu s předpovězeným y vlastní pálky (beze změny, pokud
+            predictor není aktivní)
+        """
+        y = self.predict(tick)
+        if y is None:
+            return state
+        player_id = self.player_id
+        state = dict(state)
+        paddles = state.get("paddles")
+        if isinstance(paddles, dict) and player_id in paddles:
+            state["paddles"] = {**paddles, player_id: {**paddles[player_id], "y": y}}
+        for team_key in ("team_left", "team_right"):
+            team = state.get(team_key)
+            if not team:
+                continue
+            team_paddles = team.get("paddles", [])
+            for index, paddle in enumerate(team_paddles):
+                if paddle.get("player_id") == player_id:
+                    team_paddles = list(team_paddles)
+                    team_paddles[index] = {**paddle, "y": y}
+                    state[team_key] = {**team, "paddles": team_paddles}
+                    break
+        return state
+
+    def _replay(self, start_tick: int, end_tick: int) -> None:
+        """
+        Nasimuluje kroky ``start_tick`` … ``end_tick - 1`` podle vstupů.
+
+        Vstup v kroku t je poslední rámec s ``tick <= t`` (před nepotvrzenými
+        rámci vstup posledního potvrzeného).
+        """
+        up, down = self._base_input
+        t = start_tick
+        for _seq, frame_tick, frame_up, frame_down in self._pending:
+            if frame_tick >= end_tick:
+                break
+            if frame_tick > t:
+                self._move(up, down, frame_tick - t)
+                t = frame_tick
+            up, down = frame_up, frame_down
+        self._move(up, down, end_tick - t)
+
+    def _move(self, up: bool, down: bool, steps: int) -> None:
+        """Provede ``steps`` kroků simulace pálky se stejnými pravidly jako engine."""
+        paddle = self.paddle
+        if paddle is None or steps <= 0 or not (up or down):
+            return
+        scale = settings.PHYSICS_REFERENCE_RATE / self.sim_rate
+        for _ in range(steps):
+            if up:
+                paddle.move_up(scale)
+            else:
+                paddle.move_down(scale)
+            paddle.update(self._arena_height, unrestricted=self._unrestricted, scale=scale)
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"PaddlePredictor(player_id={self.player_id}, tick={self.tick}, "
+            f"pending={len(self._pending)}, last_error={self.last_error:.2f})"
+        )
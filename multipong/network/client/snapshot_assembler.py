@@ -0,0 +1,225 @@
+"""
+SnapshotAssembler - skládání plného stavu hry z inkrementálních snapshotů.
+
+Server posílá statickou konfiguraci zápasu jednou (``match_config``)
+a pak jen dynamické snapshoty (viz ``SnapshotBuilder``). Assembler z nich
+skládá stav ve stejném tvaru jako ``MultipongEngine.get_state()``, takže
+StateBuffer i Renderer zůstávají beze změny.
+
+Delta snapshoty (klíč ``baseline``) se nejdřív doplní z historie
+posledních plných snapshotů podle ``seq`` (``apply_delta``); do
+StateBufferu tak vždy jde plný stav. Chybí-li baseline v historii,
+assembler nastaví ``needs_resync`` a klient si vyžádá keyframe.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from multipong.network.snapshot_codec import apply_delta
+
+
+logger = logging.getLogger(__name__)
+
+# Kolik posledních plných snapshotů se drží jako baseline pro delta snapshoty
+DEFAULT_HISTORY_SIZE = 128
+
+
+class SnapshotAssembler:
+    """
+    Uchovává statickou konfiguraci a poslední statistiky, rozbaluje snapshoty.
+
+    Attributes:
+        config: Statická konfigurace zápasu (None dokud nepřišla)
+        stats: Poslední statistiky {player_id: [hits, goals_scored, goals_received]}
+        stats_version: Verze posledních statistik
+        last_seq: Číslo posledního složeného snapshotu (None = žádný)
+        needs_resync: Přišla delta, jejíž baseline v historii chybí
+    """
+
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        """
+        Inicializace assembleru bez konfigurace.
+
+        Args:
+            history_size: Počet plných snapshotů držených jako baseline
+        """
+        self.config: Optional[Dict[str, Any]] = None
+        self.stats: Dict[str, List[int]] = {}
+        self.stats_version: Optional[int] = None
+        self.history_size = history_size
+        self.last_seq: Optional[int] = None
+        self.needs_resync = False
+        self._history: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+    def set_config(self, config: Dict[str, Any]) -> None:
+        """
+        Uloží statickou konfiguraci (z handshake nebo ze snapshotu).
+
+        Args:
+            config: Obsah ``match_config`` (může obsahovat i ``stats``)
+        """
+        config = dict(config)
+        config.pop("type", None)
+        stats = config.pop("stats", None)
+        stats_version = config.pop("stats_version", None)
+        self.config = config
+        if stats is not None:
+            self.stats = stats
+            self.stats_version = stats_version
+
+    def apply(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Zpracuje snapshot zprávu a vrátí plný stav hry.
+
+        Args:
+            message: Snapshot od serveru (plný nebo delta)
+
+        Returns:
+            Plný snapshot (``type`` + tvar ``get_state()``), nebo None pokud
+            ještě chybí odpovídající konfigurace nebo baseline delty
+        """
+        if "config_version" not in message:
+            # Plný snapshot starého formátu – není co skládat
+            return message
+
+        if "baseline" in message:
+            baseline = self._history.get(message["baseline"])
+            if baseline is None:
+                if not self.needs_resync:
+                    logger.debug(f"⏳ Delta snapshot proti neznámé baseline {message['baseline']}")
+                self.needs_resync = True
+                return None
+            message = apply_delta(baseline, message)
+        else:
+            self.needs_resync = False
+        if "seq" in message:
+            self._remember(message)
+
+        if "match_config" in message:
+            self.set_config(message["match_config"])
+        if "stats" in message:
+            self.stats = message["stats"]
+            self.stats_version = message.get("stats_version")
+
+        config = self.config
+        if config is None:
+            logger.debug("⏳ Snapshot bez konfigurace zápasu, čekám na match_config")
+            return None
+        if config.get("config_version") != message["config_version"]:
+            logger.warning(
+                f"⚠️ Snapshot pro konfiguraci v{message['config_version']}, "
+                f"známá je v{config.get('config_version')}"
+            )
+            return None
+
+        return self._expand(message, config)
+
+    def get_baseline(self, seq: int) -> Optional[Dict[str, Any]]:
+        """Vrátí plný snapshot z historie (None pokud v ní není)."""
+        return self._history.get(seq)
+
+    def _remember(self, message: Dict[str, Any]) -> None:
+        """Uloží plný snapshot do historie baseline."""
+        seq = message["seq"]
+        self._history[seq] = message
+        self.last_seq = seq
+        while len(self._history) > self.history_size:
+            self._history.popitem(last=False)
+
+    def _expand(self, message: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sestaví plný stav ze statické konfigurace a dynamického snapshotu.
+
+        Args:
+            message: Dynamický snapshot
+            config: Statická konfigurace zápasu (odpovídající ``config_version``)
+
+        Returns:
+            Slovník ve tvaru ``MultipongEngine.get_state()`` s klíčem ``type``
+            (a ``input_acks`` – potvrzené vstupní rámce, pokud je snapshot nese)
+        """
+        x, y, vx, vy = message["ball"]
+        score_a, score_b = message["score"]
+        paddle_ys = message["paddles"]
+        scores = {config["team_left"]["name"]: score_a, config["team_right"]["name"]: score_b}
+
+        paddles: Dict[str, Dict[str, Any]] = {}
+        teams: Dict[str, Dict[str, Any]] = {}
+        index = 0
+        for team_key in ("team_left", "team_right"):
+            team_config = config[team_key]
+            team_paddles = []
+            for paddle_config in team_config["paddles"]:
+                player_id = paddle_config["player_id"]
+                hits, goals_scored, goals_received = self.stats.get(player_id, (0, 0, 0))
+                stats = {
+                    "player_id": player_id,
+                    "hits": hits,
+                    "goals_scored": goals_scored,
+                    "goals_received": goals_received,
+                }
+                paddle_x = paddle_config["x"]
+                paddle_y = paddle_ys[index]
+                index += 1
+
+                paddles[player_id] = {
+                    "x": paddle_x,
+                    "y": paddle_y,
+                    "width": paddle_config["width"],
+                    "height": paddle_config["height"],
+                    "player_id": player_id,
+                    "zone_top": paddle_config["zone_top"],
+                    "zone_bottom": paddle_config["zone_bottom"],
+                    "stats": stats,
+                    "ai_class_name": paddle_config["ai_class_name"],
+                }
+                team_paddles.append({
+                    "x": paddle_x,
+                    "y": paddle_y,
+                    "width": paddle_config["width"],
+                    "height": paddle_config["height"],
+                    "player_id": player_id,
+                    "hits": hits,
+                    "goals_scored": goals_scored,
+                    "goals_received": goals_received,
+                    "stats": dict(stats),
+                })
+            teams[team_key] = {
+                "name": team_config["name"],
+                "score": scores[team_config["name"]],
+                "paddles": team_paddles,
+            }
+
+        state = {
+            "type": "snapshot",
+            "ball": {"x": x, "y": y, "radius": config["ball_radius"], "vx": vx, "vy": vy},
+            "paddles": paddles,
+            "score": scores,
+            "time_left": message["time_left"],
+            "is_running": message["is_running"],
+            "arena": dict(config["arena"]),
+            "team_left": teams["team_left"],
+            "team_right": teams["team_right"],
+            "goal_left": dict(config["goal_left"]),
+            "goal_right": dict(config["goal_right"]),
+            "goal_pause_remaining": message["goal_pause_remaining"],
+            "rally_hits": message["rally_hits"],
+        }
+        if "input_acks" in message:
+            state["input_acks"] = message["input_acks"]
+        return state
+
+    def reset(self) -> None:
+        """Zapomene konfiguraci, statistiky i historii baseline (např. po odpojení)."""
+        self.config = None
+        self.stats = {}
+        self.stats_version = None
+        self.last_seq = None
+        self.needs_resync = False
+        self._history.clear()
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        version = self.config.get("config_version") if self.config else None
+        return f"SnapshotAssembler(config_version={version}, stats_version={self.stats_version})"
@@ -1,18 +1,48 @@
 """
 WSClient - asynchronní WebSocket klient pro MULTIPONG Phase 5.
 Připojení k serveru, posílání vstupů, příjem snapshotů.
+
+Klient si v URL vyžádá binární a delta snapshoty (``snapshot_codec``);
+binární rámce dekóduje rovnou do tvaru JSON snapshotu. Server, který
+binární formát nepodporuje, posílá dál JSON. Při delta snapshotech klient
+potvrzuje přijaté snapshoty zprávou ``ack`` (baseline pro další delty).
+
+Server posílá snapshoty s vyjednanou frekvencí (typicky 20–30 Hz, nižší
+než simulace); ``render_delay`` udává zpoždění vykreslení, se kterým
+``StateBuffer.get_interpolated`` mezery mezi snapshoty vyplní interpolací.
+
+Vstupy se posílají jako číslované rámce (``seq``) s krokem simulace
+klienta (``tick``, měřeno od ``connected`` v jednotkách ``sim_rate``);
+server je aplikuje přes jitter buffer a ve snapshotech vrací číslo
+posledního aplikovaného rámce (``input_acks``, viz ``last_input_ack``).
+Vlastní pálku klient předpovídá hned po odeslání vstupu a při každém
+snapshotu ji srovná se serverem (``PaddlePredictor``, viz ``predict``).
 """
 
 import asyncio
 import json
 import logging
+import time
 from typing import Optional, Callable, Dict
 import websockets.exceptions
 from websockets.asyncio.client import ClientConnection, connect
 
+from multipong.network.snapshot_codec import (
+    SNAPSHOT_FORMAT_BINARY,
+    SNAPSHOT_FORMAT_JSON,
+    SNAPSHOT_SCHEMA_VERSION,
+    SnapshotCodecError,
+    decode_snapshot,
+)
+from .paddle_predictor import PaddlePredictor
+from .snapshot_assembler import SnapshotAssembler
+
 
 logger = logging.getLogger(__name__)
 
+# Výchozí počet delta snapshotů mezi potvrzeními (při 30 Hz ~7 potvrzení/s)
+DEFAULT_ACK_INTERVAL = 4
+
 
 class WSClient:
     """
@@ -22,8 +52,23 @@ class WSClient:
     Attributes:
         url: URL WebSocket serveru (např. "ws://localhost:8000/ws")
         player_id: ID hráče (např. "A1", "auto")
+        room_id: ID místnosti (None = výchozí místnost serveru)
         on_snapshot: Callback funkce volaná při příjmu snapshotu
         on_message: Callback funkce volaná při příjmu jakékoliv zprávy
+        snapshots: SnapshotAssembler skládající plný stav ze snapshotů
+        snapshot_format: Požadovaný formát snapshotů ("binary" nebo "json")
+        negotiated_format: Formát potvrzený serverem v ``connected`` zprávě
+        snapshot_delta: Požadovat delta snapshoty
+        negotiated_delta: Server delta snapshoty potvrdil
+        ack_interval: Potvrzovat každý N-tý delta snapshot (keyframe vždy)
+        client_profile: Profil klienta pro výchozí frekvenci snapshotů
+                        ("player", "spectator", "mobile"; None = player)
+        snapshot_rate: Požadovaná frekvence snapshotů v Hz (None = podle profilu)
+        negotiated_rate: Frekvence snapshotů potvrzená serverem (None = neznámá)
+        sim_rate: Frekvence simulace serveru (jednotka ``tick`` vstupních rámců)
+        input_seq: Číslo posledního odeslaného vstupního rámce
+        last_input_ack: Číslo posledního rámce, který server aplikoval (None = žádný)
+        prediction: PaddlePredictor vlastní pálky
         ws: WebSocket spojení
         running: Indikátor běhu listen smyčky
     """
@@ -36,7 +81,13 @@ class WSClient:
         on_connected: Optional[Callable[[dict], None]] = None,
         on_chat: Optional[Callable[[str, str], None]] = None,
         on_pong: Optional[Callable[[dict], None]] = None,
-        on_message: Optional[Callable[[dict], None]] = None
+        on_message: Optional[Callable[[dict], None]] = None,
+        room_id: Optional[str] = None,
+        snapshot_format: str = SNAPSHOT_FORMAT_BINARY,
+        snapshot_delta: bool = True,
+        ack_interval: int = DEFAULT_ACK_INTERVAL,
+        client_profile: Optional[str] = None,
+        snapshot_rate: Optional[float] = None
     ):
         """
         Inicializace WebSocket klienta.
@@ -49,9 +100,17 @@ class WSClient:
             on_chat: Callback pro chat zprávy (player_id, message) -> None
             on_pong: Callback pro pong zprávy (dict) -> None
             on_message: Callback pro všechny zprávy (dict) -> None
+            room_id: ID místnosti – připojí se na ``{url}/{room_id}/{player_id}``
+                     (None = výchozí místnost, ``{url}/{player_id}``)
+            snapshot_format: "binary" (kompaktní, výchozí) nebo "json" (debugování)
+            snapshot_delta: Požadovat delta snapshoty proti potvrzenému stavu
+            ack_interval: Po kolika delta snapshotech poslat potvrzení
+            client_profile: Profil klienta ("player", "spectator", "mobile")
+            snapshot_rate: Požadovaná frekvence snapshotů v Hz (None = podle profilu)
         """
         self.url = url
         self.player_id = player_id
+        self.room_id = room_id
         self.on_snapshot = on_snapshot
         self.on_connected = on_connected
         self.on_chat = on_chat
@@ -61,6 +120,45 @@ class WSClient:
         self.running = False
         self.assigned_slot: Optional[str] = None
         self._listen_task: Optional[asyncio.Task] = None
+        self.snapshots = SnapshotAssembler()
+        self.snapshot_format = snapshot_format
+        self.negotiated_format = SNAPSHOT_FORMAT_JSON
+        self.snapshot_delta = snapshot_delta
+        self.negotiated_delta = False
+        self.ack_interval = max(1, ack_interval)
+        self._unacked_snapshots = 0
+        self._resync_requested = False
+        self.client_profile = client_profile
+        self.snapshot_rate = snapshot_rate
+        self.negotiated_rate: Optional[float] = None
+        self.sim_rate: Optional[int] = None
+        self.input_seq = 0
+        self.last_input_ack: Optional[int] = None
+        self.prediction = PaddlePredictor()
+        self._clock_start = 0.0
+    
+    def input_tick(self) -> Optional[int]:
+        """
+        Aktuální krok simulace klienta pro vstupní rámec.
+        
+        Returns:
+            Počet kroků ``sim_rate`` od ``connected`` (None = server sim_rate nesdělil)
+        """
+        if not self.sim_rate:
+            return None
+        return int((time.monotonic() - self._clock_start) * self.sim_rate)
+    
+    @property
+    def render_delay(self) -> float:
+        """
+        Zpoždění vykreslení pro ``StateBuffer.get_interpolated`` (s).
+        
+        Jeden interval mezi snapshoty – vykresluje se mezi dvěma posledními
+        přijatými snapshoty místo extrapolace za nejnovější.
+        """
+        if not self.negotiated_rate:
+            return 0.0
+        return 1.0 / self.negotiated_rate
     
     async def connect(self) -> bool:
         """
@@ -70,7 +168,22 @@ class WSClient:
             True pokud se připojení zdařilo, False jinak
         """
         try:
-            full_url = f"{self.url}/{self.player_id}"
+            if self.room_id:
+                full_url = f"{self.url}/{self.room_id}/{self.player_id}"
+            else:
+                full_url = f"{self.url}/{self.player_id}"
+            params = []
+            if self.snapshot_format == SNAPSHOT_FORMAT_BINARY:
+                params.append(f"snapshot_format={SNAPSHOT_FORMAT_BINARY}")
+                params.append(f"snapshot_schema={SNAPSHOT_SCHEMA_VERSION}")
+            if self.snapshot_delta:
+                params.append("snapshot_delta=1")
+            if self.client_profile:
+                params.append(f"client_profile={self.client_profile}")
+            if self.snapshot_rate:
+                params.append(f"snapshot_rate={self.snapshot_rate}")
+            if params:
+                full_url += "?" + "&".join(params)
             logger.info(f"Připojuji se k {full_url}...")
             
             self.ws = await connect(full_url)
@@ -94,18 +207,48 @@ class WSClient:
         try:
             while self.running and self.ws:
                 msg = await self.ws.recv()
-                data = json.loads(msg)
+                if isinstance(msg, bytes):
+                    # Binární rámec = snapshot (viz snapshot_codec)
+                    try:
+                        data = decode_snapshot(msg)
+                    except SnapshotCodecError as e:
+                        logger.warning(f"⚠️ Nelze dekódovat binární snapshot: {e}")
+                        continue
+                else:
+                    data = json.loads(msg)
                 
                 msg_type = data.get("type", "unknown")
                 
                 # Zpracování podle typu zprávy
                 if msg_type == "snapshot":
-                    if self.on_snapshot:
-                        self.on_snapshot(data)
+                    # Doplnění statické konfigurace a statistik do plného stavu
+                    state = self.snapshots.apply(data)
+                    if state is not None:
+                        self._reconcile(state, "match_config" in data)
+                    if self.negotiated_delta:
+                        await self._acknowledge(data)
+                    if state is not None and self.on_snapshot:
+                        self.on_snapshot(state)
+                
+                elif msg_type == "match_config":
+                    self.snapshots.set_config(data)
+                    self._configure_prediction()
                 
                 elif msg_type == "connected":
                     # Server potvrdil připojení a přidělil slot
                     self.assigned_slot = data.get("assigned_slot")
+                    self.negotiated_format = data.get("snapshot_format", SNAPSHOT_FORMAT_JSON)
+                    self.negotiated_delta = bool(data.get("snapshot_delta"))
+                    self.negotiated_rate = data.get("snapshot_rate")
+                    self.sim_rate = data.get("sim_rate")
+                    self._clock_start = time.monotonic()
+                    self.input_seq = 0
+                    self.last_input_ack = None
+                    self.snapshots.reset()
+                    self.prediction.reset()
+                    if data.get("match_config"):
+                        self.snapshots.set_config(data["match_config"])
+                        self._configure_prediction()
                     logger.info(f"🎮 Přidělena pozice: {self.assigned_slot}")
                     if self.on_connected:
                         self.on_connected(data)
@@ -145,25 +288,99 @@ class WSClient:
             self.running = False
             logger.info("🔌 Listen smyčka ukončena")
     
-    async def send_input(self, up: bool = False, down: bool = False) -> None:
+    def _configure_prediction(self) -> None:
+        """Připraví predikci vlastní pálky podle aktuální konfigurace zápasu."""
+        if self.snapshots.config is not None and self.assigned_slot:
+            self.prediction.configure(self.snapshots.config, self.assigned_slot, self.sim_rate)
+    
+    def _reconcile(self, state: dict, config_changed: bool) -> None:
+        """Srovná predikci vlastní pálky se snapshotem serveru."""
+        if config_changed:
+            self._configure_prediction()
+        ack = state.get("input_acks", {}).get(self.assigned_slot)
+        if ack is not None:
+            self.last_input_ack = ack[0]
+        paddle = state.get("paddles", {}).get(self.assigned_slot)
+        tick = self.input_tick()
+        if paddle is not None and tick is not None:
+            self.prediction.reconcile(paddle["y"], ack, tick)
+    
+    def predict(self, state: dict) -> dict:
         """
-        Odesílá vstupy hráče serveru.
+        Dosadí do stavu pro vykreslení předpovězenou pozici vlastní pálky.
+        
+        Args:
+            state: Stav ze StateBufferu (interpolovaný nebo poslední)
+            
+        Returns:
+            Stav s vlastní pálkou v aktuálním kroku (ostatní objekty
+            beze změny – zobrazují se s ``render_delay``)
+        """
+        tick = self.input_tick()
+        if tick is None:
+            return state
+        return self.prediction.apply(state, tick)
+    
+    async def _acknowledge(self, message: dict) -> None:
+        """
+        Potvrdí serveru přijatý snapshot (baseline pro delta snapshoty).
+        
+        Keyframe se potvrzuje hned, delty každý ``ack_interval``-tý snapshot.
+        Pokud delta odkazuje na baseline, kterou klient nemá, vyžádá si
+        jednou keyframe (``ack`` se ``seq: null``).
+        """
+        if self.snapshots.needs_resync:
+            if not self._resync_requested:
+                self._resync_requested = True
+                logger.info("🔁 Chybí baseline delta snapshotu, žádám keyframe")
+                await self._send_ack(None)
+            return
+        
+        self._resync_requested = False
+        self._unacked_snapshots += 1
+        if "baseline" not in message or self._unacked_snapshots >= self.ack_interval:
+            self._unacked_snapshots = 0
+            await self._send_ack(self.snapshots.last_seq)
+    
+    async def _send_ack(self, seq: Optional[int]) -> None:
+        """Odešle potvrzení snapshotu ``seq`` (None = žádost o keyframe)."""
+        if self.ws and self.running:
+            try:
+                await self.ws.send(json.dumps({"type": "ack", "seq": seq}))
+            except Exception as e:
+                logger.error(f"❌ Chyba při odesílání potvrzení snapshotu: {e}")
+    
+    async def send_input(self, up: bool = False, down: bool = False) -> Optional[int]:
+        """
+        Odesílá vstupy hráče serveru jako číslovaný rámec.
         
         Args:
             up: True pokud je stisknuta klávesa nahoru
             down: True pokud je stisknuta klávesa dolů
+            
+        Returns:
+            Číslo odeslaného rámce (None pokud klient není připojen
+            nebo odeslání selhalo)
         """
         if self.ws and self.running:
+            self.input_seq += 1
             msg = {
                 "type": "input",
                 "up": up,
-                "down": down
+                "down": down,
+                "seq": self.input_seq
             }
+            tick = self.input_tick()
+            if tick is not None:
+                msg["tick"] = tick
+                self.prediction.record_input(self.input_seq, tick, up, down)
             try:
                 await self.ws.send(json.dumps(msg))
-                logger.debug(f"⬆️{up} ⬇️{down}")
+                logger.debug(f"⬆️{up} ⬇️{down} (#{self.input_seq})")
+                return self.input_seq
             except Exception as e:
                 logger.error(f"❌ Chyba při odesílání inputu: {e}")
+        return None
     
     async def send_chat(self, message: str) -> None:
         """
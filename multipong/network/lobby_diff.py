@@ -0,0 +1,109 @@
+"""
+Verzované změny stavu lobby (``lobby_update``; sdílené serverem i klientem).
+
+Plný stav lobby (``Lobby.get_lobby_state``) obsahuje všech osm slotů
+a nastavení zápasu. Server ho proto posílá jen klientovi, který ho
+potřebuje (vstup do lobby, ``lobby_sync`` po výpadku verze), ostatním
+jen změny proti předchozí verzi:
+
+    {"type": "lobby_update", "full": true, "version": 7,
+     "slots": {...všechny...}, "ready_players": [...], "settings": {...}}
+
+    {"type": "lobby_update", "version": 8, "base_version": 7,
+     "slots": {"A2": {...}}, "ready_players": [...]}
+
+Diff nese změněné sloty celé a ostatní klíče (``ready_players``,
+``settings``) jen pokud se změnily. Klient ho aplikuje jen na stav
+s ``version == base_version``; jinak (``apply_lobby_update`` vrátí None)
+si vyžádá plný stav zprávou ``{"type": "lobby_sync"}``.
+"""
+
+from typing import Any, Dict, Optional
+
+# Typ zprávy klienta s žádostí o plný stav lobby
+LOBBY_SYNC = "lobby_sync"
+
+# Klíče zprávy, které nejsou součástí stavu lobby
+_MESSAGE_KEYS = ("type", "full", "base_version")
+
+
+def compute_lobby_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Vrátí změny stavu lobby ``old`` → ``new``.
+
+    Args:
+        old: Předchozí stav (``Lobby.get_lobby_state``)
+        new: Aktuální stav
+
+    Returns:
+        Slovník jen se změněnými sloty a klíči (prázdný = beze změny)
+    """
+    diff: Dict[str, Any] = {}
+    old_slots = old.get("slots", {})
+    slots = {
+        slot: value for slot, value in new.get("slots", {}).items()
+        if old_slots.get(slot) != value
+    }
+    if slots:
+        diff["slots"] = slots
+    for key, value in new.items():
+        if key != "slots" and old.get(key) != value:
+            diff[key] = value
+    return diff
+
+
+def build_lobby_update(
+    state: Dict[str, Any],
+    version: int,
+    diff: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Sestaví zprávu ``lobby_update``.
+
+    Args:
+        state: Plný stav lobby verze ``version``
+        version: Verze stavu
+        diff: Změny proti verzi ``version - 1`` (None = plný stav)
+
+    Returns:
+        Zpráva pro klienty
+    """
+    if diff is None:
+        return {"type": "lobby_update", "full": True, "version": version, **state}
+    return {"type": "lobby_update", "version": version, "base_version": version - 1, **diff}
+
+
+def apply_lobby_update(
+    state: Optional[Dict[str, Any]], message: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Aplikuje ``lobby_update`` na stav lobby klienta.
+
+    Args:
+        state: Aktuální stav klienta (s klíčem ``version``; None/{} = žádný)
+        message: Přijatá zpráva ``lobby_update``
+
+    Returns:
+        Nový stav (s ``version``), původní stav pro zastaralý diff, nebo
+        None pokud diff navazuje na verzi, kterou klient nemá (výpadek –
+        klient si vyžádá plný stav)
+    """
+    if message.get("full") or "version" not in message:
+        # Plný stav (i zpráva starého serveru bez verzí)
+        return {key: value for key, value in message.items() if key not in _MESSAGE_KEYS}
+
+    version = state.get("version") if state else None
+    if state is None or version is None:
+        return None  # klient si vyžádá plný stav
+    if version >= message["version"]:
+        return state  # už obsažený (např. po plném stavu)
+    if version != message.get("base_version"):
+        return None
+
+    new_state = dict(state)
+    for key, value in message.items():
+        if key == "slots":
+            new_state["slots"] = {**state.get("slots", {}), **value}
+        elif key not in _MESSAGE_KEYS:
+            new_state[key] = value
+    return new_state
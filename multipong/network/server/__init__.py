@@ -5,19 +5,46 @@ Lobby systém, game state management, protokol komunikace
 
 __version__ = "0.4.0"
 
-from .websocket_server import app, manager, lobby
+from .websocket_server import app, manager, lobby, rooms
 from .player_session import PlayerSession
 from .websocket_manager import WebSocketManager
 from .lobby_manager import LobbyManager
+from .snapshot_builder import SnapshotBuilder
+from .input_table import InputTable
+from .input_buffer import InputBuffers
+from .telemetry import Telemetry
+from .idle_expiry import IdleExpiry
+from .lobby_updates import LobbyBroadcaster
+from .rate_limit import MessageLimiter, TokenBucket
+from .room_manager import Room, RoomHandle, RoomManager, DEFAULT_ROOM_ID
+from .tick_scheduler import TickScheduler
+from .room_workers import RemoteRoom, RoomWorkerPool, ShardedRoomManager
 from .game_loop import GameLoop, run_game_loop, initialize_game_loop, get_game_loop
 
 __all__ = [
     "app",
     "manager",
     "lobby",
+    "rooms",
     "PlayerSession",
     "WebSocketManager",
     "LobbyManager",
+    "SnapshotBuilder",
+    "InputTable",
+    "InputBuffers",
+    "Telemetry",
+    "IdleExpiry",
+    "LobbyBroadcaster",
+    "MessageLimiter",
+    "TokenBucket",
+    "Room",
+    "RoomHandle",
+    "RoomManager",
+    "DEFAULT_ROOM_ID",
+    "TickScheduler",
+    "RemoteRoom",
+    "RoomWorkerPool",
+    "ShardedRoomManager",
     "GameLoop",
     "run_game_loop",
     "initialize_game_loop",
@@ -5,9 +5,20 @@ Game loop pro MULTIPONG server - asynchronní tick smyčka.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from time import perf_counter
+from typing import Dict, Any, List, Mapping, Optional, Protocol, Union
 from multipong.engine.game_engine import MultipongEngine
+from multipong.engine.profiling import (
+    PHASE_BROADCAST,
+    PHASE_SNAPSHOT,
+    PHASE_TICK,
+    Histogram,
+    PhaseProfiler,
+)
 from multipong.network.server.websocket_manager import WebSocketManager
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.server.input_table import DictInputTable, InputTable, InputWriter
+from multipong.network.server.input_buffer import InputBuffers
 from multipong import settings
 
 # Databázové operace (pro ukládání výsledků)
@@ -21,6 +32,29 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Horní hranice košů doby zápisu výsledků do DB v sekundách (1 ms … 10 s)
+DB_WRITE_BUCKETS = (1e-3, 2e-3, 5e-3, 1e-2, 2e-2, 5e-2, 1e-1, 2e-1, 5e-1, 1.0, 2.0, 5.0, 10.0)
+
+# Histogram doby save_match_results (jen pokus o zápis, bez vypnuté DB)
+db_write_time = Histogram(DB_WRITE_BUCKETS)
+
+
+class SnapshotBroadcaster(Protocol):
+    """
+    Příjemce snapshotů game loopu.
+
+    Pro místnosti v hlavním procesu je to WebSocketManager, ve worker
+    procesu náhrada, která snapshot zakóduje a pošle gatewayi.
+    """
+
+    async def broadcast(self, message: dict, exclude: Optional[List[str]] = None) -> int:
+        """Rozešle snapshot, vrátí počet příjemců."""
+        ...
+
+    def get_player_count(self) -> int:
+        """Vrátí počet připojených hráčů."""
+        ...
+
 
 class GameLoop:
     """
@@ -28,17 +62,35 @@ class GameLoop:
     
     Attributes:
         engine: Instance MultipongEngine
-        manager: Instance WebSocketManager
-        tick_rate: Frekvence aktualizací (Hz)
+        manager: Příjemce snapshotů (WebSocketManager, SnapshotBroadcaster)
+        tick_rate: Frekvence průchodů smyčkou a broadcastu (Hz)
+        sim_rate: Frekvence simulace – fixní krok akumulátoru (Hz)
+        max_substeps: Max. počet simulačních kroků za jeden průchod
         is_running: Indikátor běžícího loopu
-        player_inputs: Sdílená mapa vstupů od hráčů
+        player_inputs: Sdílené vstupy hráčů, které engine čte přímo – InputTable,
+                       nebo slovník volajícího (``run_game_loop``)
+        input_table: Zápis do ``player_inputs`` (InputTable, u slovníku DictInputTable)
+        input_buffers: Jitter buffery číslovaných vstupních rámců (InputBuffers)
+        sim_step: Počet provedených kroků simulace
+        skipped_steps: Počet zahozených simulačních kroků (přetížení)
+        missed_ticks: Počet přeskočených ticků (průchod přetáhl přes deadline)
+        tick_count: Počet provedených průchodů
+        jitter: Histogram zpoždění startu ticku vůči jeho deadline
+        tick_time: Histogram doby průchodu smyčkou (simulace, snapshot, broadcast)
+        snapshots: SnapshotBuilder pro inkrementální snapshoty
+        profiler: PhaseProfiler místnosti (None = profilování vypnuto)
     """
     
     def __init__(
         self,
         engine: MultipongEngine,
-        manager: WebSocketManager,
-        tick_rate: int = None
+        manager: SnapshotBroadcaster,
+        tick_rate: Optional[int] = None,
+        sim_rate: Optional[int] = None,
+        max_substeps: Optional[int] = None,
+        snapshot_builder: Optional[SnapshotBuilder] = None,
+        profiling: Optional[bool] = None,
+        player_inputs: Optional[Union[InputTable, Dict[str, Dict[str, bool]]]] = None
     ):
         """
         Inicializace game loop.
@@ -47,16 +99,58 @@ class GameLoop:
             engine: Instance herního enginu
             manager: Instance WebSocket manageru
             tick_rate: Frekvence aktualizací v Hz (None = použije config)
+            sim_rate: Frekvence simulace v Hz (None = stejná jako tick_rate,
+                      pokud není tick_rate zadán, pak SERVER_SIM_RATE)
+            max_substeps: Max. simulačních kroků za průchod (None = config)
+            snapshot_builder: Sdílený SnapshotBuilder (None = vytvoří vlastní)
+            profiling: Měřit fáze ticku do histogramů (None = SERVER_PROFILING)
+            player_inputs: Sdílená tabulka vstupů nebo slovník {player_id: {"up", "down"}}
+                           (None = předalokuje se tabulka podle pálek enginu)
         """
         self.engine = engine
         self.manager = manager
         self.tick_rate = tick_rate or settings.SERVER_TICK_RATE
+        if sim_rate:
+            self.sim_rate = sim_rate
+        else:
+            self.sim_rate = tick_rate or settings.SERVER_SIM_RATE
+        self.max_substeps = max(1, max_substeps or settings.SERVER_MAX_SUBSTEPS)
         self.is_running = False
+        self.skipped_steps = 0
+        self.missed_ticks = 0
+        self.tick_count = 0
+        self.sim_step = 0
+        self.jitter = Histogram()
+        self.tick_time = Histogram()
+        self._accumulator = 0.0
+        self._last_time = 0.0
+        self.snapshots = snapshot_builder or SnapshotBuilder(engine)
+        self.last_snapshot: Optional[Dict[str, Any]] = None
         
-        # Sdílená mapa vstupů od hráčů {"player_id": {"up": bool, "down": bool}}
-        self.player_inputs: Dict[str, Dict[str, bool]] = {}
+        # Profilování fází – engine měří fyziku, loop snapshot/broadcast/tick
+        if profiling is None:
+            profiling = settings.SERVER_PROFILING
+        self.profiler: Optional[PhaseProfiler] = None
+        if profiling:
+            self.profiler = PhaseProfiler()
+            self.engine.profiler = self.profiler
         
-        logger.info(f"🎮 GameLoop inicializován (tick rate: {self.tick_rate} Hz)")
+        # Vstupy hráčů – předalokovaná tabulka podle pálek enginu, zprávy
+        # ``input`` se do ní zapisují hned při příjmu (viz InputTable)
+        if player_inputs is None:
+            paddles = getattr(engine, "paddles", None)
+            player_inputs = InputTable(paddles if isinstance(paddles, dict) else ())
+        self.player_inputs: Mapping[str, Mapping[str, bool]] = player_inputs
+        self.input_table: InputWriter = (
+            player_inputs if isinstance(player_inputs, InputTable) else DictInputTable(player_inputs)
+        )
+        # Číslované rámce (``seq``/``tick``) čekají v jitter bufferu na svůj krok
+        self.input_buffers = InputBuffers(self.input_table)
+        
+        logger.info(
+            f"🎮 GameLoop inicializován (tick rate: {self.tick_rate} Hz, "
+            f"simulace: {self.sim_rate} Hz)"
+        )
     
     def update_input(self, player_id: str, up: bool, down: bool) -> None:
         """
@@ -67,7 +161,26 @@ class GameLoop:
             up: Stav tlačítka nahoru
             down: Stav tlačítka dolů
         """
-        self.player_inputs[player_id] = {"up": up, "down": down}
+        self.input_table.set(player_id, up, down)
+    
+    def queue_input(self, player_id: str, seq: int, up: bool, down: bool, tick: Optional[int] = None) -> bool:
+        """
+        Zařadí číslovaný vstupní rámec do jitter bufferu hráče.
+        
+        Rámec se aplikuje v kroku simulace určeném ``tick`` klienta
+        a adaptivním zpožděním (viz InputBuffers).
+        
+        Args:
+            player_id: ID hráče
+            seq: Číslo rámce
+            up: Stav tlačítka nahoru
+            down: Stav tlačítka dolů
+            tick: Krok klienta, pro který rámec vznikl (None = nejbližší krok)
+            
+        Returns:
+            False pokud byl rámec zahozen jako duplicitní nebo starý
+        """
+        return self.input_buffers.push(player_id, seq, up, down, tick, self.sim_step)
     
     def clear_input(self, player_id: str) -> None:
         """
@@ -76,79 +189,229 @@ class GameLoop:
         Args:
             player_id: ID hráče
         """
-        if player_id in self.player_inputs:
-            del self.player_inputs[player_id]
+        self.input_table.clear(player_id)
+        self.input_buffers.clear(player_id)
     
     def get_current_inputs(self) -> Dict[str, Dict[str, bool]]:
         """
-        Vrátí aktuální snapshot vstupů.
+        Vrátí kopii aktuálních vstupů (tick čte tabulku přímo, kopie je jen pro volající).
+        
+        Returns:
+            Slovník {player_id: {"up": bool, "down": bool}}
+        """
+        return {player_id: dict(state) for player_id, state in self.player_inputs.items()}
+    
+    def get_profile(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Vrátí histogramy dob fází ticku této místnosti.
+        
+        Returns:
+            Slovník {fáze: histogram} (prázdný pokud je profilování vypnuto)
+        """
+        return self.profiler.to_dict() if self.profiler else {}
+    
+    async def run_tick(self, steps: int = 1) -> int:
+        """
+        Provede jeden průchod smyčkou: ``steps`` fixních kroků simulace,
+        sestavení snapshotu a jeho broadcast (bez čekání na další tick).
         
+        Args:
+            steps: Počet simulačních kroků (0 = nic se nesimuluje ani neposílá)
+            
         Returns:
-            Kopie mapy vstupů (deep copy)
+            Počet hráčů, kterým byl snapshot odeslán
+        """
+        if steps <= 0:
+            return 0
+        
+        sim_dt = 1.0 / self.sim_rate
+        input_buffers = self.input_buffers
+        for _ in range(steps):
+            self.sim_step += 1
+            if input_buffers:
+                input_buffers.advance(self.sim_step)
+            self.engine.update(self.player_inputs, dt=sim_dt)
+        
+        # Snapshot jen s dynamickým stavem (statická konfigurace jde
+        # klientům jednou v handshake)
+        profiler = self.profiler
+        if profiler is not None:
+            t_snapshot = perf_counter()
+        snapshot = self.snapshots.build_snapshot(input_acks=input_buffers.acks)
+        self.last_snapshot = snapshot
+        if profiler is not None:
+            t_broadcast = perf_counter()
+            profiler.record(PHASE_SNAPSHOT, t_broadcast - t_snapshot)
+        
+        # Broadcast snapshot všem připojeným hráčům
+        sent_count = await self.manager.broadcast(snapshot)
+        if profiler is not None:
+            profiler.record(PHASE_BROADCAST, perf_counter() - t_broadcast)
+        return sent_count
+    
+    def reset_clock(self, now: float) -> None:
         """
-        import copy
-        return copy.deepcopy(self.player_inputs)
+        Nastaví akumulátor simulace – první průchod provede jeden krok okamžitě.
+        
+        Args:
+            now: Aktuální monotónní čas (loop.time())
+        """
+        self._accumulator = 1.0 / self.sim_rate
+        self._last_time = now
+    
+    def advance_clock(self, now: float) -> int:
+        """
+        Přičte uplynulý čas do akumulátoru a vrátí počet fixních kroků simulace.
+        
+        Kroků je nejvýše ``max_substeps``; nestihnuté kroky se zahodí
+        (frame skip) a připočtou do ``skipped_steps``.
+        
+        Args:
+            now: Aktuální monotónní čas (loop.time())
+            
+        Returns:
+            Počet simulačních kroků pro tento průchod
+        """
+        sim_dt = 1.0 / self.sim_rate
+        self._accumulator += now - self._last_time
+        self._last_time = now
+        
+        steps = 0
+        while self._accumulator >= sim_dt and steps < self.max_substeps:
+            self._accumulator -= sim_dt
+            steps += 1
+        
+        if self._accumulator >= sim_dt:
+            # Přetížení – zahodíme nestihnuté kroky (frame skip)
+            dropped = int(self._accumulator / sim_dt)
+            self.skipped_steps += dropped
+            self._accumulator -= dropped * sim_dt
+            logger.warning(f"⚠️ Game loop nestíhá, zahozeno {dropped} kroků simulace")
+        return steps
+    
+    def schedule_next(self, deadline: float, now: float) -> float:
+        """
+        Vrátí další absolutní deadline ticku (bez driftu).
+        
+        Pokud průchod přetáhl přes jeden nebo více intervalů, zmeškané ticky
+        se přeskočí (počítá ``missed_ticks``) – simulace o čas nepřijde,
+        dožene ho akumulátor.
+        
+        Args:
+            deadline: Deadline právě dokončeného ticku
+            now: Aktuální monotónní čas
+            
+        Returns:
+            Deadline dalšího ticku (> now)
+        """
+        tick_interval = 1.0 / self.tick_rate
+        deadline += tick_interval
+        if deadline <= now:
+            missed = int((now - deadline) / tick_interval) + 1
+            self.missed_ticks += missed
+            deadline += missed * tick_interval
+        return deadline
+    
+    async def tick_at(self, deadline: float, now: float) -> int:
+        """
+        Jeden naplánovaný průchod smyčkou.
+        
+        Zaznamená zpoždění startu vůči deadline (jitter), dopočítá kroky
+        z akumulátoru a provede simulaci, snapshot a broadcast.
+        
+        Args:
+            deadline: Plánovaný čas startu ticku (monotónní)
+            now: Skutečný čas startu ticku (monotónní)
+            
+        Returns:
+            Počet hráčů, kterým byl snapshot odeslán
+        """
+        self.jitter.record(max(0.0, now - deadline))
+        steps = self.advance_clock(now)
+        self.tick_count += 1
+        sent_count = await self.run_tick(steps)
+        
+        # Logování každých 60 ticků (1× za sekundu při 60 Hz)
+        snapshot = self.last_snapshot
+        if steps and self.tick_count % 60 == 0 and snapshot is not None:
+            logger.debug(
+                f"📊 Tick #{self.tick_count} | "
+                f"Hráči: {self.manager.get_player_count()} | "
+                f"Broadcast: {sent_count} | "
+                f"Score: {snapshot.get('score')}"
+            )
+        
+        elapsed = asyncio.get_running_loop().time() - now
+        self.tick_time.record(elapsed)
+        if self.profiler is not None:
+            self.profiler.record(PHASE_TICK, elapsed)
+        
+        tick_interval = 1.0 / self.tick_rate
+        if elapsed > tick_interval and self.tick_count % 60 == 0:  # Loguj jen občas
+            slowest = self.profiler.slowest_last() if self.profiler else None
+            stage = f" | nejpomalejší fáze: {slowest[0]} ({slowest[1]:.4f}s)" if slowest else ""
+            logger.warning(
+                f"⚠️ Tick #{self.tick_count} přesáhl interval: "
+                f"{elapsed:.4f}s > {tick_interval:.4f}s{stage}"
+            )
+        return sent_count
+    
+    def get_jitter(self) -> Dict[str, Any]:
+        """
+        Vrátí histogram zpoždění startu ticků vůči jejich deadline.
+        
+        Returns:
+            Serializovaný Histogram (sekundy)
+        """
+        return self.jitter.to_dict()
+    
+    def get_timings(self) -> Dict[str, Any]:
+        """
+        Vrátí histogramy časování místnosti (pro metriky).
+        
+        Returns:
+            Slovník ``{"tick": ..., "jitter": ..., "stages": {fáze: ...}}``
+            serializovaných Histogramů; ``stages`` jen při profilování
+        """
+        return {
+            "tick": self.tick_time.to_dict(),
+            "jitter": self.jitter.to_dict(),
+            "stages": self.get_profile(),
+        }
     
     async def run(self) -> None:
         """
-        Spustí asynchronní game loop.
+        Spustí samostatný asynchronní game loop (bez sdíleného plánovače).
         
-        Loop běží v cyklu:
-        1. Sesbírá vstupy od hráčů
-        2. Aktualizuje engine
-        3. Získá snapshot stavu hry
+        Ticky startují na absolutních monotónních deadlinech
+        (``deadline += 1 / tick_rate``), takže doba zpracování nezpůsobuje
+        drift. Každý průchod (viz ``tick_at``):
+        1. Přičte uplynulý reálný čas do akumulátoru
+        2. Provede tolik fixních simulačních kroků (1 / sim_rate), kolik se
+           do akumulátoru vejde – max. ``max_substeps``, zbytek zahodí
+        3. Sestaví inkrementální snapshot (jen dynamický stav)
         4. Broadcastuje snapshot všem klientům
-        5. Čeká na další tick
+        5. Čeká na deadline dalšího ticku
+        
+        Pro mnoho místností v jednom procesu použijte ``TickScheduler``.
         """
         self.is_running = True
-        tick_interval = 1.0 / self.tick_rate
-        tick_count = 0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        self.reset_clock(deadline)
         
-        logger.info(f"🚀 Game loop spuštěn (interval: {tick_interval:.4f}s)")
+        logger.info(
+            f"🚀 Game loop spuštěn (interval: {1.0 / self.tick_rate:.4f}s, "
+            f"krok simulace: {1.0 / self.sim_rate:.4f}s)"
+        )
         
         try:
             while self.is_running:
-                tick_start = asyncio.get_event_loop().time()
-                
-                # 1. Aktualizace enginu s aktuálními vstupy
-                self.engine.update(self.player_inputs)
-                
-                # 2. Získání kompletního stavu hry
-                state = self.engine.get_state()
-                
-                # 3. Příprava snapshot zprávy pro klienty
-                snapshot = {
-                    "type": "snapshot",
-                    **state
-                }
-                
-                # 4. Broadcast snapshot všem připojeným hráčům
-                sent_count = await self.manager.broadcast(snapshot)
+                await self.tick_at(deadline, loop.time())
                 
-                # Logování každých 60 ticků (1× za sekundu při 60 Hz)
-                tick_count += 1
-                if tick_count % 60 == 0:
-                    logger.debug(
-                        f"📊 Tick #{tick_count} | "
-                        f"Hráči: {self.manager.get_player_count()} | "
-                        f"Broadcast: {sent_count} | "
-                        f"Score: {state.get('score', {})}"
-                    )
-                
-                # 5. Čekání na další tick (kompenzace času zpracování)
-                tick_end = asyncio.get_event_loop().time()
-                elapsed = tick_end - tick_start
-                sleep_time = max(0, tick_interval - elapsed)
-                
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                else:
-                    # Varování pokud zpracování trvá déle než tick interval
-                    if tick_count % 60 == 0:  # Loguj jen občas
-                        logger.warning(
-                            f"⚠️ Tick #{tick_count} přesáhl interval: "
-                            f"{elapsed:.4f}s > {tick_interval:.4f}s"
-                        )
+                # 5. Čekání na deadline dalšího ticku
+                deadline = self.schedule_next(deadline, loop.time())
+                await asyncio.sleep(deadline - loop.time())
         
         except asyncio.CancelledError:
             logger.info("🛑 Game loop byl zrušen (CancelledError)")
@@ -160,7 +423,7 @@ class GameLoop:
         
         finally:
             self.is_running = False
-            logger.info(f"🏁 Game loop ukončen (celkem ticků: {tick_count})")
+            logger.info(f"🏁 Game loop ukončen (celkem ticků: {self.tick_count})")
     
     def stop(self) -> None:
         """Zastaví game loop (nastaví flag, loop se ukončí na dalším ticku)."""
@@ -175,7 +438,8 @@ _game_loop_instance: GameLoop | None = None
 def initialize_game_loop(
     engine: MultipongEngine,
     manager: WebSocketManager,
-    tick_rate: int = None
+    tick_rate: Optional[int] = None,
+    sim_rate: Optional[int] = None
 ) -> GameLoop:
     """
     Inicializuje globální instanci game loop.
@@ -184,12 +448,13 @@ def initialize_game_loop(
         engine: Instance MultipongEngine
         manager: Instance WebSocketManager
         tick_rate: Volitelná frekvence ticků (Hz)
+        sim_rate: Volitelná frekvence simulace (Hz)
         
     Returns:
         Instance GameLoop
     """
     global _game_loop_instance
-    _game_loop_instance = GameLoop(engine, manager, tick_rate)
+    _game_loop_instance = GameLoop(engine, manager, tick_rate, sim_rate=sim_rate)
     return _game_loop_instance
 
 
@@ -206,17 +471,23 @@ def get_game_loop() -> GameLoop | None:
 async def run_game_loop(
     engine: MultipongEngine,
     manager: WebSocketManager,
-    player_inputs: Dict[str, Dict[str, bool]],
-    tick_rate: int = None
+    player_inputs: Union[InputTable, Dict[str, Dict[str, bool]]],
+    tick_rate: Optional[int] = None,
+    snapshots: Optional[SnapshotBuilder] = None
 ) -> None:
     """
     Funkční API pro spuštění game loop (dle Phase 4 dokumentace).
     
+    Tenká obálka nad ``GameLoop.run`` – ticky běží na absolutních
+    deadlinech se stejným akumulátorem simulace.
+    
     Args:
         engine: Instance MultipongEngine
         manager: Instance WebSocketManager
-        player_inputs: Sdílená mapa vstupů od hráčů
+        player_inputs: Sdílená mapa vstupů od hráčů (slovník nebo InputTable);
+                       engine ji čte přímo, změny se projeví v dalším kroku
         tick_rate: Volitelná frekvence ticků v Hz (None = config)
+        snapshots: Sdílený SnapshotBuilder (None = vytvoří vlastní)
     
     Example:
         ```python
@@ -226,52 +497,20 @@ async def run_game_loop(
         
         engine = MultipongEngine()
         manager = WebSocketManager()
-        inputs = {}  # Sdílená mapa
+        inputs = {}  # Sdílená mapa (nebo InputTable(engine.paddles))
         
         # Spuštění v background tasku
         asyncio.create_task(run_game_loop(engine, manager, inputs))
         ```
     """
-    tick_rate = tick_rate or settings.SERVER_TICK_RATE
-    tick_interval = 1.0 / tick_rate
-    tick_count = 0
-    
-    logger.info(f"🚀 run_game_loop spuštěn (tick rate: {tick_rate} Hz)")
+    # Engine čte přímo sdílené vstupy volajícího; slovník se pro zápisy
+    # game loopu (update_input, jitter buffer) obalí DictInputTable
+    game_loop = GameLoop(
+        engine, manager, tick_rate=tick_rate, snapshot_builder=snapshots, player_inputs=player_inputs
+    )
     
-    try:
-        while True:
-            # 1. Aktualizace enginu s aktuálními vstupy
-            engine.update(player_inputs)
-            
-            # 2. Získání stavu hry
-            state = engine.get_state()
-            
-            # 3. Příprava a broadcast snapshot
-            snapshot = {
-                "type": "snapshot",
-                **state
-            }
-            
-            await manager.broadcast(snapshot)
-            
-            # 4. Čekání na další tick
-            tick_count += 1
-            if tick_count % 60 == 0:
-                logger.debug(
-                    f"📊 Tick #{tick_count} | "
-                    f"Hráči: {manager.get_player_count()} | "
-                    f"Score: {state.get('score', {})}"
-                )
-            
-            await asyncio.sleep(tick_interval)
-    
-    except asyncio.CancelledError:
-        logger.info("🛑 run_game_loop byl zrušen (CancelledError)")
-        raise
-    
-    except Exception as e:
-        logger.error(f"❌ Chyba v run_game_loop: {e}", exc_info=True)
-        raise
+    logger.info(f"🚀 run_game_loop spuštěn (tick rate: {game_loop.tick_rate} Hz)")
+    await game_loop.run()
 
 
 def save_match_results(engine: MultipongEngine, duration_seconds: int) -> None:
@@ -287,6 +526,7 @@ def save_match_results(engine: MultipongEngine, duration_seconds: int) -> None:
         return
     
     db = None
+    started = perf_counter()
     try:
         db = SessionLocal()
         
@@ -323,3 +563,4 @@ def save_match_results(engine: MultipongEngine, duration_seconds: int) -> None:
     finally:
         if db:
             db.close()
+        db_write_time.record(perf_counter() - started)
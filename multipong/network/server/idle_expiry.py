@@ -0,0 +1,162 @@
+"""
+IdleExpiry - odpojování neaktivních relací podle haldy deadlinů.
+
+Periodická kontrola (každých 5 s projít všechny relace všech místností
+a u každé volat ``time.time()``) stojí O(připojených) a timeout pozná až
+s 5 s zpožděním. IdleExpiry místo toho drží haldu deadlinů
+``last_activity + timeout`` na monotónních hodinách (``time.monotonic``)
+a spí jediným časovačem do nejbližšího z nich:
+
+- zpráva od klienta jen přepíše ``PlayerSession.last_activity`` (bez
+  operace s haldou),
+- při splatnosti se deadline ověří: aktivní relace se znovu zařadí
+  s deadline podle své ``last_activity`` (nejvýše jednou za ``timeout``),
+  neaktivní se odpojí, odebrané relace se zahodí,
+- práce při každém probuzení je tedy úměrná splatným záznamům, ne počtu
+  připojení.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import List, Optional, Tuple
+
+from multipong import settings
+from .player_session import PlayerSession
+from .wakeup import Wakeup
+from .websocket_manager import WebSocketManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdleExpiry:
+    """
+    Halda deadlinů nečinnosti relací všech místností.
+
+    Attributes:
+        timeout: Doba nečinnosti (s), po které se relace odpojí
+        expired: Celkový počet odpojených neaktivních relací
+        rearmed: Počet záznamů znovu zařazených kvůli aktivitě relace
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Doba nečinnosti v sekundách (None = server.idle_timeout)
+        """
+        self.timeout = timeout or settings.SERVER_IDLE_TIMEOUT
+        self.expired = 0
+        self.rearmed = 0
+        self._heap: List[Tuple[float, int, PlayerSession, WebSocketManager]] = []
+        self._sequence = itertools.count()
+        self._wakeup = Wakeup()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True pokud běží task hlídání."""
+        return self._task is not None and not self._task.done()
+
+    def __len__(self) -> int:
+        """Počet záznamů v haldě (včetně relací čekajících na líné zahození)."""
+        return len(self._heap)
+
+    def watch(self, session: PlayerSession, manager: WebSocketManager) -> None:
+        """
+        Začne hlídat nečinnost relace (odpojí ji z ``manager``).
+
+        Args:
+            session: Relace hráče (deadline podle její ``last_activity``)
+            manager: WebSocketManager místnosti, ze kterého se relace odebere
+        """
+        self._push(session.last_activity + self.timeout, session, manager)
+
+    def start(self) -> None:
+        """Spustí task hlídání, pokud ještě neběží."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self.run(), name="idle-expiry")
+
+    async def stop(self) -> None:
+        """Zastaví hlídání (záznamy v haldě zůstanou)."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def pop_expired(self, now: Optional[float] = None) -> List[Tuple[PlayerSession, WebSocketManager]]:
+        """
+        Vyjme z haldy relace, jejichž nečinnost přesáhla ``timeout``.
+
+        Aktivní relace se znovu zařadí, odebrané (odpojené nebo nahrazené)
+        se zahodí.
+
+        Args:
+            now: Aktuální monotónní čas (None = time.monotonic())
+
+        Returns:
+            Seznam (relace, manager) k odpojení
+        """
+        now = time.monotonic() if now is None else now
+        heap = self._heap
+        expired = []
+        rearm = []
+        while heap and heap[0][0] <= now:
+            _deadline, _seq, session, manager = heapq.heappop(heap)
+            if not session.is_connected or manager.sessions.get(session.player_id) is not session:
+                continue
+            deadline = session.last_activity + self.timeout
+            if deadline > now:
+                rearm.append((deadline, session, manager))
+            else:
+                expired.append((session, manager))
+        for deadline, session, manager in rearm:
+            heapq.heappush(heap, (deadline, next(self._sequence), session, manager))
+        self.rearmed += len(rearm)
+        return expired
+
+    async def expire(self, now: Optional[float] = None) -> int:
+        """
+        Odpojí relace, jejichž nečinnost přesáhla ``timeout``.
+
+        Args:
+            now: Aktuální monotónní čas (None = time.monotonic())
+
+        Returns:
+            Počet odpojených relací
+        """
+        expired = self.pop_expired(now)
+        for session, manager in expired:
+            logger.warning(f"⏱️ Hráč {session.player_id} neaktivní {session.get_idle_time():.1f}s, odpojuji")
+            await manager.remove(session)
+        self.expired += len(expired)
+        return len(expired)
+
+    async def run(self) -> None:
+        """Hlavní smyčka – spí do nejbližšího deadline a odpojí neaktivní relace."""
+        loop = asyncio.get_running_loop()
+        logger.info(f"⏱️ Hlídání nečinnosti spuštěno (timeout {self.timeout:g}s)")
+        try:
+            while True:
+                heap = self._heap
+                now = time.monotonic()
+                if not heap or heap[0][0] > now:
+                    # Jediný časovač na nejbližší deadline; watch() čekání zkrátí
+                    await self._wakeup.sleep_until(loop.time() + heap[0][0] - now if heap else None)
+                    continue
+                await self.expire(now)
+        except asyncio.CancelledError:
+            logger.info("🛑 Hlídání nečinnosti zrušeno")
+            raise
+
+    def _push(self, deadline: float, session: PlayerSession, manager: WebSocketManager) -> None:
+        """Vloží záznam do haldy a probudí smyčku, pokud spí déle."""
+        heapq.heappush(self._heap, (deadline, next(self._sequence), session, manager))
+        if self._heap[0][2] is session:
+            self._wakeup.wake()
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"IdleExpiry(watched={len(self._heap)}, expired={self.expired}, timeout={self.timeout:g}s)"
@@ -0,0 +1,226 @@
+"""
+InputBuffers - jitter buffer vstupních rámců hráčů jedné místnosti.
+
+Klient posílá vstup jako číslované rámce ``{"type": "input", "seq": N,
+"tick": T, "up": bool, "down": bool}``. ``tick`` je čas rámce v krocích
+simulace klienta (``sim_rate`` z ``connected``). Server rámce řadí do
+fronty hráče a aplikuje je v krocích simulace:
+
+- posun mezi hodinami klienta a serveru se odhaduje jako minimum zpoždění
+  ``step - tick`` za posledních ``OFFSET_WINDOW`` rámců (nejrychlejší cesta),
+- rozptyl zpoždění (jitter) se průměruje jako v RFC 3550; rámec se aplikuje
+  v kroku ``tick + posun + delay``, kde ``delay`` je malé adaptivní
+  zpoždění v rozsahu ``min_delay``…``max_delay`` kroků,
+- za krok se aplikuje nejvýše jeden rámec – krátký stisk a puštění mezi
+  dvěma ticky se tak neztratí; vstup platí až do dalšího rámce,
+- nahromadí-li se víc než ``max_delay`` splatných rámců, starší se zahodí.
+
+Rámce bez ``tick`` se aplikují v nejbližším kroku (stále po jednom).
+Ve snapshotu (``input_acks``) se vrací pro každého hráče dvojice
+``[seq, tick]``: číslo posledního aplikovaného rámce a krok klienta,
+kterému odpovídá stav jeho pálky (tick rámce + počet kroků, po které
+vstup od té doby platí; None u rámců bez ``tick``). Klient podle ní
+srovná předpověď a přehraje jen nepotvrzené vstupy (``PaddlePredictor``).
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from multipong import settings
+from .input_table import INPUT_DOWN, INPUT_UP, InputWriter
+
+
+# Počet posledních rámců, ze kterých se bere minimum zpoždění (posun hodin)
+OFFSET_WINDOW = 64
+
+# Zesílení průměrování jitteru (RFC 3550: 1/16) a násobek jitteru pro delay
+JITTER_GAIN = 16
+JITTER_DELAY_FACTOR = 2.0
+
+
+class PlayerInputBuffer:
+    """
+    Fronta vstupních rámců jednoho hráče.
+
+    Attributes:
+        last_seq: Číslo posledního aplikovaného rámce (None = žádný)
+        last_tick: Krok klienta odpovídající aktuálnímu stavu (None = neznámý)
+        last_received: Nejvyšší přijaté číslo rámce
+        delay: Aktuální adaptivní zpoždění v krocích simulace
+        jitter: Průměrný rozptyl zpoždění rámců (kroky)
+        late_frames: Počet rámců, které dorazily po svém kroku
+        dropped_frames: Počet zahozených rámců (přetečení, dohánění)
+    """
+
+    __slots__ = (
+        "min_delay", "max_delay", "capacity", "last_seq", "last_tick", "last_received",
+        "delay", "jitter", "late_frames", "dropped_frames", "_frames", "_lags",
+    )
+
+    def __init__(self, min_delay: int, max_delay: int, capacity: int):
+        """
+        Args:
+            min_delay: Minimální zpoždění v krocích
+            max_delay: Maximální zpoždění v krocích (a limit dohánění)
+            capacity: Max. počet čekajících rámců
+        """
+        self.min_delay = min_delay
+        self.max_delay = max(min_delay, max_delay)
+        self.capacity = capacity
+        self.last_seq: Optional[int] = None
+        self.last_tick: Optional[int] = None
+        self.last_received: Optional[int] = None
+        self.delay = min_delay
+        self.jitter = 0.0
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self._frames: Deque[Tuple[int, int, int, Optional[int]]] = deque()  # (seq, cílový krok, bity, tick)
+        self._lags: Deque[int] = deque(maxlen=OFFSET_WINDOW)
+
+    def push(self, seq: int, bits: int, tick: Optional[int], step: int) -> bool:
+        """
+        Zařadí rámec do fronty.
+
+        Args:
+            seq: Číslo rámce (rostoucí)
+            bits: Bity ``INPUT_UP`` / ``INPUT_DOWN``
+            tick: Krok klienta, pro který rámec vznikl (None = hned)
+            step: Aktuální krok simulace serveru
+
+        Returns:
+            False pokud jde o duplicitní nebo starší rámec
+        """
+        if self.last_received is not None and seq <= self.last_received:
+            return False
+        self.last_received = seq
+
+        if tick is None:
+            target = step
+        else:
+            lag = step - tick
+            lags = self._lags
+            lags.append(lag)
+            offset = min(lags)
+            self.jitter += (lag - offset - self.jitter) / JITTER_GAIN
+            self.delay = min(self.max_delay, max(self.min_delay, math.ceil(self.jitter * JITTER_DELAY_FACTOR)))
+            target = tick + offset + self.delay
+            if target <= step:
+                self.late_frames += 1
+
+        frames = self._frames
+        if len(frames) >= self.capacity:
+            frames.popleft()
+            self.dropped_frames += 1
+        frames.append((seq, target, bits, tick))
+        return True
+
+    def pop(self, step: int) -> Optional[int]:
+        """
+        Vrátí bity rámce, který se má aplikovat v kroku ``step``.
+
+        Returns:
+            Bity vstupu, nebo None pokud žádný rámec není splatný
+            (platí předchozí vstup, ``last_tick`` se posune o krok)
+        """
+        frames = self._frames
+        if not frames or frames[0][1] > step:
+            if self.last_tick is not None:
+                self.last_tick += 1
+            return None
+        # Dohánění – víc než max_delay splatných rámců = zbytečná latence
+        while len(frames) > self.max_delay and frames[self.max_delay][1] <= step:
+            frames.popleft()
+            self.dropped_frames += 1
+        seq, _target, bits, tick = frames.popleft()
+        self.last_seq = seq
+        self.last_tick = tick
+        return bits
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+class InputBuffers:
+    """
+    Jitter buffery všech hráčů místnosti, zapisující do ``InputTable``.
+
+    Attributes:
+        table: Tabulka vstupů, kterou čte engine (InputTable nebo DictInputTable)
+        acks: Potvrzení vstupů {player_id: [seq, tick]} (viz modul)
+    """
+
+    def __init__(
+        self,
+        table: InputWriter,
+        min_delay: Optional[int] = None,
+        max_delay: Optional[int] = None,
+        capacity: Optional[int] = None
+    ):
+        """
+        Args:
+            table: Tabulka vstupů místnosti
+            min_delay: Minimální zpoždění v krocích (None = SERVER_INPUT_DELAY_MIN)
+            max_delay: Maximální zpoždění v krocích (None = SERVER_INPUT_DELAY_MAX)
+            capacity: Kapacita fronty hráče (None = SERVER_INPUT_BUFFER_SIZE)
+        """
+        self.table = table
+        self.min_delay = settings.SERVER_INPUT_DELAY_MIN if min_delay is None else min_delay
+        self.max_delay = settings.SERVER_INPUT_DELAY_MAX if max_delay is None else max_delay
+        self.capacity = capacity or settings.SERVER_INPUT_BUFFER_SIZE
+        self.acks: Dict[str, List[Optional[int]]] = {}
+        self._buffers: Dict[str, PlayerInputBuffer] = {}
+
+    def push(self, player_id: str, seq: int, up: bool, down: bool, tick: Optional[int], step: int) -> bool:
+        """
+        Zařadí vstupní rámec hráče.
+
+        Args:
+            player_id: ID hráče (pozice pálky)
+            seq: Číslo rámce
+            up: Stav tlačítka nahoru
+            down: Stav tlačítka dolů
+            tick: Krok klienta, pro který rámec vznikl (None = hned)
+            step: Aktuální krok simulace
+
+        Returns:
+            False pokud byl rámec zahozen jako duplicitní
+        """
+        buffer = self._buffers.get(player_id)
+        if buffer is None:
+            buffer = self._buffers[player_id] = PlayerInputBuffer(self.min_delay, self.max_delay, self.capacity)
+        bits = (INPUT_UP if up else 0) | (INPUT_DOWN if down else 0)
+        return buffer.push(seq, bits, tick, step)
+
+    def advance(self, step: int) -> None:
+        """
+        Aplikuje rámce splatné v kroku ``step`` do tabulky vstupů.
+
+        Args:
+            step: Krok simulace, který se právě provede
+        """
+        table = self.table
+        acks = self.acks
+        for player_id, buffer in self._buffers.items():
+            bits = buffer.pop(step)
+            if bits is not None:
+                table.set(player_id, bool(bits & INPUT_UP), bool(bits & INPUT_DOWN))
+            if buffer.last_seq is not None:
+                acks[player_id] = [buffer.last_seq, buffer.last_tick]
+
+    def get(self, player_id: str) -> Optional[PlayerInputBuffer]:
+        """Vrátí buffer hráče (None pokud neposílá číslované rámce)."""
+        return self._buffers.get(player_id)
+
+    def clear(self, player_id: str) -> None:
+        """Zapomene frontu a potvrzení odpojeného hráče."""
+        self._buffers.pop(player_id, None)
+        self.acks.pop(player_id, None)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        delays = {pid: buffer.delay for pid, buffer in self._buffers.items()}
+        return f"InputBuffers(delays={delays})"
@@ -0,0 +1,186 @@
+"""
+InputTable - předalokovaná tabulka vstupů hráčů jedné místnosti.
+
+Zpráva ``input`` od klienta se zapíše přímo do tabulky (``set``) a tick
+ji čte bez kopírování – tabulka je ``Mapping`` ve tvaru, který očekává
+``MultipongEngine.update`` (``{"A1": {"up": bool, "down": bool}, ...}``).
+
+Každá pozice (pálka) má jeden bajt s bitovou maskou ``INPUT_UP``,
+``INPUT_DOWN`` a ``INPUT_ACTIVE`` (pozici ovládá připojený hráč; bez něj
+ji engine nechá AI). Hodnoty jsou sdílené neměnné slovníky, čtení tedy
+nic nealokuje.
+
+``DictInputTable`` nabízí stejné zápisové rozhraní nad obyčejným slovníkem
+volajícího (``run_game_loop`` se sdílenou mapou vstupů).
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Union
+
+
+# Bity vstupu jedné pozice
+INPUT_UP = 0x01
+INPUT_DOWN = 0x02
+INPUT_ACTIVE = 0x04
+
+# Stav tlačítek podle bitů UP/DOWN (neměnné, sdílené všemi tabulkami)
+_BUTTON_STATES = tuple(
+    MappingProxyType({"up": bool(bits & INPUT_UP), "down": bool(bits & INPUT_DOWN)})
+    for bits in range(4)
+)
+
+
+class InputTable(Mapping):
+    """
+    Vstupy hráčů indexované pozicí pálky.
+
+    Attributes:
+        version: Počítadlo změn (roste při každé změně vstupu)
+    """
+
+    __slots__ = ("_index", "_slots", "_bits", "version")
+
+    def __init__(self, slots: Iterable[str] = ()):
+        """
+        Args:
+            slots: ID pozic, pro které se tabulka předalokuje (např. pálky enginu);
+                   jiné pozice se přidají při prvním zápisu
+        """
+        self._index: Dict[str, int] = {}
+        self._slots: list = []
+        self._bits = bytearray()
+        self.version = 0
+        for slot in slots:
+            self._slot_index(slot)
+
+    def _slot_index(self, slot: str) -> int:
+        """Vrátí index pozice (neznámou pozici přidá)."""
+        index = self._index.get(slot)
+        if index is None:
+            index = self._index[slot] = len(self._slots)
+            self._slots.append(slot)
+            self._bits.append(0)
+        return index
+
+    def set(self, slot: str, up: bool, down: bool) -> bool:
+        """
+        Zapíše vstup hráče a označí pozici jako ovládanou hráčem.
+
+        Args:
+            slot: ID pozice (pálky)
+            up: Stav tlačítka nahoru
+            down: Stav tlačítka dolů
+
+        Returns:
+            True pokud se vstup změnil
+        """
+        bits = INPUT_ACTIVE | (INPUT_UP if up else 0) | (INPUT_DOWN if down else 0)
+        index = self._slot_index(slot)
+        if self._bits[index] == bits:
+            return False
+        self._bits[index] = bits
+        self.version += 1
+        return True
+
+    def clear(self, slot: str) -> bool:
+        """
+        Uvolní pozici (hráč se odpojil) – pálku opět řídí engine.
+
+        Returns:
+            True pokud byla pozice ovládána hráčem
+        """
+        index = self._index.get(slot)
+        if index is None or not self._bits[index]:
+            return False
+        self._bits[index] = 0
+        self.version += 1
+        return True
+
+    def clear_all(self) -> None:
+        """Uvolní všechny pozice."""
+        if any(self._bits):
+            self._bits[:] = bytes(len(self._bits))
+            self.version += 1
+
+    def bits(self, slot: str) -> int:
+        """Vrátí bitovou masku vstupu pozice (0 = neovládaná)."""
+        index = self._index.get(slot)
+        return self._bits[index] if index is not None else 0
+
+    def __getitem__(self, slot: str) -> Mapping:
+        index = self._index.get(slot)
+        if index is None or not self._bits[index]:
+            raise KeyError(slot)
+        return _BUTTON_STATES[self._bits[index] & (INPUT_UP | INPUT_DOWN)]
+
+    def __contains__(self, slot: object) -> bool:
+        if not isinstance(slot, str):
+            return False
+        index = self._index.get(slot)
+        return index is not None and self._bits[index] != 0
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self._bits
+        return (slot for index, slot in enumerate(self._slots) if bits[index])
+
+    def __len__(self) -> int:
+        return len(self._bits) - self._bits.count(0)
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"InputTable({dict((slot, dict(state)) for slot, state in self.items())})"
+
+
+class DictInputTable:
+    """
+    Zápis vstupů do sdílené mapy volajícího se stejným rozhraním jako InputTable.
+
+    Engine čte přímo slovník ``inputs``, takže změny, které v něm udělá
+    volající, se projeví v dalším kroku; game loop (``update_input``,
+    ``clear_input``, jitter buffer) do něj zapisuje přes tuto obálku.
+
+    Attributes:
+        inputs: Sdílená mapa vstupů {player_id: {"up": bool, "down": bool}}
+        version: Počítadlo změn (roste při každé změně vstupu přes obálku)
+    """
+
+    __slots__ = ("inputs", "version")
+
+    def __init__(self, inputs: Dict[str, Dict[str, bool]]):
+        """
+        Args:
+            inputs: Sdílená mapa vstupů volajícího
+        """
+        self.inputs = inputs
+        self.version = 0
+
+    def set(self, slot: str, up: bool, down: bool) -> bool:
+        """Zapíše vstup hráče; vrátí True pokud se změnil."""
+        state = {"up": bool(up), "down": bool(down)}
+        if self.inputs.get(slot) == state:
+            return False
+        self.inputs[slot] = state
+        self.version += 1
+        return True
+
+    def clear(self, slot: str) -> bool:
+        """Odebere vstup hráče; vrátí True pokud ho mapa obsahovala."""
+        if self.inputs.pop(slot, None) is None:
+            return False
+        self.version += 1
+        return True
+
+    def clear_all(self) -> None:
+        """Odebere všechny vstupy."""
+        if self.inputs:
+            self.inputs.clear()
+            self.version += 1
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"DictInputTable({self.inputs})"
+
+
+# Zápisové rozhraní vstupů game loopu
+InputWriter = Union[InputTable, DictInputTable]
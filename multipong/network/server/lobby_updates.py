@@ -0,0 +1,121 @@
+"""
+LobbyBroadcaster - slučované a verzované ``lobby_update`` zprávy místnosti.
+
+Každá lobby zpráva (``join_lobby``, ``choose_slot``, ``set_ready``,
+``set_ai_level``) dříve rozeslala všem relacím plný stav lobby – při
+náporu hráčů O(hráčů²) zpráv s osmi sloty a nastavením. Místo toho:
+
+- zpráva jen označí lobby za změněné (``mark_dirty``); změny během okna
+  ``server.lobby_update_window`` se sloučí do jednoho rozeslání,
+- rozesílá se diff proti naposledy rozeslanému stavu s rostoucí verzí
+  (``multipong.network.lobby_diff``), beze změny se nerozesílá nic,
+- plný stav dostane jen relace, která ho potřebuje (``send_full`` – vstup
+  do lobby nebo ``lobby_sync`` po výpadku verze).
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from multipong import settings
+from multipong.network.lobby_diff import build_lobby_update, compute_lobby_diff
+from .lobby import Lobby
+from .player_session import PlayerSession
+from .websocket_manager import WebSocketManager, encode_message
+
+
+logger = logging.getLogger(__name__)
+
+
+class LobbyBroadcaster:
+    """
+    Rozesílání změn lobby jedné místnosti.
+
+    Attributes:
+        lobby: Lobby místnosti
+        manager: WebSocketManager s relacemi místnosti
+        window: Okno slučování změn (s)
+        version: Verze naposledy rozeslaného stavu
+        updates_sent: Počet rozeslaných diffů
+        changes_coalesced: Počet změn sloučených do již naplánovaného rozeslání
+    """
+
+    def __init__(self, lobby: Lobby, manager: WebSocketManager, window: Optional[float] = None):
+        """
+        Args:
+            lobby: Lobby místnosti
+            manager: WebSocketManager s relacemi místnosti
+            window: Okno slučování v sekundách (None = server.lobby_update_window)
+        """
+        self.lobby = lobby
+        self.manager = manager
+        self.window = settings.SERVER_LOBBY_UPDATE_WINDOW if window is None else window
+        self.version = 0
+        self.updates_sent = 0
+        self.changes_coalesced = 0
+        self._state: Dict[str, Any] = lobby.get_lobby_state()
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def pending(self) -> bool:
+        """True pokud čeká naplánované rozeslání změn."""
+        return self._handle is not None
+
+    def mark_dirty(self) -> None:
+        """
+        Označí lobby za změněné; rozeslání proběhne po uplynutí okna.
+
+        Musí být voláno uvnitř běžící event loop.
+        """
+        if self._handle is not None:
+            self.changes_coalesced += 1
+            return
+        self._handle = asyncio.get_running_loop().call_later(self.window, self.flush)
+
+    def flush(self) -> int:
+        """
+        Rozešle změny lobby hned (zruší naplánované rozeslání).
+
+        Returns:
+            Počet relací, kterým byl diff zařazen (0 = beze změny)
+        """
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.cancel()
+        state = self.lobby.get_lobby_state()
+        diff = compute_lobby_diff(self._state, state)
+        if not diff:
+            return 0
+        self._state = state
+        self.version += 1
+        self.updates_sent += 1
+        return self.manager.enqueue_text(encode_message(build_lobby_update(state, self.version, diff)))
+
+    def full_update(self) -> Dict[str, Any]:
+        """Vrátí plnou ``lobby_update`` zprávu naposledy rozeslané verze."""
+        return build_lobby_update(self._state, self.version)
+
+    def send_full(self, session: PlayerSession) -> bool:
+        """
+        Zařadí relaci plný stav lobby (ve stejné frontě jako diffy).
+
+        Relace dostane naposledy rozeslanou verzi, na kterou navážou další
+        diffy; čekající změny přijdou v nejbližším rozeslání.
+
+        Returns:
+            False pokud relace zprávu nepřijala (odpojená nebo zahlcená)
+        """
+        return session.enqueue_text(encode_message(self.full_update()))
+
+    def cancel(self) -> None:
+        """Zruší naplánované rozeslání (např. při rušení místnosti)."""
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.cancel()
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"LobbyBroadcaster(version={self.version}, sent={self.updates_sent}, "
+            f"coalesced={self.changes_coalesced}, pending={self.pending})"
+        )
@@ -0,0 +1,195 @@
+"""
+Metriky serveru v textovém formátu Prometheus (``GET /metrics``).
+
+Metriky se nesbírají zvlášť – při každém scrapu se převedou existující
+počítadla a histogramy s pevnými koši (``multipong.engine.profiling``):
+
+- ``GameLoop.tick_time`` / ``jitter`` a fáze ``PhaseProfiler`` (při
+  ``server.profiling``) – u místností ve workerech z jejich hlášení,
+- ``WebSocketManager.fanout_time`` a provoz relací (zprávy a bajty),
+- hloubky odchozích front relací, počty relací a místností,
+- počítadla přijatých zpráv podle typu z ``Telemetry`` (rate vstupů),
+- doba zápisu výsledků do DB (``game_loop.db_write_time``).
+
+Scrape je jen čtení v event loopu – nic se při něm nečeká ani nezamyká.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from . import game_loop
+from .room_manager import RoomManager
+from .telemetry import Telemetry
+
+# Content-Type textového formátu Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    """Escapuje hodnotu labelu (zpětné lomítko, uvozovky, nový řádek)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    """Vrátí ``{a="x",b="y"}`` (prázdný řetězec bez labelů)."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Formát čísla vzorku (celá čísla bez desetinné části, +Inf)."""
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsWriter:
+    """
+    Skládá metriky do textového formátu (HELP/TYPE jednou za metriku).
+
+    Attributes:
+        prefix: Prefix názvů metrik
+    """
+
+    def __init__(self, prefix: str = "multipong_"):
+        """
+        Args:
+            prefix: Prefix názvů metrik
+        """
+        self.prefix = prefix
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> List[str]:
+        """Vrátí seznam řádků vzorků metriky (a zaregistruje ji)."""
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = (kind, help_text, [])
+        return family[2]
+
+    def gauge(self, name: str, help_text: str, value: float, labels: Labels = ()) -> None:
+        """Přidá vzorek gauge."""
+        name = self.prefix + name
+        self._family(name, "gauge", help_text).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def counter(self, name: str, help_text: str, value: float, labels: Labels = ()) -> None:
+        """Přidá vzorek counteru (název bez ``_total``, přípona se doplní)."""
+        name = self.prefix + name
+        self._family(name, "counter", help_text).append(
+            f"{name}_total{_format_labels(labels)} {_format_value(value)}"
+        )
+
+    def histogram(self, name: str, help_text: str, histogram: Mapping[str, Any], labels: Labels = ()) -> None:
+        """
+        Přidá histogram (kumulativní koše ``_bucket``, ``_sum`` a ``_count``).
+
+        Args:
+            name: Název metriky (bez prefixu)
+            help_text: Popis metriky
+            histogram: Serializovaný Histogram (``Histogram.to_dict()``)
+            labels: Labely vzorku
+        """
+        name = self.prefix + name
+        lines = self._family(name, "histogram", help_text)
+        cumulative = 0
+        for bound, count in histogram.get("buckets", ()):
+            cumulative += count
+            le = (("le", _format_value(bound)),)
+            lines.append(f"{name}_bucket{_format_labels(labels + le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.get('total', 0.0))}")
+        lines.append(f"{name}_count{_format_labels(labels)} {histogram.get('count', 0)}")
+
+    def render(self) -> str:
+        """Vrátí všechny metriky v textovém formátu (zakončený novým řádkem)."""
+        out: List[str] = []
+        for name, (kind, help_text, lines) in self._families.items():
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(lines)
+        return "\n".join(out) + "\n"
+
+
+def collect_room(writer: MetricsWriter, room: Any) -> None:
+    """
+    Přidá metriky jedné místnosti (``Room`` i ``RemoteRoom``).
+
+    Args:
+        writer: Cílový MetricsWriter
+        room: Místnost s ``manager`` a ``get_timings()``
+    """
+    labels: Labels = (("room", room.room_id),)
+    manager = room.manager
+
+    writer.gauge("sessions", "Připojené relace hráčů", manager.get_player_count(), labels)
+    depths = list(manager.get_queue_depths().values())
+    writer.gauge("send_queue_depth", "Zprávy čekající v odchozích frontách relací (součet)", sum(depths), labels)
+    writer.gauge(
+        "send_queue_depth_max", "Nejdelší odchozí fronta relace v místnosti", max(depths, default=0), labels
+    )
+
+    traffic = manager.get_traffic()
+    writer.counter("messages_sent", "Zprávy odeslané klientům", traffic["messages_sent"], labels)
+    writer.counter("bytes_sent", "Bajty odeslané klientům", traffic["bytes_sent"], labels)
+    writer.counter("bytes_received", "Bajty přijaté od klientů", traffic["bytes_received"], labels)
+    writer.counter(
+        "backed_up_disconnects", "Relace odpojené kvůli zahlcení", manager.backed_up_disconnects, labels
+    )
+    writer.histogram(
+        "broadcast_fanout_seconds", "Doba rozdělení snapshotu do front relací",
+        manager.fanout_time.to_dict(), labels
+    )
+
+    timings = room.get_timings()
+    if "tick" in timings:
+        writer.histogram("tick_duration_seconds", "Doba průchodu game loopem", timings["tick"], labels)
+    if "jitter" in timings:
+        writer.histogram(
+            "tick_jitter_seconds", "Zpoždění startu ticku vůči deadline", timings["jitter"], labels
+        )
+    for stage, histogram in sorted(timings.get("stages", {}).items()):
+        writer.histogram(
+            "stage_duration_seconds", "Doba fáze ticku (server.profiling)",
+            histogram, labels + (("stage", stage),)
+        )
+
+
+def render_metrics(rooms: RoomManager, telemetry: Optional[Telemetry] = None) -> str:
+    """
+    Sestaví text ``/metrics`` pro všechny místnosti.
+
+    Args:
+        rooms: Správce místností (``RoomManager`` / ``ShardedRoomManager``)
+        telemetry: Telemetrie zpráv klientů (počítadla přijatých zpráv)
+
+    Returns:
+        Metriky v textovém formátu Prometheus
+    """
+    writer = MetricsWriter()
+    writer.gauge("rooms", "Běžící místnosti", rooms.get_room_count())
+    writer.gauge("rooms_max", "Limit počtu místností", rooms.max_rooms)
+    for room_id in sorted(rooms.rooms):
+        collect_room(writer, rooms.rooms[room_id])
+
+    if telemetry is not None:
+        for (room_id, msg_type), count in sorted(telemetry.counters.items()):
+            writer.counter(
+                "messages_received", "Zprávy přijaté od klientů podle typu",
+                count, (("room", room_id), ("type", msg_type))
+            )
+        for (room_id, msg_type, reason), count in sorted(telemetry.rejected.items()):
+            writer.counter(
+                "messages_rejected", "Zprávy odmítnuté limity spojení (velikost, frekvence)",
+                count, (("room", room_id), ("type", msg_type), ("reason", reason))
+            )
+        writer.counter(
+            "telemetry_dropped_events", "Události telemetrie přepsané před zápisem", telemetry.dropped_events
+        )
+
+    writer.histogram(
+        "db_write_duration_seconds", "Doba zápisu výsledků zápasu (save_match_results)",
+        game_loop.db_write_time.to_dict()
+    )
+    return writer.render()
@@ -1,11 +1,38 @@
 """
 PlayerSession - reprezentace připojeného hráče.
-Uchovává WebSocket spojení, ID hráče a aktuální vstup.
+Uchovává WebSocket spojení, ID hráče, aktuální vstup a odchozí frontu.
+
+Odchozí zprávy z broadcastu se neposílají přímo – ``enqueue_text`` je
+vloží do fronty relace a odešle je vlastní writer task. Pomalý klient tak
+nezdrží tick ostatním:
+- snapshoty se slučují (neodeslaný starší snapshot nahradí nejnovější),
+- spolehlivé zprávy (chat, lobby) se drží v omezené frontě v pořadí,
+- přetečení fronty nebo dlouho stojící odesílání značí zahlcenou relaci.
+
+Položky fronty jsou text (JSON) nebo bajty (binární snapshot, viz
+``multipong.network.snapshot_codec``); bajty se posílají binárním rámcem.
 """
 
+import asyncio
+import logging
 import time
-from typing import Dict
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
 from fastapi import WebSocket
+from multipong import settings
+from multipong.network.snapshot_codec import SNAPSHOT_FORMAT_JSON
+
+
+logger = logging.getLogger(__name__)
+
+# Kód zavření WebSocketu pro zahlcené relace ("Try Again Later")
+CLOSE_CODE_BACKED_UP = 1013
+
+# Kód zavření WebSocketu, když místnost ztratila worker proces ("Internal Error")
+CLOSE_CODE_WORKER_LOST = 1011
+
+# Zakódovaná odchozí zpráva (JSON text nebo binární snapshot)
+Payload = Union[str, bytes]
 
 
 class PlayerSession:
@@ -17,15 +44,46 @@ class PlayerSession:
         player_id: Unikátní ID hráče (např. "A1", "A2", "B1", "B2")
         current_input: Aktuální stav vstupů od hráče
         is_connected: Zda je hráč stále připojen
+        last_activity: Čas poslední zprávy od klienta (``time.monotonic``)
+        snapshot_format: Vyjednaný formát snapshotů ("json" nebo "binary")
+        snapshot_delta: Relace dostává delta snapshoty proti potvrzené baseline
+        acked_seq: Poslední snapshot potvrzený klientem (None = žádný / resync)
+        keyframe_seq: Číslo snapshotu, kdy relace naposledy dostala keyframe
+        config_version: Verze konfigurace zápasu, kterou klient zná
+        stats_version: Verze statistik v posledním odeslaném plném snapshotu relace
+        snapshot_rate: Vyjednaná frekvence snapshotů v Hz (None = každý tick)
+        snapshot_interval: Relace dostane každý N-tý snapshot místnosti
+        max_queue: Max. počet spolehlivých zpráv čekajících na odeslání
+        stall_timeout: Max. doba bez odeslání zprávy při neprázdné frontě (s)
+        messages_sent: Počet zpráv odeslaných writer taskem
+        bytes_sent: Počet bajtů odeslaných writer taskem (UTF-8 / binární)
+        messages_received: Počet zpráv přijatých od klienta
+        bytes_received: Počet bajtů přijatých od klienta
+        snapshots_coalesced: Počet snapshotů nahrazených novějším před odesláním
+        on_send_failed: Callback při chybě odesílání (nastaví WebSocketManager)
     """
     
-    def __init__(self, websocket: WebSocket, player_id: str):
+    def __init__(
+        self,
+        websocket: WebSocket,
+        player_id: str,
+        max_queue: Optional[int] = None,
+        stall_timeout: Optional[float] = None,
+        snapshot_format: str = SNAPSHOT_FORMAT_JSON,
+        snapshot_delta: bool = False,
+        snapshot_rate: Optional[float] = None
+    ):
         """
         Inicializace herní relace hráče.
         
         Args:
             websocket: WebSocket spojení
             player_id: ID hráče
+            max_queue: Kapacita fronty spolehlivých zpráv (None = config)
+            stall_timeout: Limit stojícího odesílání v s (None = config)
+            snapshot_format: Formát snapshotů vyjednaný v handshake
+            snapshot_delta: Posílat delta snapshoty (klient potvrzuje snapshoty)
+            snapshot_rate: Frekvence snapshotů v Hz (None = každý tick místnosti)
         """
         self.websocket: WebSocket = websocket
         self.player_id: str = player_id
@@ -34,11 +92,47 @@ class PlayerSession:
             "down": False
         }
         self.is_connected: bool = True
-        self.last_activity: float = time.time()
+        self.snapshot_format: str = snapshot_format
+        self.snapshot_delta: bool = snapshot_delta
+        self.acked_seq: Optional[int] = None
+        self.keyframe_seq: int = 0
+        self.config_version: Optional[int] = None
+        self.stats_version: Optional[int] = None
+        self.snapshot_rate: Optional[float] = snapshot_rate
+        self.snapshot_interval: int = 1
+        self.last_activity: float = time.monotonic()
+        
+        # Odchozí fronta (plní broadcast, vyprazdňuje writer task)
+        self.max_queue = max_queue or settings.SERVER_SEND_QUEUE_SIZE
+        self.stall_timeout = stall_timeout or settings.SERVER_SEND_STALL_TIMEOUT
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.messages_received = 0
+        self.bytes_received = 0
+        self.snapshots_coalesced = 0
+        self.on_send_failed: Optional[Callable[["PlayerSession", Exception], None]] = None
+        self._reliable: Deque[Payload] = deque()
+        self._pending_snapshot: Optional[Payload] = None
+        self._pending_versions: Optional[Tuple[Optional[int], Optional[int]]] = None
+        self._sending = False
+        self._last_progress = time.monotonic()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
     
     def update_activity(self) -> None:
-        """Aktualizuje čas poslední aktivity hráče."""
-        self.last_activity = time.time()
+        """Aktualizuje čas poslední aktivity hráče (monotónní hodiny)."""
+        self.last_activity = time.monotonic()
+    
+    def record_received(self, size: int) -> None:
+        """
+        Započítá přijatou zprávu (před jejím dekódováním).
+        
+        Args:
+            size: Velikost zprávy v bajtech
+        """
+        self.messages_received += 1
+        self.bytes_received += size
     
     def get_idle_time(self) -> float:
         """
@@ -47,7 +141,7 @@ class PlayerSession:
         Returns:
             Počet sekund od poslední aktivity
         """
-        return time.time() - self.last_activity
+        return time.monotonic() - self.last_activity
     
     def update_input(self, up: bool = False, down: bool = False) -> None:
         """
@@ -70,6 +164,31 @@ class PlayerSession:
         """
         return self.current_input.copy()
     
+    def ack_snapshot(self, seq: Optional[int]) -> None:
+        """
+        Zaznamená potvrzení snapshotu klientem (baseline pro delta snapshoty).
+        
+        Args:
+            seq: Číslo potvrzeného snapshotu; None = klient ztratil baseline
+                 a potřebuje plný snapshot (resync)
+        """
+        if seq is None:
+            self.acked_seq = None
+        elif isinstance(seq, int) and (self.acked_seq is None or seq > self.acked_seq):
+            self.acked_seq = seq
+    
+    def snapshot_due(self, seq: int) -> bool:
+        """
+        Kontroluje, zda relace dostane snapshot s číslem ``seq``.
+        
+        Relace se stejným intervalem dostávají stejné snapshoty, takže
+        sdílejí jejich zakódování.
+        
+        Args:
+            seq: Číslo snapshotu místnosti
+        """
+        return seq % self.snapshot_interval == 0
+    
     async def send_json(self, data: dict) -> None:
         """
         Odešle JSON zprávu klientovi.
@@ -83,9 +202,175 @@ class PlayerSession:
         if self.is_connected:
             await self.websocket.send_json(data)
     
+    async def send_text(self, text: str) -> None:
+        """
+        Odešle již zakódovanou (JSON) zprávu klientovi.
+        
+        Args:
+            text: Text zprávy
+            
+        Raises:
+            Exception: Pokud odeslání selže
+        """
+        if self.is_connected:
+            await self.websocket.send_text(text)
+    
+    @property
+    def queue_depth(self) -> int:
+        """Počet zpráv čekajících na odeslání (spolehlivé + snapshot)."""
+        return len(self._reliable) + (self._pending_snapshot is not None)
+    
+    def has_pending(self) -> bool:
+        """True pokud fronta obsahuje neodeslanou zprávu nebo právě probíhá odesílání."""
+        return self._sending or bool(self._reliable) or self._pending_snapshot is not None
+    
+    def is_stalled(self, now: Optional[float] = None) -> bool:
+        """
+        Kontroluje, zda odesílání stojí déle než ``stall_timeout``.
+        
+        Args:
+            now: Aktuální monotónní čas (None = time.monotonic())
+        """
+        if not self.has_pending():
+            return False
+        now = time.monotonic() if now is None else now
+        return now - self._last_progress > self.stall_timeout
+    
+    def enqueue_text(
+        self,
+        text: Payload,
+        reliable: bool = True,
+        versions: Optional[Tuple[Optional[int], Optional[int]]] = None
+    ) -> bool:
+        """
+        Zařadí zakódovanou zprávu do odchozí fronty (bez čekání na síť).
+        
+        Args:
+            text: Text zprávy (bajty = binární snapshot)
+            reliable: True = zpráva se musí doručit (chat, lobby),
+                      False = snapshot, neodeslaný starší se nahradí
+            versions: (stats_version, config_version) plného snapshotu – relace
+                      je převezme až po jeho odeslání; nahrazený snapshot tak
+                      statistiky ani konfiguraci "nespotřebuje"
+            
+        Returns:
+            False pokud je relace odpojená nebo zahlcená (přetečení fronty
+            spolehlivých zpráv, odesílání stojí déle než ``stall_timeout``)
+        """
+        if not self.is_connected:
+            return False
+        
+        now = time.monotonic()
+        if not self.has_pending():
+            self._last_progress = now
+        elif now - self._last_progress > self.stall_timeout:
+            return False
+        
+        if reliable:
+            if len(self._reliable) >= self.max_queue:
+                return False
+            self._reliable.append(text)
+        else:
+            if self._pending_snapshot is not None:
+                self.snapshots_coalesced += 1
+            self._pending_snapshot = text
+            self._pending_versions = versions
+        
+        wakeup, idle = self._ensure_writer()
+        idle.clear()
+        wakeup.set()
+        return True
+    
+    async def drain(self) -> None:
+        """Počká, až writer task odešle všechny zprávy z fronty."""
+        idle, task = self._idle, self._writer_task
+        if idle is not None and task is not None and not task.done():
+            await idle.wait()
+    
+    def _ensure_writer(self) -> Tuple[asyncio.Event, asyncio.Event]:
+        """
+        Spustí writer task, pokud neběží (události se vážou k aktuální event loop).
+
+        Returns:
+            Události (wakeup, idle) běžícího writer tasku
+        """
+        wakeup, idle = self._wakeup, self._idle
+        if wakeup is None or idle is None or self._writer_task is None or self._writer_task.done():
+            wakeup = self._wakeup = asyncio.Event()
+            idle = self._idle = asyncio.Event()
+            self._writer_task = asyncio.create_task(
+                self._writer(wakeup, idle), name=f"session-writer-{self.player_id}"
+            )
+        return wakeup, idle
+    
+    async def _writer(self, wakeup: asyncio.Event, idle: asyncio.Event) -> None:
+        """Writer task – postupně odesílá zprávy z fronty (spolehlivé přednostně)."""
+        try:
+            while self.is_connected:
+                await wakeup.wait()
+                wakeup.clear()
+                while self.is_connected:
+                    versions = None
+                    if self._reliable:
+                        text = self._reliable.popleft()
+                    elif self._pending_snapshot is not None:
+                        text, self._pending_snapshot = self._pending_snapshot, None
+                        versions, self._pending_versions = self._pending_versions, None
+                    else:
+                        break
+                    self._sending = True
+                    try:
+                        if isinstance(text, bytes):
+                            await self.websocket.send_bytes(text)
+                            size = len(text)
+                        else:
+                            await self.websocket.send_text(text)
+                            size = len(text) if text.isascii() else len(text.encode())
+                    finally:
+                        self._sending = False
+                    self.messages_sent += 1
+                    self.bytes_sent += size
+                    if versions is not None:
+                        self.stats_version, self.config_version = versions
+                    self._last_progress = time.monotonic()
+                idle.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Chyba při odesílání zprávy hráči {self.player_id}: {e}")
+            self.disconnect()
+            if self.on_send_failed is not None:
+                self.on_send_failed(self, e)
+        finally:
+            idle.set()
+    
+    async def close(self, code: int = CLOSE_CODE_BACKED_UP) -> None:
+        """
+        Odpojí relaci a zavře WebSocket (např. zahlcený klient).
+        
+        Args:
+            code: Kód zavření WebSocketu
+        """
+        self.disconnect()
+        try:
+            await self.websocket.close(code=code)
+        except Exception as e:
+            logger.debug(f"WebSocket hráče {self.player_id} nelze zavřít: {e}")
+    
     def disconnect(self) -> None:
-        """Označí session jako odpojenou."""
+        """Označí session jako odpojenou a zastaví writer task."""
         self.is_connected = False
+        self._reliable.clear()
+        self._pending_snapshot = None
+        self._pending_versions = None
+        task = self._writer_task
+        if task is not None and not task.done():
+            try:
+                current = asyncio.current_task()
+            except RuntimeError:
+                current = None
+            if task is not current:
+                task.cancel()
     
     def __repr__(self) -> str:
         """Textová reprezentace pro debugging."""
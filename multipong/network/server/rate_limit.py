@@ -0,0 +1,206 @@
+"""
+MessageLimiter - limity příchozích zpráv jednoho spojení (token bucket).
+
+Bez limitů server přijme od klienta libovolné množství ``input``, ``chat``
+či ``ping`` zpráv a každou dekóduje jako JSON – jediný klient tak může
+zahltit event loop celé místnosti. MessageLimiter proto každou zprávu
+ověří ještě před dekódováním:
+
+- zpráva delší než ``server.max_message_size`` bajtů se odmítne (a spojení
+  se ukončí – legitimní klient tak velké zprávy neposílá),
+- typ zprávy se přečte z textu levným regulárním výrazem (bez JSON
+  dekódování) a zpráva spotřebuje token z kbelíku svého typu
+  (``server.rate_limits``: ``{typ: {"rate": za sekundu, "burst": kapacita,
+  "policy": "drop" | "disconnect"}}``, ``"*"`` platí pro ostatní typy),
+- po dekódování ``recheck`` ověří, že skutečný typ odpovídá přečtenému;
+  zpráva, která typ jen předstírala, se započítá do kbelíku skutečného typu.
+
+Odmítnutá zpráva se podle politiky kbelíku zahodí, nebo se spojení ukončí.
+"""
+
+import re
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from multipong import settings
+
+
+# Klíč limitu platný pro typy zpráv bez vlastního nastavení
+DEFAULT_LIMIT_KEY = "*"
+
+# Politiky odmítnuté zprávy
+POLICY_DROP = "drop"
+POLICY_DISCONNECT = "disconnect"
+
+# Důvody odmítnutí (štítek počítadel)
+REASON_SIZE = "size"
+REASON_RATE = "rate"
+
+# WebSocket close kódy (RFC 6455)
+CLOSE_POLICY_VIOLATION = 1008
+CLOSE_MESSAGE_TOO_BIG = 1009
+
+# Typ zprávy čtený z textu před dekódováním JSON
+_TYPE_PATTERN = re.compile(r'"type"\s*:\s*"([A-Za-z0-9_]{1,32})"')
+
+
+def sniff_message_type(text: str) -> Optional[str]:
+    """
+    Přečte typ zprávy z JSON textu bez jeho dekódování.
+
+    Args:
+        text: Přijatý text zprávy
+
+    Returns:
+        Hodnota prvního klíče ``"type"`` nebo None
+    """
+    match = _TYPE_PATTERN.search(text)
+    return match.group(1) if match else None
+
+
+class TokenBucket:
+    """
+    Token bucket – průměrně ``rate`` zpráv za sekundu, nárazově až ``burst``.
+
+    Attributes:
+        rate: Doplňování tokenů za sekundu
+        burst: Kapacita kbelíku
+        tokens: Aktuální počet tokenů
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "_updated")
+
+    def __init__(self, rate: float, burst: float, now: Optional[float] = None):
+        """
+        Args:
+            rate: Tokenů za sekundu
+            burst: Kapacita (kbelík začíná plný)
+            now: Aktuální monotónní čas (None = time.monotonic())
+        """
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self._updated = time.monotonic() if now is None else now
+
+    def take(self, now: float) -> bool:
+        """
+        Spotřebuje jeden token.
+
+        Args:
+            now: Aktuální monotónní čas
+
+        Returns:
+            False pokud kbelík nemá token (zpráva překročila limit)
+        """
+        tokens = self.tokens + (now - self._updated) * self.rate
+        self._updated = now
+        if tokens > self.burst:
+            tokens = self.burst
+        if tokens < 1.0:
+            self.tokens = tokens
+            return False
+        self.tokens = tokens - 1.0
+        return True
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"TokenBucket(rate={self.rate:g}/s, burst={self.burst:g}, tokens={self.tokens:.1f})"
+
+
+class MessageLimiter:
+    """
+    Limity příchozích zpráv jednoho spojení.
+
+    Attributes:
+        limits: Nastavení limitů {typ: {"rate", "burst", "policy"}}
+        max_size: Maximální velikost zprávy v bajtech (0 = bez limitu)
+        rejected: Počet odmítnutých zpráv spojení
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        max_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            limits: Limity podle typu zprávy (None = server.rate_limits)
+            max_size: Maximální velikost zprávy (None = server.max_message_size)
+        """
+        self.limits: Dict[str, Mapping[str, Any]] = dict(
+            settings.SERVER_RATE_LIMITS if limits is None else limits
+        )
+        self.max_size = settings.SERVER_MAX_MESSAGE_SIZE if max_size is None else max_size
+        self.rejected = 0
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._charged: Optional[str] = None
+
+    def limit_key(self, msg_type: Optional[str]) -> str:
+        """Vrátí klíč limitu (kbelíku) pro typ zprávy."""
+        return msg_type if msg_type in self.limits else DEFAULT_LIMIT_KEY
+
+    def admit(self, text: str, size: int, now: Optional[float] = None) -> Optional[Tuple[str, str, str]]:
+        """
+        Ověří přijatou zprávu před dekódováním JSON.
+
+        Args:
+            text: Přijatý text zprávy
+            size: Velikost zprávy v bajtech
+            now: Aktuální monotónní čas (None = time.monotonic())
+
+        Returns:
+            None pokud je zpráva přijata, jinak (typ, důvod, politika);
+            typ je přečtený z textu zprávy (neověřený)
+        """
+        self._charged = None
+        if self.max_size and size > self.max_size:
+            # Velkou zprávu neprohledáváme – typ se neurčuje
+            return self._reject("unknown", REASON_SIZE, POLICY_DISCONNECT)
+        msg_type = sniff_message_type(text)
+        key = self.limit_key(msg_type)
+        self._charged = key
+        return self._take(msg_type or "unknown", key, now)
+
+    def recheck(self, msg_type: Any, now: Optional[float] = None) -> Optional[Tuple[str, str, str]]:
+        """
+        Ověří dekódovanou zprávu, jejíž typ se liší od přečteného z textu.
+
+        Args:
+            msg_type: Skutečný typ zprávy (``data["type"]``)
+            now: Aktuální monotónní čas (None = time.monotonic())
+
+        Returns:
+            None pokud je zpráva přijata, jinak (typ, důvod, politika)
+        """
+        key = self.limit_key(msg_type if isinstance(msg_type, str) else None)
+        if key == self._charged:
+            return None
+        self._charged = key
+        return self._take(msg_type if key != DEFAULT_LIMIT_KEY else "unknown", key, now)
+
+    def _take(self, msg_type: str, key: str, now: Optional[float]) -> Optional[Tuple[str, str, str]]:
+        """Spotřebuje token kbelíku ``key``; typ bez limitu projde vždy."""
+        if key not in self._buckets:
+            self._buckets[key] = self._create_bucket(key, now)
+        bucket = self._buckets[key]
+        if bucket is None:
+            return None
+        if bucket.take(time.monotonic() if now is None else now):
+            return None
+        return self._reject(msg_type, REASON_RATE, self.limits[key].get("policy", POLICY_DROP))
+
+    def _create_bucket(self, key: str, now: Optional[float]) -> Optional[TokenBucket]:
+        """Vytvoří kbelík podle nastavení (None = typ bez limitu)."""
+        limit = self.limits.get(key)
+        if not limit or not limit.get("rate"):
+            return None
+        return TokenBucket(limit["rate"], limit.get("burst", limit["rate"]), now)
+
+    def _reject(self, msg_type: str, reason: str, policy: str) -> Tuple[str, str, str]:
+        """Započítá odmítnutou zprávu."""
+        self.rejected += 1
+        return msg_type, reason, policy
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"MessageLimiter(max_size={self.max_size}, rejected={self.rejected})"
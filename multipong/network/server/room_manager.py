@@ -0,0 +1,427 @@
+"""
+RoomManager - více nezávislých zápasů (místností) v jednom procesu.
+
+Každá místnost má vlastní engine, množinu relací (WebSocketManager),
+lobby, SnapshotBuilder a GameLoop. Klienti se do místnosti směrují podle
+ID v cestě WebSocketu (``/ws/{room_id}/{player_id}``). Ticky všech místností
+řídí jeden sdílený ``TickScheduler``.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Protocol
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong import settings
+from .game_loop import GameLoop
+from .lobby import Lobby
+from .lobby_manager import LobbyManager
+from .lobby_updates import LobbyBroadcaster
+from .snapshot_builder import SnapshotBuilder
+from .tick_scheduler import TickScheduler
+from .websocket_manager import WebSocketManager
+
+
+logger = logging.getLogger(__name__)
+
+# Místnost pro klienty připojené bez ID místnosti (/ws/{player_id})
+DEFAULT_ROOM_ID = "default"
+
+# Povolené ID místnosti (bezpečné pro URL cestu i logy)
+ROOM_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,32}$")
+
+
+class RoomHandle(Protocol):
+    """
+    Rozhraní místnosti, se kterým pracuje RoomManager a obsluha spojení.
+
+    Implementuje ho ``Room`` (game loop v tomto procesu) i ``RemoteRoom``
+    (game loop ve worker procesu, viz room_workers).
+    """
+
+    room_id: str
+    manager: WebSocketManager
+    lobby: LobbyManager
+    match_lobby: Lobby
+    lobby_updates: LobbyBroadcaster
+    created_at: float
+
+    @property
+    def is_running(self) -> bool: ...
+
+    @property
+    def sim_rate(self) -> int: ...
+
+    def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def set_input(
+        self,
+        player_id: str,
+        up: bool,
+        down: bool,
+        seq: Optional[int] = None,
+        tick: Optional[int] = None
+    ) -> None: ...
+
+    def clear_input(self, player_id: str) -> None: ...
+
+    async def get_match_config(self) -> Optional[dict]: ...
+
+    def is_empty(self) -> bool: ...
+
+    def get_jitter(self) -> Dict[str, Any]: ...
+
+    def get_timings(self) -> Dict[str, Any]: ...
+
+    def get_info(self) -> dict: ...
+
+
+class Room:
+    """
+    Jedna místnost = jeden zápas se všemi svými komponentami.
+
+    Attributes:
+        room_id: ID místnosti
+        engine: Herní engine místnosti
+        manager: WebSocketManager s relacemi hráčů místnosti
+        lobby: LobbyManager – přidělování pozic (pálek)
+        match_lobby: Lobby – přezdívky, sloty, ready stav a AI úrovně
+        lobby_updates: LobbyBroadcaster – slučované diffy ``lobby_update``
+        snapshots: SnapshotBuilder sdílený handshakem a game loopem
+        game_loop: GameLoop místnosti
+        scheduler: Sdílený TickScheduler (None = vlastní task s GameLoop.run)
+        created_at: Čas vytvoření (Unix timestamp)
+    """
+
+    def __init__(
+        self,
+        room_id: str,
+        num_players_per_team: Optional[int] = None,
+        tick_rate: Optional[int] = None,
+        sim_rate: Optional[int] = None,
+        profiling: Optional[bool] = None,
+        scheduler: Optional[TickScheduler] = None
+    ):
+        """
+        Args:
+            room_id: ID místnosti
+            num_players_per_team: Počet hráčů na tým (None = config)
+            tick_rate: Frekvence game loopu v Hz (None = config)
+            sim_rate: Frekvence simulace v Hz (None = config)
+            profiling: Profilování fází ticku (None = config)
+            scheduler: Sdílený plánovač ticků (None = vlastní task)
+        """
+        self.room_id = room_id
+        self.engine = MultipongEngine(
+            arena_width=settings.WINDOW_WIDTH,
+            arena_height=settings.WINDOW_HEIGHT,
+            num_players_per_team=num_players_per_team or settings.PADDLES_COUNT_PER_TEAM
+        )
+        self.manager = WebSocketManager(tick_rate=tick_rate)
+        self.lobby = LobbyManager()
+        self.match_lobby = Lobby()
+        self.lobby_updates = LobbyBroadcaster(self.match_lobby, self.manager)
+        self.snapshots = SnapshotBuilder(self.engine)
+        self.game_loop = GameLoop(
+            self.engine,
+            self.manager,
+            tick_rate=tick_rate,
+            sim_rate=sim_rate,
+            snapshot_builder=self.snapshots,
+            profiling=profiling
+        )
+        self.scheduler = scheduler
+        self.created_at = time.time()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True pokud game loop místnosti běží."""
+        if self._task is not None and not self._task.done():
+            return True
+        return self.game_loop.is_running
+
+    def start(self) -> None:
+        """
+        Spustí zápas a game loop místnosti – ve sdíleném plánovači,
+        bez něj jako samostatný asyncio task.
+
+        Musí být voláno uvnitř běžící event loop. Opakované volání nic nedělá.
+        """
+        if self.is_running:
+            return
+        self.engine.start()
+        if self.scheduler is not None:
+            self.scheduler.add(self.room_id, self.game_loop)
+        else:
+            self._task = asyncio.create_task(self.game_loop.run(), name=f"room-{self.room_id}")
+        logger.info(f"🏟️ Místnost {self.room_id} spuštěna")
+
+    async def stop(self) -> None:
+        """Zastaví game loop místnosti a počká na jeho ukončení."""
+        self.lobby_updates.cancel()
+        if self.scheduler is not None:
+            self.scheduler.remove(self.room_id)
+        self.game_loop.stop()
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @property
+    def sim_rate(self) -> int:
+        """Frekvence simulace (Hz) – jednotka ``tick`` ve vstupních rámcích."""
+        return self.game_loop.sim_rate
+
+    def set_input(
+        self,
+        player_id: str,
+        up: bool,
+        down: bool,
+        seq: Optional[int] = None,
+        tick: Optional[int] = None
+    ) -> None:
+        """
+        Zapíše vstup hráče do tabulky vstupů game loopu.
+
+        Číslovaný rámec (``seq``) se zařadí do jitter bufferu hráče
+        a aplikuje se v kroku simulace podle ``tick``.
+
+        Args:
+            player_id: ID hráče (pozice pálky)
+            up: Stav tlačítka nahoru
+            down: Stav tlačítka dolů
+            seq: Číslo vstupního rámce (None = zapsat hned)
+            tick: Krok klienta, pro který rámec vznikl
+        """
+        if seq is None:
+            self.game_loop.update_input(player_id, up, down)
+        else:
+            self.game_loop.queue_input(player_id, seq, up, down, tick)
+
+    def clear_input(self, player_id: str) -> None:
+        """Uvolní vstup odpojeného hráče (pálku opět řídí engine)."""
+        self.game_loop.clear_input(player_id)
+
+    async def get_match_config(self) -> dict:
+        """Vrátí konfiguraci zápasu pro handshake (``SnapshotBuilder.build_config``)."""
+        return self.snapshots.build_config()
+
+    def is_empty(self) -> bool:
+        """True pokud v místnosti není žádný připojený hráč."""
+        return self.manager.get_player_count() == 0
+
+    def get_jitter(self) -> Dict[str, Any]:
+        """Vrátí histogram zpoždění ticků místnosti."""
+        return self.game_loop.get_jitter()
+
+    def get_timings(self) -> Dict[str, Any]:
+        """Vrátí histogramy časování ticků místnosti (``GameLoop.get_timings``)."""
+        return self.game_loop.get_timings()
+
+    def get_info(self) -> dict:
+        """
+        Vrátí souhrnné informace o místnosti.
+
+        Returns:
+            Slovník s ID, počtem hráčů, volnými pozicemi, skóre a během loopu
+        """
+        return {
+            "room_id": self.room_id,
+            "players_count": self.manager.get_player_count(),
+            "available_slots": self.lobby.get_available_slots(),
+            "score": {
+                "A": self.engine.team_left.score,
+                "B": self.engine.team_right.score,
+            },
+            "is_running": self.is_running,
+            "tick_jitter": {
+                "p50": self.game_loop.jitter.percentile(50),
+                "p99": self.game_loop.jitter.percentile(99),
+                "max": self.game_loop.jitter.max,
+            },
+            "created_at": self.created_at,
+        }
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"Room(id={self.room_id}, players={self.manager.get_player_count()}, "
+            f"running={self.is_running})"
+        )
+
+
+class RoomManager:
+    """
+    Správce místností – vytváření, vyhledání, výpis a rušení zápasů.
+
+    Attributes:
+        rooms: Slovník místností {room_id: RoomHandle}
+        max_rooms: Maximální počet současných místností
+        scheduler: Sdílený TickScheduler, který řídí ticky všech místností
+    """
+
+    def __init__(self, max_rooms: Optional[int] = None, scheduler: Optional[TickScheduler] = None):
+        """
+        Args:
+            max_rooms: Limit počtu místností (None = SERVER_MAX_ROOMS)
+            scheduler: Plánovač ticků (None = vytvoří vlastní)
+        """
+        self.rooms: Dict[str, RoomHandle] = {}
+        self.max_rooms = max_rooms or settings.SERVER_MAX_ROOMS
+        self.scheduler = scheduler or TickScheduler()
+        self._room_counter = 0
+
+    @staticmethod
+    def is_valid_room_id(room_id: str) -> bool:
+        """Kontroluje, zda je ID místnosti povolené (písmena, číslice, _ a -)."""
+        return bool(ROOM_ID_PATTERN.match(room_id))
+
+    def create(self, room_id: Optional[str] = None, start: bool = True, **room_kwargs) -> Optional[RoomHandle]:
+        """
+        Vytvoří novou místnost.
+
+        Args:
+            room_id: ID místnosti (None = vygeneruje se "room-<n>")
+            start: Ihned spustit game loop (vyžaduje běžící event loop)
+            **room_kwargs: Další parametry pro Room (tick_rate, ...)
+
+        Returns:
+            Nová Room nebo None (neplatné/obsazené ID, překročen limit)
+        """
+        if room_id is None:
+            room_id = self._generate_room_id()
+
+        if not self.is_valid_room_id(room_id):
+            logger.error(f"❌ Neplatné ID místnosti: {room_id!r}")
+            return None
+
+        if room_id in self.rooms:
+            logger.warning(f"⚠️ Místnost {room_id} již existuje")
+            return None
+
+        if len(self.rooms) >= self.max_rooms:
+            logger.error(f"❌ Dosažen limit místností ({self.max_rooms}), {room_id} nevytvořena")
+            return None
+
+        room = self._make_room(room_id, **room_kwargs)
+        self.rooms[room_id] = room
+        if start:
+            room.start()
+        logger.info(f"➕ Vytvořena místnost {room_id} (celkem místností: {len(self.rooms)})")
+        return room
+
+    def _make_room(self, room_id: str, **room_kwargs) -> RoomHandle:
+        """Vytvoří místnost řízenou sdíleným plánovačem (přepisuje ShardedRoomManager)."""
+        room_kwargs.setdefault("scheduler", self.scheduler)
+        return Room(room_id, **room_kwargs)
+
+    def get(self, room_id: str) -> Optional[RoomHandle]:
+        """
+        Vrátí místnost podle ID.
+
+        Returns:
+            Room nebo None pokud neexistuje
+        """
+        return self.rooms.get(room_id)
+
+    def get_or_create(self, room_id: str) -> Optional[RoomHandle]:
+        """
+        Vrátí existující místnost, případně ji vytvoří a spustí.
+
+        Returns:
+            Room nebo None (neplatné ID, překročen limit)
+        """
+        room = self.rooms.get(room_id)
+        if room is None:
+            room = self.create(room_id)
+        elif not room.is_running:
+            room.start()
+        return room
+
+    async def destroy(self, room_id: str) -> bool:
+        """
+        Zruší místnost – zastaví game loop a odpojí všechny její hráče.
+
+        Args:
+            room_id: ID místnosti
+
+        Returns:
+            True pokud byla místnost zrušena, False pokud neexistovala
+        """
+        room = self.rooms.pop(room_id, None)
+        if room is None:
+            logger.warning(f"⚠️ Pokus o zrušení neexistující místnosti {room_id}")
+            return False
+
+        await room.stop()
+        for session in room.manager.get_all_sessions():
+            try:
+                await session.send_json({"type": "room_closed", "room_id": room_id})
+                await session.websocket.close()
+            except Exception as e:
+                logger.debug(f"Relaci {session.player_id} nelze korektně zavřít: {e}")
+            await room.manager.remove(session)
+
+        logger.info(f"➖ Zrušena místnost {room_id} (zbývá místností: {len(self.rooms)})")
+        return True
+
+    def list_rooms(self) -> List[dict]:
+        """
+        Vrátí přehled všech místností.
+
+        Returns:
+            Seznam slovníků Room.get_info() seřazený podle ID
+        """
+        return [self.rooms[room_id].get_info() for room_id in sorted(self.rooms)]
+
+    def get_room_count(self) -> int:
+        """Vrátí počet místností."""
+        return len(self.rooms)
+
+    def get_player_count(self) -> int:
+        """Vrátí celkový počet připojených hráčů ve všech místnostech."""
+        return sum(room.manager.get_player_count() for room in self.rooms.values())
+
+    async def disconnect_inactive(self, timeout_seconds: float = 10.0) -> int:
+        """
+        Odpojí neaktivní hráče ve všech místnostech.
+
+        Returns:
+            Celkový počet odpojených hráčů
+        """
+        disconnected = 0
+        for room in list(self.rooms.values()):
+            disconnected += await room.manager.disconnect_inactive(timeout_seconds=timeout_seconds)
+        return disconnected
+
+    def get_jitter(self) -> Dict[str, Dict]:
+        """
+        Vrátí histogramy zpoždění ticků (jitter) všech místností.
+
+        Returns:
+            Slovník {room_id: serializovaný Histogram}
+        """
+        return {room_id: room.get_jitter() for room_id, room in self.rooms.items()}
+
+    async def shutdown(self) -> None:
+        """Zastaví game loopy všech místností i plánovač (místnosti zůstanou zachovány)."""
+        rooms = list(self.rooms.values())
+        await asyncio.gather(*(room.stop() for room in rooms), return_exceptions=True)
+        await self.scheduler.stop()
+
+    def _generate_room_id(self) -> str:
+        """Vygeneruje volné ID místnosti ve tvaru "room-<n>"."""
+        while True:
+            self._room_counter += 1
+            room_id = f"room-{self._room_counter}"
+            if room_id not in self.rooms:
+                return room_id
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"RoomManager(rooms={len(self.rooms)}, players={self.get_player_count()})"
@@ -0,0 +1,713 @@
+"""
+Sharding místností do worker procesů (škálování přes všechna jádra CPU).
+
+Krokování enginu je čistý Python a je vázané na CPU, takže jeden asyncio
+proces vytíží jediné jádro. ``ShardedRoomManager`` proto drží v hlavním
+procesu (gateway) jen WebSocket spojení, relace a lobby. Engine, AI
+a game loop každé místnosti běží ve worker procesu:
+
+    gateway ──("create" / "input" / "config" / "destroy")──▶ worker
+    gateway ◀──("snapshot" dict + kódování / "info" / "reply")── worker
+
+Každý worker je samostatný asyncio proces se stejným ``TickScheduler``
+a ``GameLoop`` jako místnosti v gateway, herní logika se tedy nemění.
+Worker posílá slovník snapshotu (z něj gateway vede historii a sestavuje
+delta snapshoty a keyframy) a plný snapshot zakódovaný jen ve formátech,
+které v místnosti používají relace s plnými snapshoty (``"formats"`` –
+gateway je hlásí při změně). Gateway ho pak jen zařadí do front relací
+(``WebSocketManager.enqueue_snapshot``).
+Vstup hráče se workeru přepošle hned při příjmu – číslovaný rámec vždy
+(jitter buffer běží ve workeru), jinak jen pokud se vstup změnil.
+Komunikace jde přes dvojici jednosměrných ``multiprocessing.Pipe`` na
+worker; do roury workeru zapisuje v gateway vlastní vlákno, takže pomalý
+worker nezdrží event loop. Nová místnost se umístí na živý worker
+s nejmenším počtem místností, místnosti spadlého workeru se přesunou
+na ostatní.
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong import settings
+from .game_loop import GameLoop
+from .input_table import InputTable
+from .lobby import Lobby
+from .lobby_manager import LobbyManager
+from .lobby_updates import LobbyBroadcaster
+from .room_manager import RoomManager
+from .tick_scheduler import TickScheduler
+from .player_session import CLOSE_CODE_WORKER_LOST
+from .websocket_manager import WebSocketManager, encode_snapshot_as
+
+
+logger = logging.getLogger(__name__)
+
+# Jak často worker posílá souhrnné informace o místnostech (s)
+INFO_INTERVAL = 1.0
+
+# Timeout čekání na odpověď workeru (handshake konfigurace) a na jeho ukončení (s)
+REQUEST_TIMEOUT = 5.0
+STOP_TIMEOUT = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Worker proces
+# ---------------------------------------------------------------------------
+
+class _PipeBroadcaster:
+    """Náhrada WebSocketManageru ve workeru – snapshot zakóduje a pošle gatewayi."""
+
+    def __init__(self, worker: "_RoomWorker", room_id: str) -> None:
+        self.worker = worker
+        self.room_id = room_id
+        # Formáty plného snapshotu, které gateway potřebuje (hlásí je "formats")
+        self.formats: Tuple[str, ...] = ()
+
+    async def broadcast(self, message: dict, exclude: Optional[List[str]] = None) -> int:
+        encoded = {fmt: encode_snapshot_as(message, fmt) for fmt in self.formats}
+        self.worker.send(("snapshot", self.room_id, message, encoded))
+        return 1
+
+    def get_player_count(self) -> int:
+        return 0  # relace drží gateway
+
+
+class _RoomWorker:
+    """Shard místností v jednom worker procesu."""
+
+    def __init__(self, worker_id: int, commands, events) -> None:
+        self.worker_id = worker_id
+        self.commands = commands
+        self.events = events
+        self.rooms: Dict[str, GameLoop] = {}
+        self.broadcasters: Dict[str, _PipeBroadcaster] = {}
+        self.scheduler = TickScheduler()
+        self._stopped: Optional[asyncio.Future] = None
+
+    def send(self, message: tuple) -> None:
+        """Pošle zprávu gatewayi (volá se jen z vlákna event loopu)."""
+        try:
+            self.events.send(message)
+        except (BrokenPipeError, EOFError, OSError):
+            self._stop()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._stopped = loop.create_future()
+        reader = threading.Thread(
+            target=self._read_commands,
+            args=(loop,),
+            name=f"room-worker-{self.worker_id}-reader",
+            daemon=True,
+        )
+        reader.start()
+        info_task = asyncio.create_task(self._report_info())
+        try:
+            await self._stopped
+        finally:
+            info_task.cancel()
+            await asyncio.gather(info_task, return_exceptions=True)
+            await self.scheduler.stop()
+
+    def _read_commands(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Vlákno čtoucí příkazy z gateway a předávající je event loopu."""
+        while True:
+            try:
+                message = self.commands.recv()
+            except (EOFError, OSError):
+                message = ("stop",)  # gateway skončila
+            try:
+                loop.call_soon_threadsafe(self._handle, message)
+            except RuntimeError:
+                return  # event loop už neběží
+            if message[0] == "stop":
+                return
+
+    def _handle(self, message: tuple) -> None:
+        command = message[0]
+        try:
+            if command == "input":
+                _, room_id, player_id, up, down, *frame = message
+                game_loop = self.rooms.get(room_id)
+                if game_loop is not None:
+                    if frame:
+                        seq, tick = frame
+                        game_loop.queue_input(player_id, seq, up, down, tick)
+                    else:
+                        game_loop.update_input(player_id, up, down)
+            elif command == "clear_input":
+                _, room_id, player_id = message
+                game_loop = self.rooms.get(room_id)
+                if game_loop is not None:
+                    game_loop.clear_input(player_id)
+            elif command == "create":
+                _, room_id, room_kwargs = message
+                self._create_room(room_id, **room_kwargs)
+            elif command == "formats":
+                _, room_id, formats = message
+                broadcaster = self.broadcasters.get(room_id)
+                if broadcaster is not None:
+                    broadcaster.formats = tuple(formats)
+            elif command == "destroy":
+                _, room_id = message
+                self.broadcasters.pop(room_id, None)
+                if self.rooms.pop(room_id, None) is not None:
+                    self.scheduler.remove(room_id)
+            elif command == "config":
+                _, request_id, room_id = message
+                game_loop = self.rooms.get(room_id)
+                config = game_loop.snapshots.build_config() if game_loop is not None else None
+                self.send(("reply", request_id, config))
+            elif command == "stop":
+                self._stop()
+            else:
+                logger.warning(f"⚠️ Worker {self.worker_id}: neznámý příkaz {command}")
+        except Exception as e:
+            logger.error(f"❌ Worker {self.worker_id}: chyba příkazu {command}: {e}", exc_info=True)
+
+    def _create_room(
+        self,
+        room_id: str,
+        num_players_per_team: Optional[int] = None,
+        tick_rate: Optional[int] = None,
+        sim_rate: Optional[int] = None,
+        profiling: Optional[bool] = None
+    ) -> None:
+        if room_id in self.rooms:
+            return
+        engine = MultipongEngine(
+            arena_width=settings.WINDOW_WIDTH,
+            arena_height=settings.WINDOW_HEIGHT,
+            num_players_per_team=num_players_per_team or settings.PADDLES_COUNT_PER_TEAM
+        )
+        broadcaster = _PipeBroadcaster(self, room_id)
+        game_loop = GameLoop(
+            engine,
+            broadcaster,
+            tick_rate=tick_rate,
+            sim_rate=sim_rate,
+            profiling=profiling
+        )
+        engine.start()
+        self.rooms[room_id] = game_loop
+        self.broadcasters[room_id] = broadcaster
+        self.scheduler.add(room_id, game_loop)
+
+    async def _report_info(self) -> None:
+        """Periodicky posílá gatewayi skóre, jitter a histogramy časování místností."""
+        while True:
+            await asyncio.sleep(INFO_INTERVAL)
+            self.send(("info", {
+                room_id: {
+                    "score": {"A": g.engine.team_left.score, "B": g.engine.team_right.score},
+                    "tick_jitter": {
+                        "p50": g.jitter.percentile(50),
+                        "p99": g.jitter.percentile(99),
+                        "max": g.jitter.max,
+                    },
+                    "tick_count": g.tick_count,
+                    "timings": g.get_timings(),
+                }
+                for room_id, g in self.rooms.items()
+            }))
+
+    def _stop(self) -> None:
+        if self._stopped is not None and not self._stopped.done():
+            self._stopped.set_result(None)
+
+
+def worker_main(worker_id: int, commands, events) -> None:
+    """
+    Vstupní bod worker procesu.
+
+    Args:
+        worker_id: Index workeru
+        commands: Čtecí konec roury s příkazy od gateway
+        events: Zapisovací konec roury se snapshoty a odpověďmi pro gateway
+    """
+    # Worker loguje jen varování a chyby (INFO logy místností patří gateway)
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logging.getLogger().setLevel(logging.WARNING)
+    try:
+        asyncio.run(_RoomWorker(worker_id, commands, events).run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        events.close()
+
+
+# ---------------------------------------------------------------------------
+# Gateway
+# ---------------------------------------------------------------------------
+
+class RemoteRoom:
+    """
+    Místnost, jejíž engine a game loop běží ve worker procesu.
+
+    Gateway drží relace, lobby a přeposílá vstupy; rozhraní odpovídá
+    ``Room``, takže ho WebSocket handler používá stejně.
+
+    Attributes:
+        room_id: ID místnosti
+        manager: WebSocketManager s relacemi hráčů místnosti (v gateway)
+        lobby: LobbyManager – přidělování pozic (pálek)
+        match_lobby: Lobby – přezdívky, sloty, ready stav a AI úrovně
+        lobby_updates: LobbyBroadcaster – slučované diffy ``lobby_update``
+        worker_id: Index workeru, na kterém místnost běží (None = neběží)
+        remote_info: Poslední souhrn od workeru (skóre, jitter, časování)
+    """
+
+    def __init__(self, room_id: str, pool: "RoomWorkerPool", **room_kwargs) -> None:
+        """
+        Args:
+            room_id: ID místnosti
+            pool: Pool worker procesů
+            **room_kwargs: Parametry místnosti pro worker (tick_rate, ...)
+        """
+        self.room_id = room_id
+        self.pool = pool
+        self.room_kwargs = room_kwargs
+        self.manager = WebSocketManager(tick_rate=room_kwargs.get("tick_rate"))
+        self.lobby = LobbyManager()
+        self.match_lobby = Lobby()
+        self.lobby_updates = LobbyBroadcaster(self.match_lobby, self.manager)
+        self.worker_id: Optional[int] = None
+        self.remote_info: Dict[str, Any] = {}
+        self.created_at = time.time()
+        self._sent_inputs = InputTable()
+        self._formats: FrozenSet[str] = frozenset()
+
+    @property
+    def is_running(self) -> bool:
+        """True pokud je místnost umístěna na workeru."""
+        return self.worker_id is not None
+
+    def start(self) -> None:
+        """Umístí místnost na nejméně vytížený worker a spustí ji tam."""
+        if not self.is_running:
+            self.pool.place(self)
+
+    async def stop(self) -> None:
+        """Zastaví místnost na workeru."""
+        self.lobby_updates.cancel()
+        if self.is_running:
+            self.pool.release(self)
+        self.reset_worker_state()
+
+    def reset_worker_state(self) -> None:
+        """
+        Zapomene stav sdílený s workerem (odeslané vstupy, hlášené formáty).
+
+        Volá se při zastavení místnosti a při jejím přesunu na jiný worker,
+        kde engine začíná znovu: relace proto dostanou další snapshot jako
+        keyframe i se statistikami a konfigurací.
+        """
+        self._sent_inputs.clear_all()
+        self._formats = frozenset()
+        self.remote_info = {}
+        self.manager.reset_snapshots()
+
+    @property
+    def sim_rate(self) -> int:
+        """Frekvence simulace místnosti na workeru (Hz)."""
+        kwargs = self.room_kwargs
+        return kwargs.get("sim_rate") or kwargs.get("tick_rate") or settings.SERVER_SIM_RATE
+
+    def set_input(
+        self,
+        player_id: str,
+        up: bool,
+        down: bool,
+        seq: Optional[int] = None,
+        tick: Optional[int] = None
+    ) -> None:
+        """Přepošle vstup hráče workeru (číslovaný rámec vždy, jinak jen při změně)."""
+        worker_id = self.worker_id
+        if worker_id is None:
+            return
+        changed = self._sent_inputs.set(player_id, up, down)
+        if seq is not None:
+            self.pool.send(worker_id, ("input", self.room_id, player_id, up, down, seq, tick))
+        elif changed:
+            self.pool.send(worker_id, ("input", self.room_id, player_id, up, down))
+
+    def clear_input(self, player_id: str) -> None:
+        """Uvolní vstup odpojeného hráče na workeru."""
+        worker_id = self.worker_id
+        if worker_id is not None and self._sent_inputs.clear(player_id):
+            self.pool.send(worker_id, ("clear_input", self.room_id, player_id))
+
+    async def get_match_config(self) -> Optional[dict]:
+        """Vyžádá si od workeru konfiguraci zápasu pro handshake."""
+        worker_id = self.worker_id
+        if worker_id is None:
+            return None
+        config: Optional[dict] = await self.pool.request(worker_id, "config", self.room_id)
+        return config
+
+    def deliver_snapshot(self, snapshot: dict, encoded: Dict[str, Any]) -> None:
+        """
+        Zařadí snapshot z workeru do front hráčů místnosti (slučuje se).
+
+        Args:
+            snapshot: Snapshot zpráva (pro delta snapshoty)
+            encoded: Zakódovaný plný snapshot {formát: data} ve formátech
+                     nahlášených workeru (chybějící formát zakóduje gateway)
+        """
+        self.manager.enqueue_snapshot(snapshot, encoded=encoded)
+        formats = frozenset(
+            session.snapshot_format
+            for session in self.manager.get_all_sessions()
+            if not session.snapshot_delta
+        )
+        worker_id = self.worker_id
+        if formats != self._formats and worker_id is not None:
+            self._formats = formats
+            self.pool.send(worker_id, ("formats", self.room_id, sorted(formats)))
+
+    async def close_sessions(self, reason: str) -> None:
+        """
+        Odpojí hráče místnosti, která nemá kde běžet (žádný živý worker).
+
+        Args:
+            reason: Důvod pro klienty (``room_closed`` zpráva)
+        """
+        for session in self.manager.get_all_sessions():
+            try:
+                await session.send_json(
+                    {"type": "room_closed", "room_id": self.room_id, "reason": reason}
+                )
+                await session.close(code=CLOSE_CODE_WORKER_LOST)
+            except Exception as e:
+                logger.debug(f"Relaci {session.player_id} nelze korektně zavřít: {e}")
+            await self.manager.remove(session)
+
+    def is_empty(self) -> bool:
+        """True pokud v místnosti není žádný připojený hráč."""
+        return self.manager.get_player_count() == 0
+
+    def get_jitter(self) -> Dict[str, float]:
+        """Vrátí souhrn jitteru ticků (p50/p99/max) hlášený workerem."""
+        jitter: Dict[str, float] = self.remote_info.get("tick_jitter", {})
+        return jitter
+
+    def get_timings(self) -> Dict[str, Any]:
+        """Vrátí histogramy časování ticků hlášené workerem (prázdné do prvního hlášení)."""
+        timings: Dict[str, Any] = self.remote_info.get("timings", {})
+        return timings
+
+    def get_info(self) -> dict:
+        """
+        Vrátí souhrnné informace o místnosti.
+
+        Returns:
+            Slovník jako ``Room.get_info()`` doplněný o ``worker_id``
+        """
+        return {
+            "room_id": self.room_id,
+            "players_count": self.manager.get_player_count(),
+            "available_slots": self.lobby.get_available_slots(),
+            "score": self.remote_info.get("score", {"A": 0, "B": 0}),
+            "is_running": self.is_running,
+            "tick_jitter": self.get_jitter(),
+            "created_at": self.created_at,
+            "worker_id": self.worker_id,
+        }
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"RemoteRoom(id={self.room_id}, worker={self.worker_id}, "
+            f"players={self.manager.get_player_count()})"
+        )
+
+
+class RoomWorkerPool:
+    """
+    Pool worker procesů, z nichž každý vlastní shard místností.
+
+    Attributes:
+        size: Počet worker procesů
+        room_counts: Počet místností na každém workeru (zátěž pro umístění)
+        alive: Které workery běží (spadlý worker nedostává nové místnosti)
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: Počet worker procesů (None = počet jader CPU)
+        """
+        self.size = max(1, workers or os.cpu_count() or 1)
+        self.room_counts: List[int] = [0] * self.size
+        self.alive: List[bool] = [False] * self.size
+        self._processes: List[BaseProcess] = []
+        self._outboxes: List[queue.SimpleQueue] = []
+        self._writers: List[threading.Thread] = []
+        self._rooms: Dict[str, RemoteRoom] = {}
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+        self._closing: Set[asyncio.Future] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """True pokud jsou worker procesy spuštěny."""
+        return bool(self._processes)
+
+    def start(self) -> None:
+        """
+        Spustí worker procesy (``spawn`` – bezpečné i s běžícími vlákny).
+
+        Musí být voláno uvnitř běžící event loop. Opakované volání nic nedělá.
+        """
+        if self.is_running:
+            return
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        for worker_id in range(self.size):
+            commands_recv, commands_send = context.Pipe(duplex=False)
+            events_recv, events_send = context.Pipe(duplex=False)
+            process = context.Process(
+                target=worker_main,
+                args=(worker_id, commands_recv, events_send),
+                name=f"multipong-room-worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            # Konce rour patřící workeru v gateway zavřeme (EOF při pádu workeru)
+            commands_recv.close()
+            events_send.close()
+            self._processes.append(process)
+            self.alive[worker_id] = True
+            outbox: queue.SimpleQueue = queue.SimpleQueue()
+            writer = threading.Thread(
+                target=self._write_commands,
+                args=(worker_id, commands_send, outbox),
+                name=f"room-worker-{worker_id}-commands",
+                daemon=True,
+            )
+            writer.start()
+            self._outboxes.append(outbox)
+            self._writers.append(writer)
+            threading.Thread(
+                target=self._read_events,
+                args=(worker_id, events_recv, loop),
+                name=f"room-worker-{worker_id}-events",
+                daemon=True,
+            ).start()
+        logger.info(f"🧵 Spuštěno {self.size} worker procesů pro místnosti")
+
+    async def stop(self) -> None:
+        """Ukončí worker procesy a počká na ně."""
+        if not self.is_running:
+            return
+        for worker_id in range(self.size):
+            self.send(worker_id, ("stop",))
+        processes, self._processes = self._processes, []
+        for outbox in self._outboxes:
+            outbox.put(None)  # zapisovací vlákno po odeslání "stop" skončí
+        writers, self._writers, self._outboxes = self._writers, [], []
+        await asyncio.to_thread(self._join, processes, writers)
+        for room in list(self._rooms.values()):
+            room.worker_id = None
+        self._rooms.clear()
+        self.room_counts = [0] * self.size
+        self.alive = [False] * self.size
+        logger.info("🧵 Worker procesy ukončeny")
+
+    @staticmethod
+    def _join(processes: List[BaseProcess], writers: Sequence[threading.Thread]) -> None:
+        for process in processes:
+            process.join(STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for writer in writers:
+            writer.join(STOP_TIMEOUT)
+
+    def least_loaded(self) -> Optional[int]:
+        """Vrátí index živého workeru s nejmenším počtem místností (None = žádný neběží)."""
+        candidates = [worker_id for worker_id in range(self.size) if self.alive[worker_id]]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda worker_id: (self.room_counts[worker_id], worker_id))
+
+    def place(self, room: RemoteRoom) -> Optional[int]:
+        """
+        Umístí místnost na nejméně vytížený živý worker.
+
+        Returns:
+            Index workeru (None = žádný worker neběží, místnost neběží)
+        """
+        self.start()
+        worker_id = self.least_loaded()
+        if worker_id is None:
+            logger.error(f"❌ Místnost {room.room_id} nelze umístit – žádný worker neběží")
+            return None
+        self.room_counts[worker_id] += 1
+        room.worker_id = worker_id
+        self._rooms[room.room_id] = room
+        self.send(worker_id, ("create", room.room_id, room.room_kwargs))
+        logger.info(
+            f"🧵 Místnost {room.room_id} umístěna na worker {worker_id} (zátěž: {self.room_counts})"
+        )
+        return worker_id
+
+    def release(self, room: RemoteRoom) -> None:
+        """Zruší místnost na jejím workeru."""
+        worker_id = room.worker_id
+        if worker_id is None or self._rooms.get(room.room_id) is not room:
+            return
+        del self._rooms[room.room_id]
+        self.room_counts[worker_id] -= 1
+        room.worker_id = None
+        if self.alive[worker_id]:
+            self.send(worker_id, ("destroy", room.room_id))
+
+    def send(self, worker_id: int, message: tuple) -> None:
+        """
+        Zařadí příkaz workeru; do roury ho zapíše vlákno workeru.
+
+        Event loop gateway tak na zápis nečeká ani u pomalého workeru.
+        """
+        try:
+            outbox = self._outboxes[worker_id]
+        except IndexError:
+            logger.error(f"❌ Worker {worker_id} neběží, příkaz {message[0]} zahozen")
+            return
+        outbox.put(message)
+
+    @staticmethod
+    def _write_commands(worker_id: int, connection, outbox: queue.SimpleQueue) -> None:
+        """Vlákno zapisující příkazy z fronty do roury workeru (None = konec)."""
+        broken = False
+        while True:
+            message = outbox.get()
+            if message is None:
+                connection.close()
+                return
+            if broken:
+                continue  # worker je pryč – frontu jen vyprázdníme
+            try:
+                connection.send(message)
+            except (BrokenPipeError, EOFError, OSError) as e:
+                logger.error(f"❌ Worker {worker_id} nedostupný: {e}")
+                broken = True
+
+    async def request(self, worker_id: int, command: str, *args) -> Any:
+        """
+        Pošle příkaz s odpovědí a počká na ni.
+
+        Returns:
+            Odpověď workeru (None při timeoutu)
+        """
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.send(worker_id, (command, request_id, *args))
+        try:
+            return await asyncio.wait_for(future, REQUEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Worker {worker_id} neodpověděl na {command}")
+            return None
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _read_events(self, worker_id: int, connection, loop: asyncio.AbstractEventLoop) -> None:
+        """Vlákno čtoucí zprávy workeru a předávající je event loopu gateway."""
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                message = ("exit",)
+            try:
+                loop.call_soon_threadsafe(self._dispatch, worker_id, message)
+            except RuntimeError:
+                return  # event loop gateway už neběží
+            if message[0] == "exit":
+                connection.close()
+                return
+
+    def _dispatch(self, worker_id: int, message: tuple) -> None:
+        kind = message[0]
+        if kind == "snapshot":
+            room = self._rooms.get(message[1])
+            if room is not None:
+                room.deliver_snapshot(message[2], message[3])
+        elif kind == "reply":
+            future = self._pending.get(message[1])
+            if future is not None and not future.done():
+                future.set_result(message[2])
+        elif kind == "info":
+            for room_id, info in message[1].items():
+                room = self._rooms.get(room_id)
+                if room is not None:
+                    room.remote_info = info
+        elif kind == "exit" and self.is_running:
+            self._worker_lost(worker_id)
+
+    def _worker_lost(self, worker_id: int) -> None:
+        """
+        Přesune místnosti spadlého workeru na ostatní živé workery.
+
+        Engine místnosti začne na novém workeru znovu (relace dostanou
+        keyframe). Bez živého workeru se hráči místností odpojí.
+        """
+        logger.error(f"❌ Worker {worker_id} neočekávaně skončil")
+        self.alive[worker_id] = False
+        self._outboxes[worker_id].put(None)
+        for room in [r for r in self._rooms.values() if r.worker_id == worker_id]:
+            self.release(room)
+            room.reset_worker_state()
+            if self.place(room) is None:
+                task = asyncio.ensure_future(room.close_sessions("worker_lost"))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"RoomWorkerPool(size={self.size}, rooms={self.room_counts}, "
+            f"running={self.is_running})"
+        )
+
+
+class ShardedRoomManager(RoomManager):
+    """
+    RoomManager, jehož místnosti běží ve worker procesech.
+
+    Attributes:
+        pool: RoomWorkerPool s worker procesy
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_rooms: Optional[int] = None):
+        """
+        Args:
+            workers: Počet worker procesů (None = počet jader CPU)
+            max_rooms: Limit počtu místností (None = SERVER_MAX_ROOMS)
+        """
+        super().__init__(max_rooms=max_rooms)
+        self.pool = RoomWorkerPool(workers)
+
+    def _make_room(self, room_id: str, **room_kwargs) -> RemoteRoom:
+        return RemoteRoom(room_id, self.pool, **room_kwargs)
+
+    def get_worker_loads(self) -> List[int]:
+        """Vrátí počet místností na každém workeru."""
+        return list(self.pool.room_counts)
+
+    async def shutdown(self) -> None:
+        """Zastaví místnosti i worker procesy."""
+        await super().shutdown()
+        await self.pool.stop()
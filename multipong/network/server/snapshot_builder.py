@@ -0,0 +1,122 @@
+"""
+SnapshotBuilder - inkrementální sestavování snapshotů pro klienty.
+
+Místo kompletního ``MultipongEngine.get_state()`` každý tick rozděluje stav
+na dvě části:
+
+- statická konfigurace zápasu (aréna, branky, rozměry a zóny pálek, AI)
+  se posílá jednou za spojení – v ``connected`` handshake (``build_config``)
+  a znovu jen po ``invalidate_config()``,
+- dynamický stav (míček, y pálek, skóre, čas) se posílá každý tick,
+  statistiky hráčů jen když se změnily (``engine.stats_version``).
+
+Každý snapshot nese pořadové číslo ``seq``, na které se odkazují delta
+snapshoty a potvrzení klientů (viz ``SnapshotHistory``).
+
+Klient skládá plný stav zpět pomocí ``SnapshotAssembler``.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from multipong.engine.game_engine import MultipongEngine
+
+
+class SnapshotBuilder:
+    """
+    Sestavuje snapshot zprávy pro jeden engine (místnost).
+
+    Attributes:
+        engine: Instance MultipongEngine
+        config_version: Verze statické konfigurace (zvyšuje invalidate_config)
+        seq: Pořadové číslo posledního sestaveného snapshotu
+    """
+
+    def __init__(self, engine: MultipongEngine):
+        """
+        Inicializace builderu.
+
+        Args:
+            engine: Herní engine, jehož stav se serializuje
+        """
+        self.engine = engine
+        self.config_version: int = 0
+        self.seq: int = 0
+        self._config: Optional[Dict[str, Any]] = None
+        self._announced_config_version: int = 0
+        self._stats_version: Optional[int] = None
+
+    def invalidate_config(self) -> None:
+        """
+        Označí statickou konfiguraci za změněnou (např. nové AI v slotu).
+
+        Nová konfigurace se přiloží k nejbližšímu snapshotu.
+        """
+        self._config = None
+        self.config_version += 1
+
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Vrátí statickou konfiguraci zápasu (cachovanou do invalidace).
+
+        Returns:
+            Slovník s konfigurací včetně ``config_version``
+        """
+        if self._config is None:
+            self._config = {
+                "config_version": self.config_version,
+                **self.engine.get_static_state(),
+            }
+        return self._config
+
+    def build_config(self) -> Dict[str, Any]:
+        """
+        Sestaví konfiguraci pro nové spojení (handshake).
+
+        Kromě statické konfigurace obsahuje aktuální statistiky, takže nový
+        klient nepotřebuje čekat na jejich další změnu.
+
+        Returns:
+            Slovník pro pole ``match_config`` zprávy ``connected``
+        """
+        return {
+            **self.get_config(),
+            "stats": self.engine.get_stats_state(),
+            "stats_version": self.engine.stats_version,
+        }
+
+    def build_snapshot(self, input_acks: Optional[Mapping[str, List[Optional[int]]]] = None) -> Dict[str, Any]:
+        """
+        Sestaví snapshot zprávu pro aktuální tick.
+
+        Args:
+            input_acks: Potvrzení vstupů {player_id: [seq, tick]}
+                        (viz InputBuffers)
+
+        Returns:
+            Zpráva ``{"type": "snapshot", "seq": ..., "config_version": ..., ...}``;
+            ``stats`` jen při změně, ``match_config`` jen po invalidaci,
+            ``input_acks`` jen pokud hráči posílají číslované vstupy
+        """
+        state = self.engine.get_dynamic_state(self._stats_version)
+        self._stats_version = state.get("stats_version", self._stats_version)
+
+        self.seq += 1
+        snapshot = {
+            "type": "snapshot",
+            "seq": self.seq,
+            "config_version": self.config_version,
+            **state,
+        }
+        if input_acks:
+            snapshot["input_acks"] = dict(input_acks)
+        if self._announced_config_version != self.config_version:
+            snapshot["match_config"] = self.get_config()
+            self._announced_config_version = self.config_version
+        return snapshot
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"SnapshotBuilder(seq={self.seq}, config_version={self.config_version}, "
+            f"stats_version={self._stats_version})"
+        )
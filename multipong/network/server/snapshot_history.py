@@ -0,0 +1,171 @@
+"""
+SnapshotHistory - historie snapshotů místnosti pro delta snapshoty.
+
+Klienti s delta snapshoty potvrzují přijaté snapshoty (``{"type": "ack",
+"seq": N}``). Server pak každé relaci posílá jen pole změněná proti
+poslednímu potvrzenému snapshotu (``compute_delta``). Protože se baseline
+bere z potvrzení a ne z posledního odeslaného snapshotu, nevadí, když
+se některý snapshot ve frontě sloučí s novějším nebo nedorazí.
+
+Plný snapshot (keyframe) dostane relace:
+- dokud nic nepotvrdila (nová relace, ``ack`` se ``seq: null`` = resync),
+- když její baseline vypadla z historie,
+- periodicky po ``keyframe_interval`` snapshotech.
+
+Keyframe nese vždy statistiky; delta je nese, když se od baseline změnily.
+Konfigurace zápasu se přikládá, pokud ji klient podle baseline (nebo
+handshake) ještě nemá.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from multipong import settings
+from multipong.network.snapshot_codec import compute_delta
+from .player_session import PlayerSession
+
+
+# Kolik posledních snapshotů se drží jako možné baseline (~2 s při 60 Hz)
+DEFAULT_HISTORY_SIZE = 128
+
+
+class SnapshotHistory:
+    """
+    Posledních N snapshotů místnosti a výběr baseline pro relace.
+
+    Attributes:
+        size: Maximální počet uchovávaných snapshotů
+        keyframe_interval: Po kolika snapshotech relace dostane keyframe
+        stats: Poslední známé statistiky hráčů
+        match_config: Poslední konfigurace zápasu přiložená ke snapshotu
+                      (None dokud se konfigurace neinvalidovala)
+    """
+
+    def __init__(self, size: int = DEFAULT_HISTORY_SIZE, keyframe_interval: Optional[int] = None):
+        """
+        Args:
+            size: Počet uchovávaných snapshotů
+            keyframe_interval: Interval keyframů (None = SERVER_SNAPSHOT_KEYFRAME_INTERVAL)
+        """
+        self.size = size
+        self.keyframe_interval = keyframe_interval or settings.SERVER_SNAPSHOT_KEYFRAME_INTERVAL
+        self.stats: Optional[Dict[str, Any]] = None
+        self.match_config: Optional[Dict[str, Any]] = None
+        self._snapshots: Dict[int, Dict[str, Any]] = {}
+        self._order: Deque[int] = deque()
+
+    def add(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Uloží snapshot (se ``seq``) a zapamatuje si jeho statistiky a konfiguraci.
+
+        Args:
+            snapshot: Snapshot z ``SnapshotBuilder.build_snapshot()``
+        """
+        seq = snapshot["seq"]
+        if seq in self._snapshots:
+            return
+        self._snapshots[seq] = snapshot
+        self._order.append(seq)
+        while len(self._order) > self.size:
+            del self._snapshots[self._order.popleft()]
+        if "stats" in snapshot:
+            self.stats = snapshot["stats"]
+        if "match_config" in snapshot:
+            self.match_config = snapshot["match_config"]
+
+    def get(self, seq: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Vrátí snapshot podle ``seq`` (None pokud už v historii není)."""
+        if seq is None:
+            return None
+        return self._snapshots.get(seq)
+
+    def baseline_for(self, session: PlayerSession, seq: int) -> Optional[Dict[str, Any]]:
+        """
+        Vybere baseline pro delta snapshot relace.
+
+        Args:
+            session: Relace s potvrzeným ``acked_seq``
+            seq: Číslo aktuálního snapshotu
+
+        Returns:
+            Potvrzený snapshot, nebo None = relace dostane keyframe
+            (a zaznamená se jí ``keyframe_seq``)
+        """
+        if seq - session.keyframe_seq < self.keyframe_interval:
+            baseline = self.get(session.acked_seq)
+            if baseline is not None:
+                return baseline
+        session.keyframe_seq = seq
+        return None
+
+    def needs_config(self, session: PlayerSession) -> bool:
+        """True pokud relace (podle baseline nebo handshake) nemá aktuální konfiguraci."""
+        if self.match_config is None:
+            return False
+        baseline = self.get(session.acked_seq)
+        known = baseline["config_version"] if baseline is not None else session.config_version
+        return bool(known != self.match_config["config_version"])
+
+    def is_stale(self, session: PlayerSession, snapshot: Dict[str, Any]) -> bool:
+        """
+        True pokud relaci s plnými snapshoty chybí statistiky nebo konfigurace.
+        
+        Snapshot nese statistiky a konfiguraci jen při změně; relace s nižší
+        frekvencí (nebo připojená během zápasu) je mohla dostat ve snapshotu,
+        který jí nebyl poslán.
+        """
+        if (
+            "stats" not in snapshot
+            and self.stats is not None
+            and session.stats_version != snapshot["stats_version"]
+        ):
+            return True
+        return "match_config" not in snapshot and self.needs_config(session)
+    
+    def build_keyframe(self, snapshot: Dict[str, Any], with_config: bool = False) -> Dict[str, Any]:
+        """
+        Sestaví plný snapshot pro relaci s delta snapshoty.
+
+        Args:
+            snapshot: Aktuální snapshot
+            with_config: Přiložit poslední konfiguraci zápasu
+
+        Returns:
+            Snapshot doplněný o statistiky (a případně konfiguraci)
+        """
+        keyframe = dict(snapshot)
+        if "stats" not in keyframe and self.stats is not None:
+            keyframe["stats"] = self.stats
+        if with_config and "match_config" not in keyframe:
+            keyframe["match_config"] = self.match_config
+        return keyframe
+
+    def build_delta(self, baseline: Dict[str, Any], snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sestaví delta snapshot proti potvrzené baseline.
+
+        Args:
+            baseline: Snapshot potvrzený klientem
+            snapshot: Aktuální snapshot
+
+        Returns:
+            Delta snapshot se statistikami/konfigurací, pokud se od baseline změnily
+        """
+        delta = compute_delta(baseline, snapshot)
+        if "stats" not in delta and baseline["stats_version"] != snapshot["stats_version"]:
+            delta["stats"] = self.stats
+        if (
+            "match_config" not in delta
+            and self.match_config is not None
+            and baseline["config_version"] != snapshot["config_version"]
+        ):
+            delta["match_config"] = self.match_config
+        return delta
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        latest = self._order[-1] if self._order else None
+        return f"SnapshotHistory(snapshots={len(self._order)}, latest_seq={latest})"
@@ -0,0 +1,282 @@
+"""
+Telemetry - počítadla a vzorkované strukturované události zpráv klientů.
+
+Logovat každou příchozí zprávu (vstupy chodí rychlostí opakování kláves
+od každého hráče) znamená tisíce formátovaných řádků logu za sekundu na
+místnost přímo v event loopu. Místo toho:
+
+- každá zpráva jen zvýší počítadlo ``(room_id, typ zprávy)``,
+- jen vzorek zpráv (každá N-tá, N podle typu zprávy a případně místnosti,
+  0 = žádná) vytvoří strukturovanou událost (slovník) v kruhovém bufferu
+  v paměti – nejstarší události se přepisují,
+- události z bufferu odebírá asynchronní sink (``run_sink``) a zapisuje je
+  v dávkách mimo event loop (``asyncio.to_thread``), takže zápis logu nikdy
+  neblokuje tick. Výchozí zápis je jeden JSON řádek na událost do loggeru
+  ``multipong.telemetry``.
+
+Vzorkování se nastavuje v ``server.telemetry_sampling`` ({typ: N}, klíč
+``"*"`` platí pro ostatní typy) a ``server.telemetry_room_sampling``
+({room_id: {typ: N}}), za běhu pak ``set_sampling``.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+
+from multipong import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Výchozí cíl sinku – strukturované události jako JSON řádky
+event_logger = logging.getLogger("multipong.telemetry")
+
+# Klíč vzorkování platný pro typy zpráv bez vlastního nastavení
+DEFAULT_SAMPLING_KEY = "*"
+
+
+def log_events(events: List[Dict[str, Any]]) -> None:
+    """Zapíše dávku událostí do loggeru ``multipong.telemetry`` (JSON řádky)."""
+    for event in events:
+        event_logger.info(json.dumps(event, ensure_ascii=False, default=str))
+
+
+class Telemetry:
+    """
+    Počítadla zpráv a kruhový buffer vzorkovaných událostí.
+
+    Attributes:
+        counters: Počty zpráv {(room_id, typ zprávy): počet}
+        rejected: Počty zpráv odmítnutých limity {(room_id, typ zprávy, důvod): počet}
+        events: Kruhový buffer posledních událostí
+        sampling: Vzorkování podle typu zprávy {typ: N}
+        room_sampling: Vzorkování místností {room_id: {typ: N}}
+        dropped_events: Počet událostí přepsaných dřív, než je sink zapsal
+        sink_errors: Počet neúspěšných zápisů dávky
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        sampling: Optional[Mapping[str, int]] = None,
+        room_sampling: Optional[Mapping[str, Mapping[str, int]]] = None,
+        writer: Callable[[List[Dict[str, Any]]], None] = log_events,
+    ):
+        """
+        Args:
+            capacity: Kapacita kruhového bufferu (None = server.telemetry_buffer_size)
+            sampling: Vzorkování podle typu zprávy (None = server.telemetry_sampling)
+            room_sampling: Vzorkování místností (None = server.telemetry_room_sampling)
+            writer: Funkce zapisující dávku událostí (volaná mimo event loop)
+        """
+        capacity = capacity or settings.SERVER_TELEMETRY_BUFFER_SIZE
+        self.counters: Dict[Tuple[str, str], int] = {}
+        self.rejected: Dict[Tuple[str, str, str], int] = {}
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max(1, capacity))
+        self.sampling: Dict[str, int] = dict(
+            settings.SERVER_TELEMETRY_SAMPLING if sampling is None else sampling
+        )
+        self.room_sampling: Dict[str, Dict[str, int]] = {
+            room_id: dict(room_config)
+            for room_id, room_config in (
+                settings.SERVER_TELEMETRY_ROOM_SAMPLING if room_sampling is None else room_sampling
+            ).items()
+        }
+        self.dropped_events = 0
+        self.sink_errors = 0
+        self._writer = writer
+        self._event_ids = itertools.count(1)
+        self._flushed_id = 0
+
+    def set_sampling(self, msg_type: str, every: int, room_id: Optional[str] = None) -> None:
+        """
+        Nastaví vzorkování událostí.
+
+        Args:
+            msg_type: Typ zprávy (``"*"`` = ostatní typy)
+            every: Událost z každé N-té zprávy (0 = žádné, 1 = všechny)
+            room_id: Jen pro tuto místnost (None = pro všechny místnosti)
+        """
+        target = self.sampling if room_id is None else self.room_sampling.setdefault(room_id, {})
+        target[msg_type] = max(0, int(every))
+
+    def sample_every(self, room_id: str, msg_type: str) -> int:
+        """
+        Vrátí platné vzorkování pro zprávu (místnost má přednost před typem).
+
+        Returns:
+            N – událost z každé N-té zprávy (0 = žádné)
+        """
+        room_config = self.room_sampling.get(room_id)
+        if room_config:
+            every = room_config.get(msg_type, room_config.get(DEFAULT_SAMPLING_KEY))
+            if every is not None:
+                return every
+        return self.sampling.get(msg_type, self.sampling.get(DEFAULT_SAMPLING_KEY, 1))
+
+    def count(self, room_id: str, msg_type: str) -> bool:
+        """
+        Započítá zprávu a rozhodne, zda z ní vytvořit událost.
+
+        Args:
+            room_id: ID místnosti
+            msg_type: Typ zprávy
+
+        Returns:
+            True pokud zpráva patří do vzorku (volající pak zavolá ``emit``)
+        """
+        key = (room_id, msg_type)
+        count = self.counters.get(key, 0) + 1
+        self.counters[key] = count
+        every = self.sample_every(room_id, msg_type)
+        return every > 0 and (count - 1) % every == 0
+
+    def reject(self, room_id: str, msg_type: str, reason: str) -> None:
+        """
+        Započítá zprávu odmítnutou limity spojení (``MessageLimiter``).
+
+        Args:
+            room_id: ID místnosti
+            msg_type: Typ zprávy (známý typ nebo ``"unknown"``)
+            reason: Důvod odmítnutí (``"size"``, ``"rate"``)
+        """
+        key = (room_id, msg_type, reason)
+        self.rejected[key] = self.rejected.get(key, 0) + 1
+
+    def emit(self, room_id: str, msg_type: str, player_id: Optional[str] = None, **fields: Any) -> None:
+        """
+        Vloží strukturovanou událost do kruhového bufferu (bez počítání a vzorkování).
+
+        Args:
+            room_id: ID místnosti
+            msg_type: Typ zprávy / události
+            player_id: Hráč, kterého se událost týká
+            **fields: Další pole události
+        """
+        self.events.append({
+            "id": next(self._event_ids),
+            "ts": time.time(),
+            "room": room_id,
+            "type": msg_type,
+            "player": player_id,
+            **fields,
+        })
+
+    def record(self, room_id: str, msg_type: str, player_id: Optional[str] = None, **fields: Any) -> bool:
+        """
+        Započítá zprávu a podle vzorkování vytvoří událost.
+
+        Returns:
+            True pokud byla událost vytvořena
+        """
+        if not self.count(room_id, msg_type):
+            return False
+        self.emit(room_id, msg_type, player_id, **fields)
+        return True
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """
+        Odebere dosud nezapsané události (buffer je dál drží pro ``snapshot``).
+
+        Returns:
+            Nové události od posledního volání (od nejstarší)
+        """
+        events = self.events
+        if not events or events[-1]["id"] <= self._flushed_id:
+            return []
+        batch = []
+        for event in reversed(events):
+            if event["id"] <= self._flushed_id:
+                break
+            batch.append(event)
+        batch.reverse()
+        self.dropped_events += batch[0]["id"] - self._flushed_id - 1
+        self._flushed_id = batch[-1]["id"]
+        return batch
+
+    async def flush(self) -> int:
+        """
+        Zapíše nezapsané události mimo event loop.
+
+        Returns:
+            Počet zapsaných událostí
+        """
+        batch = self.drain()
+        if not batch:
+            return 0
+        try:
+            await asyncio.to_thread(self._writer, batch)
+        except Exception as e:
+            self.sink_errors += 1
+            logger.warning(f"⚠️ Zápis telemetrie selhal: {e}")
+            return 0
+        return len(batch)
+
+    async def run_sink(self, interval: Optional[float] = None) -> None:
+        """
+        Smyčka sinku – periodicky zapisuje nové události (do zrušení tasku).
+
+        Args:
+            interval: Perioda zápisu v sekundách (None = server.telemetry_flush_interval)
+        """
+        interval = interval or settings.SERVER_TELEMETRY_FLUSH_INTERVAL
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                await self.flush()
+        finally:
+            # Dávka rozepsaná při zrušení se dopíše synchronně
+            batch = self.drain()
+            if batch:
+                self._writer(batch)
+
+    def discard_room(self, room_id: str) -> None:
+        """Zapomene počítadla a vzorkování zrušené místnosti."""
+        for key in [key for key in self.counters if key[0] == room_id]:
+            del self.counters[key]
+        for rejected_key in [k for k in self.rejected if k[0] == room_id]:
+            del self.rejected[rejected_key]
+        self.room_sampling.pop(room_id, None)
+
+    def snapshot(self, room_id: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        """
+        Vrátí počítadla a poslední události (pro HTTP endpoint).
+
+        Args:
+            room_id: Jen tato místnost (None = všechny)
+            limit: Maximální počet vrácených událostí
+
+        Returns:
+            Slovník ``{"counters": {room_id: {typ: počet}}, "events": [...], ...}``
+        """
+        counters: Dict[str, Dict[str, int]] = {}
+        for (room, msg_type), count in self.counters.items():
+            if room_id is None or room == room_id:
+                counters.setdefault(room, {})[msg_type] = count
+        rejected: Dict[str, Dict[str, int]] = {}
+        for (room, msg_type, reason), count in self.rejected.items():
+            if room_id is None or room == room_id:
+                rejected.setdefault(room, {})[f"{msg_type}:{reason}"] = count
+        events = [event for event in self.events if room_id is None or event["room"] == room_id]
+        return {
+            "counters": counters,
+            "rejected": rejected,
+            "events": events[-limit:] if limit > 0 else [],
+            "sampling": dict(self.sampling),
+            "room_sampling": {
+                room: dict(config) for room, config in self.room_sampling.items()
+                if room_id is None or room == room_id
+            },
+            "dropped_events": self.dropped_events,
+        }
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return (
+            f"Telemetry(counters={len(self.counters)}, events={len(self.events)}, "
+            f"dropped={self.dropped_events})"
+        )
@@ -0,0 +1,219 @@
+"""
+TickScheduler - jeden sdílený plánovač ticků pro všechny místnosti.
+
+Místo stovek samostatných tasků, z nichž každý spí ve vlastním
+``asyncio.sleep``, drží plánovač haldu absolutních monotónních deadlinů
+(``loop.time()``) a probouzí se jediným ``loop.call_at`` na nejbližší
+z nich (``Wakeup``). Ticky tak nedriftují a event loop neobsluhuje
+stovky časovačů.
+
+Místnosti se rozkládají do ``stagger_slots`` fází v rámci intervalu
+ticku (nová místnost dostane nejméně obsazenou fázi), aby se broadcasty
+všech zápasů nesešly ve stejném okamžiku. Zpoždění startu každého ticku
+vůči deadline se zaznamenává do ``GameLoop.jitter``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from .game_loop import GameLoop
+from .wakeup import Wakeup
+
+
+logger = logging.getLogger(__name__)
+
+# Výchozí počet fází, do kterých se místnosti rozkládají v rámci intervalu
+DEFAULT_STAGGER_SLOTS = 16
+
+
+class _ScheduledLoop:
+    """Záznam jedné místnosti v plánovači."""
+
+    __slots__ = ("key", "game_loop", "slot", "deadline", "active")
+
+    def __init__(self, key: str, game_loop: GameLoop, slot: int, deadline: float) -> None:
+        self.key = key
+        self.game_loop = game_loop
+        self.slot = slot
+        self.deadline = deadline
+        self.active = True
+
+
+class TickScheduler:
+    """
+    Sdílený plánovač ticků řízený absolutními deadliny.
+
+    Attributes:
+        stagger_slots: Počet fází v rámci intervalu ticku
+        ticks: Celkový počet provedených ticků všech místností
+        errors: Počet místností vyřazených kvůli výjimce v ticku
+    """
+
+    def __init__(self, stagger_slots: int = DEFAULT_STAGGER_SLOTS):
+        """
+        Args:
+            stagger_slots: Počet fází, do kterých se místnosti rozkládají
+        """
+        self.stagger_slots = max(1, stagger_slots)
+        self.ticks = 0
+        self.errors = 0
+        self._entries: Dict[str, _ScheduledLoop] = {}
+        self._heap: List[Tuple[float, int, _ScheduledLoop]] = []
+        self._sequence = itertools.count()
+        self._slot_usage = [0] * self.stagger_slots
+        self._epoch: Optional[float] = None
+        self._wakeup = Wakeup()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True pokud běží task plánovače."""
+        return self._task is not None and not self._task.done()
+
+    def add(self, key: str, game_loop: GameLoop) -> bool:
+        """
+        Zařadí game loop do plánovače a případně spustí jeho task.
+
+        Musí být voláno uvnitř běžící event loop.
+
+        Args:
+            key: Unikátní klíč (ID místnosti)
+            game_loop: GameLoop, jehož ticky plánovač řídí
+
+        Returns:
+            True pokud byl zařazen, False pokud klíč již existuje
+        """
+        if key in self._entries:
+            logger.warning(f"⚠️ Místnost {key} je v plánovači již zařazena")
+            return False
+
+        now = asyncio.get_running_loop().time()
+        if self._epoch is None:
+            self._epoch = now
+
+        # Nejméně obsazená fáze; deadliny jsou zarovnané na společnou epochu,
+        # takže se fáze místností nerozjedou ani při pozdějším přidání
+        slot = min(range(self.stagger_slots), key=self._slot_usage.__getitem__)
+        self._slot_usage[slot] += 1
+        interval = 1.0 / game_loop.tick_rate
+        offset = slot / self.stagger_slots * interval
+        periods = max(0, math.ceil((now - self._epoch - offset) / interval))
+        deadline = self._epoch + offset + periods * interval
+
+        entry = _ScheduledLoop(key, game_loop, slot, deadline)
+        self._entries[key] = entry
+        game_loop.reset_clock(now)
+        game_loop.is_running = True
+        self._push(entry)
+        self.start()
+        logger.info(f"🗓️ Místnost {key} zařazena do plánovače (fáze {slot}/{self.stagger_slots})")
+        return True
+
+    def remove(self, key: str) -> bool:
+        """
+        Vyřadí game loop z plánovače.
+
+        Returns:
+            True pokud byl vyřazen, False pokud v plánovači nebyl
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.active = False  # záznam v haldě se zahodí líně
+        entry.game_loop.is_running = False
+        self._slot_usage[entry.slot] -= 1
+        logger.info(f"🗓️ Místnost {key} vyřazena z plánovače")
+        return True
+
+    def start(self) -> None:
+        """Spustí task plánovače, pokud ještě neběží."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self.run(), name="tick-scheduler")
+
+    async def stop(self) -> None:
+        """Zastaví plánovač a vyřadí všechny game loopy."""
+        for key in list(self._entries):
+            self.remove(key)
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def get_room_count(self) -> int:
+        """Vrátí počet naplánovaných místností."""
+        return len(self._entries)
+
+    def get_jitter(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Vrátí histogramy zpoždění ticků všech naplánovaných místností.
+
+        Returns:
+            Slovník {klíč: serializovaný Histogram}
+        """
+        return {key: entry.game_loop.get_jitter() for key, entry in self._entries.items()}
+
+    async def run(self) -> None:
+        """Hlavní smyčka plánovače – spí do nejbližšího deadline a provede splatné ticky."""
+        loop = asyncio.get_running_loop()
+        logger.info("🗓️ Plánovač ticků spuštěn")
+        try:
+            while True:
+                heap = self._heap
+                while heap and not heap[0][2].active:
+                    heapq.heappop(heap)
+
+                now = loop.time()
+                if not heap or heap[0][0] > now:
+                    # Jediný časovač na nejbližší deadline; add() čekání zkrátí
+                    await self._wakeup.sleep_until(heap[0][0] if heap else None)
+                    continue
+
+                # Všechny splatné ticky (místnosti ve stejné fázi najednou)
+                due = []
+                while heap and heap[0][0] <= now:
+                    entry = heapq.heappop(heap)[2]
+                    if entry.active:
+                        due.append(entry)
+                for entry in due:
+                    await self._tick(entry, loop)
+
+        except asyncio.CancelledError:
+            logger.info("🛑 Plánovač ticků zrušen")
+            raise
+
+    async def _tick(self, entry: _ScheduledLoop, loop: asyncio.AbstractEventLoop) -> None:
+        """Provede tick jedné místnosti a naplánuje další."""
+        if not entry.active:
+            return  # vyřazena během ticku jiné místnosti
+        game_loop = entry.game_loop
+        if not game_loop.is_running:
+            # GameLoop.stop() zavolané mimo plánovač
+            self.remove(entry.key)
+            return
+
+        try:
+            await game_loop.tick_at(entry.deadline, loop.time())
+        except Exception as e:
+            logger.error(f"❌ Chyba v ticku místnosti {entry.key}: {e}", exc_info=True)
+            self.errors += 1
+            self.remove(entry.key)
+            return
+
+        self.ticks += 1
+        if entry.active:
+            entry.deadline = game_loop.schedule_next(entry.deadline, loop.time())
+            self._push(entry)
+
+    def _push(self, entry: _ScheduledLoop) -> None:
+        """Vloží záznam do haldy a probudí plánovač, pokud spí déle."""
+        heapq.heappush(self._heap, (entry.deadline, next(self._sequence), entry))
+        if self._heap[0][2] is entry:
+            self._wakeup.wake()
+
+    def __repr__(self) -> str:
+        """Textová reprezentace pro debugging."""
+        return f"TickScheduler(rooms={len(self._entries)}, ticks={self.ticks}, running={self.is_running})"
@@ -0,0 +1,53 @@
+"""
+Wakeup - jediný časovač smyčky, která spí do nejbližšího deadline haldy.
+
+TickScheduler (ticky místností) i IdleExpiry (nečinnost relací) drží
+haldu deadlinů a spí jediným ``loop.call_at`` na nejbližší z nich.
+Vložení záznamu s dřívějším deadline spánek přeruší (``wake``) a smyčka
+si naplánuje kratší čekání.
+"""
+
+import asyncio
+from typing import Optional
+
+
+def _release(waiter: asyncio.Future) -> None:
+    """Probudí čekající smyčku (pokud už nebyla probuzena)."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Wakeup:
+    """Spánek smyčky do deadline, který lze předčasně přerušit."""
+
+    __slots__ = ("_waiter",)
+
+    def __init__(self) -> None:
+        self._waiter: Optional[asyncio.Future] = None
+
+    @property
+    def is_sleeping(self) -> bool:
+        """True pokud smyčka právě spí v ``sleep_until``."""
+        return self._waiter is not None
+
+    async def sleep_until(self, when: Optional[float]) -> None:
+        """
+        Spí do času ``when`` event loopu, nebo do zavolání ``wake``.
+
+        Args:
+            when: Absolutní čas probuzení (``loop.time()``; None = jen do ``wake``)
+        """
+        loop = asyncio.get_running_loop()
+        waiter = self._waiter = loop.create_future()
+        handle = loop.call_at(when, _release, waiter) if when is not None else None
+        try:
+            await waiter
+        finally:
+            self._waiter = None
+            if handle is not None:
+                handle.cancel()
+
+    def wake(self) -> None:
+        """Přeruší probíhající spánek (bez spánku nic nedělá)."""
+        if self._waiter is not None:
+            _release(self._waiter)
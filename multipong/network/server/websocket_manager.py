@@ -2,25 +2,94 @@
 WebSocketManager - správa všech připojených hráčských relací.
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, List, Optional
-from .player_session import PlayerSession
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from multipong import settings
+from multipong.engine.profiling import Histogram
+from multipong.network.snapshot_codec import SNAPSHOT_FORMAT_BINARY, encode_snapshot
+from .player_session import Payload, PlayerSession
+from .snapshot_history import SnapshotHistory
 
 
 logger = logging.getLogger(__name__)
 
+# Typy zpráv, u kterých stačí doručit nejnovější (neodeslané starší se nahradí)
+COALESCED_MESSAGE_TYPES = frozenset({"snapshot"})
+
+# Klíč skupiny relací, které dostanou keyframe (plný snapshot se statistikami)
+_KEYFRAME = "keyframe"
+
+# Profil klienta bez ?client_profile (výchozí frekvence snapshotů)
+DEFAULT_CLIENT_PROFILE = "player"
+
+# Počítadla provozu relací (PlayerSession), která WebSocketManager sčítá
+TRAFFIC_COUNTERS = ("messages_sent", "bytes_sent", "messages_received", "bytes_received")
+
+
+def encode_message(message: dict) -> str:
+    """
+    Zakóduje zprávu do JSON textu stejně jako ``WebSocket.send_json``.
+    
+    Args:
+        message: Slovník zprávy
+        
+    Returns:
+        Kompaktní JSON text (bez mezer, UTF-8 znaky bez escapování)
+    """
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_snapshot_as(snapshot: dict, snapshot_format: str) -> Payload:
+    """
+    Zakóduje snapshot ve formátu vyjednaném relací.
+    
+    Args:
+        snapshot: Snapshot zpráva (``SnapshotBuilder.build_snapshot``)
+        snapshot_format: "binary" nebo "json"
+        
+    Returns:
+        Binární snapshot (bytes) nebo JSON text
+    """
+    if snapshot_format == SNAPSHOT_FORMAT_BINARY:
+        return encode_snapshot(snapshot)
+    return encode_message(snapshot)
+
 
 class WebSocketManager:
     """
     Správce všech aktivních WebSocket připojení.
     
+    Broadcast zprávy jen zařadí do odchozích front relací (viz
+    ``PlayerSession.enqueue_text``) a na síť nečeká.
+    
+    Místnost vytváří snapshot každý tick (``tick_rate``); relace dostává
+    jen každý ``snapshot_interval``-tý podle své vyjednané frekvence.
+    
     Attributes:
         sessions: Slovník aktivních relací {player_id: PlayerSession}
+        tick_rate: Frekvence snapshotů místnosti (Hz) – horní mez pro relace
+        backed_up_disconnects: Počet relací odpojených kvůli zahlcení
+        snapshot_history: Historie snapshotů pro delta snapshoty
+        fanout_time: Histogram doby rozdělení snapshotu do front relací (s)
     """
     
-    def __init__(self):
-        """Inicializace správce WebSocket spojení."""
+    def __init__(self, tick_rate: Optional[int] = None):
+        """
+        Inicializace správce WebSocket spojení.
+        
+        Args:
+            tick_rate: Frekvence game loopu místnosti v Hz (None = config)
+        """
         self.sessions: Dict[str, PlayerSession] = {}
+        self.tick_rate = tick_rate or settings.SERVER_TICK_RATE
+        self.backed_up_disconnects = 0
+        self.snapshot_history = SnapshotHistory()
+        self.fanout_time = Histogram()
+        # Provoz relací, které už byly odebrány (get_traffic je přičte k živým)
+        self._retired_traffic: Dict[str, int] = dict.fromkeys(TRAFFIC_COUNTERS, 0)
     
     async def add(self, session: PlayerSession) -> bool:
         """
@@ -37,9 +106,50 @@ class WebSocketManager:
             return False
         
         self.sessions[session.player_id] = session
+        session.on_send_failed = self._on_send_failed
+        if session.snapshot_rate:
+            session.snapshot_interval = max(1, round(self.tick_rate / session.snapshot_rate))
         logger.info(f"✅ Přidán hráč {session.player_id} (celkem hráčů: {len(self.sessions)})")
         return True
     
+    def negotiate_snapshot_rate(self, requested: Optional[str], profile: Optional[str] = None) -> float:
+        """
+        Vyjedná frekvenci snapshotů relace podle handshake.
+        
+        Args:
+            requested: Hodnota ``snapshot_rate`` z URL (Hz) nebo None
+            profile: Profil klienta ("player", "spectator", "mobile");
+                     neznámý profil = "player"
+            
+        Returns:
+            Skutečná frekvence v Hz – dělitel ``tick_rate`` (každý N-tý snapshot),
+            nejméně ``SERVER_MIN_SNAPSHOT_RATE`` a nejvýše ``tick_rate``
+        """
+        rates = settings.SERVER_SNAPSHOT_RATES
+        rate: float = rates.get(profile or DEFAULT_CLIENT_PROFILE, rates.get(DEFAULT_CLIENT_PROFILE, self.tick_rate))
+        if requested:
+            try:
+                rate = float(requested)
+            except ValueError:
+                logger.warning(f"Neplatná frekvence snapshotů: {requested!r}")
+        rate = max(settings.SERVER_MIN_SNAPSHOT_RATE, min(rate, self.tick_rate))
+        interval = max(1, round(self.tick_rate / rate))
+        return self.tick_rate / interval
+    
+    def reset_snapshots(self) -> None:
+        """
+        Zapomene historii snapshotů i potvrzené baseline relací.
+        
+        Pro místnost, jejíž snapshoty začínají znovu od začátku (nový engine
+        po přesunu na jiný worker); relace pak dostanou keyframe.
+        """
+        self.snapshot_history = SnapshotHistory()
+        for session in self.sessions.values():
+            session.acked_seq = None
+            session.keyframe_seq = 0
+            session.stats_version = None
+            session.config_version = None
+    
     async def remove(self, session: PlayerSession) -> bool:
         """
         Odebere relaci hráče.
@@ -52,6 +162,7 @@ class WebSocketManager:
         """
         if session.player_id in self.sessions:
             del self.sessions[session.player_id]
+            self._retire(session)
             session.disconnect()
             logger.info(f"❌ Odebrán hráč {session.player_id} (zbývá hráčů: {len(self.sessions)})")
             return True
@@ -117,59 +228,251 @@ class WebSocketManager:
         """
         Rozešle JSON zprávu všem připojeným hráčům.
         
+        Zpráva se zakóduje jen jednou a všem relacím se zařadí stejný text.
+        Snapshoty se v frontě slučují a kódují se zvlášť pro každý vyjednaný
+        formát (viz ``enqueue_snapshot``), ostatní zprávy jsou spolehlivé.
+        
         Args:
             message: Slovník k odeslání jako JSON
             exclude: Seznam player_id, kterým se zpráva neodešle (optional)
             
         Returns:
-            Počet hráčů, kterým byla zpráva úspěšně odeslána
+            Počet hráčů, kterým byla zpráva zařazena k odeslání
+        """
+        if message.get("type") == "snapshot":
+            return self.enqueue_snapshot(message, exclude)
+        reliable = message.get("type") not in COALESCED_MESSAGE_TYPES
+        return self.enqueue_text(encode_message(message), exclude, reliable=reliable)
+    
+    async def broadcast_text(
+        self,
+        text: str,
+        exclude: Optional[List[str]] = None,
+        reliable: bool = True
+    ) -> int:
         """
-        exclude_set = set(exclude) if exclude else set()
-        sent_count = 0
-        failed_sessions = []
+        Rozešle již zakódovanou (JSON) zprávu všem připojeným hráčům.
         
-        for player_id, session in list(self.sessions.items()):
-            # Přeskoč vyloučené hráče
-            if player_id in exclude_set:
-                continue
+        Args:
+            text: Text zprávy
+            exclude: Seznam player_id, kterým se zpráva neodešle (optional)
+            reliable: False = snapshot (neodeslaný starší se nahradí)
             
-            try:
-                await session.send_json(message)
-                sent_count += 1
-            except Exception as e:
-                logger.error(f"Chyba při odesílání zprávy hráči {player_id}: {e}")
-                failed_sessions.append(session)
-        
-        # Odeber hráče, kterým se nepodařilo odeslat zprávu
-        for session in failed_sessions:
-            await self.remove(session)
-        
-        return sent_count
+        Returns:
+            Počet hráčů, kterým byla zpráva zařazena k odeslání
+        """
+        return self.enqueue_text(text, exclude, reliable=reliable)
     
     async def broadcast_to_team(self, message: dict, team: str) -> int:
         """
-        Rozešle zprávu všem hráčům v daném týmu.
+        Rozešle zprávu všem hráčům v daném týmu (zakódovanou jen jednou).
         
         Args:
             message: Slovník k odeslání jako JSON
             team: Označení týmu ("A" nebo "B")
             
         Returns:
-            Počet hráčů, kterým byla zpráva odeslána
+            Počet hráčů, kterým byla zpráva zařazena k odeslání
+        """
+        # Hráč patří do týmu, pokud jeho player_id začíná písmenem týmu
+        recipients = [s for pid, s in self.sessions.items() if pid.startswith(team)]
+        if not recipients:
+            return 0
+        reliable = message.get("type") not in COALESCED_MESSAGE_TYPES
+        return self._enqueue_to(recipients, encode_message(message), reliable)
+    
+    def enqueue_text(
+        self,
+        text: str,
+        exclude: Optional[List[str]] = None,
+        reliable: bool = True
+    ) -> int:
+        """
+        Zařadí text do odchozích front všech relací (synchronně, bez I/O).
+        
+        Args:
+            text: Text zprávy
+            exclude: Seznam player_id, kterým se zpráva neodešle (optional)
+            reliable: False = snapshot (neodeslaný starší se nahradí)
+            
+        Returns:
+            Počet relací, kterým byla zpráva zařazena
+        """
+        return self._enqueue_to(self._recipients(exclude), text, reliable)
+    
+    def enqueue_snapshot(
+        self,
+        snapshot: Optional[dict] = None,
+        exclude: Optional[List[str]] = None,
+        encoded: Optional[Mapping[str, Payload]] = None
+    ) -> int:
+        """
+        Zařadí snapshot relacím, každé ve formátu vyjednaném v handshake.
+        
+        Relace dostane jen snapshoty podle své frekvence (``snapshot_due``).
+        Relace s delta snapshoty dostanou jen změny proti své potvrzené
+        baseline, případně keyframe (viz ``SnapshotHistory``). Ostatní
+        dostanou plný snapshot; pokud jim statistiky nebo konfigurace
+        přišly ve vynechaném (nebo ve frontě nahrazeném) snapshotu,
+        přiloží se. Relace se stejným formátem a stejnou baseline sdílejí
+        jedno zakódování. Snapshoty se ve frontách slučují.
+        
+        Args:
+            snapshot: Snapshot zpráva (None pokud ``encoded`` pokrývá všechny formáty)
+            exclude: Seznam player_id, kterým se snapshot neodešle (optional)
+            encoded: Již zakódovaný plný snapshot {formát: data} (např. z workeru)
+            
+        Returns:
+            Počet relací, kterým byl snapshot zařazen
+        """
+        started = perf_counter()
+        history = self.snapshot_history
+        seq = snapshot.get("seq") if snapshot is not None else None
+        if snapshot is not None and seq is not None:
+            history.add(snapshot)
+        
+        # Skupiny relací: (formát, baseline seq | _KEYFRAME | None = plný snapshot)
+        groups: Dict[Tuple[Any, ...], List[PlayerSession]] = {}
+        for session in self._recipients(exclude):
+            key: Tuple[Any, ...]
+            if snapshot is None or seq is None:
+                key = (session.snapshot_format, None)
+            elif not session.snapshot_due(seq):
+                continue
+            elif session.snapshot_delta:
+                baseline = history.baseline_for(session, seq)
+                if baseline is not None:
+                    key = (session.snapshot_format, baseline["seq"])
+                else:
+                    key = (session.snapshot_format, _KEYFRAME, history.needs_config(session))
+            else:
+                if history.is_stale(session, snapshot):
+                    key = (session.snapshot_format, _KEYFRAME, history.needs_config(session))
+                else:
+                    key = (session.snapshot_format, None)
+            groups.setdefault(key, []).append(session)
+        
+        # Relace s plnými snapshoty převezmou verze statistik a konfigurace
+        # až po odeslání (snapshot nahrazený ve frontě je nedoručil)
+        versions = None
+        if snapshot is not None and seq is not None:
+            versions = (snapshot["stats_version"], snapshot["config_version"])
+        queued = 0
+        for key, sessions in groups.items():
+            snapshot_format, baseline_seq = key[0], key[1]
+            if baseline_seq is None and encoded and snapshot_format in encoded:
+                payload = encoded[snapshot_format]
+            elif snapshot is None:
+                raise ValueError(f"Chybí snapshot pro nezakódovaný formát {snapshot_format!r}")
+            elif baseline_seq is None:
+                payload = encode_snapshot_as(snapshot, snapshot_format)
+            elif baseline_seq == _KEYFRAME:
+                keyframe = history.build_keyframe(snapshot, with_config=key[2])
+                payload = encode_snapshot_as(keyframe, snapshot_format)
+            else:
+                baseline = history.get(baseline_seq)
+                if baseline is not None:
+                    delta = history.build_delta(baseline, snapshot)
+                else:  # baseline_for ji právě vrátil – jen pro jistotu keyframe
+                    delta = history.build_keyframe(snapshot, with_config=True)
+                payload = encode_snapshot_as(delta, snapshot_format)
+            queued += self._enqueue_to(sessions, payload, reliable=False, versions=versions)
+        self.fanout_time.record(perf_counter() - started)
+        return queued
+    
+    def _recipients(self, exclude: Optional[List[str]] = None) -> List[PlayerSession]:
+        """Vrátí relace kromě vyloučených hráčů."""
+        if exclude:
+            exclude_set = set(exclude)
+            return [s for pid, s in self.sessions.items() if pid not in exclude_set]
+        return list(self.sessions.values())
+    
+    def _enqueue_to(
+        self,
+        sessions: Iterable[PlayerSession],
+        text: Payload,
+        reliable: bool,
+        versions: Optional[Tuple[Optional[int], Optional[int]]] = None
+    ) -> int:
+        """
+        Zařadí stejný text vybraným relacím; zahlcené relace odpojí.
+        
+        Args:
+            sessions: Cílové relace
+            text: Zakódovaná zpráva
+            reliable: Spolehlivá zpráva (False = snapshot)
+            versions: Verze statistik a konfigurace plného snapshotu
+                      (převezmou je jen relace bez delta snapshotů)
+        
+        Returns:
+            Počet relací, kterým byla zpráva zařazena
+        """
+        queued = 0
+        rejected = []
+        
+        for session in sessions:
+            if session.enqueue_text(text, reliable, None if session.snapshot_delta else versions):
+                queued += 1
+            else:
+                rejected.append(session)
+        
+        for session in rejected:
+            self._drop(session)
+        
+        return queued
+    
+    def _drop(self, session: PlayerSession) -> None:
+        """Odebere relaci, která nepřijala zprávu (zahlcená nebo odpojená)."""
+        if self.sessions.get(session.player_id) is not session:
+            return
+        del self.sessions[session.player_id]
+        self._retire(session)
+        if session.is_connected:
+            # Zahlcený klient – uvolníme frontu a zavřeme spojení
+            self.backed_up_disconnects += 1
+            logger.warning(
+                f"🐢 Hráč {session.player_id} nestíhá přijímat zprávy "
+                f"(fronta: {session.queue_depth}), odpojuji"
+            )
+            asyncio.ensure_future(session.close())
+        else:
+            logger.info(f"❌ Odebrán odpojený hráč {session.player_id} (zbývá hráčů: {len(self.sessions)})")
+    
+    def _on_send_failed(self, session: PlayerSession, error: Exception) -> None:
+        """Callback writer tasku relace při chybě odesílání."""
+        self._drop(session)
+    
+    def _retire(self, session: PlayerSession) -> None:
+        """Přičte provoz odebírané relace k počítadlům místnosti."""
+        retired = self._retired_traffic
+        for name in TRAFFIC_COUNTERS:
+            retired[name] += getattr(session, name)
+    
+    def get_traffic(self) -> Dict[str, int]:
         """
-        sent_count = 0
+        Vrátí kumulativní provoz místnosti (včetně odpojených relací).
         
-        for player_id, session in list(self.sessions.items()):
-            # Kontrola, zda hráč patří do týmu (player_id začíná písmenem týmu)
-            if player_id.startswith(team):
-                try:
-                    await session.send_json(message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.error(f"Chyba při odesílání zprávy hráči {player_id}: {e}")
-                    await self.remove(session)
+        Returns:
+            Slovník {počítadlo: hodnota} pro ``TRAFFIC_COUNTERS``
+        """
+        traffic = dict(self._retired_traffic)
+        for session in self.sessions.values():
+            for name in TRAFFIC_COUNTERS:
+                traffic[name] += getattr(session, name)
+        return traffic
+    
+    def get_queue_depths(self) -> Dict[str, int]:
+        """
+        Vrátí počet zpráv čekajících na odeslání pro každou relaci.
         
-        return sent_count
+        Returns:
+            Slovník {player_id: počet zpráv ve frontě}
+        """
+        return {pid: session.queue_depth for pid, session in self.sessions.items()}
+    
+    async def flush(self) -> None:
+        """Počká, až všechny relace odešlou své fronty."""
+        await asyncio.gather(*(s.drain() for s in list(self.sessions.values())))
     
     def collect_inputs(self) -> Dict[str, Dict[str, bool]]:
         """
@@ -213,6 +516,7 @@ class WebSocketManager:
         logger.info(f"Odpojuji všechny hráče (celkem: {len(self.sessions)})")
         
         for session in list(self.sessions.values()):
+            self._retire(session)
             session.disconnect()
         
         self.sessions.clear()
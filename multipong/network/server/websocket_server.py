@@ -4,20 +4,25 @@ Základní implementace s FastAPI + WebSocket endpointy.
 """
 
 import asyncio
+import json
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Optional
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, FileResponse
+from typing import Any, Optional
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+from .idle_expiry import IdleExpiry
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics
 from .player_session import PlayerSession
-from .websocket_manager import WebSocketManager
-from .lobby_manager import LobbyManager
-from multipong.engine.game_engine import MultipongEngine
-from multipong.network.server.game_loop import run_game_loop
+from .rate_limit import CLOSE_MESSAGE_TOO_BIG, CLOSE_POLICY_VIOLATION, POLICY_DISCONNECT, REASON_SIZE, MessageLimiter
+from .room_manager import DEFAULT_ROOM_ID, RoomHandle, RoomManager
+from .room_workers import ShardedRoomManager
+from .telemetry import Telemetry
 from multipong import settings
+from multipong.network.lobby_diff import LOBBY_SYNC
+from multipong.network.snapshot_codec import SNAPSHOT_SCHEMA_VERSION, negotiate_snapshot_format
 
 # Nastavení loggeru
 logging.basicConfig(
@@ -29,6 +34,17 @@ logger = logging.getLogger(__name__)
 # Seznam background tasků pro úklid při shutdownu
 _background_tasks: list[asyncio.Task] = []
 
+# Odpojování neaktivních relací všech místností (halda deadlinů)
+idle_expiry = IdleExpiry()
+
+# Počítadla a vzorkované události zpráv klientů (místo logování každé zprávy)
+telemetry = Telemetry()
+
+# Typy zpráv od klienta; ostatní se v telemetrii počítají jako "unknown"
+_MESSAGE_TYPES = frozenset({
+    "input", "ping", "ack", "chat", "join_lobby", "choose_slot", "set_ready", "set_ai_level", LOBBY_SYNC
+})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,30 +52,16 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Spouštím MULTIPONG WebSocket server...")
     logger.info(f"🎮 Lobby stav: {lobby.get_lobby_status()}")
 
-    # Aktivuj engine (reset míčku, zapne běh)
+    # Výchozí místnost (klienti bez ID místnosti) běží po celou dobu serveru
     try:
-        engine.start()
-        logger.info("🎯 Engine start() dokončen")
+        default_room.start()
+        logger.info("🎯 Výchozí místnost spuštěna")
     except Exception as e:
-        logger.error(f"❌ Chyba při startu enginu: {e}")
-
-    # Spustit timeout checker
-    _background_tasks.append(asyncio.create_task(timeout_checker()))
-    logger.info("⏱️ Timeout checker aktivován (10s timeout)")
-
-    # Průběžná synchronizace vstupů z WebSocketManageru do sdílené mapy
-    async def _sync_inputs_loop():
-        while True:
-            await asyncio.sleep(0.01)  # ~100 Hz refresh vstupů
-            try:
-                inputs = manager.collect_inputs()
-                _shared_player_inputs.clear()
-                _shared_player_inputs.update(inputs)
-            except Exception as e:
-                logger.error(f"❌ Chyba při synchronizaci vstupů: {e}")
+        logger.error(f"❌ Chyba při startu výchozí místnosti: {e}")
 
-    _background_tasks.append(asyncio.create_task(_sync_inputs_loop()))
-    logger.info("🎛️ Sync input loop spuštěn")
+    # Odpojování neaktivních hráčů (deadline nečinnosti každé relace)
+    idle_expiry.start()
+    _background_tasks.append(asyncio.create_task(telemetry.run_sink()))
 
     try:
         yield
@@ -70,6 +72,8 @@ async def lifespan(app: FastAPI):
         if _background_tasks:
             await asyncio.gather(*_background_tasks, return_exceptions=True)
         _background_tasks.clear()
+        await idle_expiry.stop()
+        await rooms.shutdown()
 
 
 # FastAPI aplikace
@@ -94,17 +98,22 @@ async def frontend_root():
         return FileResponse(index_path)
     return {"detail": "Frontend not found"}
 
-# Globální instance manažerů
-manager = WebSocketManager()
-lobby = LobbyManager()
+# Místnosti (zápasy) – každá má vlastní engine, relace, lobby a game loop.
+# Při server.workers > 0 běží enginy místností ve worker procesech
+# a tento proces slouží jen jako gateway pro WebSocket spojení.
+rooms: RoomManager
+if settings.SERVER_WORKERS > 0:
+    rooms = ShardedRoomManager(workers=settings.SERVER_WORKERS)
+else:
+    rooms = RoomManager()
+_created_room = rooms.create(DEFAULT_ROOM_ID, start=False)
+if _created_room is None:
+    raise RuntimeError(f"Výchozí místnost {DEFAULT_ROOM_ID!r} nelze vytvořit")
+default_room: RoomHandle = _created_room
 
-# Herní engine a sdílená mapa vstupů pro game loop
-engine = MultipongEngine(
-    arena_width=settings.WINDOW_WIDTH,
-    arena_height=settings.WINDOW_HEIGHT,
-    num_players_per_team=settings.PADDLES_COUNT_PER_TEAM
-)
-_shared_player_inputs: Dict[str, Dict[str, bool]] = {}
+# Komponenty výchozí místnosti (zpětná kompatibilita s /ws/{player_id})
+manager = default_room.manager
+lobby = default_room.lobby
 
 
 @app.get("/")
@@ -114,7 +123,8 @@ async def root():
         "name": "MULTIPONG WebSocket Server",
         "version": "0.4.0",
         "phase": 4,
-        "websocket_endpoint": "/ws/{player_id}"
+        "websocket_endpoint": "/ws/{player_id}",
+        "room_websocket_endpoint": "/ws/{room_id}/{player_id}"
     }
 
 
@@ -124,35 +134,228 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Metriky serveru v textovém formátu Prometheus (místnosti, ticky, provoz)."""
+    return Response(render_metrics(rooms, telemetry), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/lobby/status")
 async def lobby_status():
-    """Vrátí aktuální stav lobby."""
+    """Vrátí aktuální stav lobby výchozí místnosti."""
     return lobby.get_lobby_status()
 
 
+@app.get("/rooms")
+async def list_rooms():
+    """Vrátí přehled všech místností."""
+    return {"rooms": rooms.list_rooms(), "max_rooms": rooms.max_rooms}
+
+
+@app.post("/rooms", status_code=201)
+async def create_room(room_id: Optional[str] = None):
+    """
+    Vytvoří a spustí novou místnost.
+    
+    Args:
+        room_id: Požadované ID (None = vygeneruje se)
+    """
+    if room_id is not None and not RoomManager.is_valid_room_id(room_id):
+        raise HTTPException(status_code=400, detail=f"Invalid room id: {room_id}")
+    if room_id is not None and rooms.get(room_id):
+        raise HTTPException(status_code=409, detail=f"Room {room_id} already exists")
+    room = rooms.create(room_id)
+    if room is None:
+        raise HTTPException(status_code=503, detail="Room limit reached")
+    return room.get_info()
+
+
+@app.get("/rooms/{room_id}")
+async def get_room(room_id: str):
+    """Vrátí informace o místnosti včetně stavu lobby."""
+    room = rooms.get(room_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail=f"Room {room_id} not found")
+    return {**room.get_info(), "lobby_status": room.lobby.get_lobby_status()}
+
+
+@app.delete("/rooms/{room_id}")
+async def delete_room(room_id: str):
+    """Zruší místnost a odpojí její hráče (výchozí místnost zrušit nelze)."""
+    if room_id == DEFAULT_ROOM_ID:
+        raise HTTPException(status_code=400, detail="Default room cannot be deleted")
+    if not await rooms.destroy(room_id):
+        raise HTTPException(status_code=404, detail=f"Room {room_id} not found")
+    telemetry.discard_room(room_id)
+    return {"room_id": room_id, "deleted": True}
+
+
+@app.get("/telemetry")
+async def get_telemetry(room_id: Optional[str] = None, limit: int = 50):
+    """
+    Vrátí počítadla zpráv a poslední vzorkované události.
+    
+    Args:
+        room_id: Jen tato místnost (None = všechny)
+        limit: Maximální počet událostí
+    """
+    return telemetry.snapshot(room_id, limit)
+
+
+@app.put("/telemetry/sampling")
+async def set_telemetry_sampling(msg_type: str, every: int, room_id: Optional[str] = None):
+    """
+    Nastaví vzorkování událostí za běhu.
+    
+    Args:
+        msg_type: Typ zprávy (``*`` = ostatní typy)
+        every: Událost z každé N-té zprávy (0 = jen počítadlo)
+        room_id: Jen pro tuto místnost (None = pro všechny)
+    """
+    if every < 0:
+        raise HTTPException(status_code=400, detail="every must be >= 0")
+    telemetry.set_sampling(msg_type, every, room_id)
+    return telemetry.snapshot(room_id, limit=0)
+
+
 @app.websocket("/ws/{player_id}")
 async def websocket_endpoint(websocket: WebSocket, player_id: str):
     """
-    WebSocket endpoint pro připojení hráče.
+    WebSocket endpoint pro připojení hráče do výchozí místnosti.
     
     Args:
         websocket: WebSocket spojení
         player_id: ID hráče (např. "A1", "A2", "B1", "B2") nebo "auto" pro automatické přidělení
+    """
+    await _handle_player_connection(websocket, default_room, player_id)
+
+
+@app.websocket("/ws/{room_id}/{player_id}")
+async def room_websocket_endpoint(websocket: WebSocket, room_id: str, player_id: str):
+    """
+    WebSocket endpoint pro připojení hráče do místnosti ``room_id``.
+    
+    Neexistující místnost se vytvoří a spustí; prázdná místnost (kromě
+    výchozí) se po odchodu posledního hráče zruší.
+    
+    Args:
+        websocket: WebSocket spojení
+        room_id: ID místnosti
+        player_id: ID hráče nebo "auto" pro automatické přidělení
+    """
+    await websocket.accept()
+    room = rooms.get_or_create(room_id)
+    if room is None:
+        logger.error(f"❌ Místnost {room_id} nelze vytvořit")
+        await websocket.send_json({
+            "type": "error",
+            "message": f"Room {room_id} is not available"
+        })
+        await websocket.close()
+        return
+    
+    try:
+        await _handle_player_connection(websocket, room, player_id, accepted=True)
+    finally:
+        if room.room_id != DEFAULT_ROOM_ID and room.is_empty() and rooms.get(room.room_id) is room:
+            await rooms.destroy(room.room_id)
+            telemetry.discard_room(room.room_id)
+
+
+def _frame_number(value: Any) -> Optional[int]:
+    """Vrátí nezáporné celé číslo z pole zprávy (``seq``/``tick``), jinak None."""
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return None
+
+
+async def _reject_message(
+    websocket: WebSocket,
+    room: RoomHandle,
+    player_id: str,
+    limiter: MessageLimiter,
+    rejection: tuple
+) -> bool:
+    """
+    Započítá zprávu odmítnutou limity spojení a podle politiky ukončí spojení.
+
+    Args:
+        websocket: WebSocket spojení hráče
+        room: Místnost hráče
+        player_id: Přidělený slot hráče
+        limiter: Limity spojení
+        rejection: (typ, důvod, politika) z ``MessageLimiter``
+
+    Returns:
+        True pokud bylo spojení ukončeno
+    """
+    msg_type, reason, policy = rejection
+    # Typ je přečtený z textu zprávy – do počítadel jen známé typy
+    telemetry.reject(room.room_id, msg_type if msg_type in _MESSAGE_TYPES else "unknown", reason)
+    if limiter.rejected == 1:
+        logger.warning(f"⚠️ Hráč {player_id} překročil limit zpráv ({msg_type}, {reason}), zprávy zahazuji")
+    if policy != POLICY_DISCONNECT:
+        return False
+    logger.warning(f"🚫 Hráč {player_id} odpojen za porušení limitu zpráv ({msg_type}, {reason})")
+    code = CLOSE_MESSAGE_TOO_BIG if reason == REASON_SIZE else CLOSE_POLICY_VIOLATION
+    await websocket.close(code=code)
+    return True
+
+
+async def _handle_player_connection(
+    websocket: WebSocket,
+    room: RoomHandle,
+    player_id: str,
+    accepted: bool = False
+) -> None:
+    """
+    Obsluha připojení hráče v rámci jedné místnosti.
+    
+    Args:
+        websocket: WebSocket spojení
+        room: Místnost, do které hráč vstupuje
+        player_id: ID hráče nebo "auto" pro automatické přidělení
+        accepted: Spojení už bylo přijato (websocket.accept())
+    
+    Query parametry ``snapshot_format=binary`` a ``snapshot_schema=<verze>``
+    zapnou binární snapshoty, ``snapshot_delta=1`` delta snapshoty (viz
+    ``snapshot_codec``). Frekvenci snapshotů určuje ``client_profile``
+    (player/spectator/mobile, viz ``server.snapshot_rates``) nebo přímo
+    ``snapshot_rate=<Hz>``. Výsledek vyjednání vrací ``connected`` zpráva
+    v polích ``snapshot_format``, ``snapshot_delta`` a ``snapshot_rate``;
+    ``sim_rate`` je jednotka pole ``tick`` číslovaných vstupů.
+    
+    Každá zpráva se před dekódováním JSON ověří limity spojení
+    (``MessageLimiter``: ``server.max_message_size`` a token bucket podle
+    typu ``server.rate_limits``); odmítnutá se zahodí, nebo se spojení
+    ukončí (close kód 1009 / 1008).
     
     Protokol zpráv od klienta:
         {
             "type": "input",
             "player_id": "A1",
             "up": true,
-            "down": false
+            "down": false,
+            "seq": 17,           // volitelné: číslo vstupního rámce (jitter buffer)
+            "tick": 1234         // volitelné: krok simulace klienta (sim_rate)
         }
         {
             "type": "chat",
             "player_id": "A1",
             "message": "Hello!"
         }
+        {
+            "type": "ack",
+            "seq": 42            // null = resync (klient potřebuje keyframe)
+        }
+        {
+            "type": "lobby_sync"  // plný stav lobby po výpadku verze (viz lobby_diff)
+        }
     """
-    await websocket.accept()
+    if not accepted:
+        await websocket.accept()
+    manager = room.manager
+    lobby = room.lobby
     
     # Přidělení pozice v lobby
     assigned_slot = None
@@ -170,41 +373,96 @@ async def websocket_endpoint(websocket: WebSocket, player_id: str):
         await websocket.close()
         return
     
+    # Formát snapshotů podle požadavku klienta (?snapshot_format=binary&snapshot_delta=1)
+    snapshot_format = negotiate_snapshot_format(
+        websocket.query_params.get("snapshot_format"),
+        websocket.query_params.get("snapshot_schema")
+    )
+    snapshot_delta = websocket.query_params.get("snapshot_delta") == "1"
+    snapshot_rate = manager.negotiate_snapshot_rate(
+        websocket.query_params.get("snapshot_rate"),
+        websocket.query_params.get("client_profile")
+    )
+    
     # Vytvoření session s přidělenou pozicí
-    session = PlayerSession(websocket, assigned_slot)
+    session = PlayerSession(
+        websocket,
+        assigned_slot,
+        snapshot_format=snapshot_format,
+        snapshot_delta=snapshot_delta,
+        snapshot_rate=snapshot_rate
+    )
     await manager.add(session)
+    idle_expiry.watch(session, manager)
     
-    logger.info(f"🟢 Hráč {assigned_slot} připojen (původní ID: {player_id})")
+    logger.info(f"🟢 Hráč {assigned_slot} připojen do {room.room_id} (původní ID: {player_id})")
     
     # Odeslání potvrzení o připojení
+    match_config = await room.get_match_config()
+    if match_config is not None:
+        session.config_version = match_config.get("config_version")
     await session.send_json({
         "type": "connected",
         "assigned_slot": assigned_slot,
-        "lobby_status": lobby.get_lobby_status()
+        "room_id": room.room_id,
+        "lobby_status": lobby.get_lobby_status(),
+        "match_config": match_config,
+        "snapshot_format": snapshot_format,
+        "snapshot_schema": SNAPSHOT_SCHEMA_VERSION,
+        "snapshot_delta": snapshot_delta,
+        "snapshot_rate": snapshot_rate,
+        "sim_rate": room.sim_rate
     })
     
+    limiter = MessageLimiter()
+    
     try:
         while True:
             # Příjem zprávy od klienta
-            data = await websocket.receive_json()
+            text = await websocket.receive_text()
+            size = len(text) if text.isascii() else len(text.encode())
+            session.record_received(size)
+            
+            # Limity spojení (velikost, token bucket podle typu) ještě před
+            # dekódováním JSON; zahozená zpráva neprodlužuje aktivitu
+            rejection = limiter.admit(text, size)
+            if rejection is None:
+                data = json.loads(text)
+                msg_type = data.get("type", "unknown")
+                rejection = limiter.recheck(msg_type)
+            if rejection is not None:
+                if await _reject_message(websocket, room, assigned_slot, limiter, rejection):
+                    break
+                continue
             
             # Aktualizace aktivity
             session.update_activity()
             
-            # Logování přijaté zprávy
-            msg_type = data.get("type", "unknown")
-            logger.info(f"📨 [{assigned_slot}] Přijato: {msg_type}")
-            logger.debug(f"    Data: {data}")
+            # Každá zpráva se jen započítá; událost vznikne jen pro vzorek
+            # (server.telemetry_sampling) a zapíše ji sink mimo event loop
+            known = isinstance(msg_type, str) and msg_type in _MESSAGE_TYPES
+            sampled = telemetry.count(room.room_id, msg_type if known else "unknown")
+            if msg_type == "ack":
+                # Potvrzení snapshotu (baseline delta snapshotů)
+                session.ack_snapshot(data.get("seq"))
+                continue
             
             # Zpracování podle typu zprávy
             if msg_type == "input":
-                up = data.get("up", False)
-                down = data.get("down", False)
+                up = bool(data.get("up", False))
+                down = bool(data.get("down", False))
+                seq = _frame_number(data.get("seq"))
+                tick = _frame_number(data.get("tick"))
                 session.update_input(up, down)
-                logger.info(f"    ⬆️ UP: {up}, ⬇️ DOWN: {down}")
+                # Číslovaný rámec jde do jitter bufferu hráče, jinak zápis rovnou
+                # do tabulky vstupů místnosti – tick ho čte bez kopírování
+                room.set_input(assigned_slot, up, down, seq=seq, tick=tick)
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot, up=up, down=down, seq=seq, tick=tick)
                 
             elif msg_type == "ping":
-                logger.debug(f"    💓 Ping od {assigned_slot}")
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot)
                 pong_msg = {"type": "pong"}
                 ping_id = data.get("ping_id")
                 if ping_id:
@@ -213,7 +471,6 @@ async def websocket_endpoint(websocket: WebSocket, player_id: str):
                 
             elif msg_type == "chat":
                 message = data.get("message", "")
-                logger.info(f"    💬 Chat: {message}")
                 
                 # Broadcast chat zprávy všem hráčům
                 chat_broadcast = {
@@ -222,27 +479,32 @@ async def websocket_endpoint(websocket: WebSocket, player_id: str):
                     "message": message
                 }
                 sent_count = await manager.broadcast(chat_broadcast)
-                logger.info(f"    📡 Chat rozeslán {sent_count} hráčům")
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot, message=message, recipients=sent_count)
             
             elif msg_type == "join_lobby":
                 player_name = data.get("player_name", assigned_slot)
-                await lobby.lobby.add_player(assigned_slot, player_name)
-                logger.info(f"    👤 Hráč {player_name} vstoupil do lobby")
+                await room.match_lobby.add_player(assigned_slot, player_name)
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot, player_name=player_name)
                 
-                # Broadcast lobby update
-                await manager.broadcast({
-                    "type": "lobby_update",
-                    **lobby.lobby.get_lobby_state()
-                })
+                # Nový hráč dostane plný stav, ostatní (i on) sloučený diff
+                room.lobby_updates.send_full(session)
+                room.lobby_updates.mark_dirty()
+            
+            elif msg_type == LOBBY_SYNC:
+                # Klient zjistil výpadek verze lobby – pošleme plný stav
+                room.lobby_updates.send_full(session)
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot)
             
             elif msg_type == "choose_slot":
                 slot = data.get("slot")
-                if await lobby.lobby.assign_slot(assigned_slot, slot):
-                    logger.info(f"    🎯 Hráč {assigned_slot} obsadil slot {slot}")
-                    await manager.broadcast({
-                        "type": "lobby_update",
-                        **lobby.lobby.get_lobby_state()
-                    })
+                assigned = await room.match_lobby.assign_slot(assigned_slot, slot)
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot, slot=slot, ok=assigned)
+                if assigned:
+                    room.lobby_updates.mark_dirty()
                 else:
                     await session.send_json({
                         "type": "error",
@@ -251,18 +513,17 @@ async def websocket_endpoint(websocket: WebSocket, player_id: str):
             
             elif msg_type == "set_ready":
                 is_ready = data.get("ready", False)
-                await lobby.lobby.set_ready(assigned_slot, is_ready)
-                logger.info(f"    ✓ Hráč {assigned_slot} ready: {is_ready}")
+                await room.match_lobby.set_ready(assigned_slot, is_ready)
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot, ready=is_ready)
                 
-                # Broadcast lobby update
-                await manager.broadcast({
-                    "type": "lobby_update",
-                    **lobby.lobby.get_lobby_state()
-                })
+                room.lobby_updates.mark_dirty()
                 
                 # Check if all ready to start match
-                if lobby.lobby.all_ready():
+                if room.match_lobby.all_ready():
                     logger.info("🚀 Všichni hráči ready! Startuji zápas...")
+                    # Klienti musí dostat poslední ready stav před start_match
+                    room.lobby_updates.flush()
                     await manager.broadcast({
                         "type": "start_match",
                         "countdown": 3
@@ -272,20 +533,20 @@ async def websocket_endpoint(websocket: WebSocket, player_id: str):
             elif msg_type == "set_ai_level":
                 slot = data.get("slot")
                 level = data.get("level", "simple")
-                if await lobby.lobby.set_ai_level(slot, level):
-                    logger.info(f"    🤖 AI slot {slot} nastaveno na {level}")
-                    await manager.broadcast({
-                        "type": "lobby_update",
-                        **lobby.lobby.get_lobby_state()
-                    })
+                level_set = await room.match_lobby.set_ai_level(slot, level)
+                if sampled:
+                    telemetry.emit(room.room_id, msg_type, assigned_slot, slot=slot, level=level, ok=level_set)
+                if level_set:
+                    room.lobby_updates.mark_dirty()
                 else:
                     await session.send_json({
                         "type": "error",
                         "message": f"Nelze nastavit AI level pro slot {slot}"
                     })
                 
-            else:
+            elif sampled:
                 logger.warning(f"    ⚠️ Neznámý typ zprávy: {msg_type}")
+                telemetry.emit(room.room_id, "unknown", assigned_slot, message_type=str(msg_type)[:64])
     
     except WebSocketDisconnect:
         logger.info(f"🔴 Hráč {assigned_slot} odpojen (WebSocketDisconnect)")
@@ -294,29 +555,13 @@ async def websocket_endpoint(websocket: WebSocket, player_id: str):
         logger.error(f"❌ Chyba při komunikaci s {assigned_slot}: {e}", exc_info=True)
     
     finally:
-        # Uvolnění pozice v lobby
+        # Uvolnění pozice v lobby a vstupu (pálku opět řídí engine)
         lobby.release_slot(assigned_slot)
+        room.clear_input(assigned_slot)
         await manager.remove(session)
         logger.info(f"🔌 Ukončeno spojení s hráčem {assigned_slot}")
 
 
-async def timeout_checker():
-    """
-    Periodická kontrola timeoutu hráčů.
-    Odpojí hráče, kteří neposlali zprávu po dobu 10 sekund.
-    """
-    while True:
-        await asyncio.sleep(5)  # Kontrola každých 5 sekund
-        disconnected = await manager.disconnect_inactive(timeout_seconds=10.0)
-        if disconnected > 0:
-            logger.warning(f"⏱️ Odpojeno {disconnected} neaktivních hráčů")
-
-
-    # Spustit hlavní game loop (broadcast snapshotů)
-    asyncio.create_task(run_game_loop(engine, manager, _shared_player_inputs))
-    logger.info("🎮 Game loop spuštěn")
-
-
 @app.get("/test-client")
 async def test_client():
     """
@@ -461,5 +706,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # Příliš velký rámec odmítne už uvicorn, ještě před jeho načtením celého
+        ws_max_size=settings.SERVER_MAX_MESSAGE_SIZE
     )
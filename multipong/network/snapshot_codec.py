@@ -0,0 +1,498 @@
+"""
+Binární formát snapshotů a delta snapshoty (sdílené serverem i klientem).
+
+JSON snapshot opakuje každý tick názvy klíčů a plné floaty. Binární
+snapshot nese stejný obsah (viz ``SnapshotBuilder.build_snapshot``)
+jako pole little-endian čísel s kvantizovanými hodnotami:
+
+    hlavička   B schema, B příznaky, H config_version, I seq, B maska polí
+    [baseline] H seq - baseline (jen delta snapshot)
+    míček      h x, h y (1/8 px), h vx, h vy (1/256 px za referenční tick)
+    skóre      H A, H B
+    čas        I time_left (ms)
+    pauza      H goal_pause_remaining (ms)
+    rally      H rally_hits
+    statistiky I stats_version
+    pálky      B počet, h y × počet (1/8 px; team_left, pak team_right);
+               změněné pálky delty: B 0xFF, I maska indexů, h y × změněné
+    [stats]    B počet, pro každého hráče B délka ID, ID (UTF-8), H H H
+    [acks]     B počet, pro každého hráče B délka ID, ID (UTF-8), I seq
+               posledního aplikovaného vstupního rámce, I tick klienta
+               (0xFFFFFFFF = None) – ``input_acks`` {ID: [seq, tick]}
+    [config]   I délka, ``match_config`` jako JSON (UTF-8; jen po invalidaci)
+
+Bloky míček…pálky jsou přítomné podle masky polí (plný snapshot má všechny).
+
+Delta snapshot (klíč ``baseline``) nese jen pole změněná proti snapshotu
+``baseline``, který klient potvrdil (``ack``); změněné pálky jsou slovník
+{index: y}. Klient z něj plný snapshot složí pomocí ``apply_delta``.
+
+Formát se vyjednává v handshake: klient pošle v URL
+``?snapshot_format=binary&snapshot_schema=<verze>`` (případně
+``&snapshot_delta=1``), server odpoví v ``connected`` zprávě poli
+``snapshot_format`` a ``snapshot_delta``. Bez požadavku (nebo při neznámé
+verzi) zůstávají plné snapshoty v JSON – kvůli debugování a HTMX klientovi.
+Binární rámce WebSocketu nesou výhradně snapshoty.
+"""
+
+import json
+import struct
+from typing import Any, Dict, List, Optional
+
+
+# Verze binárního schématu (zvýšit při jakékoli změně rozložení)
+SNAPSHOT_SCHEMA_VERSION = 4
+
+# Formáty snapshotů vyjednávané v handshake
+SNAPSHOT_FORMAT_JSON = "json"
+SNAPSHOT_FORMAT_BINARY = "binary"
+
+# Kvantizace: pozice po 1/8 px (int16 => ±4096 px), rychlost po 1/256 px/tick
+POSITION_SCALE = 8
+VELOCITY_SCALE = 256
+TIME_SCALE = 1000  # sekundy -> milisekundy
+
+# Příznaky v hlavičce
+FLAG_RUNNING = 0x01
+FLAG_STATS = 0x02
+FLAG_CONFIG = 0x04
+FLAG_DELTA = 0x08
+FLAG_INPUT_ACKS = 0x10
+
+# Maska přítomných polí (pořadí bloků v rámci)
+FIELD_BALL = 0x01
+FIELD_SCORE = 0x02
+FIELD_TIME_LEFT = 0x04
+FIELD_GOAL_PAUSE = 0x08
+FIELD_RALLY_HITS = 0x10
+FIELD_STATS_VERSION = 0x20
+FIELD_PADDLES = 0x40
+FIELD_IS_RUNNING = 0x80
+FIELDS_ALL = 0xFF
+
+# Pole porovnávaná v delta snapshotu (kromě pálek, ty se porovnávají po indexech)
+DELTA_FIELDS = (
+    "ball", "score", "time_left", "is_running",
+    "goal_pause_remaining", "rally_hits", "stats_version",
+)
+
+_HEADER = struct.Struct("<BBHIB")
+_FULL_BODY = struct.Struct("<hhhhHHIHHIB")
+_BASELINE = struct.Struct("<H")
+_BALL = struct.Struct("<hhhh")
+_SCORE = struct.Struct("<HH")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_PADDLE_MASK = struct.Struct("<I")
+_STATS_ENTRY = struct.Struct("<HHH")
+_INPUT_ACK = struct.Struct("<II")
+_PADDLE_STRUCTS: Dict[int, struct.Struct] = {}
+
+_INT16_MIN, _INT16_MAX = -0x8000, 0x7FFF
+_UINT16_MAX = 0xFFFF
+_UINT32_MAX = 0xFFFFFFFF
+_MAX_DELTA_PADDLES = 32
+_SPARSE_PADDLES = 0xFF
+
+
+class SnapshotCodecError(ValueError):
+    """Binární snapshot nelze dekódovat (neznámé schéma, poškozená data)."""
+
+
+def negotiate_snapshot_format(requested: Optional[str], schema: Optional[str] = None) -> str:
+    """
+    Rozhodne formát snapshotů podle požadavku klienta.
+
+    Args:
+        requested: Formát požadovaný klientem (query parametr ``snapshot_format``)
+        schema: Verze schématu, kterou klient umí (``snapshot_schema``)
+
+    Returns:
+        ``SNAPSHOT_FORMAT_BINARY`` pokud ho klient žádá a verze schématu
+        sedí, jinak ``SNAPSHOT_FORMAT_JSON``
+    """
+    if requested != SNAPSHOT_FORMAT_BINARY:
+        return SNAPSHOT_FORMAT_JSON
+    if schema is not None and schema != str(SNAPSHOT_SCHEMA_VERSION):
+        return SNAPSHOT_FORMAT_JSON
+    return SNAPSHOT_FORMAT_BINARY
+
+
+# ---------------------------------------------------------------------------
+# Delta snapshoty
+# ---------------------------------------------------------------------------
+
+def compute_delta(baseline: Dict[str, Any], snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sestaví delta snapshot – jen pole změněná proti ``baseline``.
+
+    Args:
+        baseline: Plný snapshot, který klient potvrdil (musí mít ``seq``)
+        snapshot: Aktuální plný snapshot
+
+    Returns:
+        Delta zpráva s ``seq``, ``baseline`` a ``config_version``; pálky jako
+        {index: y} (při změně počtu pálek celý seznam), ``input_acks`` celé
+        při změně. ``stats`` a ``match_config`` se přebírají ze ``snapshot``
+        beze změny.
+    """
+    delta: Dict[str, Any] = {
+        "type": "snapshot",
+        "seq": snapshot["seq"],
+        "baseline": baseline["seq"],
+        "config_version": snapshot["config_version"],
+    }
+    for key in DELTA_FIELDS:
+        value = snapshot[key]
+        if value != baseline.get(key):
+            delta[key] = value
+
+    paddles = snapshot["paddles"]
+    base_paddles = baseline.get("paddles")
+    if base_paddles is None or len(base_paddles) != len(paddles):
+        delta["paddles"] = list(paddles)
+    else:
+        changed = {i: y for i, (y, base_y) in enumerate(zip(paddles, base_paddles)) if y != base_y}
+        if changed:
+            delta["paddles"] = changed
+
+    input_acks = snapshot.get("input_acks")
+    if input_acks != baseline.get("input_acks"):
+        delta["input_acks"] = input_acks or {}
+
+    for key in ("stats", "match_config"):
+        if key in snapshot:
+            delta[key] = snapshot[key]
+    return delta
+
+
+def apply_delta(baseline: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Složí plný snapshot z baseline a delta snapshotu.
+
+    Args:
+        baseline: Plný snapshot odpovídající ``delta["baseline"]``
+        delta: Delta snapshot (JSON i dekódovaný binární)
+
+    Returns:
+        Plný snapshot (bez ``baseline``); ``stats`` a ``match_config`` jen
+        pokud je nese delta
+    """
+    state = {key: value for key, value in baseline.items() if key not in ("stats", "match_config")}
+    for key, value in delta.items():
+        if key == "paddles" and isinstance(value, dict):
+            paddles = list(baseline["paddles"])
+            for index, y in value.items():
+                paddles[int(index)] = y
+            state["paddles"] = paddles
+        elif key == "input_acks" and not value:
+            state.pop(key, None)
+        elif key != "baseline":
+            state[key] = value
+    return state
+
+
+# ---------------------------------------------------------------------------
+# Binární kódování
+# ---------------------------------------------------------------------------
+
+def _paddle_struct(count: int) -> struct.Struct:
+    """Vrátí (cachovaný) struct pro ``count`` pozic pálek."""
+    packer = _PADDLE_STRUCTS.get(count)
+    if packer is None:
+        packer = _PADDLE_STRUCTS[count] = struct.Struct(f"<{count}h")
+    return packer
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Omezí celé číslo na rozsah typu."""
+    return low if value < low else high if value > high else value
+
+
+def _position(value: float) -> int:
+    return _clamp(round(value * POSITION_SCALE), _INT16_MIN, _INT16_MAX)
+
+
+def _ball_values(ball: List[float]) -> tuple:
+    x, y, vx, vy = ball
+    return (
+        _position(x),
+        _position(y),
+        _clamp(round(vx * VELOCITY_SCALE), _INT16_MIN, _INT16_MAX),
+        _clamp(round(vy * VELOCITY_SCALE), _INT16_MIN, _INT16_MAX),
+    )
+
+
+def _millis(seconds: float, high: int) -> int:
+    return _clamp(round(seconds * TIME_SCALE), 0, high)
+
+
+def _baseline_distance(seq: int, baseline: int) -> int:
+    """Vzdálenost baseline od ``seq`` (baseline starší než 65535 snapshotů nelze zakódovat)."""
+    distance = seq - baseline
+    if not 0 <= distance <= _UINT16_MAX:
+        raise ValueError(f"Baseline {baseline} je mimo rozsah delta snapshotu {seq}")
+    return distance
+
+
+def encode_snapshot(snapshot: Dict[str, Any]) -> bytes:
+    """
+    Zakóduje snapshot (plný nebo delta) do binárního formátu.
+
+    Args:
+        snapshot: Zpráva z ``SnapshotBuilder.build_snapshot()`` nebo
+                  ``compute_delta()``
+
+    Returns:
+        Binární snapshot (schéma ``SNAPSHOT_SCHEMA_VERSION``)
+    """
+    stats = snapshot.get("stats")
+    input_acks = snapshot.get("input_acks")
+    match_config = snapshot.get("match_config")
+    is_delta = "baseline" in snapshot
+
+    flags = FLAG_DELTA if is_delta else 0
+    if snapshot.get("is_running"):
+        flags |= FLAG_RUNNING
+    if stats is not None:
+        flags |= FLAG_STATS
+    if input_acks is not None:
+        flags |= FLAG_INPUT_ACKS
+    if match_config is not None:
+        flags |= FLAG_CONFIG
+
+    config_version = _clamp(snapshot["config_version"], 0, _UINT16_MAX)
+    seq = _clamp(snapshot.get("seq", 0), 0, _UINT32_MAX)
+
+    if not is_delta:
+        paddles = snapshot["paddles"]
+        parts = [
+            _HEADER.pack(SNAPSHOT_SCHEMA_VERSION, flags, config_version, seq, FIELDS_ALL),
+            _FULL_BODY.pack(
+                *_ball_values(snapshot["ball"]),
+                _clamp(snapshot["score"][0], 0, _UINT16_MAX),
+                _clamp(snapshot["score"][1], 0, _UINT16_MAX),
+                _millis(snapshot["time_left"], _UINT32_MAX),
+                _millis(snapshot["goal_pause_remaining"], _UINT16_MAX),
+                _clamp(snapshot["rally_hits"], 0, _UINT16_MAX),
+                _clamp(snapshot["stats_version"], 0, _UINT32_MAX),
+                len(paddles),
+            ),
+            _paddle_struct(len(paddles)).pack(*[_position(y) for y in paddles]),
+        ]
+    else:
+        fields = 0
+        body = []
+        if "ball" in snapshot:
+            fields |= FIELD_BALL
+            body.append(_BALL.pack(*_ball_values(snapshot["ball"])))
+        if "score" in snapshot:
+            fields |= FIELD_SCORE
+            body.append(_SCORE.pack(*[_clamp(s, 0, _UINT16_MAX) for s in snapshot["score"]]))
+        if "time_left" in snapshot:
+            fields |= FIELD_TIME_LEFT
+            body.append(_UINT32.pack(_millis(snapshot["time_left"], _UINT32_MAX)))
+        if "goal_pause_remaining" in snapshot:
+            fields |= FIELD_GOAL_PAUSE
+            body.append(_UINT16.pack(_millis(snapshot["goal_pause_remaining"], _UINT16_MAX)))
+        if "rally_hits" in snapshot:
+            fields |= FIELD_RALLY_HITS
+            body.append(_UINT16.pack(_clamp(snapshot["rally_hits"], 0, _UINT16_MAX)))
+        if "stats_version" in snapshot:
+            fields |= FIELD_STATS_VERSION
+            body.append(_UINT32.pack(_clamp(snapshot["stats_version"], 0, _UINT32_MAX)))
+        if "paddles" in snapshot:
+            fields |= FIELD_PADDLES
+            body.append(_encode_paddle_changes(snapshot["paddles"]))
+        if "is_running" in snapshot:
+            fields |= FIELD_IS_RUNNING
+        parts = [
+            _HEADER.pack(SNAPSHOT_SCHEMA_VERSION, flags, config_version, seq, fields),
+            _BASELINE.pack(_baseline_distance(seq, snapshot["baseline"])),
+            *body,
+        ]
+
+    if stats is not None:
+        parts.append(bytes((len(stats),)))
+        for player_id, (hits, goals_scored, goals_received) in stats.items():
+            raw_id = player_id.encode("utf-8")
+            parts.append(bytes((len(raw_id),)))
+            parts.append(raw_id)
+            parts.append(_STATS_ENTRY.pack(
+                _clamp(hits, 0, _UINT16_MAX),
+                _clamp(goals_scored, 0, _UINT16_MAX),
+                _clamp(goals_received, 0, _UINT16_MAX),
+            ))
+
+    if input_acks is not None:
+        parts.append(bytes((len(input_acks),)))
+        for player_id, (input_seq, input_tick) in input_acks.items():
+            raw_id = player_id.encode("utf-8")
+            parts.append(bytes((len(raw_id),)))
+            parts.append(raw_id)
+            parts.append(_INPUT_ACK.pack(
+                _clamp(input_seq, 0, _UINT32_MAX),
+                _UINT32_MAX if input_tick is None else _clamp(input_tick, 0, _UINT32_MAX - 1),
+            ))
+
+    if match_config is not None:
+        raw_config = json.dumps(match_config, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        parts.append(_UINT32.pack(len(raw_config)))
+        parts.append(raw_config)
+
+    return b"".join(parts)
+
+
+def _encode_paddle_changes(paddles) -> bytes:
+    """Zakóduje změněné pálky delta snapshotu ({index: y} nebo celý seznam)."""
+    if not isinstance(paddles, dict):
+        return bytes((len(paddles),)) + _paddle_struct(len(paddles)).pack(*[_position(y) for y in paddles])
+
+    changes = sorted((int(index), y) for index, y in paddles.items())
+    mask = 0
+    for index, _ in changes:
+        if index >= _MAX_DELTA_PADDLES:
+            raise ValueError(f"Delta snapshot podporuje nejvýše {_MAX_DELTA_PADDLES} pálek")
+        mask |= 1 << index
+    return (
+        bytes((_SPARSE_PADDLES,))
+        + _PADDLE_MASK.pack(mask)
+        + _paddle_struct(len(changes)).pack(*[_position(y) for _, y in changes])
+    )
+
+
+def decode_snapshot(data: bytes) -> Dict[str, Any]:
+    """
+    Dekóduje binární snapshot na zprávu ve tvaru JSON snapshotu.
+
+    Args:
+        data: Binární rámec od serveru
+
+    Returns:
+        Slovník se stejnými klíči jako ``SnapshotBuilder.build_snapshot()``
+        (delta snapshot navíc ``baseline`` a jen přítomná pole; hodnoty
+        s přesností kvantizace)
+
+    Raises:
+        SnapshotCodecError: Neznámá verze schématu nebo poškozená data
+    """
+    if not data:
+        raise SnapshotCodecError("Prázdný binární snapshot")
+    if data[0] != SNAPSHOT_SCHEMA_VERSION:
+        raise SnapshotCodecError(
+            f"Nepodporovaná verze schématu snapshotu: {data[0]} "
+            f"(podporovaná {SNAPSHOT_SCHEMA_VERSION})"
+        )
+
+    try:
+        _schema, flags, config_version, seq, fields = _HEADER.unpack_from(data, 0)
+        offset = _HEADER.size
+        snapshot: Dict[str, Any] = {
+            "type": "snapshot",
+            "seq": seq,
+            "config_version": config_version,
+        }
+
+        if not flags & FLAG_DELTA:
+            (
+                x, y, vx, vy, score_a, score_b, time_left, goal_pause,
+                rally_hits, stats_version, paddle_count,
+            ) = _FULL_BODY.unpack_from(data, offset)
+            offset += _FULL_BODY.size
+            paddle_struct = _paddle_struct(paddle_count)
+            paddles = [p / POSITION_SCALE for p in paddle_struct.unpack_from(data, offset)]
+            offset += paddle_struct.size
+            snapshot.update({
+                "ball": [x / POSITION_SCALE, y / POSITION_SCALE, vx / VELOCITY_SCALE, vy / VELOCITY_SCALE],
+                "paddles": paddles,
+                "score": [score_a, score_b],
+                "time_left": time_left / TIME_SCALE,
+                "is_running": bool(flags & FLAG_RUNNING),
+                "goal_pause_remaining": goal_pause / TIME_SCALE,
+                "rally_hits": rally_hits,
+                "stats_version": stats_version,
+            })
+        else:
+            snapshot["baseline"] = seq - _BASELINE.unpack_from(data, offset)[0]
+            offset += _BASELINE.size
+            offset = _decode_delta_fields(data, offset, fields, flags, snapshot)
+
+        if flags & FLAG_STATS:
+            count = data[offset]
+            offset += 1
+            stats = {}
+            for _ in range(count):
+                length = data[offset]
+                offset += 1
+                player_id = data[offset:offset + length].decode("utf-8")
+                offset += length
+                stats[player_id] = list(_STATS_ENTRY.unpack_from(data, offset))
+                offset += _STATS_ENTRY.size
+            snapshot["stats"] = stats
+
+        if flags & FLAG_INPUT_ACKS:
+            count = data[offset]
+            offset += 1
+            input_acks = {}
+            for _ in range(count):
+                length = data[offset]
+                offset += 1
+                player_id = data[offset:offset + length].decode("utf-8")
+                offset += length
+                input_seq, input_tick = _INPUT_ACK.unpack_from(data, offset)
+                offset += _INPUT_ACK.size
+                input_acks[player_id] = [input_seq, None if input_tick == _UINT32_MAX else input_tick]
+            snapshot["input_acks"] = input_acks
+
+        if flags & FLAG_CONFIG:
+            (length,) = _UINT32.unpack_from(data, offset)
+            offset += _UINT32.size
+            raw_config = data[offset:offset + length]
+            if len(raw_config) != length:
+                raise SnapshotCodecError("Neúplná konfigurace v binárním snapshotu")
+            snapshot["match_config"] = json.loads(raw_config)
+    except (struct.error, IndexError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise SnapshotCodecError(f"Poškozený binární snapshot: {e}") from e
+
+    return snapshot
+
+
+def _decode_delta_fields(data: bytes, offset: int, fields: int, flags: int, snapshot: Dict[str, Any]) -> int:
+    """Dekóduje pole delta snapshotu podle masky; vrátí nový offset."""
+    if fields & FIELD_BALL:
+        x, y, vx, vy = _BALL.unpack_from(data, offset)
+        offset += _BALL.size
+        snapshot["ball"] = [x / POSITION_SCALE, y / POSITION_SCALE, vx / VELOCITY_SCALE, vy / VELOCITY_SCALE]
+    if fields & FIELD_SCORE:
+        snapshot["score"] = list(_SCORE.unpack_from(data, offset))
+        offset += _SCORE.size
+    if fields & FIELD_TIME_LEFT:
+        snapshot["time_left"] = _UINT32.unpack_from(data, offset)[0] / TIME_SCALE
+        offset += _UINT32.size
+    if fields & FIELD_GOAL_PAUSE:
+        snapshot["goal_pause_remaining"] = _UINT16.unpack_from(data, offset)[0] / TIME_SCALE
+        offset += _UINT16.size
+    if fields & FIELD_RALLY_HITS:
+        snapshot["rally_hits"] = _UINT16.unpack_from(data, offset)[0]
+        offset += _UINT16.size
+    if fields & FIELD_STATS_VERSION:
+        snapshot["stats_version"] = _UINT32.unpack_from(data, offset)[0]
+        offset += _UINT32.size
+    if fields & FIELD_PADDLES:
+        count = data[offset]
+        offset += 1
+        if count == _SPARSE_PADDLES:
+            (mask,) = _PADDLE_MASK.unpack_from(data, offset)
+            offset += _PADDLE_MASK.size
+            indexes = [i for i in range(_MAX_DELTA_PADDLES) if mask >> i & 1]
+            paddle_struct = _paddle_struct(len(indexes))
+            values = paddle_struct.unpack_from(data, offset)
+            snapshot["paddles"] = {i: y / POSITION_SCALE for i, y in zip(indexes, values)}
+        else:
+            paddle_struct = _paddle_struct(count)
+            values = paddle_struct.unpack_from(data, offset)
+            snapshot["paddles"] = [y / POSITION_SCALE for y in values]
+        offset += paddle_struct.size
+    if fields & FIELD_IS_RUNNING:
+        snapshot["is_running"] = bool(flags & FLAG_RUNNING)
+    return offset
@@ -6,7 +6,7 @@ Všechny parametry jsou pro pohodlí zde znovu vystaveny.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict
 
 # Načteme konfiguraci ze config_loader
 from multipong.config.config_loader import load_config, get as config_get
@@ -58,6 +58,12 @@ BALL_SPEED_DECAY_X: float = 1.0
 BALL_SPEED_DECAY_Y: float = 1.0
 BALL_SPEED_MAX: float = 12.0
 
+# Spojitá (swept) detekce kolizí míčku – bez tunelování i při nízkém tick rate
+BALL_SWEPT_COLLISION: bool = bool(config_get("physics.swept_collision", False))
+
+# Maximální počet odrazů řešených v rámci jednoho ticku (swept režim)
+BALL_MAX_BOUNCES_PER_TICK: int = int(config_get("physics.max_bounces_per_tick", 8))
+
 # Stretch efekt konfigurace
 PADDLE_HIT_STRETCH: float = 1.3
 PADDLE_STRETCH_DECAY: float = 0.92
@@ -71,6 +77,98 @@ DEFAULT_FPS: int = int(config_get("client.fps", 60))
 # Server tick rate (Hz) - frekvence game loop aktualizací
 SERVER_TICK_RATE: int = int(config_get("server.tick_rate", 60))
 
+# Referenční frekvence fyziky (Hz) – rychlosti v konfiguraci jsou v px za tento tick.
+# Engine.step(dt) přepočítá pohyb na skutečnou délku kroku, takže změna tick rate
+# nemění chování hry.
+PHYSICS_REFERENCE_RATE: int = int(config_get("physics.reference_tick_rate", 60))
+
+# Frekvence simulace na serveru (Hz) – fixní krok akumulátoru v GameLoop
+SERVER_SIM_RATE: int = int(config_get("server.sim_rate", SERVER_TICK_RATE))
+
+# Maximální počet simulačních kroků za jeden průchod smyčkou (zbytek se zahodí)
+SERVER_MAX_SUBSTEPS: int = int(config_get("server.max_substeps", 5))
+
+# Profilování fází ticku (histogramy dob AI, fyziky, snapshotu, broadcastu)
+SERVER_PROFILING: bool = bool(config_get("server.profiling", False))
+
+# Maximální počet současně běžících místností (zápasů) v jednom procesu
+SERVER_MAX_ROOMS: int = int(config_get("server.max_rooms", 500))
+
+# Počet worker procesů s enginy místností (0 = místnosti běží v procesu serveru)
+SERVER_WORKERS: int = int(config_get("server.workers", 0))
+
+# Kapacita odchozí fronty spolehlivých zpráv (chat, lobby) jedné relace
+SERVER_SEND_QUEUE_SIZE: int = int(config_get("server.send_queue_size", 64))
+
+# Relace, jejíž odesílání stojí déle (s), je odpojena jako zahlcená
+SERVER_SEND_STALL_TIMEOUT: float = float(config_get("server.send_stall_timeout", 5.0))
+
+# Po kolika snapshotech dostane klient s delta snapshoty plný snapshot (keyframe)
+SERVER_SNAPSHOT_KEYFRAME_INTERVAL: int = int(config_get("server.snapshot_keyframe_interval", 60))
+
+# Výchozí frekvence odesílání snapshotů (Hz) podle profilu klienta (?client_profile=...).
+# Simulace běží na SERVER_SIM_RATE, snapshoty se posílají nejvýše na SERVER_TICK_RATE;
+# klient mezery mezi snapshoty vyplní interpolací (StateBuffer).
+SERVER_SNAPSHOT_RATES: Dict[str, int] = {"player": 30, "spectator": 20, "mobile": 20}
+snapshot_rates_config = config_get("server.snapshot_rates", {})
+if isinstance(snapshot_rates_config, dict):
+    SERVER_SNAPSHOT_RATES.update(
+        {k: int(v) for k, v in snapshot_rates_config.items() if isinstance(v, (int, float))}
+    )
+
+# Nejnižší frekvence snapshotů, kterou si klient může vyžádat (?snapshot_rate=...)
+SERVER_MIN_SNAPSHOT_RATE: int = int(config_get("server.min_snapshot_rate", 10))
+
+# Jitter buffer číslovaných vstupů: adaptivní zpoždění aplikace rámce v krocích
+# simulace (min…max) a max. počet čekajících rámců na hráče
+SERVER_INPUT_DELAY_MIN: int = int(config_get("server.input_delay_min", 1))
+SERVER_INPUT_DELAY_MAX: int = int(config_get("server.input_delay_max", 6))
+SERVER_INPUT_BUFFER_SIZE: int = int(config_get("server.input_buffer_size", 32))
+
+# Relace bez zprávy od klienta déle než idle_timeout (s) se odpojí (IdleExpiry)
+SERVER_IDLE_TIMEOUT: float = float(config_get("server.idle_timeout", 10.0))
+
+# Okno (s), během kterého se změny lobby slučují do jedné lobby_update zprávy
+SERVER_LOBBY_UPDATE_WINDOW: float = float(config_get("server.lobby_update_window", 0.05))
+
+# Limity příchozích zpráv jednoho spojení (ověřené před dekódováním JSON):
+# max. velikost zprávy v bajtech (větší = odpojení) a token bucket podle typu
+# zprávy {typ: {"rate": zpráv/s, "burst": nárazově, "policy": "drop" | "disconnect"}};
+# "*" platí pro ostatní typy, rate 0 = bez limitu.
+SERVER_MAX_MESSAGE_SIZE: int = int(config_get("server.max_message_size", 4096))
+SERVER_RATE_LIMITS: Dict[str, Dict[str, Any]] = {
+    "input": {"rate": 120, "burst": 60, "policy": "drop"},
+    "ack": {"rate": 120, "burst": 60, "policy": "drop"},
+    "ping": {"rate": 2, "burst": 5, "policy": "drop"},
+    "chat": {"rate": 1, "burst": 5, "policy": "drop"},
+    "*": {"rate": 10, "burst": 20, "policy": "drop"},
+}
+rate_limits_config = config_get("server.rate_limits", {})
+if isinstance(rate_limits_config, dict):
+    for msg_type, limit_config in rate_limits_config.items():
+        if isinstance(limit_config, dict):
+            SERVER_RATE_LIMITS[msg_type] = {**SERVER_RATE_LIMITS.get(msg_type, {}), **limit_config}
+
+# Telemetrie zpráv klientů: počítadla + vzorkované události v kruhovém bufferu.
+# Vzorkování {typ zprávy: N} – událost z každé N-té zprávy (0 = jen počítadlo),
+# "*" platí pro ostatní typy; telemetry_room_sampling přepisuje hodnoty pro místnosti.
+SERVER_TELEMETRY_BUFFER_SIZE: int = int(config_get("server.telemetry_buffer_size", 1024))
+SERVER_TELEMETRY_FLUSH_INTERVAL: float = float(config_get("server.telemetry_flush_interval", 1.0))
+SERVER_TELEMETRY_SAMPLING: Dict[str, int] = {"input": 0, "ping": 0, "ack": 0, "*": 1}
+telemetry_sampling_config = config_get("server.telemetry_sampling", {})
+if isinstance(telemetry_sampling_config, dict):
+    SERVER_TELEMETRY_SAMPLING.update(
+        {k: int(v) for k, v in telemetry_sampling_config.items() if isinstance(v, (int, float))}
+    )
+SERVER_TELEMETRY_ROOM_SAMPLING: Dict[str, Dict[str, int]] = {}
+telemetry_room_sampling_config = config_get("server.telemetry_room_sampling", {})
+if isinstance(telemetry_room_sampling_config, dict):
+    SERVER_TELEMETRY_ROOM_SAMPLING = {
+        room_id: {k: int(v) for k, v in room_config.items() if isinstance(v, (int, float))}
+        for room_id, room_config in telemetry_room_sampling_config.items()
+        if isinstance(room_config, dict)
+    }
+
 __all__ = [
 	"WINDOW_WIDTH",
 	"WINDOW_HEIGHT",
@@ -90,9 +188,33 @@ __all__ = [
 	"BALL_SPEED_DECAY_X",
 	"BALL_SPEED_DECAY_Y",
 	"BALL_SPEED_MAX",
+	"BALL_SWEPT_COLLISION",
+	"BALL_MAX_BOUNCES_PER_TICK",
 	"PADDLE_HIT_STRETCH",
 	"PADDLE_STRETCH_DECAY",
 	"RALLY_ADAPT_FACTOR",
 	"DEFAULT_FPS",
 	"SERVER_TICK_RATE",
+	"PHYSICS_REFERENCE_RATE",
+	"SERVER_SIM_RATE",
+	"SERVER_MAX_SUBSTEPS",
+	"SERVER_PROFILING",
+	"SERVER_MAX_ROOMS",
+	"SERVER_WORKERS",
+	"SERVER_SEND_QUEUE_SIZE",
+	"SERVER_SEND_STALL_TIMEOUT",
+	"SERVER_SNAPSHOT_KEYFRAME_INTERVAL",
+	"SERVER_SNAPSHOT_RATES",
+	"SERVER_MIN_SNAPSHOT_RATE",
+	"SERVER_INPUT_DELAY_MIN",
+	"SERVER_INPUT_DELAY_MAX",
+	"SERVER_INPUT_BUFFER_SIZE",
+	"SERVER_IDLE_TIMEOUT",
+	"SERVER_LOBBY_UPDATE_WINDOW",
+	"SERVER_MAX_MESSAGE_SIZE",
+	"SERVER_RATE_LIMITS",
+	"SERVER_TELEMETRY_BUFFER_SIZE",
+	"SERVER_TELEMETRY_FLUSH_INTERVAL",
+	"SERVER_TELEMETRY_SAMPLING",
+	"SERVER_TELEMETRY_ROOM_SAMPLING",
 ]
@@ -0,0 +1,146 @@
+"""Paritní testy BatchedMultipongEngine vs. MultipongEngine."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from multipong.engine.batched_engine import (
+    INPUT_DOWN,
+    INPUT_NONE,
+    INPUT_UP,
+    BatchedMultipongEngine,
+)
+from multipong import settings
+from multipong.engine.game_engine import MultipongEngine
+
+
+def _inputs_to_dict(row, player_ids):
+    """Převede řádek pole vstupů na slovník pro MultipongEngine.update."""
+    inputs = {}
+    for code, pid in zip(row, player_ids):
+        if code == INPUT_NONE:
+            continue
+        inputs[pid] = {"up": bool(code & INPUT_UP), "down": bool(code & INPUT_DOWN)}
+    return inputs
+
+
+def _assert_match_equal(batch, i, engine):
+    """Porovná stav zápasu i v dávce se stavem objektového enginu (bitově)."""
+    paddles = engine.team_left.paddles + engine.team_right.paddles
+    assert batch.ball_x[i] == engine.ball.x
+    assert batch.ball_y[i] == engine.ball.y
+    assert batch.ball_vx[i] == engine.ball.vx
+    assert batch.ball_vy[i] == engine.ball.vy
+    assert list(batch.paddle_y[i]) == [p.y for p in paddles]
+    assert tuple(batch.score[i]) == (engine.score["A"], engine.score["B"])
+    assert list(batch.hits[i]) == [p.stats.hits for p in paddles]
+    assert list(batch.goals_scored[i]) == [p.stats.goals_scored for p in paddles]
+    assert batch.rally_hits[i] == engine.rally_hits
+    assert bool(batch.pending_serve[i]) == engine._pending_ball_reset
+
+
+def test_batched_engine_layout_matches_engine():
+    """Sloty a geometrie pálek odpovídají objektovému enginu."""
+    engine = MultipongEngine(num_players_per_team=4)
+    batch = BatchedMultipongEngine(3, num_players_per_team=4)
+
+    paddles = engine.team_left.paddles + engine.team_right.paddles
+    assert batch.player_ids == [p.player_id for p in paddles]
+    assert batch.num_paddles == len(paddles)
+    assert list(batch.paddle_x) == [p.x for p in paddles]
+    assert batch.paddle_y.shape == (3, len(paddles))
+    for i in range(3):
+        _assert_match_equal(batch, i, engine)
+
+
+@pytest.mark.parametrize("players_per_team", [1, 2, 3, 4])
+def test_batched_engine_parity_random_play(players_per_team):
+    """Náhodné zápasy s náhodnými vstupy dávají bitově shodný stav každý tick."""
+    rng = random.Random(1234 + players_per_team)
+    num_matches = 16
+    batch = BatchedMultipongEngine(num_matches, num_players_per_team=players_per_team)
+    engines = [MultipongEngine(num_players_per_team=players_per_team) for _ in range(num_matches)]
+
+    for i, engine in enumerate(engines):
+        engine.ball.x = rng.uniform(30, engine.arena.width - 30)
+        engine.ball.y = rng.uniform(30, engine.arena.height - 30)
+        engine.ball.vx = rng.choice([-1, 1]) * rng.uniform(3, 12)
+        engine.ball.vy = rng.choice([-1, 1]) * rng.uniform(1, 12)
+        batch.load_match(i, engine)
+
+    choices = [INPUT_NONE, 0, INPUT_UP, INPUT_DOWN, INPUT_UP | INPUT_DOWN]
+    for _ in range(1200):
+        inputs = np.array(
+            [[rng.choice(choices) for _ in batch.player_ids] for _ in range(num_matches)],
+            dtype=np.int8,
+        )
+        batch.update(inputs)
+        for i, engine in enumerate(engines):
+            engine.update(_inputs_to_dict(inputs[i], batch.player_ids))
+            _assert_match_equal(batch, i, engine)
+
+    # Scénáře musí skutečně pokrýt zásahy i góly
+    assert batch.hits.sum() > 0
+    assert batch.score.sum() > 0
+
+
+def test_batched_engine_update_without_inputs():
+    """update(None) odpovídá update({}) – fallback AI pro sloty mimo *1."""
+    batch = BatchedMultipongEngine(2, num_players_per_team=4)
+    engines = [MultipongEngine(num_players_per_team=4) for _ in range(2)]
+    engines[1].ball.vy = -7.5
+    batch.load_match(1, engines[1])
+
+    for _ in range(300):
+        batch.update()
+        for i, engine in enumerate(engines):
+            engine.update({})
+            _assert_match_equal(batch, i, engine)
+
+
+def test_batched_engine_goal_pause_freezes_ball():
+    """Během pauzy po gólu stojí míček ve středu, pálky se hýbou dál."""
+    batch = BatchedMultipongEngine(2)
+    batch.ball_x[0] = batch.arena_width + 10
+    batch.ball_y[0] = batch.arena_height / 2
+
+    batch.update()
+
+    assert tuple(batch.score[0]) == (1, 0)
+    assert tuple(batch.score[1]) == (0, 0)
+    assert batch.ball_vx[0] == 0 and batch.ball_vy[0] == 0
+    assert batch.pending_serve[0]
+
+    x_before = batch.ball_x.copy()
+    batch.update(np.array([INPUT_DOWN, INPUT_NONE], dtype=np.int8))
+    assert batch.ball_x[0] == x_before[0]
+    assert batch.ball_x[1] != x_before[1]
+
+
+def test_batched_engine_reset_matches_engine():
+    """reset() odpovídá MultipongEngine.reset()."""
+    engine = MultipongEngine(num_players_per_team=4)
+    batch = BatchedMultipongEngine(2, num_players_per_team=4)
+    for _ in range(50):
+        engine.update({})
+    batch.load_match(0, engine)
+
+    engine.reset()
+    batch.reset(mask=[0])
+
+    _assert_match_equal(batch, 0, engine)
+
+
+def test_batched_engine_rejects_swept_collision(monkeypatch):
+    """Swept režim dávka nesimuluje – místo odlišné fyziky vyhodí ValueError."""
+    monkeypatch.setattr(settings, "BALL_SWEPT_COLLISION", True)
+    assert MultipongEngine().swept_collision
+    with pytest.raises(ValueError):
+        BatchedMultipongEngine(2)
+
+    monkeypatch.setattr(settings, "BALL_SWEPT_COLLISION", False)
+    batch = BatchedMultipongEngine(2)
+    with pytest.raises(ValueError):
+        batch.load_match(0, MultipongEngine(swept_collision=True))
@@ -0,0 +1,39 @@
+"""Testy kompaktní reprezentace entit (__slots__)."""
+
+import pytest
+
+from multipong.engine.arena import Arena
+from multipong.engine.ball import Ball
+from multipong.engine.game_engine import MultipongEngine
+from multipong.engine.goal_zone import GoalZone
+from multipong.engine.paddle import Paddle
+from multipong.engine.player_stats import PlayerStats
+from multipong.engine.team import Team
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Arena(800, 600),
+        Ball(x=10, y=10, vx=1, vy=1, radius=5),
+        Paddle(x=0, y=0, width=10, height=50),
+        PlayerStats(player_id="A1"),
+        GoalZone(x=0, top=100, bottom=200),
+    ],
+)
+def test_entities_have_no_instance_dict(instance):
+    """Entity nemají __dict__ a nelze jim přidat neznámý atribut."""
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unknown_attribute = 1
+
+
+def test_engine_entities_are_slotted():
+    """Týmy a pálky vytvořené enginem jsou kompaktní, ID hráčů internovaná."""
+    engine = MultipongEngine(num_players_per_team=2)
+    assert isinstance(engine.team_left, Team)
+    assert not hasattr(engine.team_left, "__dict__")
+    for player_id, paddle in engine.paddles.items():
+        assert not hasattr(paddle, "__dict__")
+        assert paddle.player_id is player_id
+        assert paddle.stats.player_id is player_id
@@ -0,0 +1,142 @@
+"""Testy event busu enginu (PaddleHit, WallBounce, GoalScored, ServeStarted)."""
+
+from multipong import settings
+from multipong.ai import QLearningAI
+from multipong.engine.events import (
+    EventBus,
+    GoalScored,
+    PaddleHit,
+    ServeStarted,
+    WallBounce,
+)
+from multipong.engine.game_engine import MultipongEngine
+
+
+def _prepare_hit(engine: MultipongEngine) -> None:
+    """Postaví míček těsně před pálku A1, letící proti ní."""
+    left = engine.paddles["A1"]
+    engine.ball.x = left.x + left.width + engine.ball.radius + 1
+    engine.ball.y = left.y + left.height / 2
+    engine.ball.vx = -5.0
+    engine.ball.vy = 0.0
+
+
+def test_bus_subscribe_emit_unsubscribe():
+    """Posluchač dostane jen události svého typu a lze ho odebrat."""
+    bus = EventBus()
+    received = []
+    assert not bus.listening(PaddleHit)
+
+    bus.subscribe(PaddleHit, received.append)
+    assert bus.listening(PaddleHit)
+    assert not bus.listening(WallBounce)
+
+    bus.emit(PaddleHit(1.0, "A1", "A", 0, 0, 0, 0))
+    bus.emit(WallBounce(1.0, "top", 0, 0))
+    assert [type(e) for e in received] == [PaddleHit]
+
+    assert bus.unsubscribe(PaddleHit, received.append) is True
+    assert bus.unsubscribe(PaddleHit, received.append) is False
+    assert not bus.listening(PaddleHit)
+
+
+def test_engine_without_listeners_has_empty_bus():
+    """Bez RL odměn engine nic neposlouchá – události se nevytváří."""
+    engine = MultipongEngine(ai_rewards=False)
+    for event_type in (PaddleHit, WallBounce, GoalScored, ServeStarted):
+        assert not engine.events.listening(event_type)
+
+    _prepare_hit(engine)
+    engine.update({})
+    assert engine.paddles["A1"].stats.hits == 1
+
+
+def test_paddle_hit_event_in_both_modes():
+    """Zásah pálky emituje PaddleHit v diskrétním i swept režimu."""
+    for swept in (False, True):
+        engine = MultipongEngine(swept_collision=swept, ai_rewards=False)
+        hits = []
+        engine.events.subscribe(PaddleHit, hits.append)
+        _prepare_hit(engine)
+
+        engine.update({})
+
+        assert len(hits) == 1
+        assert hits[0].player_id == "A1"
+        assert hits[0].team == "A"
+        assert hits[0].ball_vx < 0  # stav míčku v okamžiku dopadu
+
+
+def test_wall_bounce_events():
+    """Odraz od stropu a zadní stěny emituje WallBounce se správnou stěnou."""
+    for swept in (False, True):
+        engine = MultipongEngine(swept_collision=swept, ai_rewards=False)
+        bounces = []
+        engine.events.subscribe(WallBounce, bounces.append)
+
+        engine.ball.x = engine.arena.width / 2
+        engine.ball.y = engine.ball.radius + 2
+        engine.ball.vx = 0.0
+        engine.ball.vy = -5.0
+        engine.update({})
+        assert [b.wall for b in bounces] == ["top"]
+
+        bounces.clear()
+        engine.ball.x = engine.ball.radius + 2
+        engine.ball.y = 40  # mimo ústí branky i pálku
+        engine.ball.vx = -5.0
+        engine.ball.vy = 0.0
+        engine.update({})
+        assert [b.wall for b in bounces] == ["back_left"]
+
+
+def test_goal_and_serve_events():
+    """Gól emituje GoalScored, konec pauzy ServeStarted."""
+    engine = MultipongEngine(ai_rewards=False)
+    events = []
+    engine.events.subscribe_all(events.append)
+
+    engine.ball.x = engine.arena.width + 10
+    engine.ball.y = engine.goal_right.top + 5
+    engine.update({})
+
+    goals = [e for e in events if isinstance(e, GoalScored)]
+    assert len(goals) == 1
+    assert goals[0].scoring_team == "A"
+    assert goals[0].conceding_team == "B"
+    assert (goals[0].score_a, goals[0].score_b) == (1, 0)
+
+    pause_ticks = round(settings.GOAL_PAUSE_SECONDS * settings.PHYSICS_REFERENCE_RATE)
+    engine.simulate(pause_ticks)
+
+    serves = [e for e in events if isinstance(e, ServeStarted)]
+    assert len(serves) == 1
+    assert serves[0].ball_vx != 0
+
+
+def test_score_goal_does_not_emit():
+    """Ruční score_goal() mění skóre, ale GoalScored (a RL odměny) nevyvolá."""
+    engine = MultipongEngine()
+    goals = []
+    engine.events.subscribe(GoalScored, goals.append)
+
+    engine.score_goal("A")
+
+    assert engine.score["A"] == 1
+    assert goals == []
+
+
+def test_ai_rewards_via_listener():
+    """RL odměna za zásah jde přes posluchače; bez něj se Q tabulka nemění."""
+    for ai_rewards in (True, False):
+        engine = MultipongEngine(ai_rewards=ai_rewards)
+        ai = QLearningAI(lr=0.5, epsilon=0.0)
+        engine.paddles["A1"].ai = ai
+        _prepare_hit(engine)
+        # Zapamatuje si stav/akci jako při běžném rozhodnutí
+        ai.decide(engine.paddles["A1"], engine.ball, engine.arena)
+        before = {s: dict(a) for s, a in ai.Q.items()}
+
+        engine.events.emit(PaddleHit(0.0, "A1", "A", 0, 0, 0, 0))
+
+        assert (ai.Q != before) is ai_rewards
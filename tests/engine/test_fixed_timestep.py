@@ -0,0 +1,76 @@
+"""Testy časově nezávislé fyziky (MultipongEngine.step)."""
+
+import pytest
+
+from multipong import settings
+from multipong.engine.game_engine import MultipongEngine
+
+
+def _engine_with_free_ball() -> MultipongEngine:
+    """Engine s míčkem uprostřed, daleko od stěn a pálek."""
+    engine = MultipongEngine()
+    engine.ball.x = 600
+    engine.ball.y = 200
+    engine.ball.vx = 6.0
+    engine.ball.vy = 4.0
+    return engine
+
+
+def test_step_reference_dt_matches_update():
+    """step(1/60) je bitově shodný s update()."""
+    a = _engine_with_free_ball()
+    b = _engine_with_free_ball()
+
+    for _ in range(120):
+        a.update({"A1": {"up": True, "down": False}})
+        b.step(1.0 / settings.PHYSICS_REFERENCE_RATE, {"A1": {"up": True, "down": False}})
+
+    assert a.ball.x == b.ball.x
+    assert a.ball.y == b.ball.y
+    assert a.paddles["A1"].y == b.paddles["A1"].y
+
+
+def test_ball_distance_independent_of_step_rate():
+    """Za stejný čas urazí míček stejnou vzdálenost při 30 i 120 Hz."""
+    coarse = _engine_with_free_ball()
+    fine = _engine_with_free_ball()
+
+    for _ in range(3):
+        coarse.step(1.0 / 30)
+    for _ in range(12):
+        fine.step(1.0 / 120)
+
+    assert coarse.ball.x == pytest.approx(fine.ball.x)
+    assert coarse.ball.y == pytest.approx(fine.ball.y)
+    assert coarse.ball.x == pytest.approx(600 + 6.0 * 6)
+
+
+def test_paddle_speed_independent_of_step_rate():
+    """Pálka se za sekundu posune stejně při různém dt."""
+    coarse = MultipongEngine()
+    fine = MultipongEngine()
+    start = coarse.paddles["A1"].y
+    inputs = {"A1": {"up": False, "down": True}}
+
+    for _ in range(5):
+        coarse.step(1.0 / 20, inputs)
+    for _ in range(15):
+        fine.step(1.0 / 60, inputs)
+
+    moved = coarse.paddles["A1"].y - start
+    assert moved == pytest.approx(fine.paddles["A1"].y - start)
+    assert moved == pytest.approx(coarse.paddles["A1"].speed * 15)
+
+
+def test_speed_decay_scales_with_dt(monkeypatch):
+    """Decay rychlosti za dva poloviční kroky odpovídá jednomu celému."""
+    monkeypatch.setattr(settings, "BALL_SPEED_DECAY", 0.9)
+    full = _engine_with_free_ball()
+    half = _engine_with_free_ball()
+
+    full.step(1.0 / 60)
+    half.step(1.0 / 120)
+    half.step(1.0 / 120)
+
+    assert full.ball.vx == pytest.approx(6.0 * 0.9)
+    assert half.ball.vx == pytest.approx(full.ball.vx)
@@ -0,0 +1,62 @@
+"""Testy profilování fází ticku (Histogram, PhaseProfiler)."""
+
+import pytest
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.engine.profiling import (
+    ENGINE_PHASES,
+    PHASE_BALL,
+    PHASE_PADDLES,
+    Histogram,
+    PhaseProfiler,
+)
+
+
+def test_histogram_buckets_and_percentiles():
+    """Vzorky padají do pevných košů, percentily odpovídají horním hranicím."""
+    histogram = Histogram(bounds=(1e-3, 1e-2, 1e-1))
+    for _ in range(90):
+        histogram.record(5e-4)
+    for _ in range(9):
+        histogram.record(5e-3)
+    histogram.record(0.5)
+
+    assert histogram.counts == [90, 9, 0, 1]
+    assert histogram.count == 100
+    assert histogram.max == 0.5
+    assert histogram.percentile(50) == 1e-3
+    assert histogram.percentile(95) == 1e-2
+    assert histogram.percentile(100) == 0.5
+    assert histogram.mean == pytest.approx((90 * 5e-4 + 9 * 5e-3 + 0.5) / 100)
+
+    data = histogram.to_dict()
+    assert data["buckets"][-1] == [float("inf"), 1]
+
+
+def test_engine_without_profiler_records_nothing():
+    """Bez profileru engine neměří (výchozí stav)."""
+    engine = MultipongEngine()
+    assert engine.profiler is None
+    engine.simulate(10)
+
+
+def test_engine_records_all_phases():
+    """Profiler dostane jeden vzorek každé fáze za tick."""
+    profiler = PhaseProfiler()
+    engine = MultipongEngine(num_players_per_team=2, profiler=profiler)
+    engine.simulate(100)
+
+    for phase in ENGINE_PHASES:
+        assert profiler.get(phase).count == 100
+    assert profiler.slowest_last()[0] in ENGINE_PHASES
+
+
+def test_swept_mode_measures_ball_phase_as_whole():
+    """Swept režim měří pohyb, stěny i kolize jako fázi ball."""
+    profiler = PhaseProfiler()
+    engine = MultipongEngine(swept_collision=True, profiler=profiler)
+    engine.simulate(20)
+
+    assert profiler.get(PHASE_PADDLES).count == 20
+    assert profiler.get(PHASE_BALL).count == 20
+    assert set(profiler.to_dict()) == {PHASE_PADDLES, PHASE_BALL}
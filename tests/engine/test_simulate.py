@@ -0,0 +1,88 @@
+"""Testy simulačního času, pauzy po gólu a headless režimu simulate()."""
+
+import time
+
+from multipong import settings
+from multipong.engine.game_engine import MultipongEngine
+
+
+def _score_goal_for_a(engine: MultipongEngine) -> None:
+    """Pošle míček do pravé branky a provede tick (gól pro A)."""
+    engine.ball.x = engine.arena.width + 10
+    engine.ball.y = engine.goal_right.top + 5
+    engine.update({})
+
+
+def test_goal_pause_measured_in_ticks():
+    """Pauza po gólu trvá přesně GOAL_PAUSE_SECONDS simulačního času."""
+    engine = MultipongEngine()
+    _score_goal_for_a(engine)
+    assert engine.score["A"] == 1
+
+    pause_ticks = round(settings.GOAL_PAUSE_SECONDS * settings.PHYSICS_REFERENCE_RATE)
+    assert engine.get_goal_pause_remaining() == settings.GOAL_PAUSE_SECONDS
+
+    for _ in range(pause_ticks - 1):
+        engine.update({})
+        assert engine.ball.vx == 0
+
+    engine.update({})
+    assert engine.goal_pause_until is None
+    assert engine.ball.vx != 0
+    assert engine.get_goal_pause_remaining() == 0.0
+
+
+def test_time_left_counts_down_while_running():
+    """Časomíra zápasu běží jen když je hra spuštěná a končí na nule."""
+    engine = MultipongEngine()
+    engine.update({})
+    assert engine.time_left == 120.0
+
+    engine.start()
+    engine.time_left = 1.0
+    engine.simulate(30)
+    assert abs(engine.time_left - 0.5) < 1e-9
+    assert engine.is_running is True
+
+    engine.simulate(60)
+    assert engine.time_left == 0.0
+    assert engine.is_running is False
+
+
+def test_simulate_is_deterministic():
+    """Dva enginy se stejnými vstupy skončí ve stejném stavu."""
+    def policy(engine, tick):
+        return {"A1": {"up": tick % 7 < 3, "down": tick % 5 == 0}}
+
+    a = MultipongEngine(num_players_per_team=2)
+    b = MultipongEngine(num_players_per_team=2)
+
+    state_a = a.simulate(3000, policy)
+    state_b = b.simulate(3000, policy)
+
+    assert state_a == state_b
+    assert a.sim_tick == 3000
+
+
+def test_simulate_replays_recorded_inputs():
+    """Iterovatelný zdroj vstupů se přehraje tick po ticku."""
+    recorded = [{"A1": {"up": False, "down": True}}] * 10
+    engine = MultipongEngine()
+    start_y = engine.paddles["A1"].y
+
+    engine.simulate(20, recorded)
+
+    assert engine.paddles["A1"].y == start_y + 10 * engine.paddles["A1"].speed
+
+
+def test_simulate_runs_faster_than_real_time():
+    """Minuta herního času se nasimuluje výrazně rychleji než za minutu."""
+    engine = MultipongEngine(num_players_per_team=4)
+    engine.start()
+
+    started = time.perf_counter()
+    engine.simulate(60 * settings.PHYSICS_REFERENCE_RATE)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 10.0
+    assert abs(engine.time_left - 60.0) < 1e-6
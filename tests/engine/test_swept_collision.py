@@ -0,0 +1,149 @@
+"""Testy spojité (swept) detekce kolizí."""
+
+from multipong.engine.ball import Ball
+from multipong.engine.collision import sweep_circle_aabb, sweep_line
+from multipong.engine.game_engine import MultipongEngine
+from multipong.engine.goal_zone import GoalZone
+
+
+def test_sweep_circle_aabb_time_of_impact():
+    """Kruh letící na obdélník narazí v přesně spočteném čase."""
+    # Míček na x=100 letí doleva 50 px/tick, čelo rozšířeného obdélníku na x=80
+    t = sweep_circle_aabb(100, 50, -50, 0, 10, 50, 0, 70, 100, 1.0)
+    assert t is not None
+    assert abs(t - 0.4) < 1e-9
+
+
+def test_sweep_circle_aabb_miss_and_overlap():
+    """Minutí vrací None, počáteční překryv vrací 0."""
+    assert sweep_circle_aabb(100, 500, -50, 0, 10, 50, 0, 70, 100, 1.0) is None
+    assert sweep_circle_aabb(100, 50, 50, 0, 10, 50, 0, 70, 100, 1.0) is None
+    assert sweep_circle_aabb(60, 50, -5, 0, 10, 50, 0, 70, 100, 1.0) == 0.0
+
+
+def test_sweep_line_and_goal_zone():
+    """Čas dosažení čáry a branky."""
+    assert sweep_line(100, -10, 50, 10.0) == 5.0
+    assert sweep_line(100, -10, 50, 2.0) is None
+
+    goal = GoalZone(x=0, top=300, bottom=500)
+    ball = Ball(x=110, y=400, vx=-50, vy=0, radius=10)
+    assert goal.sweep(ball, 1.0) is None
+    ball.vx = -200
+    assert abs(goal.sweep(ball, 1.0) - 0.5) < 1e-9
+    assert goal.contains_y(400)
+    assert not goal.contains_y(100)
+
+
+def test_fast_ball_tunnels_in_discrete_mode():
+    """Diskrétní režim: rychlý míček proletí 20px pálkou (regresní ukázka)."""
+    engine = MultipongEngine(swept_collision=False)
+    left = engine.paddles["A1"]
+    engine.ball.x = left.x + left.width + engine.ball.radius + 5
+    engine.ball.y = left.y + left.height / 2
+    engine.ball.vx = -70.0
+    engine.ball.vy = 0.0
+
+    engine.update({})
+
+    assert engine.ball.vx < 0
+    assert left.stats.hits == 0
+
+
+def test_fast_ball_hits_paddle_in_swept_mode():
+    """Swept režim: stejný rychlý míček se od pálky odrazí."""
+    engine = MultipongEngine(swept_collision=True)
+    left = engine.paddles["A1"]
+    engine.ball.x = left.x + left.width + engine.ball.radius + 5
+    engine.ball.y = left.y + left.height / 2
+    engine.ball.vx = -70.0
+    engine.ball.vy = 0.0
+
+    engine.update({})
+
+    assert engine.ball.vx > 0
+    assert left.stats.hits == 1
+    # Zbytek ticku doletí od čela pálky novou rychlostí
+    assert engine.ball.x > left.x + left.width + engine.ball.radius
+
+
+def test_swept_mode_resolves_multiple_bounces_per_tick():
+    """Míček v rohu se během jednoho ticku odrazí od stropu i zadní stěny."""
+    engine = MultipongEngine(swept_collision=True)
+    engine.ball.x = 30
+    engine.ball.y = 30
+    engine.ball.vx = -40.0
+    engine.ball.vy = -40.0
+
+    engine.update({})
+
+    assert engine.ball.vx > 0
+    assert engine.ball.vy > 0
+    assert engine.ball.x >= engine.ball.radius
+    assert engine.ball.y >= engine.ball.radius
+
+
+def test_swept_mode_scores_fast_goal():
+    """Rychlý míček do ústí branky dá gól i bez koncového překryvu."""
+    engine = MultipongEngine(swept_collision=True)
+    engine.ball.x = engine.arena.width - 60
+    engine.ball.y = engine.goal_right.top + 10  # mimo pálku B1, v ústí branky
+    engine.ball.vx = 80.0
+    engine.ball.vy = 0.0
+
+    engine.update({})
+
+    assert engine.score["A"] == 1
+    assert engine.ball.vx == 0
+
+
+def test_swept_mode_matches_discrete_for_slow_hit():
+    """Při běžné rychlosti dává swept režim stejný odraz jako diskrétní."""
+    results = []
+    for swept in (False, True):
+        engine = MultipongEngine(swept_collision=swept)
+        left = engine.paddles["A1"]
+        engine.ball.x = left.x + left.width + engine.ball.radius + 1
+        engine.ball.y = left.y + left.height / 2
+        engine.ball.vx = -5.0
+        engine.ball.vy = 3.0
+        engine.update({})
+        results.append((engine.ball.vx, engine.ball.vy, left.stats.hits))
+
+    assert results[0] == results[1]
+
+
+def test_swept_mode_stops_at_impact_when_bounce_limit_is_spent(monkeypatch):
+    """Po vyčerpání limitu odrazů míček neproletí stěnou – zastaví v bodě dopadu."""
+    monkeypatch.setattr("multipong.settings.BALL_MAX_BOUNCES_PER_TICK", 1)
+    engine = MultipongEngine(swept_collision=True)
+    engine.ball.x = 30
+    engine.ball.y = 60
+    engine.ball.vx = -40.0  # zadní stěna v polovině ticku, pak strop
+    engine.ball.vy = -80.0
+
+    engine.update({})
+
+    radius = engine.ball.radius
+    assert engine.ball.vx > 0  # jediný povolený odraz (zadní stěna)
+    assert engine.ball.vy < 0
+    assert engine.ball.y >= radius - 1e-9
+    assert engine.ball.x >= radius - 1e-9
+
+    engine.update({})
+    assert engine.ball.vy > 0  # odložený odraz od stropu
+
+
+def test_wall_bounce_uses_arena_height_in_both_modes():
+    """Diskrétní i swept režim se odráží od dna arény, ne od výšky okna."""
+    for swept in (False, True):
+        engine = MultipongEngine(arena_height=400, swept_collision=swept)
+        engine.ball.x = engine.arena.width / 2
+        engine.ball.y = 400 - engine.ball.radius - 5
+        engine.ball.vx = 0.0
+        engine.ball.vy = 15.0
+
+        engine.update({})
+
+        assert engine.ball.vy < 0
+        assert engine.ball.y <= 400 - engine.ball.radius
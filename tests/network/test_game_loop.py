@@ -12,6 +12,7 @@ from multipong.network.server.game_loop import (
     get_game_loop
 )
 from multipong.engine.game_engine import MultipongEngine
+from multipong.network.server.input_table import InputTable
 from multipong.network.server.websocket_manager import WebSocketManager
 
 
@@ -86,7 +87,7 @@ class TestGameLoop:
         """Test základního běhu game loop."""
         engine = Mock(spec=MultipongEngine)
         engine.update = Mock()
-        engine.get_state = Mock(return_value={
+        engine.get_dynamic_state = Mock(return_value={
             "ball": {"x": 100, "y": 200},
             "score": {"A": 0, "B": 0}
         })
@@ -109,7 +110,7 @@ class TestGameLoop:
         
         # Ověříme, že engine a manager byly volány
         assert engine.update.call_count > 0
-        assert engine.get_state.call_count > 0
+        assert engine.get_dynamic_state.call_count > 0
         assert manager.broadcast.call_count > 0
     
     @pytest.mark.asyncio
@@ -117,7 +118,7 @@ class TestGameLoop:
         """Test běhu s aktuálními vstupy."""
         engine = Mock(spec=MultipongEngine)
         engine.update = Mock()
-        engine.get_state = Mock(return_value={"score": {"A": 0, "B": 0}})
+        engine.get_dynamic_state = Mock(return_value={"score": {"A": 0, "B": 0}})
         
         manager = AsyncMock(spec=WebSocketManager)
         manager.broadcast = AsyncMock(return_value=1)
@@ -146,7 +147,7 @@ class TestGameLoop:
         """Test zastavení game loop."""
         engine = Mock(spec=MultipongEngine)
         engine.update = Mock()
-        engine.get_state = Mock(return_value={})
+        engine.get_dynamic_state = Mock(return_value={})
         
         manager = AsyncMock(spec=WebSocketManager)
         manager.broadcast = AsyncMock(return_value=0)
@@ -193,7 +194,7 @@ class TestRunGameLoopFunction:
         """Test základního běhu funkčního API."""
         engine = Mock(spec=MultipongEngine)
         engine.update = Mock()
-        engine.get_state = Mock(return_value={
+        engine.get_dynamic_state = Mock(return_value={
             "ball": {"x": 100, "y": 200},
             "score": {"A": 0, "B": 0}
         })
@@ -219,7 +220,7 @@ class TestRunGameLoopFunction:
         
         # Ověříme volání
         assert engine.update.call_count > 0
-        assert engine.get_state.call_count > 0
+        assert engine.get_dynamic_state.call_count > 0
         assert manager.broadcast.call_count > 0
     
     @pytest.mark.asyncio
@@ -227,7 +228,7 @@ class TestRunGameLoopFunction:
         """Test funkčního API se sdílenými vstupy."""
         engine = Mock(spec=MultipongEngine)
         engine.update = Mock()
-        engine.get_state = Mock(return_value={"score": {"A": 0, "B": 0}})
+        engine.get_dynamic_state = Mock(return_value={"score": {"A": 0, "B": 0}})
         
         manager = AsyncMock(spec=WebSocketManager)
         manager.broadcast = AsyncMock(return_value=1)
@@ -252,3 +253,193 @@ class TestRunGameLoopFunction:
         assert engine.update.called
         first_call_inputs = engine.update.call_args_list[0][0][0]
         assert first_call_inputs is player_inputs
+    
+    @pytest.mark.asyncio
+    async def test_run_game_loop_with_input_table(self):
+        """InputTable předaná funkčnímu API se čte přímo, bez kopie."""
+        engine = Mock(spec=MultipongEngine)
+        engine.update = Mock()
+        engine.get_dynamic_state = Mock(return_value={"score": {"A": 0, "B": 0}})
+        player_inputs = InputTable()
+        player_inputs.set("A1", up=True, down=False)
+        
+        with patch.object(GameLoop, "run", autospec=True) as run:
+            await run_game_loop(engine, AsyncMock(spec=WebSocketManager), player_inputs, tick_rate=10)
+        loop = run.call_args[0][0]
+        await loop.run_tick()
+        
+        assert loop.player_inputs is player_inputs
+        assert loop.input_table is player_inputs
+        assert engine.update.call_args[0][0] is player_inputs
+    
+    @pytest.mark.asyncio
+    async def test_run_game_loop_dict_stays_shared(self):
+        """Se slovníkem zapisuje game loop do mapy volajícího a změny volajícího vidí engine."""
+        engine = MultipongEngine(num_players_per_team=1)
+        player_inputs = {"A1": {"up": True, "down": False}}
+        
+        with patch.object(GameLoop, "run", autospec=True) as run:
+            await run_game_loop(engine, WebSocketManager(), player_inputs, tick_rate=10)
+        loop = run.call_args[0][0]
+        
+        loop.update_input("B1", up=False, down=True)
+        assert player_inputs["B1"] == {"up": False, "down": True}
+        player_inputs["A1"]["down"] = True
+        assert loop.get_current_inputs()["A1"] == {"up": True, "down": True}
+        loop.clear_input("B1")
+        assert "B1" not in player_inputs
+        
+        assert loop.queue_input("B1", 1, True, False)
+        await loop.run_tick(steps=2)
+        assert player_inputs["B1"] == {"up": True, "down": False}
+    
+    @pytest.mark.asyncio
+    async def test_run_game_loop_inputs_stay_table_methods(self):
+        """update_input a clear_input zapisují do sdílené tabulky volajícího."""
+        engine = MultipongEngine(num_players_per_team=1)
+        player_inputs = InputTable(engine.paddles)
+        
+        with patch.object(GameLoop, "run", autospec=True) as run:
+            await run_game_loop(engine, WebSocketManager(), player_inputs, tick_rate=10)
+        loop = run.call_args[0][0]
+        
+        loop.update_input("A1", True, False)
+        assert player_inputs["A1"] == {"up": True, "down": False}
+        loop.clear_input("A1")
+        assert "A1" not in player_inputs
+    
+    @pytest.mark.asyncio
+    async def test_run_game_loop_jitter_buffer_uses_shared_table(self):
+        """Číslované rámce (queue_input) se aplikují do tabulky, kterou čte engine."""
+        engine = MultipongEngine(num_players_per_team=1)
+        player_inputs = InputTable(engine.paddles)
+        
+        with patch.object(GameLoop, "run", autospec=True) as run:
+            await run_game_loop(engine, WebSocketManager(), player_inputs, tick_rate=10)
+        loop = run.call_args[0][0]
+        
+        assert loop.queue_input("B1", 1, False, True)
+        with patch.object(engine, "update", wraps=engine.update) as update:
+            await loop.run_tick(steps=2)
+        
+        assert player_inputs["B1"] == {"up": False, "down": True}
+        assert all(call.args[0] is player_inputs for call in update.call_args_list)
+        assert loop.last_snapshot["input_acks"] == {"B1": [1, None]}
+
+
+class TestGameLoopAccumulator:
+    """Testy fixního kroku simulace s akumulátorem."""
+    
+    def test_sim_rate_defaults(self):
+        """sim_rate je implicitně rovný tick_rate."""
+        loop = GameLoop(Mock(), Mock(), tick_rate=30)
+        assert loop.sim_rate == 30
+        
+        loop = GameLoop(Mock(), Mock(), tick_rate=30, sim_rate=120)
+        assert loop.sim_rate == 120
+    
+    @pytest.mark.asyncio
+    async def test_run_substeps_with_fixed_dt(self):
+        """Při sim_rate > tick_rate provede loop více kroků s fixním dt."""
+        engine = Mock(spec=MultipongEngine)
+        engine.update = Mock()
+        engine.get_dynamic_state = Mock(return_value={})
+        
+        manager = AsyncMock(spec=WebSocketManager)
+        manager.broadcast = AsyncMock(return_value=0)
+        manager.get_player_count = Mock(return_value=0)
+        
+        loop = GameLoop(engine, manager, tick_rate=10, sim_rate=50)
+        
+        task = asyncio.create_task(loop.run())
+        await asyncio.sleep(0.35)
+        loop.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+        
+        # Každý krok dostane fixní dt = 1 / sim_rate
+        dts = [call.kwargs["dt"] for call in engine.update.call_args_list]
+        assert dts and all(dt == pytest.approx(0.02) for dt in dts)
+        # Více simulačních kroků než broadcastů
+        assert engine.update.call_count > manager.broadcast.call_count
+    
+    @pytest.mark.asyncio
+    async def test_run_skips_steps_when_overloaded(self):
+        """Při omezeném max_substeps se nestihnuté kroky zahodí."""
+        engine = Mock(spec=MultipongEngine)
+        engine.update = Mock()
+        engine.get_dynamic_state = Mock(return_value={})
+        
+        manager = AsyncMock(spec=WebSocketManager)
+        manager.broadcast = AsyncMock(return_value=0)
+        manager.get_player_count = Mock(return_value=0)
+        
+        loop = GameLoop(engine, manager, tick_rate=10, sim_rate=100, max_substeps=2)
+        
+        task = asyncio.create_task(loop.run())
+        await asyncio.sleep(0.25)
+        loop.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+        
+        assert loop.skipped_steps > 0
+
+
+class TestGameLoopRunTick:
+    """Testy jednoho průchodu smyčkou bez čekání (run_tick)."""
+    
+    @pytest.mark.asyncio
+    async def test_run_tick_steps_and_broadcasts_once(self):
+        """run_tick(n) provede n kroků simulace a jeden broadcast."""
+        engine = MultipongEngine()
+        manager = AsyncMock(spec=WebSocketManager)
+        manager.broadcast = AsyncMock(return_value=3)
+        loop = GameLoop(engine, manager, tick_rate=30, sim_rate=60)
+        
+        sent = await loop.run_tick(2)
+        
+        assert sent == 3
+        assert engine.sim_tick == pytest.approx(2.0)
+        manager.broadcast.assert_awaited_once()
+        assert loop.last_snapshot["type"] == "snapshot"
+    
+    @pytest.mark.asyncio
+    async def test_run_tick_without_steps_does_nothing(self):
+        """run_tick(0) nesimuluje ani neposílá."""
+        engine = Mock(spec=MultipongEngine)
+        manager = AsyncMock(spec=WebSocketManager)
+        loop = GameLoop(engine, manager, tick_rate=30)
+        
+        assert await loop.run_tick(0) == 0
+        engine.update.assert_not_called()
+        manager.broadcast.assert_not_called()
+
+
+class TestGameLoopProfiling:
+    """Testy profilování fází ticku v GameLoop."""
+    
+    def test_profiling_disabled_by_default(self):
+        """Bez profilování je get_profile() prázdný."""
+        loop = GameLoop(MultipongEngine(), Mock(), tick_rate=30, profiling=False)
+        assert loop.profiler is None
+        assert loop.get_profile() == {}
+    
+    @pytest.mark.asyncio
+    async def test_profiling_records_engine_and_loop_phases(self):
+        """Histogramy obsahují fáze enginu, snapshot, broadcast i celý tick."""
+        engine = MultipongEngine()
+        manager = AsyncMock(spec=WebSocketManager)
+        manager.broadcast = AsyncMock(return_value=0)
+        manager.get_player_count = Mock(return_value=0)
+        
+        loop = GameLoop(engine, manager, tick_rate=50, profiling=True)
+        assert engine.profiler is loop.profiler
+        
+        task = asyncio.create_task(loop.run())
+        await asyncio.sleep(0.2)
+        loop.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+        
+        profile = loop.get_profile()
+        for phase in ("paddles", "ball", "walls_goals", "paddle_collision",
+                      "snapshot", "broadcast", "tick"):
+            assert profile[phase]["count"] > 0
+        assert profile["broadcast"]["count"] == manager.broadcast.call_count
@@ -0,0 +1,98 @@
+"""
+Testy odpojování neaktivních relací (IdleExpiry).
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from multipong.network.server.idle_expiry import IdleExpiry
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.websocket_manager import WebSocketManager
+
+
+async def _session(manager, player_id, idle=0.0):
+    """Relace přidaná do manageru, naposledy aktivní před ``idle`` s."""
+    session = PlayerSession(Mock(), player_id)
+    session.last_activity -= idle
+    await manager.add(session)
+    return session
+
+
+@pytest.mark.asyncio
+class TestIdleExpiry:
+    """Testy haldy deadlinů nečinnosti."""
+
+    async def test_expires_only_idle_sessions(self):
+        """Odpojí se jen relace nečinné déle než timeout."""
+        manager = WebSocketManager()
+        expiry = IdleExpiry(timeout=10.0)
+        idle = await _session(manager, "A1", idle=11.0)
+        active = await _session(manager, "B1")
+        for session in (idle, active):
+            expiry.watch(session, manager)
+
+        assert await expiry.expire() == 1
+        assert manager.get_player_ids() == ["B1"]
+        assert not idle.is_connected
+        assert len(expiry) == 1
+
+    async def test_activity_rearms_deadline(self):
+        """Aktivní relace se při splatnosti jen znovu zařadí (s novým deadline)."""
+        manager = WebSocketManager()
+        expiry = IdleExpiry(timeout=10.0)
+        session = await _session(manager, "A1")
+        expiry.watch(session, manager)
+        start = session.last_activity
+
+        session.last_activity = start + 8.0  # zpráva v 8. sekundě
+        assert expiry.pop_expired(now=start + 10.5) == []
+        assert expiry.rearmed == 1
+        assert expiry.pop_expired(now=start + 17.9) == []
+        assert expiry.pop_expired(now=start + 18.1) == [(session, manager)]
+
+    async def test_removed_sessions_are_discarded(self):
+        """Relace, která odešla (nebo byla nahrazena), se v haldě líně zahodí."""
+        manager = WebSocketManager()
+        expiry = IdleExpiry(timeout=10.0)
+        session = await _session(manager, "A1", idle=20.0)
+        expiry.watch(session, manager)
+        await manager.remove(session)
+        replacement = await _session(manager, "A1", idle=20.0)
+
+        assert expiry.pop_expired() == []
+        assert manager.get_session("A1") is replacement
+        assert len(expiry) == 0
+
+    async def test_run_wakes_at_deadline(self):
+        """Smyčka spí do nejbližšího deadline a odpojí relaci bez pravidelného skenu."""
+        manager = WebSocketManager()
+        expiry = IdleExpiry(timeout=0.05)
+        expiry.start()
+        session = await _session(manager, "A1")
+        expiry.watch(session, manager)
+
+        await asyncio.sleep(0.02)
+        assert manager.get_player_count() == 1
+        await asyncio.sleep(0.08)
+        assert manager.get_player_count() == 0
+        assert expiry.expired == 1
+        await expiry.stop()
+        assert not expiry.is_running
+
+    async def test_expiry_cost_does_not_scan_all_sessions(self):
+        """Probuzení projde jen splatné záznamy, ne všechny relace."""
+        manager = WebSocketManager()
+        expiry = IdleExpiry(timeout=10.0)
+        now = time.monotonic()
+        for i in range(1000):
+            session = PlayerSession(Mock(), f"P{i}")
+            session.last_activity = now - (11.0 if i < 3 else 0.0)
+            manager.sessions[session.player_id] = session
+            expiry.watch(session, manager)
+
+        assert await expiry.expire(now) == 3
+        assert expiry.rearmed == 0
+        assert len(expiry) == 997
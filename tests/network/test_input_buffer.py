@@ -0,0 +1,144 @@
+"""
+Testy jitter bufferu číslovaných vstupů (InputBuffers) a potvrzení ve snapshotu.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.server.game_loop import GameLoop
+from multipong.network.server.input_buffer import InputBuffers, PlayerInputBuffer
+from multipong.network.server.input_table import INPUT_DOWN, INPUT_UP, InputTable
+
+
+def _game_loop():
+    """GameLoop s běžícím enginem a mock managerem."""
+    engine = MultipongEngine(num_players_per_team=2)
+    engine.start()
+    manager = Mock()
+    manager.broadcast = AsyncMock(return_value=1)
+    return GameLoop(engine, manager, tick_rate=60, sim_rate=60)
+
+
+class TestPlayerInputBuffer:
+    """Testy fronty rámců jednoho hráče."""
+
+    def test_duplicate_and_old_frames_are_rejected(self):
+        """Rámec se stejným nebo nižším seq se zahodí."""
+        buffer = PlayerInputBuffer(min_delay=1, max_delay=6, capacity=8)
+
+        assert buffer.push(5, INPUT_UP, None, 0) is True
+        assert buffer.push(5, INPUT_UP, None, 0) is False
+        assert buffer.push(3, 0, None, 0) is False
+        assert len(buffer) == 1
+
+    def test_one_frame_per_step(self):
+        """Stisk a puštění v jednom ticku se aplikují v po sobě jdoucích krocích."""
+        buffer = PlayerInputBuffer(min_delay=1, max_delay=6, capacity=8)
+        buffer.push(1, INPUT_UP, None, 10)
+        buffer.push(2, 0, None, 10)
+
+        assert buffer.pop(11) == INPUT_UP
+        assert buffer.last_seq == 1
+        assert buffer.pop(12) == 0
+        assert buffer.last_seq == 2
+        assert buffer.pop(13) is None
+
+    def test_frames_wait_for_their_step(self):
+        """Rámec s tickem se aplikuje až v kroku tick + posun + delay."""
+        buffer = PlayerInputBuffer(min_delay=2, max_delay=6, capacity=8)
+        buffer.push(1, INPUT_DOWN, tick=100, step=105)  # posun hodin 5 kroků
+
+        assert buffer.pop(106) is None
+        assert buffer.pop(107) == INPUT_DOWN
+
+    def test_delay_adapts_to_jitter(self):
+        """Pravidelné rámce drží minimální zpoždění, rozkolísané ho zvýší (max. max_delay)."""
+        buffer = PlayerInputBuffer(min_delay=1, max_delay=6, capacity=64)
+        step = 0
+        for seq in range(1, 41):
+            step += 2
+            buffer.push(seq, 0, tick=step - 3, step=step)
+            buffer.pop(step)
+        assert buffer.delay == 1
+
+        for seq in range(41, 201):
+            step += 2
+            lag = 3 + (seq * 7) % 9  # zpoždění 3–11 kroků
+            buffer.push(seq, 0, tick=step - lag, step=step)
+            buffer.pop(step)
+        assert 1 < buffer.delay <= 6
+
+        for seq in range(201, 401):
+            step += 2
+            buffer.push(seq, 0, tick=step - 3 - (seq % 2) * 40, step=step)
+            buffer.pop(step)
+        assert buffer.delay == 6
+
+    def test_backlog_is_bounded_by_max_delay(self):
+        """Nahromaděné splatné rámce se dohánějí zahozením nejstarších."""
+        buffer = PlayerInputBuffer(min_delay=1, max_delay=3, capacity=32)
+        for seq in range(1, 11):
+            buffer.push(seq, 0, None, 0)
+
+        assert buffer.pop(1) == 0
+        assert buffer.last_seq == 8
+        assert len(buffer) == 2
+        assert buffer.dropped_frames == 7
+
+
+class TestInputBuffers:
+    """Testy bufferů místnosti zapisujících do InputTable."""
+
+    def test_advance_writes_table_and_acks(self):
+        """Splatný rámec se zapíše do tabulky a potvrdí jeho seq."""
+        table = InputTable(["A1", "B1"])
+        buffers = InputBuffers(table, min_delay=1, max_delay=4)
+        buffers.push("A1", 7, True, False, None, 0)
+
+        buffers.advance(1)
+
+        assert table["A1"] == {"up": True, "down": False}
+        assert buffers.acks == {"A1": [7, None]}
+
+        buffers.clear("A1")
+        assert buffers.acks == {}
+        assert buffers.get("A1") is None
+
+
+@pytest.mark.asyncio
+class TestGameLoopInputs:
+    """Testy číslovaných vstupů v GameLoop."""
+
+    async def test_short_press_is_not_lost(self):
+        """Stisk a puštění mezi dvěma ticky pohne pálkou a oba se potvrdí."""
+        game_loop = _game_loop()
+        paddle = game_loop.engine.paddles["A1"]
+        game_loop.update_input("A1", False, False)
+        start_y = paddle.y
+
+        game_loop.queue_input("A1", 1, True, False)
+        game_loop.queue_input("A1", 2, False, False)
+        await game_loop.run_tick(2)
+
+        assert paddle.y < start_y
+        assert game_loop.player_inputs["A1"] == {"up": False, "down": False}
+        assert game_loop.last_snapshot["input_acks"] == {"A1": [2, None]}
+
+    async def test_snapshot_echoes_last_processed_seq(self):
+        """Snapshot nese input_acks [seq, tick] jen pro hráče s číslovanými vstupy."""
+        game_loop = _game_loop()
+        await game_loop.run_tick(1)
+        assert "input_acks" not in game_loop.last_snapshot
+
+        game_loop.queue_input("B1", 3, False, True, tick=0)
+        while "input_acks" not in game_loop.last_snapshot:
+            await game_loop.run_tick(1)
+        assert game_loop.last_snapshot["input_acks"] == {"B1": [3, 0]}
+
+        # Vstup platí dál – tick potvrzení roste s každým krokem
+        await game_loop.run_tick(2)
+        assert game_loop.last_snapshot["input_acks"] == {"B1": [3, 2]}
+        game_loop.clear_input("B1")
+        await game_loop.run_tick(1)
+        assert "input_acks" not in game_loop.last_snapshot
@@ -0,0 +1,77 @@
+"""
+Testy tabulky vstupů (InputTable) a přímého zápisu vstupů z WebSocketu.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.server.input_table import INPUT_ACTIVE, INPUT_UP, InputTable
+
+
+class TestInputTable:
+    """Testy tabulky vstupů."""
+
+    def test_mapping_of_active_slots(self):
+        """Tabulka se chová jako mapa vstupů jen pro pozice ovládané hráčem."""
+        table = InputTable(["A1", "A2", "B1"])
+        assert len(table) == 0
+        assert "A1" not in table
+
+        assert table.set("A1", True, False) is True
+        assert table.set("A1", True, False) is False
+        table.set("B1", False, False)
+
+        assert table == {"A1": {"up": True, "down": False}, "B1": {"up": False, "down": False}}
+        assert list(table) == ["A1", "B1"]
+        assert table.bits("A1") == INPUT_ACTIVE | INPUT_UP
+        with pytest.raises(KeyError):
+            table["A2"]
+
+    def test_clear_and_version(self):
+        """Uvolnění pozice ji vyřadí z mapy, verze roste jen při změně."""
+        table = InputTable(["A1"])
+        table.set("A1", False, True)
+        table.set("C9", True, False)  # neznámá pozice se přidá
+        version = table.version
+
+        assert table.clear("A1") is True
+        assert table.clear("A1") is False
+        assert table.clear("X1") is False
+        assert table.version == version + 1
+        assert dict(table) == {"C9": {"up": True, "down": False}}
+
+        table.clear_all()
+        assert len(table) == 0
+
+    def test_engine_reads_table(self):
+        """Engine čte tabulku přímo – neovládaná pozice zůstává AI."""
+        engine = MultipongEngine(num_players_per_team=2)
+        engine.start()
+        table = InputTable(engine.paddles)
+        start_y = engine.paddles["A1"].y
+
+        table.set("A1", False, True)
+        for _ in range(10):
+            engine.update(table)
+
+        assert engine.paddles["A1"].y > start_y
+
+
+class TestInputMessages:
+    """Zpráva input se zapíše do tabulky místnosti hned při příjmu."""
+
+    def test_input_message_updates_room_table(self):
+        """Po zprávě input je vstup v tabulce bez synchronizační smyčky."""
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/inputs/A1") as ws:
+                ws.receive_json()
+                ws.send_json({"type": "input", "up": True, "down": False})
+                ws.send_json({"type": "ping", "ping_id": "sync"})
+                while ws.receive_json().get("type") != "pong":
+                    pass
+
+                room = websocket_server.rooms.get("inputs")
+                assert room.game_loop.player_inputs["A1"] == {"up": True, "down": False}
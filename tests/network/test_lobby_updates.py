@@ -0,0 +1,167 @@
+"""
+Testy slučovaných a verzovaných lobby_update zpráv (lobby_diff, LobbyBroadcaster).
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+from fastapi.testclient import TestClient
+
+from multipong.network.lobby_diff import apply_lobby_update, build_lobby_update, compute_lobby_diff
+from multipong.network.server.lobby import Lobby
+from multipong.network.server.lobby_updates import LobbyBroadcaster
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.websocket_manager import WebSocketManager
+
+
+def _sent(websocket):
+    """Zprávy odeslané relaci (dekódovaný JSON)."""
+    return [json.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+
+
+async def _room(players=("A1", "B1"), window=0.02):
+    """Lobby, manager s relacemi a broadcaster; vrací i websockety relací."""
+    lobby = Lobby()
+    manager = WebSocketManager()
+    sockets = {}
+    for player_id in players:
+        sockets[player_id] = AsyncMock()
+        await manager.add(PlayerSession(sockets[player_id], player_id))
+    return lobby, manager, LobbyBroadcaster(lobby, manager, window=window), sockets
+
+
+class TestLobbyDiff:
+    """Testy výpočtu a aplikace diffů."""
+
+    @pytest.mark.asyncio
+    async def test_diff_carries_only_changed_slots_and_keys(self):
+        """Diff obsahuje jen změněné sloty a klíče a aplikuje se na předchozí verzi."""
+        lobby = Lobby()
+        await lobby.add_player("p1", "Alice")
+        await lobby.assign_slot("p1", "A1")
+        old = lobby.get_lobby_state()
+        await lobby.assign_slot("p1", "B2")
+        await lobby.set_ready("p1", True)
+        new = lobby.get_lobby_state()
+
+        diff = compute_lobby_diff(old, new)
+
+        assert set(diff) == {"slots", "ready_players"}
+        assert set(diff["slots"]) == {"A1", "B2"}
+        client = apply_lobby_update({}, build_lobby_update(old, 3))
+        client = apply_lobby_update(client, build_lobby_update(new, 4, diff))
+        assert client == {"version": 4, **new}
+
+    def test_version_gap_and_stale_diffs(self):
+        """Diff na chybějící verzi vrátí None, už obsažený diff se ignoruje."""
+        state = {"version": 5, "slots": {}, "ready_players": []}
+
+        assert apply_lobby_update(state, {"type": "lobby_update", "version": 7, "base_version": 6}) is None
+        assert apply_lobby_update({}, {"type": "lobby_update", "version": 1, "base_version": 0}) is None
+        assert apply_lobby_update(state, {"type": "lobby_update", "version": 5, "base_version": 4}) is state
+
+    def test_unversioned_message_is_full_state(self):
+        """Zpráva bez verze (plný stav) stav nahradí."""
+        assert apply_lobby_update({"version": 2}, {"type": "lobby_update", "slots": {"A1": {}}}) == {
+            "slots": {"A1": {}}
+        }
+
+
+@pytest.mark.asyncio
+class TestLobbyBroadcaster:
+    """Testy slučování rozesílání."""
+
+    async def test_changes_within_window_are_coalesced(self):
+        """Změny v jednom okně odejdou jako jeden diff všem relacím."""
+        lobby, manager, updates, sockets = await _room()
+        for i in range(4):
+            await lobby.add_player(f"p{i}", f"Hráč {i}")
+            await lobby.assign_slot(f"p{i}", f"A{i + 1}")
+            updates.mark_dirty()
+
+        await asyncio.sleep(0.05)
+        await manager.flush()
+
+        messages = _sent(sockets["A1"])
+        assert len(messages) == 1
+        assert messages[0]["version"] == 1 and messages[0]["base_version"] == 0
+        assert set(messages[0]["slots"]) == {"A1", "A2", "A3", "A4"}
+        assert "settings" not in messages[0]
+        assert _sent(sockets["B1"]) == messages
+        assert updates.changes_coalesced == 3
+
+    async def test_no_change_sends_nothing(self):
+        """Bez změny stavu se nic nerozesílá ani se nezvyšuje verze."""
+        lobby, manager, updates, sockets = await _room()
+
+        assert updates.flush() == 0
+        assert updates.version == 0
+
+    async def test_full_state_for_new_session_then_diffs(self):
+        """Nová relace dostane plný stav poslední verze a naváže na další diff."""
+        lobby, manager, updates, sockets = await _room(players=("A1",))
+        await lobby.add_player("p1", "Alice")
+        await lobby.assign_slot("p1", "A1")
+        assert updates.flush() == 1
+        socket = AsyncMock()
+        session = PlayerSession(socket, "B1")
+        await manager.add(session)
+
+        await lobby.add_player("p2", "Bob")
+        await lobby.assign_slot("p2", "B1")
+        updates.send_full(session)
+        updates.mark_dirty()
+        await asyncio.sleep(0.05)
+        await manager.flush()
+
+        state = {}
+        for message in _sent(socket):
+            state = apply_lobby_update(state, message)
+        assert state == {"version": 2, **lobby.get_lobby_state()}
+
+    async def test_cancel_drops_pending_update(self):
+        """Zrušení místnosti zruší naplánované rozeslání."""
+        lobby, manager, updates, sockets = await _room()
+        await lobby.add_player("p1", "Alice")
+        updates.mark_dirty()
+
+        updates.cancel()
+        await asyncio.sleep(0.05)
+
+        assert not updates.pending
+        assert updates.version == 0
+
+
+class TestLobbyProtocol:
+    """Lobby zprávy přes WebSocket server."""
+
+    def test_join_gets_full_state_and_resync(self):
+        """join_lobby vrátí plný stav, změny chodí jako diff, lobby_sync pošle plný stav znovu."""
+        from multipong.network.server import websocket_server
+
+        def receive_lobby(ws):
+            while True:
+                message = ws.receive_json()
+                if message.get("type") == "lobby_update":
+                    return message
+
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/lobbydiff/A1") as ws:
+                ws.receive_json()
+                ws.send_json({"type": "join_lobby", "player_name": "Alice"})
+                full = receive_lobby(ws)
+                assert full["full"] is True and len(full["slots"]) == 8
+                state = apply_lobby_update({}, full)
+
+                ws.send_json({"type": "choose_slot", "slot": "A3"})
+                diff = receive_lobby(ws)
+                assert diff["base_version"] == full["version"]
+                assert list(diff["slots"]) == ["A3"]
+                state = apply_lobby_update(state, diff)
+                assert state["slots"]["A3"]["nickname"] == "Alice"
+
+                ws.send_json({"type": "lobby_sync"})
+                resync = receive_lobby(ws)
+                assert apply_lobby_update({}, resync) == state
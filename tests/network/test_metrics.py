@@ -0,0 +1,128 @@
+"""
+Testy metrik serveru (textový formát Prometheus, endpoint /metrics).
+"""
+
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from multipong.engine.profiling import Histogram
+from multipong.network.server.metrics import MetricsWriter
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.websocket_manager import WebSocketManager
+
+
+def _samples(text):
+    """Rozparsuje vzorky metrik {"název{labely}": hodnota} (bez HELP/TYPE)."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = float(value)
+    return samples
+
+
+class TestMetricsWriter:
+    """Testy skládání textového formátu."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Koše histogramu jsou kumulativní a končí +Inf se součtem vzorků."""
+        histogram = Histogram((0.001, 0.01))
+        for seconds in (0.0005, 0.002, 0.003, 0.5):
+            histogram.record(seconds)
+        writer = MetricsWriter()
+
+        writer.histogram("tick_seconds", "Doba ticku", histogram.to_dict(), (("room", "r1"),))
+        text = writer.render()
+
+        assert "# TYPE multipong_tick_seconds histogram" in text
+        samples = _samples(text)
+        assert samples['multipong_tick_seconds_bucket{room="r1",le="0.001"}'] == 1
+        assert samples['multipong_tick_seconds_bucket{room="r1",le="0.01"}'] == 3
+        assert samples['multipong_tick_seconds_bucket{room="r1",le="+Inf"}'] == 4
+        assert samples['multipong_tick_seconds_count{room="r1"}'] == 4
+        assert samples['multipong_tick_seconds_sum{room="r1"}'] == pytest.approx(0.5055)
+
+    def test_help_and_type_once_per_metric(self):
+        """Více vzorků jedné metriky sdílí HELP/TYPE, labely se escapují."""
+        writer = MetricsWriter()
+        writer.counter("bytes_sent", "Bajty", 10, (("room", "a"),))
+        writer.counter("bytes_sent", "Bajty", 20, (("room", 'b"x'),))
+
+        text = writer.render()
+
+        assert text.count("# TYPE multipong_bytes_sent counter") == 1
+        assert 'multipong_bytes_sent_total{room="b\\"x"} 20' in text
+
+
+class TestTraffic:
+    """Testy počítadel provozu místnosti."""
+
+    @pytest.mark.asyncio
+    async def test_traffic_survives_removed_sessions(self):
+        """Provoz odebrané relace zůstane v počítadlech místnosti."""
+        manager = WebSocketManager()
+        session = PlayerSession(websocket=None, player_id="A1")
+        await manager.add(session)
+        session.record_received(12)
+        session.bytes_sent = 100
+        session.messages_sent = 2
+
+        await manager.remove(session)
+        other = PlayerSession(websocket=None, player_id="B1")
+        await manager.add(other)
+        other.record_received(3)
+
+        assert manager.get_traffic() == {
+            "messages_sent": 2,
+            "bytes_sent": 100,
+            "messages_received": 2,
+            "bytes_received": 15,
+        }
+
+
+class TestMetricsEndpoint:
+    """Scrape /metrics z běžícího serveru."""
+
+    def test_scrape_reports_room_traffic_and_ticks(self):
+        """Po připojení a vstupu hráče /metrics hlásí relaci, zprávy a ticky."""
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/metrics/A1") as ws:
+                ws.receive_json()
+                ws.send_json({"type": "input", "up": True, "down": False})
+                ws.send_json({"type": "ping", "ping_id": "sync"})
+                while ws.receive_json().get("type") != "pong":
+                    pass
+                while ws.receive_json().get("type") != "snapshot":
+                    pass
+
+                response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        samples = _samples(response.text)
+        room = '{room="metrics"}'
+        assert samples["multipong_rooms"] >= 2
+        assert samples[f"multipong_sessions{room}"] == 1
+        assert samples['multipong_messages_received_total{room="metrics",type="input"}'] == 1
+        assert samples[f"multipong_bytes_received_total{room}"] > 0
+        assert samples[f"multipong_messages_sent_total{room}"] > 0
+        assert samples[f"multipong_tick_duration_seconds_count{room}"] > 0
+        assert samples[f"multipong_broadcast_fanout_seconds_count{room}"] > 0
+        assert f"multipong_send_queue_depth{room}" in samples
+        assert "multipong_db_write_duration_seconds_count" in samples
+        assert all(re.fullmatch(r"[a-zA-Z_:][a-zA-Z0-9_:]*(\{.*\})?", key) for key in samples)
+
+    def test_scrape_parses_with_prometheus_client(self):
+        """Výstup je čitelný parserem prometheus_client (pokud je nainstalován)."""
+        parser = pytest.importorskip("prometheus_client.parser")
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            text = client.get("/metrics").text
+
+        names = {family.name for family in parser.text_string_to_metric_families(text)}
+        assert {"multipong_rooms", "multipong_tick_jitter_seconds", "multipong_bytes_sent"} <= names
@@ -0,0 +1,125 @@
+"""
+Testy predikce vlastní pálky na klientu (PaddlePredictor) proti skutečnému serveru.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from multipong import settings
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.client.paddle_predictor import PaddlePredictor
+from multipong.network.server.game_loop import GameLoop
+
+
+def _game_loop():
+    """GameLoop 2v2 s míčkem mimo hru (pálky se pohybují jen podle vstupů)."""
+    engine = MultipongEngine(num_players_per_team=2)
+    engine.start()
+    manager = Mock()
+    manager.broadcast = AsyncMock(return_value=1)
+    return GameLoop(engine, manager, tick_rate=60, sim_rate=60)
+
+
+def _predictor(game_loop, player_id="A1"):
+    """Predictor nakonfigurovaný z handshake konfigurace serveru."""
+    predictor = PaddlePredictor(sim_rate=game_loop.sim_rate)
+    predictor.configure(game_loop.snapshots.build_config(), player_id)
+    return predictor
+
+
+def _pattern(tick):
+    """Vstup hráče v kroku ``tick`` – držení, krátké stisky i pauzy."""
+    phase = tick % 90
+    if phase < 25:
+        return True, False
+    if phase < 35:
+        return False, False
+    if phase < 70:
+        return False, True
+    return phase % 3 == 0, False  # stisky na jeden krok
+
+
+class TestPaddlePredictor:
+    """Testy lokální predikce."""
+
+    def test_moves_immediately_with_engine_rules(self):
+        """Odeslaný vstup pálku posune hned, stejně jako engine (včetně ořezu)."""
+        game_loop = _game_loop()
+        predictor = _predictor(game_loop)
+        start_y = game_loop.engine.paddles["A1"].y
+        predictor.reconcile(start_y, None, tick=10)
+
+        predictor.record_input(1, 11, True, False)
+        step = game_loop.engine.paddles["A1"].speed * settings.PHYSICS_REFERENCE_RATE / 60
+
+        assert predictor.predict(11) == start_y
+        assert predictor.predict(13) == pytest.approx(start_y - 2 * step)  # kroky 11 a 12
+        assert predictor.predict(10_000) == 0  # ořez na horní okraj arény
+
+    def test_ai_paddle_is_not_predicted(self):
+        """Pálka bez konfigurace (nebo řízená AI) se nepředpovídá."""
+        game_loop = _game_loop()
+        predictor = _predictor(game_loop, player_id="X9")
+        predictor.reconcile(100.0, None, tick=1)
+
+        assert not predictor.active
+        assert predictor.predict(5) is None
+        state = {"paddles": {"A1": {"y": 1.0}}}
+        assert predictor.apply(state, 5) is state
+
+    def test_apply_overrides_local_paddle(self):
+        """Předpovězené y se dosadí do pálek i týmů, ostatní pálky zůstanou."""
+        game_loop = _game_loop()
+        predictor = _predictor(game_loop)
+        predictor.reconcile(200.0, None, tick=1)
+        state = {
+            "paddles": {"A1": {"y": 100.0}, "B1": {"y": 50.0}},
+            "team_left": {"name": "A", "paddles": [{"player_id": "A1", "y": 100.0}]},
+        }
+
+        predicted = predictor.apply(state, 1)
+
+        assert predicted["paddles"]["A1"]["y"] == 200.0
+        assert predicted["paddles"]["B1"]["y"] == 50.0
+        assert predicted["team_left"]["paddles"][0]["y"] == 200.0
+        assert state["paddles"]["A1"]["y"] == 100.0
+
+
+@pytest.mark.asyncio
+class TestReconciliation:
+    """Predikce proti skutečnému GameLoop se zpožděním sítě."""
+
+    @pytest.mark.parametrize("latency", [3, 6])
+    async def test_prediction_matches_server(self, latency):
+        """Se stálou latencí se předpověď po srovnání shoduje se serverem."""
+        game_loop = _game_loop()
+        predictor = _predictor(game_loop)
+        index = [p["player_id"] for p in game_loop.snapshots.get_config()["team_left"]["paddles"]].index("A1")
+
+        to_server = []  # (krok doručení, seq, up, down, tick)
+        to_client = []  # (krok doručení, snapshot)
+        seq = 0
+        last_input = None
+        errors = []
+        for tick in range(1, 600):
+            for frame in [f for f in to_server if f[0] == tick]:
+                game_loop.queue_input("A1", *frame[1:])
+            await game_loop.run_tick(1)
+            to_client.append((tick + latency, game_loop.last_snapshot))
+
+            for _, snapshot in [m for m in to_client if m[0] == tick]:
+                ack = snapshot.get("input_acks", {}).get("A1")
+                predictor.reconcile(snapshot["paddles"][index], ack, tick)
+                if ack is not None and predictor.acked_seq and predictor.acked_seq > 2:
+                    errors.append(predictor.last_error)
+
+            up, down = _pattern(tick)
+            if tick > 20 and ((up, down) != last_input or tick % 3 == 0):
+                seq += 1
+                predictor.record_input(seq, tick, up, down)
+                to_server.append((tick + latency, seq, up, down, tick))
+                last_input = (up, down)
+
+        assert len(errors) > 400
+        assert max(errors) < 1e-6
+        assert game_loop.input_buffers.get("A1").late_frames == 0
@@ -0,0 +1,134 @@
+"""
+Testy limitů příchozích zpráv spojení (MessageLimiter, TokenBucket).
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from multipong.network.server.rate_limit import (
+    CLOSE_MESSAGE_TOO_BIG,
+    MessageLimiter,
+    TokenBucket,
+    sniff_message_type,
+)
+
+
+LIMITS = {
+    "input": {"rate": 10, "burst": 3, "policy": "drop"},
+    "chat": {"rate": 1, "burst": 1, "policy": "disconnect"},
+    "ping": {"rate": 0},
+    "*": {"rate": 1, "burst": 2},
+}
+
+
+def _message(msg_type, **fields):
+    """JSON text zprávy daného typu."""
+    return json.dumps({"type": msg_type, **fields})
+
+
+class TestTokenBucket:
+    """Testy token bucketu."""
+
+    def test_burst_then_refill(self):
+        """Kbelík pustí burst naráz a pak jen rychlostí rate."""
+        bucket = TokenBucket(rate=10, burst=3, now=0.0)
+
+        assert [bucket.take(0.0) for _ in range(4)] == [True, True, True, False]
+        assert not bucket.take(0.05)
+        assert bucket.take(0.1)
+        assert bucket.take(10.0) and bucket.tokens == pytest.approx(2.0)
+
+
+class TestMessageLimiter:
+    """Testy limitů spojení."""
+
+    def test_sniff_message_type(self):
+        """Typ se přečte z textu; hodnota uvnitř řetězce se nepočítá."""
+        assert sniff_message_type('{"up": true, "type" : "input"}') == "input"
+        assert sniff_message_type(_message("chat", message='"type":"ping"')) == "chat"
+        assert sniff_message_type('{"kind": "input"}') is None
+
+    def test_rate_limit_per_type(self):
+        """Každý typ má vlastní kbelík; nad limitem se vrátí politika kbelíku."""
+        limiter = MessageLimiter(LIMITS, max_size=256)
+        text = _message("input", up=True)
+
+        results = [limiter.admit(text, len(text), now=0.0) for _ in range(4)]
+        chat = _message("chat", message="ahoj")
+
+        assert results[:3] == [None] * 3
+        assert results[3] == ("input", "rate", "drop")
+        assert limiter.admit(chat, len(chat), now=0.0) is None
+        assert limiter.admit(chat, len(chat), now=0.1) == ("chat", "rate", "disconnect")
+        assert limiter.rejected == 2
+
+    def test_unlimited_and_default_limits(self):
+        """rate 0 = bez limitu, typy bez nastavení sdílí kbelík "*"."""
+        limiter = MessageLimiter(LIMITS, max_size=256)
+        ping = _message("ping")
+        for _ in range(100):
+            assert limiter.admit(ping, len(ping), now=0.0) is None
+
+        results = [limiter.admit(_message(t), 20, now=0.0) for t in ("set_ready", "join_lobby", "bogus")]
+
+        assert results[:2] == [None, None]
+        assert results[2] == ("bogus", "rate", "drop")
+
+    def test_oversized_message_disconnects_without_parsing(self):
+        """Příliš velká zpráva se odmítne s politikou disconnect."""
+        limiter = MessageLimiter(LIMITS, max_size=64)
+        text = _message("chat", message="x" * 100)
+
+        assert limiter.admit(text, len(text)) == ("unknown", "size", "disconnect")
+
+    def test_recheck_charges_real_type(self):
+        """Zpráva, jejíž typ z textu neodpovídá dekódovanému, se účtuje skutečnému typu."""
+        limiter = MessageLimiter(LIMITS, max_size=256)
+        # Duplicitní klíč: regulární výraz vidí první "type", json.loads poslední
+        text = '{"type": "ping", "type": "input"}'
+
+        for _ in range(3):
+            assert limiter.admit(text, len(text), now=0.0) is None
+            assert limiter.recheck(json.loads(text)["type"], now=0.0) is None
+        limiter.admit(text, len(text), now=0.0)
+
+        assert limiter.recheck("input", now=0.0) == ("input", "rate", "drop")
+        assert limiter.recheck("input", now=0.0) is None  # stejná zpráva se neúčtuje dvakrát
+
+
+class TestServerLimits:
+    """Limity v obsluze WebSocket spojení."""
+
+    def test_flood_is_dropped_and_counted(self):
+        """Zprávy nad limit se zahodí, spojení zůstane a odmítnutí jsou v metrikách."""
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/ratelimit/A1") as ws:
+                ws.receive_json()
+                for i in range(20):
+                    ws.send_json({"type": "chat", "message": f"spam {i}"})
+                ws.send_json({"type": "ping", "ping_id": "p1"})
+                while ws.receive_json().get("type") != "pong":
+                    pass
+
+                rejected = websocket_server.telemetry.rejected
+                assert rejected[("ratelimit", "chat", "rate")] >= 10
+                metrics = client.get("/metrics").text
+                assert 'multipong_messages_rejected_total{room="ratelimit",type="chat",reason="rate"}' in metrics
+
+    def test_oversized_message_closes_connection(self):
+        """Příliš velká zpráva ukončí spojení kódem 1009."""
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/ratelimit2/A1") as ws:
+                ws.receive_json()
+                ws.send_text(_message("chat", message="x" * 10_000))
+                with pytest.raises(WebSocketDisconnect) as excinfo:
+                    while True:
+                        ws.receive_json()
+                assert excinfo.value.code == CLOSE_MESSAGE_TOO_BIG
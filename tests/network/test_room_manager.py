@@ -0,0 +1,247 @@
+"""
+Unit testy pro Room a RoomManager (více zápasů v jednom procesu).
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from fastapi.testclient import TestClient
+
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.room_manager import DEFAULT_ROOM_ID, Room, RoomManager
+from multipong.network.snapshot_codec import SNAPSHOT_SCHEMA_VERSION, decode_snapshot
+
+
+class TestRoom:
+    """Testy jedné místnosti."""
+
+    def test_room_has_own_components(self):
+        """Každá místnost má vlastní engine, relace, lobby i game loop."""
+        room_a = Room("a")
+        room_b = Room("b")
+
+        assert room_a.engine is not room_b.engine
+        assert room_a.manager is not room_b.manager
+        assert room_a.lobby is not room_b.lobby
+        assert room_a.game_loop.engine is room_a.engine
+        assert room_a.game_loop.snapshots is room_a.snapshots
+
+    def test_set_and_clear_input(self):
+        """Vstup hráče se zapíše přímo do tabulky vstupů game loopu."""
+        room = Room("a")
+
+        room.set_input("A1", True, False)
+        assert room.game_loop.player_inputs == {"A1": {"up": True, "down": False}}
+
+        room.clear_input("A1")
+        assert room.game_loop.player_inputs == {}
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """start() spustí game loop jako task, stop() ho ukončí."""
+        room = Room("a", tick_rate=120)
+        room.start()
+        assert room.is_running
+
+        await asyncio.sleep(0.05)
+        assert room.engine.sim_tick > 0
+
+        await room.stop()
+        assert not room.is_running
+
+
+class TestRoomManager:
+    """Testy správce místností."""
+
+    def test_create_without_start(self):
+        """Místnost lze vytvořit bez spuštění loopu (mimo event loop)."""
+        rooms = RoomManager()
+        room = rooms.create("r1", start=False)
+
+        assert room is not None
+        assert rooms.get("r1") is room
+        assert not room.is_running
+        assert rooms.get_room_count() == 1
+
+    def test_create_rejects_duplicate_and_invalid_id(self):
+        """Duplicitní nebo neplatné ID místnost nevytvoří."""
+        rooms = RoomManager()
+        rooms.create("r1", start=False)
+
+        assert rooms.create("r1", start=False) is None
+        assert rooms.create("bad id/..", start=False) is None
+        assert rooms.get_room_count() == 1
+
+    def test_room_limit(self):
+        """Po dosažení limitu se další místnost nevytvoří."""
+        rooms = RoomManager(max_rooms=2)
+        assert rooms.create(start=False) is not None
+        assert rooms.create(start=False) is not None
+        assert rooms.create(start=False) is None
+
+    def test_generated_ids_are_unique(self):
+        """Bez zadaného ID se generují unikátní ID."""
+        rooms = RoomManager()
+        ids = {rooms.create(start=False).room_id for _ in range(5)}
+        assert len(ids) == 5
+
+    def test_list_rooms(self):
+        """Přehled místností obsahuje ID, hráče i skóre."""
+        rooms = RoomManager()
+        rooms.create("b", start=False)
+        rooms.create("a", start=False)
+
+        listing = rooms.list_rooms()
+
+        assert [r["room_id"] for r in listing] == ["a", "b"]
+        assert listing[0]["players_count"] == 0
+        assert listing[0]["score"] == {"A": 0, "B": 0}
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_starts_room(self):
+        """get_or_create vytvoří a spustí místnost, podruhé vrátí tutéž."""
+        rooms = RoomManager()
+        room = rooms.get_or_create("r1")
+
+        assert room.is_running
+        assert rooms.get_or_create("r1") is room
+        await rooms.shutdown()
+        assert not room.is_running
+
+    @pytest.mark.asyncio
+    async def test_destroy_closes_sessions(self):
+        """Zrušení místnosti zastaví loop a odpojí její hráče."""
+        rooms = RoomManager()
+        room = rooms.create("r1")
+        websocket = Mock()
+        websocket.send_json = AsyncMock()
+        websocket.close = AsyncMock()
+        session = PlayerSession(websocket, "A1")
+        await room.manager.add(session)
+
+        assert await rooms.destroy("r1") is True
+
+        assert rooms.get("r1") is None
+        assert not room.is_running
+        assert room.manager.get_player_count() == 0
+        websocket.send_json.assert_awaited_with({"type": "room_closed", "room_id": "r1"})
+        websocket.close.assert_awaited_once()
+        assert await rooms.destroy("r1") is False
+
+    @pytest.mark.asyncio
+    async def test_disconnect_inactive_all_rooms(self):
+        """Timeout kontrola prochází všechny místnosti."""
+        rooms = RoomManager()
+        for room_id in ("r1", "r2"):
+            room = rooms.create(room_id, start=False)
+            session = PlayerSession(Mock(), "A1")
+            session.last_activity -= 60
+            room.manager.sessions["A1"] = session
+
+        assert await rooms.disconnect_inactive(timeout_seconds=10.0) == 2
+        assert rooms.get_player_count() == 0
+
+
+class TestRoomRouting:
+    """Směrování klientů do místností podle ID v cestě WebSocketu."""
+
+    def test_players_in_different_rooms_are_isolated(self):
+        """Stejný slot ve dvou místnostech nekoliduje."""
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/alpha/A1") as ws_alpha, \
+                    client.websocket_connect("/ws/beta/A1") as ws_beta:
+                connected_alpha = ws_alpha.receive_json()
+                connected_beta = ws_beta.receive_json()
+
+                assert connected_alpha["room_id"] == "alpha"
+                assert connected_beta["room_id"] == "beta"
+                assert connected_alpha["assigned_slot"] == "A1"
+                assert connected_beta["assigned_slot"] == "A1"
+
+                listing = client.get("/rooms").json()["rooms"]
+                ids = {r["room_id"] for r in listing}
+                assert {DEFAULT_ROOM_ID, "alpha", "beta"} <= ids
+
+            # Prázdné místnosti se po odpojení zruší
+            assert client.get("/rooms/alpha").status_code == 404
+            assert websocket_server.rooms.get(DEFAULT_ROOM_ID) is not None
+
+    def test_binary_snapshot_negotiation(self):
+        """Klient si v URL vyžádá binární snapshoty a dostává je jako bajty."""
+        from multipong.network.server import websocket_server
+        
+        with TestClient(websocket_server.app) as client:
+            url = f"/ws/bin/A1?snapshot_format=binary&snapshot_schema={SNAPSHOT_SCHEMA_VERSION}"
+            with client.websocket_connect(url) as ws, \
+                    client.websocket_connect("/ws/bin/B1") as ws_json:
+                connected = ws.receive_json()
+                assert connected["snapshot_format"] == "binary"
+                assert ws_json.receive_json()["snapshot_format"] == "json"
+                
+                while True:
+                    message = ws.receive()
+                    if message.get("bytes") is not None:
+                        break
+                snapshot = decode_snapshot(message["bytes"])
+                assert snapshot["type"] == "snapshot"
+                config = connected["match_config"]
+                paddle_count = len(config["team_left"]["paddles"]) + len(config["team_right"]["paddles"])
+                assert len(snapshot["paddles"]) == paddle_count
+    
+    def test_snapshot_rate_per_client_profile(self):
+        """Mobilní klient dostane nižší frekvenci snapshotů než hráč."""
+        from multipong.network.server import websocket_server
+        
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/rate/A1") as ws, \
+                    client.websocket_connect("/ws/rate/B1?client_profile=mobile") as ws_mobile:
+                player_rate = ws.receive_json()["snapshot_rate"]
+                mobile_rate = ws_mobile.receive_json()["snapshot_rate"]
+                
+                room = websocket_server.rooms.get("rate")
+                assert player_rate == room.manager.negotiate_snapshot_rate(None, "player")
+                assert mobile_rate == room.manager.negotiate_snapshot_rate(None, "mobile")
+                assert mobile_rate <= player_rate <= room.manager.tick_rate
+                intervals = {pid: s.snapshot_interval for pid, s in room.manager.sessions.items()}
+                assert intervals["A1"] == round(room.manager.tick_rate / player_rate)
+                assert intervals["B1"] == round(room.manager.tick_rate / mobile_rate)
+    
+    def test_delta_snapshots_after_ack(self):
+        """Klient s delta snapshoty dostane keyframe a po potvrzení delty."""
+        from multipong.network.server import websocket_server
+        
+        with TestClient(websocket_server.app) as client:
+            with client.websocket_connect("/ws/delta/A1?snapshot_delta=1") as ws:
+                assert ws.receive_json()["snapshot_delta"] is True
+                
+                message = ws.receive_json()
+                while message.get("type") != "snapshot":
+                    message = ws.receive_json()
+                assert "baseline" not in message
+                ws.send_json({"type": "ack", "seq": message["seq"]})
+                
+                for _ in range(200):
+                    delta = ws.receive_json()
+                    if "baseline" in delta:
+                        break
+                assert delta["baseline"] == message["seq"]
+                assert "score" not in delta
+    
+    def test_room_rest_endpoints(self):
+        """Vytvoření, detail a zrušení místnosti přes REST."""
+        from multipong.network.server import websocket_server
+
+        with TestClient(websocket_server.app) as client:
+            created = client.post("/rooms", params={"room_id": "rest-room"})
+            assert created.status_code == 201
+            assert created.json()["room_id"] == "rest-room"
+            assert client.post("/rooms", params={"room_id": "rest-room"}).status_code == 409
+
+            detail = client.get("/rooms/rest-room").json()
+            assert detail["lobby_status"]["players_count"] == 0
+
+            assert client.delete("/rooms/rest-room").status_code == 200
+            assert client.delete("/rooms/rest-room").status_code == 404
+            assert client.delete(f"/rooms/{DEFAULT_ROOM_ID}").status_code == 400
@@ -0,0 +1,233 @@
+"""
+Testy shardingu místností do worker procesů (ShardedRoomManager).
+"""
+
+import asyncio
+import json
+import queue
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.server.player_session import CLOSE_CODE_WORKER_LOST, PlayerSession
+from multipong.network.server.room_workers import (
+    RemoteRoom,
+    RoomWorkerPool,
+    ShardedRoomManager,
+    _PipeBroadcaster,
+)
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.snapshot_codec import decode_snapshot
+
+
+def _fake_pool(workers=2):
+    """Pool s frontami příkazů místo worker procesů (vše živé)."""
+    pool = RoomWorkerPool(workers=workers)
+    pool._processes = [Mock() for _ in range(workers)]
+    pool._outboxes = [queue.SimpleQueue() for _ in range(workers)]
+    pool.alive = [True] * workers
+    return pool
+
+
+def _drain(outbox):
+    """Příkazy zařazené do fronty workeru."""
+    messages = []
+    while not outbox.empty():
+        messages.append(outbox.get_nowait())
+    return messages
+
+
+class TestRoomPlacement:
+    """Umístění místností na workery (bez spouštění procesů)."""
+
+    def test_least_loaded_worker(self):
+        """Místnost jde na worker s nejmenším počtem místností."""
+        pool = RoomWorkerPool(workers=3)
+        pool.alive = [True, True, True]
+        pool.room_counts = [2, 0, 1]
+        assert pool.least_loaded() == 1
+
+        pool.room_counts = [1, 1, 1]
+        assert pool.least_loaded() == 0
+
+    def test_least_loaded_skips_dead_workers(self):
+        """Spadlý worker nové místnosti nedostává; bez živého workeru není kam umístit."""
+        pool = RoomWorkerPool(workers=2)
+        pool.alive = [False, True]
+        pool.room_counts = [0, 5]
+        assert pool.least_loaded() == 1
+
+        pool.alive = [False, False]
+        assert pool.least_loaded() is None
+
+    def test_send_only_queues(self):
+        """send() jen zařadí příkaz; zápis do roury dělá vlákno workeru."""
+        pool = _fake_pool(workers=1)
+        pool.send(0, ("destroy", "r1"))
+        assert _drain(pool._outboxes[0]) == [("destroy", "r1")]
+
+    def test_command_writer_survives_broken_pipe(self):
+        """Po chybě roury vlákno frontu jen vyprázdní a na konci rouru zavře."""
+        connection = Mock()
+        connection.send.side_effect = BrokenPipeError()
+        outbox = queue.SimpleQueue()
+        for message in (("input",), ("destroy",), None):
+            outbox.put(message)
+
+        RoomWorkerPool._write_commands(0, connection, outbox)
+
+        assert connection.send.call_count == 1
+        connection.close.assert_called_once()
+
+    def test_remote_room_forwards_only_changed_inputs(self):
+        """Vstupy se workeru posílají jen při změně."""
+        pool = Mock(spec=RoomWorkerPool)
+        room = RemoteRoom("r1", pool)
+        room.worker_id = 0
+
+        room.set_input("A1", True, False)
+        room.set_input("A1", True, False)
+        room.set_input("A1", False, False)
+        room.clear_input("A1")
+        room.clear_input("A1")
+
+        assert [c.args[1] for c in pool.send.call_args_list] == [
+            ("input", "r1", "A1", True, False),
+            ("input", "r1", "A1", False, False),
+            ("clear_input", "r1", "A1"),
+        ]
+
+    def test_remote_room_forwards_every_numbered_frame(self):
+        """Číslované rámce jdou workeru vždy (jitter buffer je ve workeru)."""
+        pool = Mock(spec=RoomWorkerPool)
+        room = RemoteRoom("r1", pool)
+        room.worker_id = 0
+
+        room.set_input("A1", True, False, seq=1, tick=10)
+        room.set_input("A1", True, False, seq=2, tick=11)
+
+        assert [c.args[1] for c in pool.send.call_args_list] == [
+            ("input", "r1", "A1", True, False, 1, 10),
+            ("input", "r1", "A1", True, False, 2, 11),
+        ]
+
+
+class TestSnapshotFormats:
+    """Worker kóduje jen formáty plných snapshotů, které gateway potřebuje."""
+
+    @pytest.mark.asyncio
+    async def test_worker_encodes_only_requested_formats(self):
+        """Bez nahlášených formátů jde jen slovník, pak jen požadované formáty."""
+        worker = Mock()
+        broadcaster = _PipeBroadcaster(worker, "r1")
+        snapshot = SnapshotBuilder(MultipongEngine()).build_snapshot()
+
+        await broadcaster.broadcast(snapshot)
+        broadcaster.formats = ("binary",)
+        await broadcaster.broadcast(snapshot)
+
+        first, second = [c.args[0] for c in worker.send.call_args_list]
+        assert first == ("snapshot", "r1", snapshot, {})
+        assert list(second[3]) == ["binary"]
+
+    @pytest.mark.asyncio
+    async def test_gateway_reports_formats_of_full_snapshot_sessions(self):
+        """Gateway nahlásí workeru formáty relací s plnými snapshoty, jen při změně."""
+        pool = Mock(spec=RoomWorkerPool)
+        room = RemoteRoom("r1", pool)
+        room.worker_id = 0
+        json_socket = Mock()
+        json_socket.send_text = AsyncMock()
+        await room.manager.add(PlayerSession(json_socket, "A1"))
+        await room.manager.add(PlayerSession(Mock(), "B1", snapshot_format="binary", snapshot_delta=True))
+
+        snapshots = SnapshotBuilder(MultipongEngine())
+        room.deliver_snapshot(snapshots.build_snapshot(), {})
+        room.deliver_snapshot(snapshots.build_snapshot(), {})
+
+        assert [c.args[1] for c in pool.send.call_args_list] == [("formats", "r1", ["json"])]
+
+
+class TestWorkerLoss:
+    """Místnosti spadlého workeru (bez spouštění procesů)."""
+
+    @pytest.mark.asyncio
+    async def test_rooms_move_to_live_worker(self):
+        """Místnost spadlého workeru se vytvoří na živém workeru a relace dostanou keyframe."""
+        pool = _fake_pool(workers=2)
+        room = RemoteRoom("r1", pool)
+        pool.place(room)
+        session = PlayerSession(Mock(), "A1")
+        await room.manager.add(session)
+        session.acked_seq = 42
+        room.set_input("A1", True, False)
+        _drain(pool._outboxes[0])
+
+        pool._dispatch(0, ("exit",))
+
+        assert room.worker_id == 1
+        assert pool.alive == [False, True]
+        assert pool.room_counts == [0, 1]
+        assert _drain(pool._outboxes[1]) == [("create", "r1", {})]
+        assert session.acked_seq is None
+        room.set_input("A1", True, False)  # vstup se novému workeru pošle znovu
+        assert _drain(pool._outboxes[1]) == [("input", "r1", "A1", True, False)]
+
+    @pytest.mark.asyncio
+    async def test_sessions_closed_without_live_worker(self):
+        """Bez živého workeru se hráči místnosti odpojí s chybovým kódem."""
+        pool = _fake_pool(workers=1)
+        room = RemoteRoom("r1", pool)
+        pool.place(room)
+        websocket = AsyncMock()
+        await room.manager.add(PlayerSession(websocket, "A1"))
+
+        pool._dispatch(0, ("exit",))
+        await asyncio.gather(*pool._closing)
+
+        assert not room.is_running
+        assert room.manager.get_player_count() == 0
+        assert websocket.send_json.await_args.args[0]["reason"] == "worker_lost"
+        websocket.close.assert_awaited_once_with(code=CLOSE_CODE_WORKER_LOST)
+
+
+class TestShardedRoomManager:
+    """Integrační test se skutečnými worker procesy."""
+
+    @pytest.mark.asyncio
+    async def test_rooms_run_in_workers(self):
+        """Místnosti se rozloží na workery a snapshoty dorazí hráčům v gateway."""
+        rooms = ShardedRoomManager(workers=2)
+        try:
+            created = [rooms.create(f"r{i}") for i in range(3)]
+            assert rooms.get_worker_loads() == [2, 1]
+            assert {room.worker_id for room in created} == {0, 1}
+
+            websocket = Mock()
+            websocket.send_text = AsyncMock()
+            session = PlayerSession(websocket, "A1")
+            await created[0].manager.add(session)
+            binary_websocket = Mock()
+            binary_websocket.send_bytes = AsyncMock()
+            await created[0].manager.add(PlayerSession(binary_websocket, "B1", snapshot_format="binary"))
+            created[0].set_input("A1", True, False)
+
+            config = await created[0].get_match_config()
+            assert "config_version" in config
+            assert config["arena"]
+
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if websocket.send_text.await_count >= 3 and binary_websocket.send_bytes.await_count:
+                    break
+            assert websocket.send_text.await_count >= 3
+            snapshot = json.loads(websocket.send_text.await_args.args[0])
+            assert snapshot["type"] == "snapshot"
+            binary = decode_snapshot(binary_websocket.send_bytes.await_args.args[0])
+            assert binary["config_version"] == snapshot["config_version"]
+
+            assert await rooms.destroy("r0")
+            assert rooms.get_worker_loads() == [1, 1]
+        finally:
+            await rooms.shutdown()
+        assert not rooms.pool.is_running
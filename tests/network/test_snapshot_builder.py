@@ -0,0 +1,114 @@
+"""
+Testy pro SnapshotBuilder (server) a SnapshotAssembler (klient).
+"""
+
+import json
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.client.snapshot_assembler import SnapshotAssembler
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+
+
+def _policy(engine, tick):
+    """Deterministické vstupy pro část slotů, zbytek řídí fallback AI."""
+    return {"A1": {"up": tick % 11 < 4, "down": tick % 7 == 0}}
+
+
+class TestSnapshotBuilder:
+    """Testy inkrementálních snapshotů."""
+
+    def test_assembled_state_matches_get_state(self):
+        """Konfigurace + dynamické snapshoty dají přesně get_state() každý tick."""
+        engine = MultipongEngine(num_players_per_team=2)
+        engine.start()
+        engine.ball.vx = -9.0
+        engine.ball.vy = -7.5
+        builder = SnapshotBuilder(engine)
+        assembler = SnapshotAssembler()
+        assembler.set_config(builder.build_config())
+
+        for tick in range(2000):
+            engine.update(_policy(engine, tick))
+            state = assembler.apply(builder.build_snapshot())
+            assert state.pop("type") == "snapshot"
+            assert state == engine.get_state()
+
+        # Scénář musí pokrýt zásahy i góly
+        assert engine.stats_version > 0
+        assert engine.score["A"] + engine.score["B"] > 0
+
+    def test_snapshot_has_no_static_fields(self):
+        """Snapshot neobsahuje arénu, branky ani rozměry pálek."""
+        engine = MultipongEngine(num_players_per_team=4)
+        snapshot = SnapshotBuilder(engine).build_snapshot()
+
+        for key in ("arena", "goal_left", "goal_right", "team_left", "team_right"):
+            assert key not in snapshot
+        assert snapshot["type"] == "snapshot"
+        assert len(snapshot["paddles"]) == len(engine.paddles)
+        assert "match_config" not in snapshot
+
+    def test_stats_sent_only_when_changed(self):
+        """Statistiky jsou v prvním snapshotu a pak jen po změně."""
+        engine = MultipongEngine()
+        builder = SnapshotBuilder(engine)
+
+        assert "stats" in builder.build_snapshot()
+        assert "stats" not in builder.build_snapshot()
+
+        left = engine.paddles["A1"]
+        engine.ball.x = left.x + left.width + engine.ball.radius + 1
+        engine.ball.y = left.y + left.height / 2
+        engine.ball.vx = -5.0
+        engine.update({})
+        assert left.stats.hits == 1
+
+        snapshot = builder.build_snapshot()
+        assert snapshot["stats"]["A1"] == [1, 0, 0]
+        assert "stats" not in builder.build_snapshot()
+
+    def test_invalidate_config_attaches_new_config(self):
+        """Po invalidaci nese nejbližší snapshot novou konfiguraci."""
+        engine = MultipongEngine()
+        builder = SnapshotBuilder(engine)
+        assembler = SnapshotAssembler()
+        assembler.set_config(builder.build_config())
+
+        engine.paddles["A1"].height = 150
+        builder.invalidate_config()
+        snapshot = builder.build_snapshot()
+
+        assert snapshot["config_version"] == 1
+        assert snapshot["match_config"]["team_left"]["paddles"][0]["height"] == 150
+        assert "match_config" not in builder.build_snapshot()
+
+        state = assembler.apply(snapshot)
+        assert state["paddles"]["A1"]["height"] == 150
+
+    def test_payload_much_smaller_than_full_state(self):
+        """Dynamický snapshot je řádově menší než plný stav."""
+        engine = MultipongEngine(num_players_per_team=4)
+        builder = SnapshotBuilder(engine)
+        builder.build_snapshot()  # první snapshot nese statistiky
+        engine.update({})
+
+        full = json.dumps({"type": "snapshot", **engine.get_state()})
+        incremental = json.dumps(builder.build_snapshot())
+
+        assert len(incremental) * 10 < len(full)
+
+
+class TestSnapshotAssembler:
+    """Testy skládání stavu na klientu."""
+
+    def test_waits_for_config(self):
+        """Bez konfigurace se snapshot nerozbalí."""
+        engine = MultipongEngine()
+        assembler = SnapshotAssembler()
+        assert assembler.apply(SnapshotBuilder(engine).build_snapshot()) is None
+
+    def test_legacy_full_snapshot_passes_through(self):
+        """Plný snapshot starého formátu projde beze změny."""
+        engine = MultipongEngine()
+        message = {"type": "snapshot", **engine.get_state()}
+        assert SnapshotAssembler().apply(message) is message
@@ -0,0 +1,202 @@
+"""
+Testy binárního formátu snapshotů (snapshot_codec).
+"""
+
+import json
+
+import pytest
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.client.snapshot_assembler import SnapshotAssembler
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.server.websocket_manager import encode_message
+from multipong.network.snapshot_codec import (
+    POSITION_SCALE,
+    SNAPSHOT_FORMAT_BINARY,
+    SNAPSHOT_FORMAT_JSON,
+    SNAPSHOT_SCHEMA_VERSION,
+    VELOCITY_SCALE,
+    SnapshotCodecError,
+    apply_delta,
+    compute_delta,
+    decode_snapshot,
+    encode_snapshot,
+    negotiate_snapshot_format,
+)
+
+
+def _running_builder():
+    """Engine 4v4 v běhu s míčkem mířícím na pálky (zásahy i góly)."""
+    engine = MultipongEngine(num_players_per_team=4)
+    engine.start()
+    engine.ball.vx = -9.0
+    engine.ball.vy = -7.5
+    return engine, SnapshotBuilder(engine)
+
+
+class TestSnapshotCodec:
+    """Testy kódování a dekódování binárních snapshotů."""
+
+    def test_round_trip_within_quantization(self):
+        """Dekódovaný snapshot odpovídá JSON snapshotu s přesností kvantizace."""
+        engine, builder = _running_builder()
+
+        for _ in range(600):
+            engine.update({})
+            snapshot = builder.build_snapshot()
+            decoded = decode_snapshot(encode_snapshot(snapshot))
+
+            assert decoded.keys() == snapshot.keys()
+            for key in ("type", "config_version", "score", "is_running", "rally_hits",
+                        "stats_version"):
+                assert decoded[key] == snapshot[key]
+            for actual, expected in zip(decoded["ball"][:2] + decoded["paddles"],
+                                        snapshot["ball"][:2] + snapshot["paddles"]):
+                assert abs(actual - expected) <= 0.5 / POSITION_SCALE
+            for actual, expected in zip(decoded["ball"][2:], snapshot["ball"][2:]):
+                assert abs(actual - expected) <= 0.5 / VELOCITY_SCALE
+            assert abs(decoded["time_left"] - snapshot["time_left"]) <= 0.0005
+            assert abs(decoded["goal_pause_remaining"] - snapshot["goal_pause_remaining"]) <= 0.0005
+            if "stats" in snapshot:
+                assert decoded["stats"] == snapshot["stats"]
+
+        assert engine.stats_version > 0
+
+    def test_match_config_is_carried(self):
+        """Snapshot po invalidaci nese celou konfiguraci zápasu."""
+        engine, builder = _running_builder()
+        builder.invalidate_config()
+        snapshot = builder.build_snapshot()
+
+        decoded = decode_snapshot(encode_snapshot(snapshot))
+
+        assert decoded["match_config"] == json.loads(json.dumps(snapshot["match_config"]))
+
+    def test_assembler_accepts_decoded_snapshot(self):
+        """Dekódovaný snapshot se složí do plného stavu jako JSON snapshot."""
+        engine, builder = _running_builder()
+        assembler = SnapshotAssembler()
+        assembler.set_config(builder.build_config())
+
+        engine.update({})
+        state = assembler.apply(decode_snapshot(encode_snapshot(builder.build_snapshot())))
+
+        assert state is not None
+        assert state["paddles"].keys() == engine.get_state()["paddles"].keys()
+        assert abs(state["ball"]["x"] - engine.ball.x) <= 0.5 / POSITION_SCALE
+
+    def test_binary_is_much_smaller_than_json(self):
+        """Běžný snapshot (bez statistik) je v binární podobě několikrát menší."""
+        engine, builder = _running_builder()
+        builder.build_snapshot()
+        engine.update({})
+        snapshot = builder.build_snapshot()
+        assert "stats" not in snapshot
+
+        binary = encode_snapshot(snapshot)
+
+        assert len(binary) * 4 < len(encode_message(snapshot).encode("utf-8"))
+
+    def test_out_of_range_values_are_clamped(self):
+        """Hodnoty mimo rozsah typu se oříznou místo výjimky."""
+        engine, builder = _running_builder()
+        snapshot = builder.build_snapshot()
+        snapshot["ball"] = [1e6, -1e6, 1e6, -1e6]
+
+        decoded = decode_snapshot(encode_snapshot(snapshot))
+
+        assert decoded["ball"][0] == 0x7FFF / POSITION_SCALE
+        assert decoded["ball"][1] == -0x8000 / POSITION_SCALE
+
+    def test_input_acks_round_trip(self):
+        """Potvrzené vstupní rámce projdou binárním snapshotem i deltou."""
+        engine, builder = _running_builder()
+        baseline = builder.build_snapshot(input_acks={"A1": [70000, 123456], "B2": [3, None]})
+        snapshot = builder.build_snapshot(input_acks={"A1": [70001, 123457], "B2": [3, None]})
+
+        assert decode_snapshot(encode_snapshot(snapshot))["input_acks"] == snapshot["input_acks"]
+        delta = decode_snapshot(encode_snapshot(compute_delta(baseline, snapshot)))
+        assert apply_delta(baseline, delta)["input_acks"] == {"A1": [70001, 123457], "B2": [3, None]}
+
+        released = builder.build_snapshot()
+        delta = decode_snapshot(encode_snapshot(compute_delta(snapshot, released)))
+        assert "input_acks" not in apply_delta(snapshot, delta)
+
+    def test_unknown_schema_is_rejected(self):
+        """Neznámá verze schématu vyvolá SnapshotCodecError."""
+        engine, builder = _running_builder()
+        data = bytearray(encode_snapshot(builder.build_snapshot()))
+        data[0] = SNAPSHOT_SCHEMA_VERSION + 1
+
+        with pytest.raises(SnapshotCodecError):
+            decode_snapshot(bytes(data))
+
+    def test_truncated_data_is_rejected(self):
+        """Useknutý rámec vyvolá SnapshotCodecError."""
+        engine, builder = _running_builder()
+        data = encode_snapshot(builder.build_snapshot())
+
+        for length in (0, 5, len(data) - 1):
+            with pytest.raises(SnapshotCodecError):
+                decode_snapshot(data[:length])
+
+
+class TestBinaryDelta:
+    """Testy binárního kódování delta snapshotů."""
+
+    def test_delta_round_trip(self):
+        """Binární delta se složí na stejný stav jako JSON delta."""
+        engine, builder = _running_builder()
+        baseline = builder.build_snapshot()
+        for _ in range(5):
+            engine.update({"A1": {"up": True, "down": False}})
+        snapshot = builder.build_snapshot()
+        delta = compute_delta(baseline, snapshot)
+
+        data = encode_snapshot(delta)
+        decoded = decode_snapshot(data)
+
+        assert decoded["baseline"] == baseline["seq"]
+        assert decoded.keys() == delta.keys()
+        assert apply_delta(baseline, decoded)["paddles"] == apply_delta(baseline, delta)["paddles"]
+        assert len(data) < len(encode_snapshot(snapshot))
+
+    def test_sparse_paddles_keep_length(self):
+        """Změna jen první pálky se nedekóduje jako zkrácený seznam."""
+        engine, builder = _running_builder()
+        baseline = builder.build_snapshot()
+        snapshot = dict(baseline, seq=baseline["seq"] + 1)
+        snapshot["paddles"] = [baseline["paddles"][0] + 8] + baseline["paddles"][1:]
+
+        decoded = decode_snapshot(encode_snapshot(compute_delta(baseline, snapshot)))
+
+        assert decoded["paddles"] == {0: snapshot["paddles"][0]}
+        assert apply_delta(baseline, decoded)["paddles"] == snapshot["paddles"]
+
+    def test_unchanged_state_is_tiny(self):
+        """Delta bez změn nese jen hlavičku."""
+        engine, builder = _running_builder()
+        baseline = builder.build_snapshot()
+        snapshot = dict(baseline, seq=baseline["seq"] + 1)
+        snapshot.pop("stats", None)
+
+        data = encode_snapshot(compute_delta(baseline, snapshot))
+
+        assert len(data) <= 12
+        assert decode_snapshot(data)["baseline"] == baseline["seq"]
+
+
+class TestNegotiation:
+    """Testy vyjednání formátu v handshake."""
+
+    def test_default_is_json(self):
+        """Bez požadavku klienta zůstává JSON."""
+        assert negotiate_snapshot_format(None) == SNAPSHOT_FORMAT_JSON
+        assert negotiate_snapshot_format("xml") == SNAPSHOT_FORMAT_JSON
+
+    def test_binary_with_matching_schema(self):
+        """Binární formát se přijme jen se známou verzí schématu."""
+        schema = str(SNAPSHOT_SCHEMA_VERSION)
+        assert negotiate_snapshot_format("binary") == SNAPSHOT_FORMAT_BINARY
+        assert negotiate_snapshot_format("binary", schema) == SNAPSHOT_FORMAT_BINARY
+        assert negotiate_snapshot_format("binary", "999") == SNAPSHOT_FORMAT_JSON
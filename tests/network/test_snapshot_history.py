@@ -0,0 +1,202 @@
+"""
+Testy delta snapshotů – SnapshotHistory (server) a skládání na klientu.
+"""
+
+import json
+import random
+
+import pytest
+from unittest.mock import AsyncMock
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.client.snapshot_assembler import SnapshotAssembler
+from multipong.network.server.player_session import PlayerSession
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.server.snapshot_history import SnapshotHistory
+from multipong.network.server.websocket_manager import WebSocketManager
+from multipong.network.snapshot_codec import apply_delta, compute_delta, decode_snapshot
+
+
+def _running_builder(num_players_per_team=2):
+    """Engine v běhu s míčkem mířícím na pálky (zásahy i góly)."""
+    engine = MultipongEngine(num_players_per_team=num_players_per_team)
+    engine.start()
+    engine.ball.vx = -9.0
+    engine.ball.vy = -7.5
+    return engine, SnapshotBuilder(engine)
+
+
+async def _delta_session(manager, player_id="A1", snapshot_format="json"):
+    """Relace s delta snapshoty a AsyncMock WebSocketem."""
+    session = PlayerSession(AsyncMock(), player_id, snapshot_format=snapshot_format, snapshot_delta=True)
+    await manager.add(session)
+    return session
+
+
+def _last_sent(session):
+    """Poslední snapshot odeslaný relaci (dekódovaný)."""
+    websocket = session.websocket
+    if session.snapshot_format == "binary":
+        return decode_snapshot(websocket.send_bytes.await_args.args[0])
+    return json.loads(websocket.send_text.await_args.args[0])
+
+
+class TestDelta:
+    """Testy compute_delta / apply_delta."""
+
+    def test_only_changed_fields(self):
+        """Delta nese jen změněná pole a změněné pálky."""
+        engine, builder = _running_builder()
+        baseline = builder.build_snapshot()
+        engine.paddles["A1"].y += 10
+        engine.update({})
+        snapshot = builder.build_snapshot()
+
+        delta = compute_delta(baseline, snapshot)
+
+        assert delta["baseline"] == baseline["seq"]
+        assert "score" not in delta
+        assert "rally_hits" not in delta
+        assert "ball" in delta
+        assert isinstance(delta["paddles"], dict)
+        assert apply_delta(baseline, json.loads(json.dumps(delta)))["paddles"] == snapshot["paddles"]
+
+
+class TestSnapshotHistory:
+    """Testy výběru baseline a keyframů."""
+
+    def test_history_is_bounded(self):
+        """Historie drží jen posledních N snapshotů."""
+        engine, builder = _running_builder()
+        history = SnapshotHistory(size=4)
+        for _ in range(10):
+            history.add(builder.build_snapshot())
+
+        assert len(history) == 4
+        assert history.get(6) is None
+        assert history.get(10)["seq"] == 10
+
+    def test_keyframe_until_ack_and_periodically(self):
+        """Bez potvrzení keyframe, po potvrzení delta, po intervalu opět keyframe."""
+        engine, builder = _running_builder()
+        history = SnapshotHistory(keyframe_interval=5)
+        session = PlayerSession(AsyncMock(), "A1", snapshot_delta=True)
+
+        first = builder.build_snapshot()
+        history.add(first)
+        assert history.baseline_for(session, first["seq"]) is None
+
+        session.ack_snapshot(first["seq"])
+        kinds = []
+        for _ in range(10):
+            snapshot = builder.build_snapshot()
+            history.add(snapshot)
+            kinds.append("delta" if history.baseline_for(session, snapshot["seq"]) else "keyframe")
+
+        assert kinds == ["delta"] * 4 + ["keyframe"] + ["delta"] * 4 + ["keyframe"]
+
+
+@pytest.mark.asyncio
+class TestDeltaBroadcast:
+    """Testy delta snapshotů přes WebSocketManager."""
+
+    async def test_keyframe_then_delta(self):
+        """Nová relace dostane keyframe se statistikami, po potvrzení delty."""
+        engine, builder = _running_builder()
+        manager = WebSocketManager()
+        await manager.broadcast(builder.build_snapshot())  # statistiky jdou v prvním snapshotu
+        session = await _delta_session(manager)
+
+        engine.update({})
+        await manager.broadcast(builder.build_snapshot())
+        await manager.flush()
+        keyframe = _last_sent(session)
+        assert "baseline" not in keyframe
+        assert "stats" in keyframe
+
+        session.ack_snapshot(keyframe["seq"])
+        engine.update({})
+        await manager.broadcast(builder.build_snapshot())
+        await manager.flush()
+        delta = _last_sent(session)
+        assert delta["baseline"] == keyframe["seq"]
+        assert "stats" not in delta
+        assert "score" not in delta
+
+    async def test_legacy_session_unchanged(self):
+        """Relace bez delta snapshotů dostává plné snapshoty jako dřív."""
+        engine, builder = _running_builder()
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.add(PlayerSession(websocket, "B1"))
+
+        snapshot = builder.build_snapshot()
+        await manager.broadcast(snapshot)
+        await manager.flush()
+
+        assert json.loads(websocket.send_text.await_args.args[0]) == snapshot
+
+    async def test_resync_and_evicted_baseline_send_keyframe(self):
+        """Po resync nebo s baseline mimo historii přijde keyframe."""
+        engine, builder = _running_builder()
+        manager = WebSocketManager()
+        manager.snapshot_history = SnapshotHistory(size=3, keyframe_interval=1000)
+        session = await _delta_session(manager)
+
+        snapshot = builder.build_snapshot()
+        await manager.broadcast(snapshot)
+        session.ack_snapshot(snapshot["seq"])
+        await manager.broadcast(builder.build_snapshot())
+        await manager.flush()
+        assert "baseline" in _last_sent(session)
+
+        session.ack_snapshot(None)
+        await manager.broadcast(builder.build_snapshot())
+        await manager.flush()
+        assert "baseline" not in _last_sent(session)
+
+        session.ack_snapshot(snapshot["seq"])  # mezitím vypadla z historie
+        for _ in range(3):
+            await manager.broadcast(builder.build_snapshot())
+        await manager.flush()
+        assert "baseline" not in _last_sent(session)
+
+    @pytest.mark.parametrize("snapshot_format", ["json", "binary"])
+    async def test_client_reconstructs_every_state(self, snapshot_format):
+        """Klient s nepravidelnými potvrzeními a ztracenými snapshoty složí přesný stav."""
+        random.seed(7)
+        engine, builder = _running_builder()
+        manager = WebSocketManager()
+        manager.snapshot_history = SnapshotHistory(keyframe_interval=30)
+        session = await _delta_session(manager, snapshot_format=snapshot_format)
+        assembler = SnapshotAssembler()
+        assembler.set_config(builder.build_config())
+        reference = SnapshotAssembler()
+        reference.set_config(builder.build_config())
+
+        deltas = 0
+        for tick in range(1500):
+            engine.update({"A1": {"up": tick % 40 < 10, "down": False}})
+            snapshot = builder.build_snapshot()
+            expected = reference.apply(snapshot)
+            await manager.broadcast(snapshot)
+            if random.random() < 0.3:
+                continue  # snapshot "ztracen" (sloučen s dalším ve frontě)
+            await manager.flush()
+            message = _last_sent(session)
+            deltas += "baseline" in message
+
+            state = assembler.apply(message)
+            if snapshot_format == "json":
+                assert state == expected
+            else:
+                assert state["score"] == expected["score"]
+                assert state["paddles"].keys() == expected["paddles"].keys()
+                assert abs(state["ball"]["x"] - expected["ball"]["x"]) <= 0.0625
+                assert {pid: p["stats"] for pid, p in state["paddles"].items()} == \
+                    {pid: p["stats"] for pid, p in expected["paddles"].items()}
+            if random.random() < 0.5:
+                session.ack_snapshot(assembler.last_seq)
+
+        assert deltas > 500
+        assert engine.stats_version > 1
@@ -0,0 +1,111 @@
+"""
+Testy telemetrie zpráv klientů (počítadla, vzorkování, kruhový buffer, sink).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from multipong.network.server.telemetry import Telemetry
+
+
+def _telemetry(**kwargs):
+    """Telemetrie s nezávislým nastavením (ne z config.json)."""
+    kwargs.setdefault("capacity", 8)
+    kwargs.setdefault("sampling", {"input": 0, "*": 1})
+    kwargs.setdefault("room_sampling", {})
+    kwargs.setdefault("writer", lambda events: None)
+    return Telemetry(**kwargs)
+
+
+class TestTelemetry:
+    """Testy počítadel a vzorkování."""
+
+    def test_counts_every_message_and_samples_every_nth(self):
+        """Každá zpráva se započítá, událost vznikne jen z každé N-té."""
+        telemetry = _telemetry(sampling={"input": 3, "*": 1})
+
+        sampled = [telemetry.record("r1", "input", "A1", up=True) for _ in range(7)]
+
+        assert sampled == [True, False, False, True, False, False, True]
+        assert telemetry.counters[("r1", "input")] == 7
+        assert [event["player"] for event in telemetry.events] == ["A1"] * 3
+        assert telemetry.events[0]["up"] is True
+
+    def test_sampling_per_type_and_room(self):
+        """Nastavení místnosti má přednost před typem zprávy, "*" před výchozím."""
+        telemetry = _telemetry()
+        telemetry.set_sampling("input", 1, room_id="debug")
+
+        assert telemetry.record("r1", "input") is False
+        assert telemetry.record("debug", "input") is True
+        assert telemetry.record("r1", "chat") is True
+
+        telemetry.set_sampling("*", 0)
+        assert telemetry.record("r1", "chat") is False
+        assert telemetry.counters[("r1", "chat")] == 2
+
+    def test_ring_buffer_drops_oldest_unflushed_events(self):
+        """Buffer drží posledních ``capacity`` událostí, přepsané se počítají."""
+        telemetry = _telemetry(capacity=4)
+        for i in range(3):
+            telemetry.emit("r1", "chat", n=i)
+        assert [event["n"] for event in telemetry.drain()] == [0, 1, 2]
+        assert telemetry.drain() == []
+
+        for i in range(3, 9):
+            telemetry.emit("r1", "chat", n=i)
+
+        assert [event["n"] for event in telemetry.drain()] == [5, 6, 7, 8]
+        assert telemetry.dropped_events == 2
+
+    def test_discard_room_and_snapshot(self):
+        """Snapshot filtruje místnost, zrušená místnost zmizí z počítadel."""
+        telemetry = _telemetry()
+        telemetry.record("r1", "chat", "A1", message="hi")
+        telemetry.record("r2", "ping")
+
+        snapshot = telemetry.snapshot("r1")
+        assert snapshot["counters"] == {"r1": {"chat": 1}}
+        assert [event["message"] for event in snapshot["events"]] == ["hi"]
+
+        telemetry.discard_room("r2")
+        assert telemetry.snapshot()["counters"] == {"r1": {"chat": 1}}
+
+
+@pytest.mark.asyncio
+class TestTelemetrySink:
+    """Testy asynchronního sinku."""
+
+    async def test_sink_writes_batches_off_the_event_loop(self):
+        """Sink zapisuje dávky v jiném vlákně a při zrušení dopíše zbytek."""
+        batches = []
+        threads = []
+
+        def writer(events):
+            threads.append(threading.get_ident())
+            batches.append([event["n"] for event in events])
+
+        telemetry = _telemetry(writer=writer)
+        sink = asyncio.create_task(telemetry.run_sink(interval=0.01))
+        telemetry.emit("r1", "chat", n=1)
+        telemetry.emit("r1", "chat", n=2)
+        await asyncio.sleep(0.05)
+        telemetry.emit("r1", "chat", n=3)
+        sink.cancel()
+        await asyncio.gather(sink, return_exceptions=True)
+
+        assert batches == [[1, 2], [3]]
+        assert threads[0] != threading.get_ident()
+
+    async def test_writer_failure_is_counted(self):
+        """Chyba zápisu neshodí sink, jen se započítá."""
+        def writer(events):
+            raise OSError("disk full")
+
+        telemetry = _telemetry(writer=writer)
+        telemetry.emit("r1", "chat")
+
+        assert await telemetry.flush() == 0
+        assert telemetry.sink_errors == 1
@@ -0,0 +1,148 @@
+"""
+Unit testy pro TickScheduler (sdílený plánovač ticků místností).
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.server.game_loop import GameLoop
+from multipong.network.server.tick_scheduler import TickScheduler
+from multipong.network.server.websocket_manager import WebSocketManager
+
+
+def make_game_loop(tick_rate: int = 20) -> GameLoop:
+    """GameLoop s mock enginem a managerem."""
+    engine = Mock(spec=MultipongEngine)
+    engine.update = Mock()
+    engine.get_dynamic_state = Mock(return_value={})
+    manager = AsyncMock(spec=WebSocketManager)
+    manager.broadcast = AsyncMock(return_value=0)
+    manager.get_player_count = Mock(return_value=0)
+    return GameLoop(engine, manager, tick_rate=tick_rate)
+
+
+class TestTickScheduler:
+    """Testy sdíleného plánovače ticků."""
+
+    @pytest.mark.asyncio
+    async def test_ticks_all_rooms_on_deadlines(self):
+        """Jeden plánovač tickuje všechny místnosti a měří jejich jitter."""
+        scheduler = TickScheduler()
+        loops = [make_game_loop(20) for _ in range(3)]
+        for i, game_loop in enumerate(loops):
+            assert scheduler.add(f"r{i}", game_loop)
+
+        assert scheduler.is_running
+        await asyncio.sleep(0.32)
+        await scheduler.stop()
+
+        for game_loop in loops:
+            # 20 Hz po ~0.32 s → ~6–7 ticků bez driftu
+            assert 5 <= game_loop.tick_count <= 8
+            assert game_loop.jitter.count == game_loop.tick_count
+            assert not game_loop.is_running
+        assert scheduler.ticks == sum(g.tick_count for g in loops)
+
+    @pytest.mark.asyncio
+    async def test_rooms_are_staggered_across_interval(self):
+        """Místnosti dostanou různé fáze rozložené v intervalu ticku."""
+        scheduler = TickScheduler(stagger_slots=4)
+        for i in range(4):
+            scheduler.add(f"r{i}", make_game_loop(10))
+
+        # Fáze v čtvrtinách intervalu od epochy (celé periody se při zátěži
+        # mohou přeskočit, fáze ne)
+        quarters = [
+            (entry.deadline - scheduler._epoch) / 0.1 * 4
+            for entry in scheduler._entries.values()
+        ]
+        assert len({entry.slot for entry in scheduler._entries.values()}) == 4
+        assert all(q == pytest.approx(round(q), abs=1e-6) for q in quarters)
+        assert sorted(round(q) % 4 for q in quarters) == [0, 1, 2, 3]
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_removed_slot_is_reused(self):
+        """Uvolněná fáze se přidělí další místnosti."""
+        scheduler = TickScheduler(stagger_slots=4)
+        for i in range(3):
+            scheduler.add(f"r{i}", make_game_loop())
+        freed_slot = scheduler._entries["r1"].slot
+
+        assert scheduler.remove("r1")
+        assert not scheduler.remove("r1")
+        scheduler.add("r3", make_game_loop())
+
+        assert scheduler._entries["r3"].slot == freed_slot
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_removed_room_stops_ticking(self):
+        """Vyřazená místnost už nedostává ticky."""
+        scheduler = TickScheduler()
+        game_loop = make_game_loop(50)
+        scheduler.add("r1", game_loop)
+
+        await asyncio.sleep(0.1)
+        scheduler.remove("r1")
+        ticks = game_loop.tick_count
+        await asyncio.sleep(0.1)
+
+        assert ticks > 0
+        assert game_loop.tick_count == ticks
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_failing_room_does_not_stop_others(self):
+        """Výjimka v ticku vyřadí jen danou místnost."""
+        scheduler = TickScheduler()
+        broken = make_game_loop(50)
+        broken.engine.update = Mock(side_effect=RuntimeError("boom"))
+        healthy = make_game_loop(50)
+        scheduler.add("broken", broken)
+        scheduler.add("healthy", healthy)
+
+        await asyncio.sleep(0.1)
+
+        assert scheduler.errors == 1
+        assert scheduler.get_room_count() == 1
+        assert healthy.tick_count > 1
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_game_loop_stop_unschedules(self):
+        """GameLoop.stop() vyřadí místnost na jejím dalším ticku."""
+        scheduler = TickScheduler()
+        game_loop = make_game_loop(50)
+        scheduler.add("r1", game_loop)
+
+        await asyncio.sleep(0.05)
+        game_loop.stop()
+        await asyncio.sleep(0.05)
+
+        assert scheduler.get_room_count() == 0
+        await scheduler.stop()
+
+
+class TestGameLoopDeadlines:
+    """Testy deadline plánování v GameLoop."""
+
+    def test_schedule_next_skips_missed_ticks(self):
+        """Přetažený tick přeskočí zmeškané deadliny (bez driftu)."""
+        game_loop = make_game_loop(10)
+
+        assert game_loop.schedule_next(1.0, 1.05) == pytest.approx(1.1)
+        # Tick skončil až v 1.35 → deadliny 1.1, 1.2, 1.3 jsou zmeškané
+        assert game_loop.schedule_next(1.0, 1.35) == pytest.approx(1.4)
+        assert game_loop.missed_ticks == 3
+
+    def test_advance_clock_uses_accumulator(self):
+        """advance_clock vrací počet fixních kroků podle uplynulého času."""
+        game_loop = make_game_loop(10)
+        game_loop.sim_rate = 50
+        game_loop.reset_clock(0.0)
+
+        assert game_loop.advance_clock(0.0) == 1
+        assert game_loop.advance_clock(0.105) == 5
@@ -0,0 +1,38 @@
+"""
+Testy sdíleného časovače smyček nad haldou deadlinů (Wakeup).
+"""
+
+import asyncio
+
+import pytest
+
+from multipong.network.server.wakeup import Wakeup
+
+
+@pytest.mark.asyncio
+class TestWakeup:
+    """Testy spánku do deadline a jeho přerušení."""
+
+    async def test_sleeps_until_deadline(self):
+        """Bez přerušení se smyčka probudí v zadaném čase loopu."""
+        loop = asyncio.get_running_loop()
+        wakeup = Wakeup()
+        when = loop.time() + 0.02
+
+        await wakeup.sleep_until(when)
+
+        assert loop.time() >= when
+        assert not wakeup.is_sleeping
+
+    async def test_wake_interrupts_sleep(self):
+        """wake() ukončí spánek bez deadline; mimo spánek nic nedělá."""
+        wakeup = Wakeup()
+        wakeup.wake()
+        task = asyncio.create_task(wakeup.sleep_until(None))
+        await asyncio.sleep(0)
+        assert wakeup.is_sleeping
+
+        wakeup.wake()
+        await asyncio.wait_for(task, 1.0)
+
+        assert not wakeup.is_sleeping
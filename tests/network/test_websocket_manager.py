@@ -2,12 +2,16 @@
 Unit testy pro PlayerSession a WebSocketManager.
 """
 
+import json
 import time
 import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
+from multipong.engine.game_engine import MultipongEngine
 from multipong.network.server.player_session import PlayerSession
-from multipong.network.server.websocket_manager import WebSocketManager
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.server.websocket_manager import WebSocketManager, encode_message
+from multipong.network.snapshot_codec import decode_snapshot, encode_snapshot
 
 
 class TestPlayerSession:
@@ -238,10 +242,14 @@ class TestWebSocketManager:
         
         message = {"type": "snapshot", "data": "test"}
         sent_count = await manager.broadcast(message)
+        await manager.flush()
         
         assert sent_count == 2
-        mock_ws1.send_json.assert_called_once_with(message)
-        mock_ws2.send_json.assert_called_once_with(message)
+        # Zpráva se zakóduje jednou a všem jde stejný text
+        text = '{"type":"snapshot","data":"test"}'
+        mock_ws1.send_text.assert_called_once_with(text)
+        mock_ws2.send_text.assert_called_once_with(text)
+        mock_ws1.send_json.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_broadcast_with_exclude(self):
@@ -259,10 +267,11 @@ class TestWebSocketManager:
         
         message = {"type": "snapshot"}
         sent_count = await manager.broadcast(message, exclude=["A1"])
+        await manager.flush()
         
         assert sent_count == 1
-        mock_ws1.send_json.assert_not_called()
-        mock_ws2.send_json.assert_called_once_with(message)
+        mock_ws1.send_text.assert_not_called()
+        mock_ws2.send_text.assert_called_once_with('{"type":"snapshot"}')
     
     @pytest.mark.asyncio
     async def test_broadcast_to_team(self):
@@ -279,11 +288,67 @@ class TestWebSocketManager:
         
         message = {"type": "team_message"}
         sent_count = await manager.broadcast_to_team(message, "A")
+        await manager.flush()
         
         assert sent_count == 2
-        mock_ws_a1.send_json.assert_called_once_with(message)
-        mock_ws_a2.send_json.assert_called_once_with(message)
-        mock_ws_b1.send_json.assert_not_called()
+        mock_ws_a1.send_text.assert_called_once_with('{"type":"team_message"}')
+        mock_ws_a2.send_text.assert_called_once_with('{"type":"team_message"}')
+        mock_ws_b1.send_text.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self):
+        """JSON se při broadcastu serializuje jednou bez ohledu na počet příjemců."""
+        manager = WebSocketManager()
+        for i in range(5):
+            await manager.add(PlayerSession(AsyncMock(), f"S{i}"))
+        
+        with patch("multipong.network.server.websocket_manager.json.dumps",
+                   wraps=json.dumps) as dumps:
+            sent_count = await manager.broadcast({"type": "snapshot", "ball": [1, 2]})
+        
+        assert sent_count == 5
+        assert dumps.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_snapshot_per_format(self):
+        """Snapshot dostane každá relace ve svém formátu, kódovaný jednou na formát."""
+        manager = WebSocketManager()
+        json_ws, binary_ws, binary_ws2 = AsyncMock(), AsyncMock(), AsyncMock()
+        await manager.add(PlayerSession(json_ws, "A1"))
+        await manager.add(PlayerSession(binary_ws, "B1", snapshot_format="binary"))
+        await manager.add(PlayerSession(binary_ws2, "B2", snapshot_format="binary"))
+        snapshot = {
+            "type": "snapshot", "seq": 1, "config_version": 0, "ball": [1.0, 2.0, 3.0, 4.0],
+            "paddles": [10.0, 20.0], "score": [1, 2], "time_left": 60.0,
+            "is_running": True, "goal_pause_remaining": 0.0, "rally_hits": 0,
+            "stats_version": 0,
+        }
+        
+        with patch("multipong.network.server.websocket_manager.encode_snapshot",
+                   wraps=encode_snapshot) as encode:
+            sent_count = await manager.broadcast(snapshot)
+        await manager.flush()
+        
+        assert sent_count == 3
+        assert encode.call_count == 1
+        assert json.loads(json_ws.send_text.await_args.args[0]) == snapshot
+        binary_ws.send_text.assert_not_called()
+        assert decode_snapshot(binary_ws.send_bytes.await_args.args[0]) == snapshot
+        assert binary_ws2.send_bytes.await_args.args[0] == binary_ws.send_bytes.await_args.args[0]
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_removes_failed_session(self):
+        """Relace, které se nepodařilo odeslat, se odeberou."""
+        manager = WebSocketManager()
+        broken_ws = AsyncMock()
+        broken_ws.send_text.side_effect = RuntimeError("closed")
+        await manager.add(PlayerSession(broken_ws, "A1"))
+        await manager.add(PlayerSession(AsyncMock(), "B1"))
+        
+        await manager.broadcast({"type": "snapshot"})
+        await manager.flush()
+        
+        assert manager.get_player_ids() == ["B1"]
     
     @pytest.mark.asyncio
     async def test_collect_inputs(self):
@@ -336,6 +401,76 @@ class TestWebSocketManager:
         assert "2" in repr_str or "A1" in repr_str
 
 
+@pytest.mark.asyncio
+class TestSnapshotRates:
+    """Testy frekvence snapshotů nezávislé na ticku místnosti."""
+    
+    async def test_negotiate_snapshot_rate(self):
+        """Frekvence podle profilu nebo požadavku, oříznutá a zarovnaná na tick."""
+        manager = WebSocketManager(tick_rate=60)
+        rates = {"player": 30, "spectator": 20, "mobile": 20}
+        
+        with patch.dict("multipong.settings.SERVER_SNAPSHOT_RATES", rates, clear=True), \
+                patch("multipong.settings.SERVER_MIN_SNAPSHOT_RATE", 10):
+            assert manager.negotiate_snapshot_rate(None) == 30
+            assert manager.negotiate_snapshot_rate(None, "spectator") == 20
+            assert manager.negotiate_snapshot_rate(None, "toaster") == 30
+            assert manager.negotiate_snapshot_rate("25", "mobile") == 30
+            assert manager.negotiate_snapshot_rate("1000") == 60
+            assert manager.negotiate_snapshot_rate("1") == 10
+            assert manager.negotiate_snapshot_rate("fast", "mobile") == 20
+    
+    async def test_sessions_receive_every_nth_snapshot(self):
+        """Relace dostává jen každý N-tý snapshot, stejná frekvence sdílí zakódování."""
+        engine = MultipongEngine(num_players_per_team=2)
+        engine.start()
+        builder = SnapshotBuilder(engine)
+        manager = WebSocketManager(tick_rate=60)
+        sessions = {
+            "A1": PlayerSession(AsyncMock(), "A1", snapshot_rate=60),
+            "A2": PlayerSession(AsyncMock(), "A2", snapshot_rate=30),
+            "B1": PlayerSession(AsyncMock(), "B1", snapshot_rate=20),
+            "B2": PlayerSession(AsyncMock(), "B2", snapshot_rate=20),
+        }
+        for session in sessions.values():
+            await manager.add(session)
+        
+        with patch("multipong.network.server.websocket_manager.encode_message",
+                   wraps=encode_message) as encode:
+            for _ in range(60):
+                engine.update({})
+                await manager.broadcast(builder.build_snapshot())
+                await manager.flush()
+        
+        counts = {pid: s.websocket.send_text.await_count for pid, s in sessions.items()}
+        assert counts == {"A1": 60, "A2": 30, "B1": 20, "B2": 20}
+        # Jedno zakódování na tick + první snapshot A2 a B1/B2 doplněný o statistiky
+        assert encode.call_count == 60 + 2
+        assert sessions["B1"].websocket.send_text.await_args == sessions["B2"].websocket.send_text.await_args
+    
+    async def test_skipped_stats_are_delivered(self):
+        """Statistiky z vynechaného snapshotu dostane relace v dalším odeslaném."""
+        engine = MultipongEngine(num_players_per_team=2)
+        engine.start()
+        builder = SnapshotBuilder(engine)
+        manager = WebSocketManager(tick_rate=60)
+        websocket = AsyncMock()
+        await manager.add(PlayerSession(websocket, "A1", snapshot_rate=20))
+        engine.ball.vx = -9.0  # míček míří na pálky – zásahy a góly mění statistiky
+        engine.ball.vy = -7.5
+        
+        for _ in range(600):
+            engine.update({})
+            snapshot = builder.build_snapshot()
+            await manager.broadcast(snapshot)
+            await manager.flush()
+        
+        received = [json.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+        with_stats = [message["stats_version"] for message in received if "stats" in message]
+        assert engine.stats_version > 0
+        assert with_stats[-1] == engine.stats_version
+
+
 class TestPlayerSessionTimeout:
     """Testy pro timeout funkcionalitu v PlayerSession."""
     
@@ -346,7 +481,7 @@ class TestPlayerSessionTimeout:
         
         assert hasattr(session, "last_activity")
         assert isinstance(session.last_activity, float)
-        assert session.last_activity <= time.time()
+        assert session.last_activity <= time.monotonic()
     
     def test_update_activity(self):
         """Test aktualizace času poslední aktivity."""
@@ -415,7 +550,7 @@ class TestWebSocketManagerTimeout:
         await manager.add(session)
         
         # Simulujeme starou aktivitu (11 sekund zpět)
-        session.last_activity = time.time() - 11.0
+        session.last_activity = time.monotonic() - 11.0
         
         # Odpojení s timeoutem 10s
         disconnected = await manager.disconnect_inactive(timeout_seconds=10.0)
@@ -437,8 +572,8 @@ class TestWebSocketManagerTimeout:
         await manager.add(session3)
         
         # Nastavíme neaktivitu pro session1 a session3
-        session1.last_activity = time.time() - 11.0
-        session3.last_activity = time.time() - 12.0
+        session1.last_activity = time.monotonic() - 11.0
+        session3.last_activity = time.monotonic() - 12.0
         # session2 zůstane aktivní
         
         disconnected = await manager.disconnect_inactive(timeout_seconds=10.0)
@@ -456,7 +591,7 @@ class TestWebSocketManagerTimeout:
         await manager.add(session)
         
         # Simulujeme aktivitu před 3 sekundami
-        session.last_activity = time.time() - 3.0
+        session.last_activity = time.monotonic() - 3.0
         
         # S timeoutem 5s by neměl být odpojen
         disconnected = await manager.disconnect_inactive(timeout_seconds=5.0)
@@ -466,3 +601,151 @@ class TestWebSocketManagerTimeout:
         disconnected = await manager.disconnect_inactive(timeout_seconds=2.0)
         assert disconnected == 1
 
+
+
+class BlockingWebSocket:
+    """Atrapa pomalého klienta – send_text čeká, dokud ho test nepustí."""
+    
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+        self.close = AsyncMock()
+    
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(text)
+
+
+class TestSendQueues:
+    """Testy odchozích front relací (writer task, slučování snapshotů)."""
+    
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast(self):
+        """Broadcast nečeká na pomalého klienta, rychlý dostane zprávu hned."""
+        manager = WebSocketManager()
+        slow_ws = BlockingWebSocket()
+        fast_ws = AsyncMock()
+        await manager.add(PlayerSession(slow_ws, "A1"))
+        await manager.add(PlayerSession(fast_ws, "B1"))
+        
+        sent_count = await asyncio.wait_for(manager.broadcast({"type": "snapshot"}), timeout=0.1)
+        await asyncio.sleep(0)
+        
+        assert sent_count == 2
+        fast_ws.send_text.assert_called_once_with('{"type":"snapshot"}')
+        assert slow_ws.sent == []
+        slow_ws.release.set()
+        await manager.flush()
+        assert slow_ws.sent == ['{"type":"snapshot"}']
+    
+    @pytest.mark.asyncio
+    async def test_snapshots_coalesce_latest_wins(self):
+        """Neodeslaný starší snapshot nahradí nejnovější; spolehlivé zprávy zůstanou."""
+        manager = WebSocketManager()
+        ws = BlockingWebSocket()
+        session = PlayerSession(ws, "A1")
+        await manager.add(session)
+        
+        await manager.broadcast({"type": "snapshot", "n": 1})
+        await asyncio.sleep(0)  # writer začne posílat snapshot 1
+        await manager.broadcast({"type": "snapshot", "n": 2})
+        await manager.broadcast({"type": "chat", "message": "ahoj"})
+        await manager.broadcast({"type": "snapshot", "n": 3})
+        await manager.broadcast({"type": "lobby_update"})
+        
+        ws.release.set()
+        await manager.flush()
+        
+        assert [json.loads(t) for t in ws.sent] == [
+            {"type": "snapshot", "n": 1},
+            {"type": "chat", "message": "ahoj"},
+            {"type": "lobby_update"},
+            {"type": "snapshot", "n": 3},
+        ]
+        assert session.snapshots_coalesced == 1
+        assert session.messages_sent == 4
+    
+    @pytest.mark.asyncio
+    async def test_coalesced_snapshot_does_not_lose_stats(self):
+        """Statistiky a konfigurace z nahrazeného snapshotu přijdou v novějším."""
+        manager = WebSocketManager()
+        ws = BlockingWebSocket()
+        session = PlayerSession(ws, "A1")
+        await manager.add(session)
+        config = {"config_version": 2}
+
+        def snapshot(seq, **extra):
+            return {"type": "snapshot", "seq": seq, "stats_version": 1, "config_version": 2, **extra}
+
+        await manager.broadcast(snapshot(1))
+        await asyncio.sleep(0)  # writer uvázl na snapshotu 1
+        await manager.broadcast(snapshot(2, stats={"hits": 1}, match_config=config))
+        for seq in range(3, 6):
+            await manager.broadcast(snapshot(seq))
+
+        ws.release.set()
+        await manager.flush()
+
+        received = [json.loads(t) for t in ws.sent]
+        assert [message["seq"] for message in received] == [1, 5]
+        assert received[1]["stats"] == {"hits": 1}
+        assert received[1]["match_config"] == config
+        assert (session.stats_version, session.config_version) == (1, 2)
+
+        await manager.broadcast(snapshot(6))
+        await manager.flush()
+        assert "stats" not in json.loads(ws.sent[-1])
+
+    @pytest.mark.asyncio
+    async def test_reliable_queue_overflow_disconnects(self):
+        """Při přetečení fronty spolehlivých zpráv je relace odpojena."""
+        manager = WebSocketManager()
+        ws = BlockingWebSocket()
+        session = PlayerSession(ws, "A1", max_queue=2)
+        await manager.add(session)
+        
+        for i in range(3):
+            await manager.broadcast({"type": "chat", "n": i})
+            await asyncio.sleep(0)
+        assert manager.get_queue_depths() == {"A1": 2}
+        
+        await manager.broadcast({"type": "chat", "n": 3})
+        await asyncio.sleep(0)
+        
+        assert manager.get_player_count() == 0
+        assert manager.backed_up_disconnects == 1
+        assert session.is_connected is False
+        ws.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_stalled_session_disconnects(self):
+        """Relace, jejíž odesílání stojí déle než stall_timeout, je odpojena."""
+        manager = WebSocketManager()
+        ws = BlockingWebSocket()
+        session = PlayerSession(ws, "A1", stall_timeout=0.05)
+        await manager.add(session)
+        
+        await manager.broadcast({"type": "snapshot"})
+        await asyncio.sleep(0.01)
+        assert await manager.broadcast({"type": "snapshot"}) == 1
+        assert not session.is_stalled()
+        
+        await asyncio.sleep(0.06)
+        assert session.is_stalled()
+        assert await manager.broadcast({"type": "snapshot"}) == 0
+        assert manager.get_player_count() == 0
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        """disconnect() zruší writer task a zahodí frontu."""
+        ws = BlockingWebSocket()
+        session = PlayerSession(ws, "A1")
+        session.enqueue_text("x", reliable=True)
+        session.enqueue_text("y", reliable=True)
+        await asyncio.sleep(0)
+        
+        session.disconnect()
+        await asyncio.sleep(0)
+        
+        assert session.queue_depth == 0
+        assert session.enqueue_text("z") is False
@@ -3,11 +3,16 @@ Unit testy pro WSClient a StateBuffer.
 """
 
 import asyncio
+import json
 import pytest
+import websockets.exceptions
 import time
 from unittest.mock import Mock, AsyncMock, patch
 from multipong.network.client.ws_client import WSClient
 from multipong.network.client.state_buffer import StateBuffer
+from multipong.engine.game_engine import MultipongEngine
+from multipong.network.server.snapshot_builder import SnapshotBuilder
+from multipong.network.snapshot_codec import compute_delta, encode_snapshot
 
 
 class TestWSClient:
@@ -246,6 +251,25 @@ class TestWSClientAsync:
         assert '"up": true' in call_args
         assert '"down": false' in call_args
     
+    async def test_send_input_numbers_frames(self):
+        """Vstupy mají rostoucí seq a po connected i tick simulace."""
+        client = WSClient("ws://localhost:8000/ws", "A1")
+        mock_ws = AsyncMock()
+        client.ws = mock_ws
+        client.running = True
+        
+        assert await client.send_input(up=True) == 1
+        first = json.loads(mock_ws.send.call_args[0][0])
+        assert first["seq"] == 1
+        assert "tick" not in first  # sim_rate ještě neznámý
+        
+        client.sim_rate = 60
+        client._clock_start = time.monotonic() - 1.0
+        assert await client.send_input(up=False) == 2
+        second = json.loads(mock_ws.send.call_args[0][0])
+        assert second["seq"] == 2
+        assert 60 <= second["tick"] <= 62
+    
     async def test_send_chat(self):
         """Test odeslání chat zprávy."""
         client = WSClient("ws://localhost:8000/ws", "A1")
@@ -287,3 +311,100 @@ class TestWSClientAsync:
         
         assert client.running is False
         mock_ws.close.assert_called_once()
+    
+    async def test_listen_decodes_binary_snapshot(self):
+        """Binární rámec se dekóduje a složí do plného stavu pro on_snapshot."""
+        engine = MultipongEngine(num_players_per_team=2)
+        engine.start()
+        builder = SnapshotBuilder(engine)
+        connected = json.dumps({
+            "type": "connected",
+            "assigned_slot": "A1",
+            "match_config": builder.build_config(),
+            "snapshot_format": "binary",
+        })
+        engine.update({})
+        frame = encode_snapshot(builder.build_snapshot())
+        
+        on_snapshot = Mock()
+        client = WSClient("ws://localhost:8000/ws", "A1", on_snapshot=on_snapshot)
+        client.ws = AsyncMock()
+        client.ws.recv.side_effect = [
+            connected, b"\xff", frame, websockets.exceptions.ConnectionClosed(None, None)
+        ]
+        client.running = True
+        
+        await client._listen()
+        
+        assert client.negotiated_format == "binary"
+        on_snapshot.assert_called_once()
+        state = on_snapshot.call_args.args[0]
+        assert state["type"] == "snapshot"
+        assert abs(state["ball"]["x"] - engine.ball.x) < 0.1
+        assert set(state["paddles"]) == set(engine.get_state()["paddles"])
+    
+    async def test_listen_acknowledges_delta_snapshots(self):
+        """Keyframe se potvrdí hned, delty po ack_interval, chybějící baseline vyvolá resync."""
+        engine = MultipongEngine(num_players_per_team=2)
+        engine.start()
+        builder = SnapshotBuilder(engine)
+        connected = json.dumps({
+            "type": "connected",
+            "assigned_slot": "A1",
+            "match_config": builder.build_config(),
+            "snapshot_delta": True,
+        })
+        keyframe = builder.build_snapshot()
+        deltas = []
+        for _ in range(2):
+            engine.update({})
+            deltas.append(compute_delta(keyframe, builder.build_snapshot()))
+        orphan = dict(deltas[-1], baseline=999)
+        
+        on_snapshot = Mock()
+        client = WSClient("ws://localhost:8000/ws", "A1", on_snapshot=on_snapshot, ack_interval=2)
+        client.ws = AsyncMock()
+        client.ws.recv.side_effect = [
+            connected,
+            encode_snapshot(keyframe),
+            json.dumps(deltas[0]),
+            encode_snapshot(deltas[1]),
+            json.dumps(orphan),
+            json.dumps(orphan),
+            websockets.exceptions.ConnectionClosed(None, None),
+        ]
+        client.running = True
+        
+        await client._listen()
+        
+        acks = [json.loads(call.args[0]) for call in client.ws.send.call_args_list]
+        assert acks == [
+            {"type": "ack", "seq": keyframe["seq"]},
+            {"type": "ack", "seq": deltas[1]["seq"]},
+            {"type": "ack", "seq": None},
+        ]
+        assert on_snapshot.call_count == 3
+    
+    async def test_snapshot_rate_request_and_render_delay(self):
+        """Profil a frekvence jdou v URL, render_delay odpovídá vyjednané frekvenci."""
+        client = WSClient("ws://localhost:8000/ws", "A1", client_profile="mobile", snapshot_rate=20)
+        
+        with patch("multipong.network.client.ws_client.connect", new=AsyncMock()) as connect, \
+                patch.object(client, "_listen", new=AsyncMock()):
+            assert await client.connect()
+        
+        url = connect.await_args.args[0]
+        assert "client_profile=mobile" in url
+        assert "snapshot_rate=20" in url
+        assert client.render_delay == 0.0
+        
+        client.ws = AsyncMock()
+        client.ws.recv.side_effect = [
+            json.dumps({"type": "connected", "assigned_slot": "A1", "snapshot_rate": 20.0}),
+            websockets.exceptions.ConnectionClosed(None, None),
+        ]
+        client.running = True
+        await client._listen()
+        
+        assert client.negotiated_rate == 20.0
+        assert client.render_delay == pytest.approx(0.05)